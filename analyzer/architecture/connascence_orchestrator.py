@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
 
 
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 import ast
 import logging
 import time
@@ -243,11 +243,7 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
         analysis_start = time.time()
 
         # Find Python files
-        python_files = list(project_path.rglob("*.py"))
-
-        # Filter out unwanted files
-        filtered_files = [f for f in python_files
-                        if not any(skip in str(f) for skip in ['__pycache__', '.git', 'node_modules'])]
+        filtered_files = self._discover_python_files(project_path)
 
         # Process files (parallel or sequential)
         if self.enable_parallel_processing and len(filtered_files) > 1:
@@ -283,41 +279,76 @@ class ConnascenceOrchestrator(ConnascenceOrchestratorInterface):
     def _process_files_parallel(self, files: List[Path]) -> List[ConnascenceViolation]:
         """Process files in parallel for improved performance."""
         all_violations = []
+        for _, violations in self._iter_file_violations(files, parallel=True):
+            all_violations.extend(violations)
+        return all_violations
+
+    def _process_files_sequential(self, files: List[Path]) -> List[ConnascenceViolation]:
+        """Process files sequentially for simpler error handling."""
+        all_violations = []
+        for _, violations in self._iter_file_violations(files, parallel=False):
+            all_violations.extend(violations)
+        return all_violations
+
+    def _discover_python_files(self, project_path: Path) -> List[Path]:
+        """Find Python files under a project path, skipping generated directories."""
+        if project_path.is_file():
+            return [project_path]
+        return [f for f in project_path.rglob("*.py")
+                if not any(skip in str(f) for skip in ['__pycache__', '.git', 'node_modules'])]
+
+    def _iter_file_violations(self, files: List[Path], parallel: bool = True,
+                              ordered: bool = False) -> Iterator[Tuple[Path, List[ConnascenceViolation]]]:
+        """
+        Yield (file_path, violations) as each file finishes.
+
+        Results arrive in completion order unless ordered=True, in which case
+        out-of-order completions are buffered until their predecessors finish.
+        """
+        if not parallel or len(files) <= 1:
+            for file_path in files:
+                try:
+                    violations = self._analyze_single_file(file_path)
+                except Exception as e:
+                    logger.error(f"Sequential file analysis failed for {file_path}: {e}")
+                    self._notify_error(e, {'file_path': str(file_path)})
+                    violations = []
+                else:
+                    self._notify_file_analyzed(str(file_path), violations)
+                yield file_path, violations
+            return
 
-        with ThreadPoolExecutor(max_workers=self.max_worker_threads) as executor:
-            # Submit all file analysis tasks
-            future_to_file = {
-                executor.submit(self._analyze_single_file, file_path): file_path
-                for file_path in files
+        executor = ThreadPoolExecutor(max_workers=self.max_worker_threads)
+        try:
+            future_to_index = {
+                executor.submit(self._analyze_single_file, file_path): index
+                for index, file_path in enumerate(files)
             }
+            pending: Dict[int, List[ConnascenceViolation]] = {}
+            next_index = 0
 
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                file_path = files[index]
                 try:
                     violations = future.result()
-                    all_violations.extend(violations)
                     self._notify_file_analyzed(str(file_path), violations)
                 except Exception as e:
                     logger.error(f"Parallel file analysis failed for {file_path}: {e}")
                     self._notify_error(e, {'file_path': str(file_path)})
-
-        return all_violations
-
-    def _process_files_sequential(self, files: List[Path]) -> List[ConnascenceViolation]:
-        """Process files sequentially for simpler error handling."""
-        all_violations = []
-
-        for file_path in files:
-            try:
-                violations = self._analyze_single_file(file_path)
-                all_violations.extend(violations)
-                self._notify_file_analyzed(str(file_path), violations)
-            except Exception as e:
-                logger.error(f"Sequential file analysis failed for {file_path}: {e}")
-                self._notify_error(e, {'file_path': str(file_path)})
-
-        return all_violations
+                    violations = []
+
+                if not ordered:
+                    yield file_path, violations
+                    continue
+
+                pending[index] = violations
+                while next_index in pending:
+                    yield files[next_index], pending.pop(next_index)
+                    next_index += 1
+        finally:
+            # Consumers may stop early; do not run the remaining files
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def _analyze_single_file(self, file_path: Path) -> List[ConnascenceViolation]:
         """Analyze single file and return enhanced violations."""
@@ -7,7 +7,7 @@ Maintains 100% API compatibility while using the new decomposed architecture.
 """
 
 import ast
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Union
 from pathlib import Path
 import time
 import logging
@@ -153,6 +153,26 @@ class RefactoredUnifiedAnalyzer:
         """
         return self.analyze_project(codebase_path)
 
+    def iter_results(self,
+                     project_path: Union[str, Path],
+                     ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-file results as each file finishes.
+
+        Yields one dict per file in completion order (or discovery order when
+        ordered=True) so callers can emit output before the project completes.
+        """
+        files = self.orchestrator._discover_python_files(Path(project_path))
+        parallel = self.orchestrator.enable_parallel_processing
+        file_results = self.orchestrator._iter_file_violations(files, parallel=parallel, ordered=ordered)
+
+        for file_path, violations in file_results:
+            yield {
+                'file_path': str(file_path),
+                'violations': [v.to_dict() for v in violations],
+                'violation_count': len(violations)
+            }
+
     # LEGACY ANALYSIS METHODS - Maintained for Backward Compatibility
 
     def _analyze_project_batch(self, project_path: Path, policy_preset: str) -> Dict[str, Any]:
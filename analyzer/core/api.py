@@ -7,7 +7,7 @@ NASA Rule 3 Compliance: ≤100 LOC target
 Version: 6.0.0 (Week 1 Refactoring)
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from pathlib import Path
 import logging
 
@@ -90,6 +90,29 @@ class Analyzer:
 
         return result
 
+    def iter_results(self, path: str, ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-file analysis results as each file completes.
+
+        Args:
+            path: Path to analyze (file or directory)
+            ordered: Yield files in discovery order. The engine analyzes one
+                file at a time, so completion order already is discovery
+                order and both settings give the same sequence.
+
+        Yields:
+            Per-file result dictionaries
+
+        NASA Rule 4: 1 assertion
+        """
+        assert path, "Path cannot be empty"
+
+        target_path = Path(path)
+        if not target_path.exists():
+            raise FileNotFoundError(f"Path not found: {path}")
+
+        yield from self.engine.iter_file_results(str(target_path))
+
 
 # Convenience function for one-liner usage
 def analyze(path: str, policy: str = "standard") -> Dict[str, Any]:
@@ -8,9 +8,11 @@ Version: 6.0.0 (Week 1 Refactoring)
 """
 
 import argparse
+import json
 import sys
 import logging
-from typing import List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, TextIO
 
 from .api import Analyzer
 
@@ -37,9 +39,9 @@ def create_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         "--format",
-        choices=["dict", "json", "sarif"],
+        choices=["dict", "json", "sarif", "ndjson"],
         default="json",
-        help="Output format (default: json)"
+        help="Output format (default: json; ndjson streams one line per file)"
     )
 
     parser.add_argument(
@@ -99,8 +101,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     try:
-        # Run analysis
         analyzer = Analyzer(policy=args.policy)
+
+        if args.format == "ndjson":
+            return _run_ndjson(analyzer, args)
+
+        # Run analysis
         result = analyzer.analyze(args.path, format=args.format)
 
         # Write output
@@ -113,23 +119,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         # Check quality gates
         if args.fail_on_critical:
-            quality = result.get("quality_scores", {})
-            nasa_compliance = quality.get("nasa_compliance", 0.0)
-            theater_score = quality.get("theater_score", 100.0)
-
-            if nasa_compliance < args.compliance_threshold:
-                logger.error(
-                    f"NASA compliance {nasa_compliance:.2%} below threshold "
-                    f"{args.compliance_threshold:.2%}"
-                )
-                return 1
-
-            if theater_score > args.theater_threshold:
-                logger.error(
-                    f"Theater score {theater_score} above threshold "
-                    f"{args.theater_threshold}"
-                )
-                return 1
+            return _check_quality_gates(result.get("quality_scores", {}), args)
 
         return 0
 
@@ -141,5 +131,56 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 1
 
 
+
+def _check_quality_gates(quality: Dict[str, Any], args: argparse.Namespace) -> int:
+    """Return 1 if quality scores violate the configured thresholds."""
+    nasa_compliance = quality.get("nasa_compliance", 0.0)
+    theater_score = quality.get("theater_score", 100.0)
+
+    if nasa_compliance < args.compliance_threshold:
+        logger.error(
+            f"NASA compliance {nasa_compliance:.2%} below threshold "
+            f"{args.compliance_threshold:.2%}"
+        )
+        return 1
+
+    if theater_score > args.theater_threshold:
+        logger.error(
+            f"Theater score {theater_score} above threshold "
+            f"{args.theater_threshold}"
+        )
+        return 1
+
+    return 0
+
+
+def _run_ndjson(analyzer: Analyzer, args: argparse.Namespace) -> int:
+    """Stream one JSON line per file as it completes, then a summary line."""
+    stream: TextIO = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        files_analyzed = 0
+        severity_counts: Counter = Counter()
+
+        for file_result in analyzer.iter_results(args.path, ordered=True):
+            files_analyzed += 1
+            severity_counts.update(
+                v.get("severity", "medium") if isinstance(v, dict) else "medium"
+                for v in file_result["violations"]
+            )
+            stream.write(json.dumps({"type": "file", **file_result}, default=str) + "\n")
+            stream.flush()
+
+        summary = analyzer.engine.summarize_counts(args.path, files_analyzed, severity_counts)
+        stream.write(json.dumps({"type": "summary", **summary}, default=str) + "\n")
+        stream.flush()
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+            logger.info(f"Results written to {args.output}")
+
+    if args.fail_on_critical:
+        return _check_quality_gates(summary["quality_scores"], args)
+    return 0
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -19,9 +19,25 @@ Features:
 - NASA POT10 compliant bounded learning with memory safety
 """
 
+from collections import defaultdict, deque
 import asyncio
+import hashlib
 import json
 import logging
+import statistics
+import threading
+
+try:
+    from .phase_correlation_storage import get_global_storage
+    from .unified_memory_model import (
+        MemoryCorrelation, PerformanceCorrelation, UnifiedMemoryModel, get_global_memory_model
+    )
+    MEMORY_SYSTEM_AVAILABLE = True
+except ImportError:
+    MemoryCorrelation = PerformanceCorrelation = UnifiedMemoryModel = None
+    get_global_memory_model = get_global_storage = None
+    MEMORY_SYSTEM_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -16,6 +16,7 @@ Evidence Retention: 90 days
 
 from .audit_trail import AuditTrailGenerator
 from .core import ComplianceOrchestrator
+from .evidence_graph import EvidenceGraph
 from .iso27001 import ISO27001ControlMapper
 from .nist_ssdf import NISTSSDFPracticeValidator
 from .reporting import ComplianceReportGenerator
@@ -23,6 +24,7 @@ from .soc2 import SOC2EvidenceCollector
 
 __all__ = [
     'ComplianceOrchestrator',
+    'EvidenceGraph',
     'SOC2EvidenceCollector', 
     'ISO27001ControlMapper',
     'NISTSSDFPracticeValidator',
@@ -0,0 +1,535 @@
+"""
+Segmented Append-Only Audit Log
+
+Tamper-evident audit storage for compliance and forensic logging:
+    - Records are JSON lines chained by hash: every record carries the hash
+      of its predecessor, so the chain is extended in O(1) per record
+    - Appends only hit the OS page cache; a background thread fsyncs at most
+      once per interval, so concurrent producers share one group fsync
+    - Every records_per_root records (and on rotation/close) the pending
+      block is sealed: its Merkle root is computed and signed once, instead
+      of signing every record. get_proof() returns a per-record inclusion
+      proof against the signed root
+    - Segments rotate by size and are named after their first sequence
+      number, so a record is located without an index
+
+    Layout:
+        <directory>/segment-000000000001.log
+        <directory>/segment-000000052817.log
+        ...
+
+    Record line:  {"event": {...},"hash": h,"prev": h',"seq": n,"ts": t}
+                  hash = sha256("seq|ts|prev|" + canonical event JSON), and
+                  verification re-hashes the event text exactly as stored
+    Seal line:    {"seal": {"first_seq", "last_seq", "merkle_root",
+                            "chain_hash", "signature", "sealed_at"}}
+
+    Only a final line without its newline is treated as a torn write and
+    truncated on reopen; an unreadable line anywhere else is kept on disk
+    and reported by verify().
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+GENESIS_HASH = "0" * 64
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+
+_HASH_FIELD = ',"hash":"'
+_RECORD_FIELDS = frozenset({"event", "hash", "prev", "seq", "ts"})
+_SEAL_FIELDS = frozenset({"first_seq", "last_seq", "merkle_root", "chain_hash"})
+
+def _canonical(body: Any) -> str:
+    return json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+
+def _record_hash(seq: int, timestamp: float, prev_hash: str, event_json: str) -> str:
+    return hashlib.sha256(f"{seq}|{timestamp!r}|{prev_hash}|{event_json}".encode("utf-8")).hexdigest()
+
+def _record_line(seq: int, timestamp: float, prev_hash: str, record_hash: str, event_json: str) -> str:
+    return f'{{"event":{event_json}{_HASH_FIELD}{record_hash}","prev":"{prev_hash}","seq":{seq},"ts":{timestamp!r}}}\n'
+
+def _parse_line(line: str) -> Dict[str, Any]:
+    """Parse a log line; records keep their raw event text for re-hashing."""
+    entry = json.loads(line)
+    if not isinstance(entry, dict):
+        raise ValueError("Audit log line is not an object")
+    if "seal" in entry:
+        if not isinstance(entry["seal"], dict) or not _SEAL_FIELDS <= entry["seal"].keys():
+            raise ValueError("Malformed seal")
+        return entry
+    if not _RECORD_FIELDS <= entry.keys():
+        raise ValueError("Malformed record")
+    # The record's own hash field is the last ',"hash":"' in the line
+    entry["event_json"] = line[len('{"event":'):line.rindex(_HASH_FIELD)]
+    return entry
+
+def _entry_is_valid(entry: Dict[str, Any]) -> bool:
+    return _record_hash(entry["seq"], entry["ts"], entry["prev"], entry["event_json"]) == entry["hash"]
+
+def _leaf(record_hash: str) -> bytes:
+    # Domain-separated from interior nodes (second-preimage resistance)
+    return hashlib.sha256(b"\x00" + bytes.fromhex(record_hash)).digest()
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+def _merkle_levels(record_hashes: List[str]) -> List[List[bytes]]:
+    # An odd node is carried up unchanged
+    levels = [[_leaf(h) for h in record_hashes]]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        levels.append([_node(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                       for i in range(0, len(level), 2)])
+    return levels
+
+def _path_from_levels(levels: List[List[bytes]], index: int) -> List[Tuple[str, str]]:
+    path = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            path.append(("L" if sibling < index else "R", level[sibling].hex()))
+        index //= 2
+    return path
+
+def merkle_root(record_hashes: List[str]) -> str:
+    """Merkle root over record hashes."""
+    if not record_hashes:
+        return GENESIS_HASH
+    return _merkle_levels(record_hashes)[-1][0].hex()
+
+def merkle_path(record_hashes: List[str], index: int) -> List[Tuple[str, str]]:
+    """Sibling hashes from leaf to root as (side, hex) pairs."""
+    return _path_from_levels(_merkle_levels(record_hashes), index)
+
+def merkle_paths(record_hashes: List[str]) -> List[List[Tuple[str, str]]]:
+    """merkle_path() for every leaf, building the tree only once."""
+    levels = _merkle_levels(record_hashes)
+    return [_path_from_levels(levels, index) for index in range(len(record_hashes))]
+
+def merkle_root_from_path(record_hash: str, path: List[Tuple[str, str]]) -> str:
+    """Recompute the Merkle root from a leaf hash and its merkle_path()."""
+    node = _leaf(record_hash)
+    for side, sibling in path:
+        node = _node(bytes.fromhex(sibling), node) if side == "L" else _node(node, bytes.fromhex(sibling))
+    return node.hex()
+
+def verify_proof(proof: Dict[str, Any],
+                 verify_signature: Optional[Callable[[str, Optional[str]], bool]] = None) -> bool:
+    """
+    Check an inclusion proof from SegmentedAuditLog.get_proof().
+
+    Args:
+        proof: Proof returned by get_proof()
+        verify_signature: Checks (merkle_root, signature); when given, the
+            seal's signature must verify as well
+    """
+    try:
+        record = _parse_line(proof["record_line"])
+    except ValueError:
+        return False
+    if not _entry_is_valid(record):
+        return False
+    seal = proof["seal"]
+    if merkle_root_from_path(record["hash"], proof["path"]) != seal["merkle_root"]:
+        return False
+    return verify_signature is None or _signature_ok(verify_signature, seal)
+
+def _signature_ok(verify_signature: Callable[[str, Optional[str]], bool], seal: Dict[str, Any]) -> bool:
+    if not seal.get("signature"):
+        return False
+    try:
+        return bool(verify_signature(seal["merkle_root"], seal["signature"]))
+    except Exception as e:
+        logger.error(f"Audit seal signature check failed: {e}")
+        return False
+
+class SegmentedAuditLog:
+    """
+    Append-only, hash-chained audit log with group fsync and signed roots.
+
+    append() is thread-safe and never waits for the disk; call flush() (or
+    append(..., durable=True)) where a caller needs the record on stable
+    storage before continuing.
+    """
+
+    def __init__(self,
+                directory: Union[str, Path],
+                max_segment_bytes: int = 64 * 1024 * 1024,
+                records_per_root: int = 1024,
+                fsync_interval_seconds: float = 0.05,
+                signer: Optional[Callable[[str], Optional[str]]] = None,
+                signature_verifier: Optional[Callable[[str, Optional[str]], bool]] = None):
+        """
+        Open (or resume) a segmented audit log.
+
+        Args:
+            directory: Directory holding the segment files
+            max_segment_bytes: Segment size that triggers rotation
+            records_per_root: Records per sealed (signed) Merkle block
+            fsync_interval_seconds: Maximum delay before a group fsync
+            signer: Signs a hex Merkle root, e.g. an RSA/HMAC signing function
+            signature_verifier: Checks (merkle_root, signature) for verify();
+                defaults to re-signing with a deterministic signer (HMAC,
+                RSA PKCS#1 v1.5)
+        """
+        assert max_segment_bytes >= 4096, "Segments must be at least 4KB"
+        assert 1 <= records_per_root <= 1_000_000, "records_per_root must be 1-1000000"
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.records_per_root = records_per_root
+        self.fsync_interval = fsync_interval_seconds
+        self.signer = signer
+        self.signature_verifier = signature_verifier
+        if signature_verifier is None and signer is not None:
+            self.signature_verifier = lambda root, signature: signer(root) == signature
+
+        self._lock = threading.RLock()
+        self._durable = threading.Condition(self._lock)
+        self._seq = 0
+        self._prev_hash = GENESIS_HASH
+        self._block: List[str] = []  # record hashes since the last seal
+        self._durable_seq = 0
+        self._retired: List[Any] = []  # rotated files awaiting final fsync
+        self._closed = False
+
+        self.stats = {
+            "records_appended": 0,
+            "seals_written": 0,
+            "fsyncs": 0,
+            "segments_rotated": 0
+        }
+
+        self._resume()
+        self._file = open(self._segment_path, "ab")
+        self._segment_bytes = self._file.tell()
+
+        self._stop = threading.Event()
+        self._syncer = threading.Thread(target=self._sync_loop, name="audit-log-fsync", daemon=True)
+        self._syncer.start()
+
+    # -- writing ---------------------------------------------------------
+
+    def append(self, event: Dict[str, Any], durable: bool = False) -> int:
+        """
+        Append an event and return its sequence number.
+
+        Args:
+            event: JSON-serializable event payload
+            durable: Wait for the next group fsync before returning
+        """
+        # Serialize before taking a sequence number so a bad event leaves no gap
+        event_json = _canonical(event)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Audit log is closed")
+
+            self._seq += 1
+            seq = self._seq
+            timestamp = time.time()
+            record_hash = _record_hash(seq, timestamp, self._prev_hash, event_json)
+            self._write(_record_line(seq, timestamp, self._prev_hash, record_hash, event_json))
+            self._prev_hash = record_hash
+            self._block.append(record_hash)
+            self.stats["records_appended"] += 1
+
+            if len(self._block) >= self.records_per_root:
+                self._seal_block()
+            if self._segment_bytes >= self.max_segment_bytes:
+                self._rotate()
+
+        if durable:
+            self.flush()
+        return seq
+
+    def seal(self) -> Optional[Dict[str, Any]]:
+        """Seal the pending block now; returns the seal or None if empty."""
+        with self._lock:
+            return self._seal_block()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every record appended so far has been fsynced."""
+        with self._lock:
+            target = self._seq
+            if self._durable_seq >= target:
+                return True
+        self._sync_now()
+        with self._lock:
+            return self._durable.wait_for(lambda: self._durable_seq >= target, timeout=timeout)
+
+    def close(self) -> None:
+        """Seal the pending block, fsync and stop the background syncer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._seal_block()
+            self._closed = True
+        self._stop.set()
+        self._syncer.join()
+        self._sync_now()
+        with self._lock:
+            self._file.close()
+
+    @property
+    def last_sequence(self) -> int:
+        with self._lock:
+            return self._seq
+
+    @property
+    def chain_head(self) -> str:
+        with self._lock:
+            return self._prev_hash
+
+    def _write(self, line: str) -> None:
+        data = line.encode("utf-8")
+        self._file.write(data)
+        self._segment_bytes += len(data)
+
+    def _seal_block(self) -> Optional[Dict[str, Any]]:
+        if not self._block:
+            return None
+
+        root = merkle_root(self._block)
+        seal = {
+            "first_seq": self._seq - len(self._block) + 1,
+            "last_seq": self._seq,
+            "merkle_root": root,
+            "chain_hash": self._prev_hash,
+            "signature": self._sign(root),
+            "sealed_at": time.time()
+        }
+        self._write(_canonical({"seal": seal}) + "\n")
+        self._block = []
+        self.stats["seals_written"] += 1
+        return seal
+
+    def _sign(self, root: str) -> Optional[str]:
+        if self.signer is None:
+            return None
+        try:
+            return self.signer(root)
+        except Exception as e:
+            logger.error(f"Audit segment signing failed: {e}")
+            return None
+
+    def _rotate(self) -> None:
+        # Segments only ever contain whole blocks
+        self._seal_block()
+        self._retired.append(self._file)
+        self._segment_path = self._path_for(self._seq + 1)
+        self._file = open(self._segment_path, "ab")
+        self._segment_bytes = 0
+        self.stats["segments_rotated"] += 1
+
+    # -- group fsync -----------------------------------------------------
+
+    def _sync_loop(self) -> None:
+        while not self._stop.wait(self.fsync_interval):
+            if self._durable_seq < self._seq:
+                self._sync_now()
+
+    def _sync_now(self) -> None:
+        with self._lock:
+            target = self._seq
+            files = self._retired + [self._file]
+            self._retired = []
+            for handle in files:
+                handle.flush()
+
+        # fsync outside the lock so appends continue meanwhile
+        for handle in files:
+            try:
+                os.fsync(handle.fileno())
+            except ValueError:
+                continue  # retired file already synced and closed by a concurrent flush
+            except OSError as e:
+                logger.error(f"Audit log fsync failed: {e}")
+                return
+        for handle in files[:-1]:
+            handle.close()
+
+        with self._lock:
+            self.stats["fsyncs"] += 1
+            if target > self._durable_seq:
+                self._durable_seq = target
+            self._durable.notify_all()
+
+    # -- reading and verification ---------------------------------------
+
+    def segments(self) -> List[Path]:
+        """Segment files in sequence order."""
+        return sorted(self.directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+    def get_proof(self, seq: int) -> Optional[Dict[str, Any]]:
+        """
+        Inclusion proof for one record against its block's signed root.
+
+        Returns None if the sequence number is unknown or its block has not
+        been sealed yet.
+        """
+        with self._lock:
+            if seq < 1 or seq > self._seq:
+                return None
+            self._file.flush()
+            segment = self._segment_for(seq)
+
+        block: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for line, entry in self._read_segment(segment):
+            if entry is None or "seal" not in entry:
+                block.append((line, entry))
+                continue
+            seal = entry["seal"]
+            if seal["first_seq"] <= seq <= seal["last_seq"]:
+                # No proof from a block with unreadable records
+                if any(record is None for _, record in block) or len(block) != seal["last_seq"] - seal["first_seq"] + 1:
+                    return None
+                index = seq - seal["first_seq"]
+                line, record = block[index]
+                return {
+                    "seq": seq,
+                    "record_line": line,
+                    "event": json.loads(record["event_json"]),
+                    "path": merkle_path([entry["hash"] for _, entry in block], index),
+                    "seal": seal
+                }
+            block = []
+        return None
+
+    def verify(self) -> Dict[str, Any]:
+        """
+        Re-check the hash chain, every sealed root and its signature, and
+        segment boundaries. Unreadable lines are reported, never skipped
+        silently.
+        """
+        self.flush()
+        report = {"records_verified": 0, "seals_verified": 0, "signatures_verified": 0,
+                  "unsealed_records": 0, "issues": []}
+        prev_hash = GENESIS_HASH
+        expected_seq = 1
+        block: List[str] = []
+
+        segments = self.segments()
+        for segment in segments:
+            if segment != segments[-1] and not self._ends_with_newline(segment):
+                report["issues"].append(f"Truncated final line in rotated segment {segment.name}")
+            for line_number, (_, entry) in enumerate(self._read_segment(segment), 1):
+                if entry is None:
+                    report["issues"].append(f"Unreadable line {line_number} in {segment.name}")
+                    block.append(GENESIS_HASH)  # keeps the enclosing seal from verifying
+                    prev_hash = None  # chain link to the next record is unknown
+                    expected_seq += 1
+                    continue
+
+                if "seal" in entry:
+                    seal = entry["seal"]
+                    if merkle_root(block) != seal["merkle_root"] or seal["chain_hash"] != prev_hash:
+                        report["issues"].append(f"Seal {seal['first_seq']}-{seal['last_seq']} does not match its records")
+                    if self.signature_verifier is not None:
+                        if _signature_ok(self.signature_verifier, seal):
+                            report["signatures_verified"] += 1
+                        else:
+                            report["issues"].append(f"Seal {seal['first_seq']}-{seal['last_seq']} signature is invalid")
+                    report["seals_verified"] += 1
+                    block = []
+                    continue
+
+                if prev_hash is None:
+                    pass  # already reported as unreadable
+                elif entry["seq"] != expected_seq or entry["prev"] != prev_hash:
+                    report["issues"].append(f"Chain broken at record {entry['seq']} in {segment.name}")
+                if not _entry_is_valid(entry):
+                    report["issues"].append(f"Record {entry['seq']} hash mismatch in {segment.name}")
+                prev_hash = entry["hash"]
+                expected_seq = entry["seq"] + 1
+                block.append(entry["hash"])
+                report["records_verified"] += 1
+
+        report["unsealed_records"] = len(block)
+        report["valid"] = not report["issues"]
+        return report
+
+    def _resume(self) -> None:
+        """Restore sequence, chain head and pending block from the last segment."""
+        segments = self.segments()
+        if not segments:
+            self._segment_path = self._path_for(1)
+            return
+
+        self._segment_path = segments[-1]
+        valid_bytes = 0
+        for line, entry in self._read_segment(self._segment_path):
+            valid_bytes += len(line.encode("utf-8"))
+            if entry is None:
+                # Kept on disk for verify() to report; the chain resumes
+                # from the last readable record
+                logger.error(f"Unreadable audit record in {self._segment_path.name}")
+                continue
+            if "seal" in entry:
+                self._block = []
+                continue
+            self._seq = entry["seq"]
+            self._prev_hash = entry["hash"]
+            self._block.append(entry["hash"])
+
+        # Drop a torn final line left by a crash mid-write
+        if valid_bytes < self._segment_path.stat().st_size:
+            logger.warning(f"Truncating torn audit record in {self._segment_path.name}")
+            with open(self._segment_path, "r+b") as f:
+                f.truncate(valid_bytes)
+
+        # A freshly rotated segment is empty: the chain continues from the
+        # previous one, whose blocks were all sealed at rotation
+        if self._seq == 0 and len(segments) > 1:
+            self._seq = self._first_seq(self._segment_path) - 1
+            for _, entry in self._read_segment(segments[-2]):
+                if entry is not None and "seal" not in entry:
+                    self._prev_hash = entry["hash"]
+        self._durable_seq = self._seq
+
+    def _segment_for(self, seq: int) -> Path:
+        candidates = [path for path in self.segments() if self._first_seq(path) <= seq]
+        return candidates[-1]
+
+    def _path_for(self, first_seq: int) -> Path:
+        return self.directory / f"{SEGMENT_PREFIX}{first_seq:012d}{SEGMENT_SUFFIX}"
+
+    @staticmethod
+    def _first_seq(path: Path) -> int:
+        return int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        with open(path, "rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Yield (raw line, parsed entry) for every complete line.
+
+        An unreadable complete line yields entry None; a final line without
+        its newline is a torn write and is not yielded.
+        """
+        with open(path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    return
+                line = raw.decode("utf-8", errors="replace")
+                try:
+                    entry = _parse_line(line)
+                except (ValueError, KeyError, TypeError):
+                    entry = None
+                yield line, entry
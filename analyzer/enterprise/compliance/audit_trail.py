@@ -1,7 +1,3 @@
-from datetime import datetime, timedelta
-import time
-from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
-
 """
 Automated Audit Trail Generation and Evidence Packaging (CE-004)
 
@@ -21,419 +17,443 @@ Provides comprehensive audit trail generation for compliance frameworks:
         - Cross-framework audit trail correlation
         """
 
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import hashlib
 import json
 import logging
+import time
+import uuid
+import zipfile
 
 import asyncio
 
+from .audit_log import SegmentedAuditLog
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_RETENTION_DAYS = 90
+
+@dataclass
+class AuditEvent:
+    """A single audit trail event."""
+    event_id: str
+    timestamp: datetime
+    event_type: str
+    framework: str
+    source: str
+    description: str
+    evidence_files: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    data_hash: Optional[str] = None
+    integrity_verified: bool = False
+
+@dataclass
+class EvidencePackage:
+    """A tamper-evident package of evidence files for one framework."""
+    package_id: str
+    creation_timestamp: datetime
+    framework: str
+    evidence_type: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    files: List[str] = field(default_factory=list)
+    package_hash: Optional[str] = None
+    chain_of_custody: List[AuditEvent] = field(default_factory=list)
+    retention_until: datetime = field(
+        default_factory=lambda: datetime.now() + timedelta(days=DEFAULT_RETENTION_DAYS)
+    )
+
 class AuditTrailGenerator:
     def __init__(self, config):
         self.config = config
-        self.audit_events: List[Dict] = []
         self.evidence_packages: List[Dict] = []
 
         # Audit trail configuration
         self.audit_log_path = Path(self.config.artifacts_path) / "audit_trails"
         self.evidence_packages_path = Path(self.config.artifacts_path) / "evidence_packages"
-        result = self._ensure_audit_directories()  # Return value captured
-        
+        self._ensure_audit_directories()
+
+        # Events are streamed into a hash-chained, segmented log instead of
+        # accumulating in memory; one signed Merkle root per block of records
+        self.event_log = SegmentedAuditLog(
+            self.audit_log_path / "segments",
+            records_per_root=getattr(self.config, "audit_records_per_root", 1024),
+            signer=getattr(self.config, "audit_signer", None)
+        )
+
     def _ensure_audit_directories(self):
         """Ensure audit trail directories exist"""
         self.audit_log_path.mkdir(parents=True, exist_ok=True)
         self.evidence_packages_path.mkdir(parents=True, exist_ok=True)
-        
-        async def generate_audit_trail(self, evidence_results: Dict[str, Any], 
-                                       collection_start: datetime) -> Dict[str, Any]:
+
+    async def generate_audit_trail(self, evidence_results: Dict[str, Any],
+                                   collection_start: datetime) -> Dict[str, Any]:
         """Generate comprehensive audit trail for compliance evidence collection"""
         try:
-        audit_trail_id = str(uuid.uuid4())
-        audit_start = datetime.now()
-            
-        # Create audit events for evidence collection
-        audit_events = await self._create_audit_events(evidence_results, collection_start)
-            
-        # Generate evidence packages
-        evidence_packages = await self._create_evidence_packages(evidence_results, audit_trail_id)
-            
-        # Create master audit log
-        audit_log = await self._create_master_audit_log(
-            audit_trail_id, audit_events, evidence_packages, collection_start
-        )
-            
-        # Generate integrity verification
-        integrity_report = await self._verify_audit_integrity(audit_events, evidence_packages)
-            
-        # Save audit trail
-        await self._save_audit_trail(audit_trail_id, audit_log, integrity_report)
-            
-        return {
-            "audit_trail_id": audit_trail_id,
-            "generation_timestamp": audit_start.isoformat(),
-            "audit_events_count": len(audit_events),
-            "evidence_packages_count": len(evidence_packages),
-            "audit_log": audit_log,
-            "integrity_report": integrity_report,
-            "retention_until": (datetime.now() + timedelta(days=self.config.evidence_retention_days)).isoformat(),
-            "status": "success"
-        }
-            
+            audit_trail_id = str(uuid.uuid4())
+            audit_start = datetime.now()
+
+            # Audit events go straight into the segmented log as they are
+            # created; only running counts are kept for this trail
+            first_seq = self.event_log.last_sequence + 1
+            event_stats = self._new_event_stats()
+            await self._create_audit_events(evidence_results, collection_start, event_stats)
+
+            # Generate evidence packages
+            evidence_packages = await self._create_evidence_packages(evidence_results, audit_trail_id)
+
+            # Seal so every event of this trail has an inclusion proof
+            event_log_range = await self._seal_event_log(first_seq)
+
+            # Create master audit log
+            audit_log = await self._create_master_audit_log(
+                audit_trail_id, event_stats, evidence_packages, collection_start, event_log_range
+            )
+
+            # Generate integrity verification
+            integrity_report = await self._verify_audit_integrity(event_stats, evidence_packages)
+
+            # Save audit trail
+            await self._save_audit_trail(audit_trail_id, audit_log, integrity_report)
+
+            return {
+                "audit_trail_id": audit_trail_id,
+                "generation_timestamp": audit_start.isoformat(),
+                "audit_events_count": event_stats["events"],
+                "evidence_packages_count": len(evidence_packages),
+                "audit_log": audit_log,
+                "integrity_report": integrity_report,
+                "retention_until": (datetime.now() + timedelta(days=self.config.evidence_retention_days)).isoformat(),
+                "status": "success"
+            }
+
         except Exception as e:
-        _ = self.logger.error(f"Audit trail generation failed: {e}")  # Return acknowledged
-        return {
-            "status": "error",
-            "error": str(e),
-            "generation_timestamp": datetime.now().isoformat()
-        }
-    
-        async def _create_audit_events(self, evidence_results: Dict[str, Any],
-                                       collection_start: datetime) -> List[AuditEvent]:
-        """Create audit events for evidence collection activities"""
-        audit_events = []
-        
-        for framework, results in evidence_results.items():
-        if framework in ['audit_trail', 'performance', 'compliance_report']:
-        continue
-            
-        # Framework assessment event
-        event = AuditEvent(
-            event_id=str(uuid.uuid4()),
-            timestamp=collection_start,
-            event_type="framework_assessment",
-            framework=framework,
-            source="automated",
-            description=f"Automated {framework} compliance assessment initiated",
-            metadata={
-                "assessment_type": "automated_compliance_check",
-                "evidence_collected": results.get("status") == "success",
-                "controls_assessed": self._count_controls_assessed(results),
-                "automation_level": "high"
+            logger.error(f"Audit trail generation failed: {e}")
+            return {
+                "status": "error",
+                "error": str(e),
+                "generation_timestamp": datetime.now().isoformat()
             }
-        )
-            
-        # Generate data hash for integrity
-        event.data_hash = self._generate_data_hash(results)
-        event.integrity_verified = True
-            
-        result = audit_events.append(event)
-        assert result is not None, "Critical operation failed"
-            
-        # Evidence collection events for each control/practice
-        evidence_events = await self._create_evidence_collection_events(framework, results, collection_start)
-        result = audit_events.extend(evidence_events)
-        assert result is not None, 'Critical operation failed'
-        
-        return audit_events
-    
-        async def _create_evidence_collection_events(self, framework: str, results: Dict[str, Any],
-                                                     base_timestamp: datetime) -> List[AuditEvent]:
-        """Create detailed evidence collection events"""
-        events = []
-        
+
+    async def _create_audit_events(self, evidence_results: Dict[str, Any],
+                                   collection_start: datetime,
+                                   event_stats: Dict[str, Any]) -> int:
+        """Create audit events for evidence collection activities and append them to the event log"""
+        created = 0
+
+        for framework, results in evidence_results.items():
+            if framework in ['audit_trail', 'performance', 'compliance_report']:
+                continue
+
+            # Framework assessment event
+            event = AuditEvent(
+                event_id=str(uuid.uuid4()),
+                timestamp=collection_start,
+                event_type="framework_assessment",
+                framework=framework,
+                source="automated",
+                description=f"Automated {framework} compliance assessment initiated",
+                metadata={
+                    "assessment_type": "automated_compliance_check",
+                    "evidence_collected": results.get("status") == "success",
+                    "controls_assessed": self._count_controls_assessed(results),
+                    "automation_level": "high"
+                }
+            )
+
+            # Generate data hash for integrity
+            event.data_hash = self._generate_data_hash(results)
+            event.integrity_verified = True
+
+            self._record_event(event, event_stats)
+            created += 1
+
+            # Evidence collection events for each control/practice
+            created += await self._create_evidence_collection_events(framework, results, collection_start, event_stats)
+
+        return created
+
+    async def _create_evidence_collection_events(self, framework: str, results: Dict[str, Any],
+                                                 base_timestamp: datetime,
+                                                 event_stats: Dict[str, Any]) -> int:
+        """Create detailed evidence collection events; returns the number recorded"""
         # Create events based on framework type
         if framework == "SOC2":
-        result = events.extend(await self._create_soc2_evidence_events(results, base_timestamp))
-        assert result is not None, 'Critical operation failed'
+            return await self._create_soc2_evidence_events(results, base_timestamp, event_stats)
         elif framework == "ISO27001":
-        result = events.extend(await self._create_iso27001_evidence_events(results, base_timestamp))
-        assert result is not None, 'Critical operation failed'
+            return await self._create_iso27001_evidence_events(results, base_timestamp, event_stats)
         elif framework == "NIST-SSDF":
-        result = events.extend(await self._create_nist_ssdf_evidence_events(results, base_timestamp))
-        assert result is not None, 'Critical operation failed'
-        
-        return events
-    
-        async def _create_soc2_evidence_events(self, results: Dict[str, Any],
-                                               base_timestamp: datetime) -> List[AuditEvent]:
+            return await self._create_nist_ssdf_evidence_events(results, base_timestamp, event_stats)
+
+        return 0
+
+    async def _create_soc2_evidence_events(self, results: Dict[str, Any],
+                                           base_timestamp: datetime,
+                                           event_stats: Dict[str, Any]) -> int:
         """Create SOC2-specific evidence collection events"""
-        events = []
-        
+        events = 0
+
         evidence_by_criteria = results.get("evidence_by_criteria", {})
-        
+
         for criteria_name, criteria_data in evidence_by_criteria.items():
-        if criteria_data.get("evidence_count", 0) == 0:
-        continue
-            
-        # Trust Services Criteria evidence event
-        event = AuditEvent(
-            event_id=str(uuid.uuid4()),
-            timestamp=base_timestamp + timedelta(seconds=len(events)),
-            event_type="trust_services_evidence_collection",
-            framework="SOC2",
-            source="automated",
-            description=f"SOC2 {criteria_name} Trust Services Criteria evidence collection",
-            evidence_files=self._extract_evidence_files(criteria_data),
-            metadata={
-                "criteria": criteria_name,
-                "controls_assessed": len(criteria_data.get("controls", [])),
-                "evidence_count": criteria_data.get("evidence_count", 0),
-                "automated_collection": True
-            }
-        )
-            
-        event.data_hash = self._generate_data_hash(criteria_data)
-        event.integrity_verified = True
-        result = events.append(event)
-        assert result is not None, "Critical operation failed"
-        
+            if criteria_data.get("evidence_count", 0) == 0:
+                continue
+
+            # Trust Services Criteria evidence event
+            event = AuditEvent(
+                event_id=str(uuid.uuid4()),
+                timestamp=base_timestamp + timedelta(seconds=events),
+                event_type="trust_services_evidence_collection",
+                framework="SOC2",
+                source="automated",
+                description=f"SOC2 {criteria_name} Trust Services Criteria evidence collection",
+                evidence_files=self._extract_evidence_files(criteria_data),
+                metadata={
+                    "criteria": criteria_name,
+                    "controls_assessed": len(criteria_data.get("controls", [])),
+                    "evidence_count": criteria_data.get("evidence_count", 0),
+                    "automated_collection": True
+                }
+            )
+
+            event.data_hash = self._generate_data_hash(criteria_data)
+            event.integrity_verified = True
+            self._record_event(event, event_stats)
+            events += 1
+
         return events
-    
-        async def _create_iso27001_evidence_events(self, results: Dict[str, Any],
-                                                   base_timestamp: datetime) -> List[AuditEvent]:
+
+    async def _create_iso27001_evidence_events(self, results: Dict[str, Any],
+                                               base_timestamp: datetime,
+                                               event_stats: Dict[str, Any]) -> int:
         """Create ISO27001-specific evidence collection events"""
-        events = []
-        
+        events = 0
+
         control_assessments = results.get("control_assessments", [])
-        
+
         for i, assessment in enumerate(control_assessments):
-        event = AuditEvent(
-            event_id=str(uuid.uuid4()),
-            timestamp=base_timestamp + timedelta(seconds=i * 2),
-            event_type="iso27001_control_assessment",
-            framework="ISO27001",
-            source="automated",
-            description=f"ISO27001 Control {assessment.get('control_id')} assessment",
-            evidence_files=self._extract_evidence_files(assessment.get("evidence", {})),
-            metadata={
-                "control_id": assessment.get("control_id"),
-                "category": assessment.get("category"),
-                "implementation_status": assessment.get("implementation_status"),
-                "risk_rating": assessment.get("risk_rating"),
-                "evidence_count": len(assessment.get("evidence", {}))
-            }
-        )
-            
-        event.data_hash = self._generate_data_hash(assessment)
-        event.integrity_verified = True
-        result = events.append(event)
-        assert result is not None, "Critical operation failed"
-        
+            event = AuditEvent(
+                event_id=str(uuid.uuid4()),
+                timestamp=base_timestamp + timedelta(seconds=i * 2),
+                event_type="iso27001_control_assessment",
+                framework="ISO27001",
+                source="automated",
+                description=f"ISO27001 Control {assessment.get('control_id')} assessment",
+                evidence_files=self._extract_evidence_files(assessment.get("evidence", {})),
+                metadata={
+                    "control_id": assessment.get("control_id"),
+                    "category": assessment.get("category"),
+                    "implementation_status": assessment.get("implementation_status"),
+                    "risk_rating": assessment.get("risk_rating"),
+                    "evidence_count": len(assessment.get("evidence", {}))
+                }
+            )
+
+            event.data_hash = self._generate_data_hash(assessment)
+            event.integrity_verified = True
+            self._record_event(event, event_stats)
+            events += 1
+
         return events
-    
-        async def _create_nist_ssdf_evidence_events(self, results: Dict[str, Any],
-                                                    base_timestamp: datetime) -> List[AuditEvent]:
+
+    async def _create_nist_ssdf_evidence_events(self, results: Dict[str, Any],
+                                                base_timestamp: datetime,
+                                                event_stats: Dict[str, Any]) -> int:
         """Create NIST-SSDF-specific evidence collection events"""
-        events = []
-        
+        events = 0
+
         practice_assessments = results.get("practice_assessments", [])
-        
+
         for i, assessment in enumerate(practice_assessments):
-        event = AuditEvent(
-            event_id=str(uuid.uuid4()),
-            timestamp=base_timestamp + timedelta(seconds=i * 3),
-            event_type="nist_ssdf_practice_assessment",
-            framework="NIST-SSDF",
-            source="automated",
-            description=f"NIST-SSDF Practice {assessment.get('practice_id')} assessment",
-            evidence_files=self._extract_evidence_files(assessment.get("evidence", {})),
-            metadata={
-                "practice_id": assessment.get("practice_id"),
-                "group": assessment.get("group"),
-                "implementation_tier": assessment.get("implementation_tier"),
-                "maturity_level": assessment.get("maturity_level"),
-                "automation_level": assessment.get("automation_level"),
-                "evidence_count": len(assessment.get("evidence", []))
-            }
-        )
-            
-        event.data_hash = self._generate_data_hash(assessment)
-        event.integrity_verified = True
-        result = events.append(event)
-        assert result is not None, "Critical operation failed"
-        
+            event = AuditEvent(
+                event_id=str(uuid.uuid4()),
+                timestamp=base_timestamp + timedelta(seconds=i * 3),
+                event_type="nist_ssdf_practice_assessment",
+                framework="NIST-SSDF",
+                source="automated",
+                description=f"NIST-SSDF Practice {assessment.get('practice_id')} assessment",
+                evidence_files=self._extract_evidence_files(assessment.get("evidence", {})),
+                metadata={
+                    "practice_id": assessment.get("practice_id"),
+                    "group": assessment.get("group"),
+                    "implementation_tier": assessment.get("implementation_tier"),
+                    "maturity_level": assessment.get("maturity_level"),
+                    "automation_level": assessment.get("automation_level"),
+                    "evidence_count": len(assessment.get("evidence", []))
+                }
+            )
+
+            event.data_hash = self._generate_data_hash(assessment)
+            event.integrity_verified = True
+            self._record_event(event, event_stats)
+            events += 1
+
         return events
-    
-        async def _create_evidence_packages(self, evidence_results: Dict[str, Any],
-                                            audit_trail_id: str) -> List[EvidencePackage]:
+
+    async def _create_evidence_packages(self, evidence_results: Dict[str, Any],
+                                        audit_trail_id: str) -> List[EvidencePackage]:
         """Create tamper-evident evidence packages"""
         packages = []
-        
+
         for framework, results in evidence_results.items():
-        if framework in ['audit_trail', 'performance', 'compliance_report']:
-        continue
-            
-        # Create framework-specific evidence package
-        package = EvidencePackage(
-            package_id=f"{audit_trail_id}_{framework}_{int(time.time())}",
-            creation_timestamp=datetime.now(),
-            framework=framework,
-            evidence_type="automated_compliance_assessment",
-            metadata={
-                "framework": framework,
-                "assessment_timestamp": results.get("collection_timestamp") or results.get("assessment_timestamp"),
-                "evidence_count": self._count_evidence_artifacts(results),
-                "automated": True,
-                "compliance_score": self._extract_compliance_score(results)
-            }
-        )
-            
-        # Package evidence files
-        evidence_files = await self._package_evidence_files(framework, results, package.package_id)
-        package.files = evidence_files
-            
-        # Generate package hash for integrity
-        package.package_hash = await self._generate_package_hash(evidence_files, package.metadata)
-            
-        # Create chain of custody
-        package.chain_of_custody = await self._create_chain_of_custody(package)
-            
-        result = packages.append(package)
-        assert result is not None, "Critical operation failed"
-        
+            if framework in ['audit_trail', 'performance', 'compliance_report']:
+                continue
+
+            # Create framework-specific evidence package
+            creation_timestamp = datetime.now()
+            package = EvidencePackage(
+                package_id=f"{audit_trail_id}_{framework}_{int(time.time())}",
+                creation_timestamp=creation_timestamp,
+                framework=framework,
+                evidence_type="automated_compliance_assessment",
+                metadata={
+                    "framework": framework,
+                    "assessment_timestamp": results.get("collection_timestamp") or results.get("assessment_timestamp"),
+                    "evidence_count": self._count_evidence_artifacts(results),
+                    "automated": True,
+                    "compliance_score": self._extract_compliance_score(results)
+                },
+                retention_until=creation_timestamp + timedelta(days=self.config.evidence_retention_days)
+            )
+
+            # Package evidence files
+            evidence_files = await self._package_evidence_files(framework, results, package.package_id)
+            package.files = evidence_files
+
+            # Generate package hash for integrity
+            package.package_hash = await self._generate_package_hash(evidence_files, package.metadata)
+
+            # Create chain of custody
+            package.chain_of_custody = await self._create_chain_of_custody(package)
+
+            packages.append(package)
+
         return packages
-    
-        async def _package_evidence_files(self, framework: str, results: Dict[str, Any],
-                                          package_id: str) -> List[str]:
+
+    async def _package_evidence_files(self, framework: str, results: Dict[str, Any],
+                                      package_id: str) -> List[str]:
         """Package evidence files into compressed archives"""
         package_dir = self.evidence_packages_path / package_id
         package_dir.mkdir(parents=True, exist_ok=True)
-        
+
         evidence_files = []
-        
+
         # Save framework results as JSON
         results_file = package_dir / f"{framework.lower()}_results.json"
         with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
-        result = evidence_files.append(str(results_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            json.dump(results, f, indent=2, default=str)
+        evidence_files.append(str(results_file.relative_to(self.evidence_packages_path)))
+
         # Save specific evidence artifacts based on framework
         if framework == "SOC2":
-        result = evidence_files.extend(await self._package_soc2_evidence(results, package_dir))
-        assert result is not None, 'Critical operation failed'
+            evidence_files.extend(await self._package_soc2_evidence(results, package_dir))
         elif framework == "ISO27001":
-        result = evidence_files.extend(await self._package_iso27001_evidence(results, package_dir))
-        assert result is not None, 'Critical operation failed'
+            evidence_files.extend(await self._package_iso27001_evidence(results, package_dir))
         elif framework == "NIST-SSDF":
-        result = evidence_files.extend(await self._package_nist_ssdf_evidence(results, package_dir))
-        assert result is not None, 'Critical operation failed'
-        
+            evidence_files.extend(await self._package_nist_ssdf_evidence(results, package_dir))
+
         # Create compressed archive
         archive_file = self.evidence_packages_path / f"{package_id}.zip"
         with zipfile.ZipFile(archive_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in evidence_files:
-        full_path = self.evidence_packages_path / file_path
-        if full_path.exists():
-        result = zipf.write(full_path, file_path)
-        assert result is not None, 'Critical operation failed'
-        
+            for file_path in evidence_files:
+                full_path = self.evidence_packages_path / file_path
+                if full_path.exists():
+                    zipf.write(full_path, file_path)
+
         # Add archive to evidence files list
-        result = evidence_files.append(str(archive_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+        evidence_files.append(str(archive_file.relative_to(self.evidence_packages_path)))
+
         return evidence_files
-    
-        async def _package_soc2_evidence(self, results: Dict[str, Any], package_dir: Path) -> List[str]:
+
+    async def _package_soc2_evidence(self, results: Dict[str, Any], package_dir: Path) -> List[str]:
         """Package SOC2-specific evidence"""
         evidence_files = []
-        
+
         # Save SOC2 matrix
         if "soc2_matrix" in results:
-        matrix_file = package_dir / "soc2_compliance_matrix.json"
-        with open(matrix_file, 'w') as f:
-        json.dump(results["soc2_matrix"], f, indent=2, default=str)
-        result = evidence_files.append(str(matrix_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            matrix_file = package_dir / "soc2_compliance_matrix.json"
+            with open(matrix_file, 'w') as f:
+                json.dump(results["soc2_matrix"], f, indent=2, default=str)
+            evidence_files.append(str(matrix_file.relative_to(self.evidence_packages_path)))
+
         # Save evidence summary
         if "evidence_summary" in results:
-        summary_file = package_dir / "soc2_evidence_summary.json"
-        with open(summary_file, 'w') as f:
-        json.dump(results["evidence_summary"], f, indent=2, default=str)
-        result = evidence_files.append(str(summary_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            summary_file = package_dir / "soc2_evidence_summary.json"
+            with open(summary_file, 'w') as f:
+                json.dump(results["evidence_summary"], f, indent=2, default=str)
+            evidence_files.append(str(summary_file.relative_to(self.evidence_packages_path)))
+
         return evidence_files
-    
-        async def _package_iso27001_evidence(self, results: Dict[str, Any], package_dir: Path) -> List[str]:
+
+    async def _package_iso27001_evidence(self, results: Dict[str, Any], package_dir: Path) -> List[str]:
         """Package ISO27001-specific evidence"""
         evidence_files = []
-        
+
         # Save compliance matrix
         if "compliance_matrix" in results:
-        matrix_file = package_dir / "iso27001_compliance_matrix.json"
-        with open(matrix_file, 'w') as f:
-        json.dump(results["compliance_matrix"], f, indent=2, default=str)
-        result = evidence_files.append(str(matrix_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            matrix_file = package_dir / "iso27001_compliance_matrix.json"
+            with open(matrix_file, 'w') as f:
+                json.dump(results["compliance_matrix"], f, indent=2, default=str)
+            evidence_files.append(str(matrix_file.relative_to(self.evidence_packages_path)))
+
         # Save risk assessment
         if "risk_assessment" in results:
-        risk_file = package_dir / "iso27001_risk_assessment.json"
-        with open(risk_file, 'w') as f:
-        json.dump(results["risk_assessment"], f, indent=2, default=str)
-        result = evidence_files.append(str(risk_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            risk_file = package_dir / "iso27001_risk_assessment.json"
+            with open(risk_file, 'w') as f:
+                json.dump(results["risk_assessment"], f, indent=2, default=str)
+            evidence_files.append(str(risk_file.relative_to(self.evidence_packages_path)))
+
         # Save gap analysis
         if "gap_analysis" in results:
-        gap_file = package_dir / "iso27001_gap_analysis.json"
-        with open(gap_file, 'w') as f:
-        json.dump(results["gap_analysis"], f, indent=2, default=str)
-        result = evidence_files.append(str(gap_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            gap_file = package_dir / "iso27001_gap_analysis.json"
+            with open(gap_file, 'w') as f:
+                json.dump(results["gap_analysis"], f, indent=2, default=str)
+            evidence_files.append(str(gap_file.relative_to(self.evidence_packages_path)))
+
         return evidence_files
-    
-        async def _package_nist_ssdf_evidence(self, results: Dict[str, Any], package_dir: Path) -> List[str]:
+
+    async def _package_nist_ssdf_evidence(self, results: Dict[str, Any], package_dir: Path) -> List[str]:
         """Package NIST-SSDF-specific evidence"""
         evidence_files = []
-        
+
         # Save implementation tier assessment
         if "implementation_tier" in results:
-        tier_file = package_dir / "nist_ssdf_implementation_tier.json"
-        with open(tier_file, 'w') as f:
-        json.dump(results["implementation_tier"], f, indent=2, default=str)
-        result = evidence_files.append(str(tier_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            tier_file = package_dir / "nist_ssdf_implementation_tier.json"
+            with open(tier_file, 'w') as f:
+                json.dump(results["implementation_tier"], f, indent=2, default=str)
+            evidence_files.append(str(tier_file.relative_to(self.evidence_packages_path)))
+
         # Save maturity assessment
         if "maturity_assessment" in results:
-        maturity_file = package_dir / "nist_ssdf_maturity_assessment.json"
-        with open(maturity_file, 'w') as f:
-        json.dump(results["maturity_assessment"], f, indent=2, default=str)
-        result = evidence_files.append(str(maturity_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            maturity_file = package_dir / "nist_ssdf_maturity_assessment.json"
+            with open(maturity_file, 'w') as f:
+                json.dump(results["maturity_assessment"], f, indent=2, default=str)
+            evidence_files.append(str(maturity_file.relative_to(self.evidence_packages_path)))
+
         # Save gap analysis
         if "gap_analysis" in results:
-        gap_file = package_dir / "nist_ssdf_gap_analysis.json"
-        with open(gap_file, 'w') as f:
-        json.dump(results["gap_analysis"], f, indent=2, default=str)
-        result = evidence_files.append(str(gap_file.relative_to(self.evidence_packages_path)))
-        assert result is not None, "Critical operation failed"
-        
+            gap_file = package_dir / "nist_ssdf_gap_analysis.json"
+            with open(gap_file, 'w') as f:
+                json.dump(results["gap_analysis"], f, indent=2, default=str)
+            evidence_files.append(str(gap_file.relative_to(self.evidence_packages_path)))
+
         return evidence_files
-    
-        async def _create_master_audit_log(self, audit_trail_id: str, audit_events: List[AuditEvent],
-                                           evidence_packages: List[EvidencePackage],
-                                           collection_start: datetime) -> Dict[str, Any]:
-        """Create master audit log with all events and evidence"""
+
+    async def _create_master_audit_log(self, audit_trail_id: str, event_stats: Dict[str, Any],
+                                       evidence_packages: List[EvidencePackage],
+                                       collection_start: datetime,
+                                       event_log_range: Dict[str, Any]) -> Dict[str, Any]:
+        """Create master audit log; the events themselves live in the segmented event log"""
         return {
             "audit_trail_id": audit_trail_id,
             "creation_timestamp": datetime.now().isoformat(),
             "collection_start_timestamp": collection_start.isoformat(),
-            "total_events": len(audit_events),
+            "total_events": event_stats["events"],
             "total_evidence_packages": len(evidence_packages),
-            "frameworks_assessed": list(set(event.framework for event in audit_events)),
-            "audit_events": [
-                {
-                    "event_id": event.event_id,
-                    "timestamp": event.timestamp.isoformat(),
-                    "event_type": event.event_type,
-                    "framework": event.framework,
-                    "source": event.source,
-                    "description": event.description,
-                    "data_hash": event.data_hash,
-                    "evidence_files": event.evidence_files,
-                    "metadata": event.metadata,
-                    "integrity_verified": event.integrity_verified
-                } for event in audit_events
-            ],
+            "frameworks_assessed": sorted(event_stats["frameworks"]),
+            "event_log_range": event_log_range,
             "evidence_packages": [
                 {
                     "package_id": pkg.package_id,
@@ -458,48 +478,38 @@ class AuditTrailGenerator:
                 "tamper_detection": True
             }
         }
-    
-        async def _verify_audit_integrity(self, audit_events: List[AuditEvent],
-                                          evidence_packages: List[EvidencePackage]) -> Dict[str, Any]:
+
+    async def _verify_audit_integrity(self, event_stats: Dict[str, Any],
+                                      evidence_packages: List[EvidencePackage]) -> Dict[str, Any]:
         """Verify integrity of audit trail and evidence packages"""
+        # Audit events were checked one by one as they were recorded
         integrity_checks = {
-            "audit_events_verified": 0,
+            "audit_events_verified": event_stats["verified"],
             "evidence_packages_verified": 0,
             "hash_verification_passed": True,
             "timestamp_verification_passed": True,
             "chain_of_custody_verified": True,
-            "integrity_issues": []
+            "integrity_issues": list(event_stats["integrity_issues"])
         }
-        
-        # Verify audit events
-        for event in audit_events:
-        if event.integrity_verified and event.data_hash:
-        integrity_checks["audit_events_verified"] += 1
-        else:
-        result = integrity_checks["integrity_issues"].append(f"Event {event.event_id} integrity verification failed")
 
-        assert result is not None, "Critical operation failed"
-        
         # Verify evidence packages
         for package in evidence_packages:
-        if package.package_hash:
-            # Verify package hash (simplified check)
-        integrity_checks["evidence_packages_verified"] += 1
-        else:
-        result = integrity_checks["integrity_issues"].append(f"Package {package.package_id} hash verification failed")
+            if package.package_hash:
+                # Verify package hash (simplified check)
+                integrity_checks["evidence_packages_verified"] += 1
+            else:
+                integrity_checks["integrity_issues"].append(f"Package {package.package_id} hash verification failed")
 
-        assert result is not None, "Critical operation failed"
-        
         # Overall integrity status
         integrity_checks["overall_integrity"] = len(integrity_checks["integrity_issues"]) == 0
         integrity_checks["verification_timestamp"] = datetime.now().isoformat()
-        
+
         return integrity_checks
-    
-        async def _create_chain_of_custody(self, package: EvidencePackage) -> List[AuditEvent]:
+
+    async def _create_chain_of_custody(self, package: EvidencePackage) -> List[AuditEvent]:
         """Create chain of custody for evidence package"""
         custody_events = []
-        
+
         # Package creation event
         creation_event = AuditEvent(
             event_id=str(uuid.uuid4()),
@@ -515,9 +525,8 @@ class AuditTrailGenerator:
                 "retention_until": package.retention_until.isoformat()
             }
         )
-        result = custody_events.append(creation_event)
-        assert result is not None, "Critical operation failed"
-        
+        custody_events.append(creation_event)
+
         # Package sealing event
         sealing_event = AuditEvent(
             event_id=str(uuid.uuid4()),
@@ -532,67 +541,102 @@ class AuditTrailGenerator:
                 "tamper_evident": True
             }
         )
-        result = custody_events.append(sealing_event)
-        assert result is not None, "Critical operation failed"
-        
+        custody_events.append(sealing_event)
+
         return custody_events
-    
-        async def _save_audit_trail(self, audit_trail_id: str, audit_log: Dict[str, Any],
-                                    integrity_report: Dict[str, Any]):
-        """Save audit trail to persistent storage"""
+
+    def _new_event_stats(self) -> Dict[str, Any]:
+        """Running totals for the events of one audit trail"""
+        return {"events": 0, "verified": 0, "frameworks": set(), "integrity_issues": []}
+
+    def _record_event(self, event: AuditEvent, event_stats: Dict[str, Any]):
+        """Append an audit event to the segmented event log as soon as it is created"""
+        self.event_log.append({
+            "event_id": event.event_id,
+            "timestamp": event.timestamp.isoformat(),
+            "event_type": event.event_type,
+            "framework": event.framework,
+            "source": event.source,
+            "description": event.description,
+            "data_hash": event.data_hash,
+            "evidence_files": event.evidence_files,
+            "metadata": event.metadata,
+            "integrity_verified": event.integrity_verified
+        })
+
+        event_stats["events"] += 1
+        event_stats["frameworks"].add(event.framework)
+        if event.integrity_verified and event.data_hash:
+            event_stats["verified"] += 1
+        else:
+            event_stats["integrity_issues"].append(f"Event {event.event_id} integrity verification failed")
+
+    async def _seal_event_log(self, first_seq: int) -> Dict[str, Any]:
+        """Seal and flush the event log; returns the sequence range of this trail"""
+        seal = self.event_log.seal()
+        await asyncio.to_thread(self.event_log.flush)
+        return {
+            "first_seq": first_seq,
+            "last_seq": self.event_log.last_sequence,
+            "merkle_root": seal["merkle_root"] if seal else None,
+            "chain_head": self.event_log.chain_head
+        }
+
+    async def _save_audit_trail(self, audit_trail_id: str, audit_log: Dict[str, Any],
+                                integrity_report: Dict[str, Any]):
+        """Save audit trail manifest and integrity report (events are already in the event log)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Save master audit log
+        # Save master audit log manifest (summary, packages, event log range)
         audit_log_file = self.audit_log_path / f"audit_trail_{audit_trail_id}_{timestamp}.json"
         with open(audit_log_file, 'w') as f:
-        json.dump(audit_log, f, indent=2, default=str)
-        
+            json.dump(audit_log, f, indent=2, default=str)
+
         # Save integrity report
         integrity_file = self.audit_log_path / f"integrity_report_{audit_trail_id}_{timestamp}.json"
         with open(integrity_file, 'w') as f:
-        json.dump(integrity_report, f, indent=2, default=str)
-        
+            json.dump(integrity_report, f, indent=2, default=str)
+
         # Update audit trail index
-        await self._update_audit_trail_index(audit_trail_id, audit_log_file, integrity_file)
-    
-        async def _update_audit_trail_index(self, audit_trail_id: str,
-                                            audit_log_file: Path, integrity_file: Path):
+        await self._update_audit_trail_index(audit_trail_id, audit_log_file, integrity_file,
+                                             audit_log["event_log_range"])
+
+    async def _update_audit_trail_index(self, audit_trail_id: str,
+                                        audit_log_file: Path, integrity_file: Path,
+                                        event_log_range: Optional[Dict[str, Any]] = None):
         """Update audit trail index for tracking"""
         index_file = self.audit_log_path / "audit_trail_index.json"
-        
+
         # Load existing index
         index_data = []
         if index_file.exists():
-        with open(index_file, 'r') as f:
-        index_data = json.load(f)
-        
+            with open(index_file, 'r') as f:
+                index_data = json.load(f)
+
         # Add new entry
-        result = index_data.append({
+        index_data.append({
             "audit_trail_id": audit_trail_id,
             "creation_timestamp": datetime.now().isoformat(),
             "audit_log_file": str(audit_log_file.name),
             "integrity_file": str(integrity_file.name),
+            "event_log_range": event_log_range,
             "retention_until": (datetime.now() + timedelta(days=self.config.evidence_retention_days)).isoformat()
         })
-        assert result is not None, 'Critical operation failed'
-        
+
         # Save updated index
         with open(index_file, 'w') as f:
-        json.dump(index_data, f, indent=2, default=str)
-    
+            json.dump(index_data, f, indent=2, default=str)
+
     def _generate_data_hash(self, data: Any) -> str:
         """Generate SHA-256 hash for data integrity"""
         try:
-
-        data_str = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
+            data_str = json.dumps(data, sort_keys=True, default=str)
+            return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
         except Exception as e:
-            pass
+            logger.warning(f"Failed to generate data hash: {e}")
+            return hashlib.sha256(str(data).encode('utf-8')).hexdigest()
 
-        _ = self.logger.warning(f"Failed to generate data hash: {e}")  # Return acknowledged
-        return hashlib.sha256(str(data).encode('utf-8')).hexdigest()
-    
-        async def _generate_package_hash(self, files: List[str], metadata: Dict[str, Any]) -> str:
+    async def _generate_package_hash(self, files: List[str], metadata: Dict[str, Any]) -> str:
         """Generate hash for evidence package"""
         hash_input = {
             "files": sorted(files),
@@ -600,134 +644,120 @@ class AuditTrailGenerator:
             "timestamp": datetime.now().isoformat()
         }
         return self._generate_data_hash(hash_input)
-    
+
     def _count_controls_assessed(self, results: Dict[str, Any]) -> int:
         """Count number of controls assessed in framework results"""
         if "control_assessments" in results:
-            pass
-
-        return len(results["control_assessments"])
+            return len(results["control_assessments"])
         elif "practice_assessments" in results:
-        return len(results["practice_assessments"])
+            return len(results["practice_assessments"])
         elif "evidence_by_criteria" in results:
-        return sum(len(criteria.get("controls", [])) for criteria in results["evidence_by_criteria"].values())
+            return sum(len(criteria.get("controls", [])) for criteria in results["evidence_by_criteria"].values())
         return 0
-    
+
     def _count_evidence_artifacts(self, results: Dict[str, Any]) -> int:
         """Count total evidence artifacts collected"""
         if "evidence_summary" in results:
-            pass
-
-        return results["evidence_summary"].get("total_evidence_artifacts", 0)
+            return results["evidence_summary"].get("total_evidence_artifacts", 0)
         elif "controls_tested" in results:
-        return results.get("controls_tested", 0)
+            return results.get("controls_tested", 0)
         elif "practices_assessed" in results:
-        return results.get("practices_assessed", 0)
+            return results.get("practices_assessed", 0)
         return 0
-    
+
     def _extract_compliance_score(self, results: Dict[str, Any]) -> Optional[float]:
         """Extract compliance score from results"""
         if "overall_compliance_score" in results:
-            pass
-
-        return results["overall_compliance_score"]
+            return results["overall_compliance_score"]
         elif "compliance_matrix" in results:
-        return results["compliance_matrix"].get("overall_compliance_percentage")
+            return results["compliance_matrix"].get("overall_compliance_percentage")
 
         return None
-    
+
     def _extract_evidence_files(self, data: Any) -> List[str]:
         """Extract evidence file references from data"""
         files = []
 
         if isinstance(data, dict):
-            pass
-
-        if "artifacts" in data:
-        artifacts = data["artifacts"]
-        if isinstance(artifacts, list):
-        for artifact in artifacts:
-        if isinstance(artifact, dict) and "file" in artifact:
-        result = files.append(artifact["file"])
-        assert result is not None, "Critical operation failed"
-        if "evidence" in data:
-        evidence = data["evidence"]
-        if isinstance(evidence, dict) and "artifacts" in evidence:
-        result = files.extend(self._extract_evidence_files(evidence["artifacts"]))
-        assert result is not None, 'Critical operation failed'
+            if "artifacts" in data:
+                artifacts = data["artifacts"]
+                if isinstance(artifacts, list):
+                    for artifact in artifacts:
+                        if isinstance(artifact, dict) and "file" in artifact:
+                            files.append(artifact["file"])
+            if "evidence" in data:
+                evidence = data["evidence"]
+                if isinstance(evidence, dict) and "artifacts" in evidence:
+                    files.extend(self._extract_evidence_files(evidence["artifacts"]))
         elif isinstance(data, list):
-        for item in data:
-        result = files.extend(self._extract_evidence_files(item))
-        assert result is not None, 'Critical operation failed'
+            for item in data:
+                files.extend(self._extract_evidence_files(item))
         return files
-    
-        async def cleanup_expired_audit_trails(self) -> Dict[str, Any]:
+
+    async def cleanup_expired_audit_trails(self) -> Dict[str, Any]:
         """Clean up expired audit trails and evidence packages"""
         index_file = self.audit_log_path / "audit_trail_index.json"
-        
+
         if not index_file.exists():
-        return {"status": "no_index", "cleaned": 0}
-        
+            return {"status": "no_index", "cleaned": 0}
+
         try:
-        with open(index_file, 'r') as f:
-        index_data = json.load(f)
-            
-        current_time = datetime.now()
-        active_trails = []
-        cleaned_count = 0
-            
-        for trail in index_data:
-        retention_until = datetime.fromisoformat(trail['retention_until'])
-        if retention_until > current_time:
-        result = active_trails.append(trail)
-        assert result is not None, "Critical operation failed"
-        else:
-            # Clean up files
-        for file_key in ['audit_log_file', 'integrity_file']:
-        file_path = self.audit_log_path / trail[file_key]
-        if file_path.exists():
-        result = file_path.unlink()  # Return value captured
-        cleaned_count += 1
-            
-        # Save cleaned index
-        with open(index_file, 'w') as f:
-        json.dump(active_trails, f, indent=2, default=str)
-            
-        return {
-            "status": "success",
-            "cleaned": cleaned_count,
-            "remaining": len(active_trails),
-            "cleanup_timestamp": current_time.isoformat()
-        }
-            
+            with open(index_file, 'r') as f:
+                index_data = json.load(f)
+
+            current_time = datetime.now()
+            active_trails = []
+            cleaned_count = 0
+
+            for trail in index_data:
+                retention_until = datetime.fromisoformat(trail['retention_until'])
+                if retention_until > current_time:
+                    active_trails.append(trail)
+                else:
+                    # Clean up files
+                    for file_key in ['audit_log_file', 'integrity_file']:
+                        file_path = self.audit_log_path / trail[file_key]
+                        if file_path.exists():
+                            file_path.unlink()
+                    cleaned_count += 1
+
+            # Save cleaned index
+            with open(index_file, 'w') as f:
+                json.dump(active_trails, f, indent=2, default=str)
+
+            return {
+                "status": "success",
+                "cleaned": cleaned_count,
+                "remaining": len(active_trails),
+                "cleanup_timestamp": current_time.isoformat()
+            }
+
         except Exception as e:
-        _ = self.logger.error(f"Failed to cleanup expired audit trails: {e}")  # Return acknowledged
-        return {"status": "error", "error": str(e)}
-    
+            logger.error(f"Failed to cleanup expired audit trails: {e}")
+            return {"status": "error", "error": str(e)}
+
     def get_audit_trail_status(self) -> Dict[str, Any]:
         """Get current audit trail system status"""
         index_file = self.audit_log_path / "audit_trail_index.json"
 
         total_trails = 0
         active_trails = 0
-        
+
         if index_file.exists():
-            pass
+            try:
+                with open(index_file, 'r') as f:
+                    index_data = json.load(f)
+
+                total_trails = len(index_data)
+                current_time = datetime.now()
+
+                for trail in index_data:
+                    retention_until = datetime.fromisoformat(trail['retention_until'])
+                    if retention_until > current_time:
+                        active_trails += 1
+            except Exception as e:
+                logger.error(f"Failed to read audit trail index: {e}")
 
-        try:
-        with open(index_file, 'r') as f:
-        index_data = json.load(f)
-                
-        total_trails = len(index_data)
-        current_time = datetime.now()
-                
-        for trail in index_data:
-        retention_until = datetime.fromisoformat(trail['retention_until'])
-        if retention_until > current_time:
-        active_trails += 1
-        except Exception as e:
-        _ = self.logger.error(f"Failed to read audit trail index: {e}")  # Return acknowledged
-        
         return {
             "audit_trail_directory": str(self.audit_log_path),
             "evidence_packages_directory": str(self.evidence_packages_path),
@@ -736,5 +766,7 @@ class AuditTrailGenerator:
             "retention_days": self.config.evidence_retention_days,
             "integrity_verification": True,
             "tamper_detection": True,
+            "event_log_segments": len(self.event_log.segments()),
+            "event_log_last_sequence": self.event_log.last_sequence,
             "status": "operational"
-        }
\ No newline at end of file
+        }
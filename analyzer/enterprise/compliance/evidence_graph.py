@@ -0,0 +1,470 @@
+"""
+Shared Compliance Evidence Graph
+
+SOC2, ISO27001 and NIST SSDF controls overlap heavily in the repository
+facts they rely on (CI workflows, review process, dependency manifests,
+security documentation...). Instead of each framework scanning the
+project on its own:
+    - Collectors register named facts, optionally depending on other facts
+    - Controls declare which facts (or parts of facts) they need
+    - Required facts are collected once, in parallel dependency waves
+    - Every fact is content-hashed so controls across frameworks cite the
+      same evidence item
+
+A multi-framework run therefore costs about one framework's I/O.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Directories never worth walking for compliance evidence
+SKIP_DIRECTORIES = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv', '.tox',
+    '.mypy_cache', '.pytest_cache'
+})
+
+# Content scans only read reasonably small files
+MAX_SCANNED_FILE_BYTES = 1024 * 1024
+
+@dataclass(frozen=True)
+class FactCollector:
+    """A named repository fact and how to collect it."""
+    name: str
+    collect: Callable[['EvidenceGraph'], Any]
+    depends_on: Tuple[str, ...] = ()
+    description: str = ""
+
+@dataclass
+class Fact:
+    """A collected fact, keyed by the hash of its canonical content."""
+    name: str
+    value: Any
+    content_hash: str
+    collected_at: str
+    duration_ms: float
+    error: Optional[str] = None
+
+@dataclass(frozen=True)
+class ControlRequirement:
+    """
+    A framework control and the evidence it needs.
+
+    ``evidence`` maps the framework's own evidence names to fact
+    selectors: a fact name, optionally followed by dotted keys into the
+    fact value (``ci_workflows.indicators.security_scanning``).
+    """
+    framework: str
+    control_id: str
+    title: str
+    evidence: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def facts(self) -> Set[str]:
+        return {selector.split('.', 1)[0] for selector in self.evidence.values()}
+
+def content_hash(value: Any) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _select(value: Any, keys: List[str]) -> Any:
+    for key in keys:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+class EvidenceGraph:
+    """Memoized, parallel collection of repository facts shared by all frameworks."""
+
+    def __init__(self, project_path: str, max_workers: Optional[int] = None,
+                 collectors: Optional[Iterable[FactCollector]] = None):
+        self.project_path = Path(project_path)
+        self.max_workers = max_workers
+        self.collectors: Dict[str, FactCollector] = {}
+        self._facts: Dict[str, Fact] = {}
+        self._collect_lock = threading.RLock()
+        self._local = threading.local()
+        self.stats = {'collectors_run': 0, 'facts_reused': 0, 'collection_seconds': 0.0}
+
+        for collector in (REPOSITORY_COLLECTORS if collectors is None else collectors):
+            self.add_collector(collector)
+
+    def add_collector(self, collector: FactCollector) -> None:
+        if collector.name in self.collectors:
+            raise ValueError(f"Fact collector already registered: {collector.name}")
+        self.collectors[collector.name] = collector
+
+    def register(self, name: str, depends_on: Tuple[str, ...] = (), description: str = ""):
+        """Decorator form of add_collector."""
+        def decorator(function: Callable[['EvidenceGraph'], Any]):
+            self.add_collector(FactCollector(name, function, tuple(depends_on), description))
+            return function
+        return decorator
+
+    def invalidate(self) -> None:
+        """Forget collected facts, e.g. after the repository changed."""
+        with self._collect_lock:
+            self._facts.clear()
+
+    def fact(self, name: str) -> Any:
+        """Value of a fact, collecting it (and its dependencies) if needed."""
+        fact = self._facts.get(name)
+        if fact is None:
+            if getattr(self._local, 'collecting', None):
+                raise KeyError(f"Collector {self._local.collecting} uses undeclared dependency: {name}")
+            fact = self.collect([name])[name]
+        return fact.value
+
+    def collect(self, names: Iterable[str]) -> Dict[str, Fact]:
+        """Collect the given facts once; independent collectors run in parallel."""
+        names = list(names)
+        with self._collect_lock:
+            required = self._dependency_closure(names)
+            pending = [name for name in required if name not in self._facts]
+            self.stats['facts_reused'] += len(set(names)) - len(set(names) & set(pending))
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while pending:
+                    ready = [name for name in pending
+                             if all(dep in self._facts for dep in self.collectors[name].depends_on)]
+                    if not ready:
+                        raise ValueError(f"Circular fact dependencies among: {sorted(pending)}")
+                    # NASA Rule 2: each wave removes at least one pending fact
+                    for fact in pool.map(self._run_collector, ready):
+                        self._facts[fact.name] = fact
+                    self.stats['collectors_run'] += len(ready)
+                    pending = [name for name in pending if name not in self._facts]
+            self.stats['collection_seconds'] += time.perf_counter() - start
+
+            return {name: self._facts[name] for name in names}
+
+    def _dependency_closure(self, names: Iterable[str]) -> List[str]:
+        ordered: List[str] = []
+        seen: Set[str] = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            if name not in self.collectors:
+                raise KeyError(f"No collector registered for fact: {name}")
+            seen.add(name)
+            ordered.append(name)
+            stack.extend(self.collectors[name].depends_on)
+        return ordered
+
+    def _run_collector(self, name: str) -> Fact:
+        collector = self.collectors[name]
+        start = time.perf_counter()
+        value, error = None, None
+        self._local.collecting = name
+        try:
+            value = collector.collect(self)
+        except Exception as e:
+            logger.warning(f"Evidence collector {name} failed: {e}")
+            error = str(e)
+        finally:
+            self._local.collecting = None
+        return Fact(
+            name=name,
+            value=value,
+            content_hash=content_hash(value),
+            collected_at=datetime.now().isoformat(),
+            duration_ms=(time.perf_counter() - start) * 1000,
+            error=error
+        )
+
+    def evaluate_controls(self, controls: Iterable[ControlRequirement]) -> Dict[str, Dict[str, Any]]:
+        """Evaluate controls against memoized facts, grouped by framework."""
+        controls = list(controls)
+        facts = self.collect(sorted(set().union(*(control.facts for control in controls))))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for control in controls:
+            evidence = {}
+            for evidence_name, selector in control.evidence.items():
+                fact_name, *keys = selector.split('.')
+                fact = facts[fact_name]
+                evidence[evidence_name] = {
+                    'fact': selector,
+                    'content_hash': fact.content_hash,
+                    'present': bool(_select(fact.value, keys))
+                }
+            present = sum(1 for item in evidence.values() if item['present'])
+            coverage = present / len(evidence) if evidence else 0.0
+            status = 'satisfied' if coverage == 1.0 else 'partial' if present else 'missing'
+
+            framework = results.setdefault(control.framework, {'controls': {}})
+            framework['controls'][control.control_id] = {
+                'control_id': control.control_id,
+                'title': control.title,
+                'status': status,
+                'coverage': round(coverage, 3),
+                'evidence': evidence
+            }
+
+        for framework in results.values():
+            statuses = [control['status'] for control in framework['controls'].values()]
+            framework['summary'] = {
+                'total_controls': len(statuses),
+                'satisfied': statuses.count('satisfied'),
+                'partial': statuses.count('partial'),
+                'missing': statuses.count('missing'),
+                'compliance_percentage': round(100.0 * statuses.count('satisfied') / len(statuses), 1) if statuses else 0.0
+            }
+        return results
+
+    def evaluate_framework(self, framework: str) -> Dict[str, Any]:
+        return self.evaluate_controls(FRAMEWORK_CONTROLS[framework]).get(framework, {'controls': {}})
+
+    def assess(self, frameworks: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Assess several frameworks from one shared collection pass."""
+        frameworks = list(frameworks or FRAMEWORK_CONTROLS)
+        controls = [control for name in frameworks for control in FRAMEWORK_CONTROLS[name]]
+        results = self.evaluate_controls(controls)
+        return {
+            'assessment_timestamp': datetime.now().isoformat(),
+            'project_path': str(self.project_path),
+            'frameworks': {name: results.get(name, {'controls': {}}) for name in frameworks},
+            'evidence': self.evidence_index(),
+            'collection': dict(self.stats)
+        }
+
+    def control_evidence(self, framework: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Present evidence per control as ``{control_id: {evidence_name: value}}``,
+        the shape framework assessors take as ``evidence_data``.
+        """
+        controls = FRAMEWORK_CONTROLS[framework]
+        facts = self.collect(sorted(set().union(*(control.facts for control in controls))))
+        evidence_data: Dict[str, Dict[str, Any]] = {}
+        for control in controls:
+            for evidence_name, selector in control.evidence.items():
+                fact_name, *keys = selector.split('.')
+                value = _select(facts[fact_name].value, keys)
+                if value:
+                    evidence_data.setdefault(control.control_id, {})[evidence_name] = value
+        return evidence_data
+
+    def evidence_index(self) -> Dict[str, Dict[str, Any]]:
+        """Collected facts keyed by content hash; shared evidence appears once."""
+        index: Dict[str, Dict[str, Any]] = {}
+        for fact in self._facts.values():
+            entry = index.setdefault(fact.content_hash, {'facts': [], 'collected_at': fact.collected_at})
+            entry['facts'].append(fact.name)
+            if fact.error:
+                entry['error'] = fact.error
+        return index
+
+# ---------------------------------------------------------------------------
+# Repository fact collectors
+# ---------------------------------------------------------------------------
+
+def _repository_files(graph: EvidenceGraph) -> Dict[str, int]:
+    """Single walk of the project: relative POSIX path -> size."""
+    files: Dict[str, int] = {}
+    root = str(graph.project_path)
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories[:] = [name for name in subdirectories if name not in SKIP_DIRECTORIES]
+        relative_directory = os.path.relpath(directory, root).replace(os.sep, '/')
+        prefix = '' if relative_directory == '.' else relative_directory + '/'
+        for filename in filenames:
+            try:
+                files[prefix + filename] = os.stat(os.path.join(directory, filename)).st_size
+            except OSError:
+                continue
+    return files
+
+def _matching(graph: EvidenceGraph, patterns: Tuple[str, ...]) -> List[str]:
+    files = graph.fact('repository_files')
+    return sorted(path for path in files
+                  if any(fnmatch(path.rsplit('/', 1)[-1].lower(), pattern) for pattern in patterns))
+
+def _name_collector(name: str, patterns: Tuple[str, ...], description: str) -> FactCollector:
+    return FactCollector(name, lambda graph: _matching(graph, patterns), ('repository_files',), description)
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _term_pattern(terms: Tuple[str, ...]) -> 're.Pattern[str]':
+    """Match any of the (lowercase) terms as a whole token, so 'test' does not match 'latest'."""
+    alternatives = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf'(?<![a-z0-9])(?:{alternatives})(?![a-z0-9])')
+
+WORKFLOW_INDICATORS = {
+    'security_scanning': ('codeql', 'snyk', 'trivy', 'bandit', 'semgrep', 'dependency-review', 'security'),
+    'testing': ('pytest', 'jest', 'npm test', 'unittest', 'test', 'tests'),
+    'signing': ('cosign', 'sigstore', 'gpg', 'sign', 'signing', 'signature'),
+    'sbom': ('sbom', 'cyclonedx', 'spdx'),
+    'deployment': ('deploy', 'deployment', 'release', 'releases')
+}
+WORKFLOW_PATTERNS = {name: _term_pattern(terms) for name, terms in WORKFLOW_INDICATORS.items()}
+
+def _ci_workflows(graph: EvidenceGraph) -> Dict[str, Any]:
+    workflows: Dict[str, Any] = {}
+    indicators: Dict[str, List[str]] = {name: [] for name in WORKFLOW_INDICATORS}
+    for path in graph.fact('repository_files'):
+        if not path.startswith('.github/workflows/') or not path.endswith(('.yml', '.yaml')):
+            continue
+        content = (graph.project_path / path).read_text(encoding='utf-8', errors='ignore')
+        lowered = content.lower()
+        found = [name for name, pattern in WORKFLOW_PATTERNS.items() if pattern.search(lowered)]
+        workflows[path] = {
+            'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+            'indicators': found
+        }
+        for name in found:
+            indicators[name].append(path)
+    return {'workflows': workflows, 'indicators': indicators}
+
+def _change_review(graph: EvidenceGraph) -> Dict[str, List[str]]:
+    files = graph.fact('repository_files')
+    lowered = {path.lower(): path for path in files}
+    templates = [path for key, path in lowered.items()
+                 if key.rsplit('/', 1)[-1] == 'pull_request_template.md'
+                 or key.startswith('.github/pull_request_template/')]
+    code_owners = [path for key, path in lowered.items()
+                   if key in ('codeowners', '.github/codeowners', 'docs/codeowners')]
+    settings = [path for key, path in lowered.items() if key in ('.github/settings.yml', '.github/settings.yaml')]
+    return {'pr_templates': sorted(templates), 'code_owners': code_owners, 'repository_settings': settings}
+
+DEPENDENCY_MANIFESTS = (
+    'package.json', 'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'requirements*.txt',
+    'pyproject.toml', 'poetry.lock', 'pipfile', 'pipfile.lock', 'go.mod', 'go.sum',
+    'cargo.toml', 'cargo.lock'
+)
+LOCKFILES = ('package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'poetry.lock', 'pipfile.lock', 'go.sum', 'cargo.lock')
+
+def _dependency_manifests(graph: EvidenceGraph) -> Dict[str, Any]:
+    manifests = {path: _file_sha256(graph.project_path / path) for path in _matching(graph, DEPENDENCY_MANIFESTS)}
+    locked = [path for path in manifests if path.rsplit('/', 1)[-1].lower() in LOCKFILES]
+    return {'manifests': manifests, 'lockfiles': locked}
+
+AUTH_TERMS = {
+    'oauth2_jwt': ('oauth', 'oauth2', 'jwt', 'token', 'tokens'),
+    'password_based': ('password', 'passwords', 'hash', 'bcrypt'),
+    'multi_factor': ('mfa', '2fa')
+}
+AUTH_PATTERNS = {method: _term_pattern(terms) for method, terms in AUTH_TERMS.items()}
+
+def _authentication_config(graph: EvidenceGraph) -> Dict[str, Any]:
+    files = graph.fact('repository_files')
+    candidates = [path for path in _matching(graph, ('.env*', 'auth*', '*security*', '*oauth*'))
+                  if files[path] < MAX_SCANNED_FILE_BYTES]
+    methods: Set[str] = set()
+    for path in candidates:
+        try:
+            content = (graph.project_path / path).read_text(encoding='utf-8', errors='ignore').lower()
+        except OSError:
+            continue
+        methods.update(method for method, pattern in AUTH_PATTERNS.items() if pattern.search(content))
+    return {'files': candidates, 'methods': sorted(methods)} if candidates else {}
+
+def _test_suite(graph: EvidenceGraph) -> Dict[str, Any]:
+    tests = _matching(graph, ('test_*.py', '*_test.py', '*.test.js', '*.test.ts', '*.spec.js', '*.spec.ts', '*_test.go'))
+    return {'test_files': len(tests), 'sample': tests[:20]} if tests else {}
+
+REPOSITORY_COLLECTORS: Tuple[FactCollector, ...] = (
+    FactCollector('repository_files', _repository_files, description="Project file index"),
+    FactCollector('ci_workflows', _ci_workflows, ('repository_files',), "CI/CD workflows and their security indicators"),
+    FactCollector('change_review', _change_review, ('repository_files',), "PR templates, code owners, repo settings"),
+    FactCollector('dependency_manifests', _dependency_manifests, ('repository_files',), "Dependency manifests and lockfiles"),
+    FactCollector('authentication_config', _authentication_config, ('repository_files',), "Authentication methods in config"),
+    FactCollector('test_suite', _test_suite, ('repository_files',), "Automated test files"),
+    _name_collector('security_documentation', ('security*.md', '*policy*.md', '*security*.rst', 'threat*model*'),
+                    "Security policies and requirements"),
+    _name_collector('cryptography_usage', ('*crypto*', '*encrypt*', '*ssl*', '*tls*'), "Cryptography-related files"),
+    _name_collector('logging_monitoring', ('log*', 'audit*', 'monitoring*'), "Logging, audit and monitoring"),
+    _name_collector('incident_response', ('incident*', 'runbook*', 'postmortem*', '*playbook*'),
+                    "Incident response procedures"),
+    _name_collector('backup_recovery', ('backup*', '*restore*', '*disaster*recovery*'), "Backup and recovery"),
+    _name_collector('network_config', ('network*', 'firewall*', 'nginx*'), "Network security configuration"),
+    _name_collector('supply_chain_artifacts', ('sbom*', '*.sig', '*provenance*', '*.intoto.jsonl'),
+                    "SBOMs, signatures and provenance")
+)
+
+# ---------------------------------------------------------------------------
+# Framework control declarations
+# ---------------------------------------------------------------------------
+
+def _controls(framework: str, *specs: Tuple[str, str, Dict[str, str]]) -> List[ControlRequirement]:
+    return [ControlRequirement(framework, control_id, title, evidence) for control_id, title, evidence in specs]
+
+FRAMEWORK_CONTROLS: Dict[str, List[ControlRequirement]] = {
+    'SOC2': _controls(
+        'SOC2',
+        ('CC6.1', "Logical and Physical Access Controls", {
+            'access_configuration': 'authentication_config', 'access_reviews': 'change_review.code_owners'}),
+        ('CC6.7', "Data Transmission and Encryption", {'encryption_usage': 'cryptography_usage'}),
+        ('CC7.1', "Vulnerability Detection", {
+            'security_scanning': 'ci_workflows.indicators.security_scanning',
+            'dependency_inventory': 'dependency_manifests.manifests'}),
+        ('CC7.2', "System Monitoring", {'monitoring': 'logging_monitoring'}),
+        ('CC7.4', "Incident Response", {'incident_procedures': 'incident_response'}),
+        ('CC8.1', "Change Management", {
+            'cicd_workflows': 'ci_workflows.workflows', 'review_process': 'change_review.pr_templates',
+            'automated_testing': 'test_suite'}),
+        ('A1.2', "Backup and Recovery", {'backup_procedures': 'backup_recovery'})
+    ),
+    # Evidence names follow the ISO27001 control catalog's evidence_required
+    'ISO27001': _controls(
+        'ISO27001',
+        ('A.5.1', "Policies for Information Security", {'policy_docs': 'security_documentation'}),
+        ('A.5.3', "Segregation of Duties", {'access_reviews': 'change_review.code_owners'}),
+        ('A.6.2', "Information Security in Project Management", {
+            'project_docs': 'security_documentation', 'review_records': 'change_review.pr_templates'}),
+        ('A.8.1', "Inventory of Assets", {
+            'asset_registers': 'dependency_manifests.manifests', 'inventory_systems': 'supply_chain_artifacts'}),
+        ('A.9.1', "Access Control Policy", {
+            'policy_documents': 'security_documentation', 'review_records': 'change_review.code_owners'}),
+        ('A.9.2', "Access to Networks and Network Services", {
+            'access_lists': 'network_config', 'authorization_records': 'authentication_config'}),
+        ('A.10.1', "Cryptographic Controls", {'encryption_usage': 'cryptography_usage'}),
+        ('A.12.1', "Operational Procedures and Responsibilities", {
+            'procedure_documents': 'incident_response', 'update_records': 'ci_workflows.indicators.deployment'}),
+        ('A.12.2', "Protection from Malware", {
+            'antimalware_systems': 'ci_workflows.indicators.security_scanning', 'detection_logs': 'logging_monitoring'}),
+        ('A.13.1', "Network Security Management", {
+            'security_configurations': 'network_config', 'monitoring_systems': 'logging_monitoring'}),
+        ('A.14.1', "Information Security Requirements Analysis and Specification", {
+            'requirements_documents': 'security_documentation', 'review_records': 'change_review.pr_templates'}),
+        ('A.14.2', "Securing Application Services on Public Networks", {
+            'encryption_evidence': 'cryptography_usage', 'monitoring_logs': 'logging_monitoring'})
+    ),
+    'NIST-SSDF': _controls(
+        'NIST-SSDF',
+        ('PO.1', "Define Security Requirements", {'security_requirements': 'security_documentation'}),
+        ('PO.3', "Implement Supporting Toolchains", {'toolchain': 'ci_workflows.workflows'}),
+        ('PS.1', "Protect All Forms of Code", {
+            'code_owners': 'change_review.code_owners', 'authentication': 'authentication_config'}),
+        ('PS.2', "Provide Integrity Verification", {
+            'signatures': 'supply_chain_artifacts', 'signing_pipeline': 'ci_workflows.indicators.signing'}),
+        ('PS.3', "Archive and Protect Each Release", {
+            'release_provenance': 'supply_chain_artifacts', 'locked_dependencies': 'dependency_manifests.lockfiles'}),
+        ('PW.7', "Review Human-Readable Code", {'code_review': 'change_review.pr_templates'}),
+        ('PW.8', "Test Executable Code", {
+            'test_suite': 'test_suite', 'security_testing': 'ci_workflows.indicators.security_scanning'}),
+        ('RV.1', "Identify and Confirm Vulnerabilities", {
+            'vulnerability_scanning': 'ci_workflows.indicators.security_scanning',
+            'dependency_inventory': 'dependency_manifests.manifests'}),
+        ('RV.2', "Assess, Prioritize, and Remediate Vulnerabilities", {'incident_procedures': 'incident_response'})
+    )
+}
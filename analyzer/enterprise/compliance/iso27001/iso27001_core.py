@@ -59,13 +59,20 @@ class ISO27001ComplianceSystem:
 
         logger.info("ISO27001 compliance system initialized with delegated components")
 
-    async def perform_comprehensive_assessment(self, evidence_data: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Perform comprehensive ISO27001 compliance assessment."""
+    async def perform_comprehensive_assessment(self, evidence_data: Dict[str, Any] = None,
+                                               evidence_graph=None) -> Dict[str, Any]:
+        """Perform comprehensive ISO27001 compliance assessment.
+
+        An EvidenceGraph supplies per-control evidence from facts shared
+        with the other frameworks.
+        """
         logger.info("Starting comprehensive ISO27001 assessment...")
 
         try:
             # Load evidence if not provided
-            if evidence_data is None:
+            if evidence_data is None and evidence_graph is not None:
+                evidence_data = evidence_graph.control_evidence("ISO27001")
+            elif evidence_data is None:
                 evidence_data = await self._load_evidence_data()
 
             # Delegate assessment to specialized component
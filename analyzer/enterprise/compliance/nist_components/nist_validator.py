@@ -8,9 +8,24 @@ class NISTValidator(NISTFrameworkBase):
         self.controls = {}
         self.results = {}
 
-    def validate_compliance(self, target):
-        """Validate NIST SSDF compliance for target"""
-        return {"status": "validated", "score": 0.95}
+    def validate_compliance(self, target, evidence_graph=None):
+        """Validate NIST SSDF compliance for target
+
+        With an EvidenceGraph, practices are evaluated from its memoized
+        facts instead of scanning the target again.
+        """
+        if evidence_graph is None:
+            return {"status": "validated", "score": 0.95}
+
+        assessment = evidence_graph.evaluate_framework("NIST-SSDF")
+        summary = assessment.get("summary", {})
+        self.controls = assessment["controls"]
+        self.results = {
+            "status": "validated",
+            "score": round(summary.get("compliance_percentage", 0.0) / 100, 3),
+            "practice_assessment": assessment
+        }
+        return self.results
 
     def generate_report(self):
         """Generate compliance report"""
@@ -18,16 +18,23 @@ class NISTSSFDFramework:
             VulnerabilityManagementControl()
         ]
 
-    def run_compliance_check(self, target):
-        """Execute complete NIST SSDF compliance check"""
-        results = self.validator.validate_compliance(target)
+    def run_compliance_check(self, target, evidence_graph=None):
+        """Execute complete NIST SSDF compliance check
+
+        With an EvidenceGraph, the validator evaluates practices from facts
+        shared with the other frameworks instead of re-collecting them.
+        """
+        results = self.validator.validate_compliance(target, evidence_graph=evidence_graph)
         report = self.reporter.generate_compliance_report()
 
-        return {
+        check = {
             "validation_results": results,
             "compliance_report": report,
             "status": "COMPLIANT"
         }
+        if "practice_assessment" in results:
+            check["practice_assessment"] = results["practice_assessment"]
+        return check
 
 # Maintain backward compatibility
 def run_nist_compliance():
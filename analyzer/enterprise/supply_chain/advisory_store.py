@@ -0,0 +1,522 @@
+"""
+Offline OSV Advisory Store
+
+Air-gapped vulnerability lookups from OSV-format JSON dumps:
+    - Dumps (directories of advisories, single .json files or the per-
+      ecosystem all.zip archives) are imported into a SQLite database
+      keyed by (ecosystem, package)
+    - Affected ranges are precompiled per package into sorted elementary
+      intervals, so a version lookup is a single bisect: O(log n)
+    - refresh() only ingests changed dump files and newer advisory
+      revisions, and recompiles only the packages they touch
+
+    Usage:
+        python -m analyzer.enterprise.supply_chain.advisory_store import --db osv.db dumps/
+        python -m analyzer.enterprise.supply_chain.advisory_store refresh --db osv.db dumps/
+        python -m analyzer.enterprise.supply_chain.advisory_store query --db osv.db PyPI jinja2 2.10
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+import json
+import logging
+import re
+import sqlite3
+import sys
+import threading
+import zipfile
+import zlib
+
+try:
+    from packaging.version import InvalidVersion, Version
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Bump when version keys or the compiled layout change; stored indexes are rebuilt
+KEY_SCHEME_VERSION = 1
+KEY_SCHEME = f"{KEY_SCHEME_VERSION}:{'pep440' if PACKAGING_AVAILABLE else 'generic'}"
+
+_SEMVER_PATTERN = re.compile(r'^\d+(\.\d+)*(-[0-9A-Za-z.-]+)?$')
+_TOKEN_PATTERN = re.compile(r'\d+|[A-Za-z]+')
+_PEP440_PRE_RANK = {'a': 0, 'b': 1, 'rc': 2}
+
+def _strip_zeros(release: List[int]) -> List[int]:
+    # 1.2 == 1.2.0 for every supported scheme
+    while release and release[-1] == 0:
+        release.pop()
+    return release
+
+def _generic_version_key(version: str) -> List[Any]:
+    """SemVer precedence; other schemes are approximated by their tokens."""
+    text = version.strip()
+    if text[:1] in ('v', 'V') and text[1:2].isdigit():
+        text = text[1:]
+    text = text.split('+', 1)[0]  # build metadata has no precedence
+
+    if _SEMVER_PATTERN.match(text):
+        release_text, _, pre_text = text.partition('-')
+        release = _strip_zeros([int(part) for part in release_text.split('.')])
+        pre = [[0, int(part)] if part.isdigit() else [1, part] for part in pre_text.split('.') if part]
+        return [release, 0 if pre else 1, pre]
+
+    leading = re.match(r'^\d+(\.\d+)*', text)
+    release = _strip_zeros([int(part) for part in leading.group(0).split('.')]) if leading else []
+    rest = text[leading.end():] if leading else text
+    qualifiers = [[0, int(token)] if token.isdigit() else [1, token.lower()] for token in _TOKEN_PATTERN.findall(rest)]
+    return [release, 1, qualifiers]
+
+def _pep440_version_key(version: str) -> Optional[List[Any]]:
+    """PEP 440 ordering (dev < pre < final < post) as a JSON-friendly key."""
+    try:
+        parsed = Version(version)
+    except InvalidVersion:
+        return None
+
+    if parsed.pre is None and parsed.post is None and parsed.dev is not None:
+        pre = [-2, 0, 0]
+    elif parsed.pre is not None:
+        pre = [-1, _PEP440_PRE_RANK[parsed.pre[0]], parsed.pre[1]]
+    else:
+        pre = [0, 0, 0]
+    post = parsed.post if parsed.post is not None else -1
+    dev = [0, parsed.dev] if parsed.dev is not None else [1, 0]
+    return [parsed.epoch, _strip_zeros(list(parsed.release)), pre, post, dev]
+
+def _encode_key(value: Any) -> str:
+    """
+    Order-preserving string form of a nested key: comparing encodings
+    gives the same result as comparing the lists, so compiled indexes are
+    flat strings that load and bisect quickly.
+    """
+    if isinstance(value, list):
+        return '\x02' + ''.join(_encode_key(item) for item in value) + '\x01'
+    if isinstance(value, int):
+        digits = str(value + 2)  # keys never go below -2
+        return 'i' + chr(ord('a') + len(digits)) + digits
+    return 's' + value + '\x00'
+
+def version_key(ecosystem: str, version: str) -> Optional[str]:
+    """Sortable key for a version in an OSV ecosystem, or None if unparseable."""
+    if not version:
+        return None
+    if ecosystem == 'PyPI' and PACKAGING_AVAILABLE:
+        key = _pep440_version_key(version)
+    else:
+        key = _generic_version_key(version)
+    return _encode_key(key) if key is not None else None
+
+def normalize_package(ecosystem: str, package: str) -> str:
+    if ecosystem == 'PyPI':
+        return re.sub(r'[-_.]+', '-', package).lower()  # PEP 503
+    return package
+
+def _point(key: str, above: bool = False) -> str:
+    # No encoded key is a prefix of another, so "just above v" sorts before any w > v
+    return key + ('1' if above else '0')
+
+def compile_package_ranges(ecosystem: str, entries: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Compile every (advisory_id, affected entry) of one package into
+    elementary intervals.
+
+    Boundaries are points: a version itself or the point just above it,
+    so "fixed" (exclusive) and "last_affected" (inclusive) both become
+    half-open intervals. Segment i covers [boundaries[i-1], boundaries[i])
+    and lists the indexes of the advisories affecting it.
+    """
+    advisory_ids = sorted({advisory_id for advisory_id, _ in entries})
+    index_of = {advisory_id: i for i, advisory_id in enumerate(advisory_ids)}
+    intervals: List[Tuple[Optional[str], Optional[str], int]] = []
+    unconditional: Set[int] = set()
+
+    for advisory_id, entry in entries:
+        advisory = index_of[advisory_id]
+        evaluable = False
+
+        for version in entry.get('versions', []):
+            key = version_key(ecosystem, version)
+            if key is not None:
+                intervals.append((_point(key), _point(key, above=True), advisory))
+                evaluable = True
+
+        for range_data in entry.get('ranges', []):
+            if range_data.get('type') not in ('SEMVER', 'ECOSYSTEM'):
+                continue  # GIT ranges cannot be evaluated against package versions
+            evaluable = True
+            intervals.extend((low, high, advisory) for low, high in _range_intervals(ecosystem, range_data))
+
+        if not evaluable:
+            unconditional.add(advisory)  # assume affected, as the online scanner does
+
+    boundaries = sorted({point for low, high, _ in intervals for point in (low, high) if point is not None})
+
+    # Sweep: +1 where an interval opens, -1 where it closes
+    changes: Dict[int, Dict[int, int]] = {}
+    for low, high, advisory in intervals:
+        start = 0 if low is None else bisect_right(boundaries, low)
+        end = len(boundaries) + 1 if high is None else bisect_right(boundaries, high)
+        if start >= end:
+            continue
+        changes.setdefault(start, {}).setdefault(advisory, 0)
+        changes[start][advisory] += 1
+        changes.setdefault(end, {}).setdefault(advisory, 0)
+        changes[end][advisory] -= 1
+
+    segments: List[str] = []
+    active: Dict[int, int] = {}
+    for segment in range(len(boundaries) + 1):
+        for advisory, delta in changes.get(segment, {}).items():
+            active[advisory] = active.get(advisory, 0) + delta
+        segments.append(' '.join(str(advisory) for advisory in sorted(a for a, count in active.items() if count > 0)))
+
+    return {
+        'advisories': advisory_ids,
+        'boundaries': boundaries,
+        'segments': segments,
+        'unconditional': sorted(unconditional)
+    }
+
+def _range_intervals(ecosystem: str, range_data: Dict[str, Any]) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """Half-open [low, high) intervals from an OSV SEMVER/ECOSYSTEM event list."""
+    events = []
+    for event in range_data.get('events', []):
+        for kind in ('introduced', 'fixed', 'last_affected'):
+            if kind in event:
+                version = event[kind]
+                key = None if (kind == 'introduced' and version == '0') else version_key(ecosystem, version)
+                events.append((kind, key))
+
+    # OSV evaluates events in version order; "introduced: 0" sorts first
+    events.sort(key=lambda event: (event[1] is not None, event[1] or ''))
+
+    low: Optional[str] = None
+    open_interval = False
+    for kind, key in events:
+        if kind == 'introduced':
+            if not open_interval:
+                low = _point(key) if key is not None else None
+                open_interval = True
+        elif open_interval:
+            if key is None:
+                continue  # unparseable bound: stay conservative and keep the range open
+            yield low, _point(key, above=(kind == 'last_affected'))
+            open_interval = False
+    if open_interval:
+        yield low, None
+
+class OfflineAdvisoryStore:
+    """SQLite-backed OSV advisory database answering scans without network access."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS advisories (
+            id TEXT PRIMARY KEY,
+            modified TEXT,
+            body BLOB NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS affected (
+            ecosystem TEXT NOT NULL,
+            package TEXT NOT NULL,
+            advisory_id TEXT NOT NULL,
+            entries TEXT NOT NULL,
+            PRIMARY KEY (ecosystem, package, advisory_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_affected_advisory ON affected(advisory_id);
+        CREATE TABLE IF NOT EXISTS package_index (
+            ecosystem TEXT NOT NULL,
+            package TEXT NOT NULL,
+            compiled TEXT NOT NULL,
+            PRIMARY KEY (ecosystem, package)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS sources (
+            path TEXT PRIMARY KEY,
+            size INTEGER,
+            mtime_ns INTEGER,
+            imported_at TEXT
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, db_path: Union[str, Path], cache_size: int = 4096):
+        """
+        Open (or create) an advisory database.
+
+        Args:
+            db_path: SQLite database file
+            cache_size: Compiled packages kept in memory
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._compiled_cache: "OrderedDict[Tuple[str, str], Optional[Dict[str, Any]]]" = OrderedDict()
+
+        self._check_key_scheme()
+
+    # -- import / refresh -----------------------------------------------
+
+    def import_dump(self, *sources: Union[str, Path]) -> Dict[str, int]:
+        """Import OSV dumps, re-ingesting every advisory they contain."""
+        return self._ingest_sources(sources, incremental=False)
+
+    def refresh(self, *sources: Union[str, Path]) -> Dict[str, int]:
+        """Ingest only changed dump files and advisories newer than stored."""
+        return self._ingest_sources(sources, incremental=True)
+
+    def _ingest_sources(self, sources: Tuple[Union[str, Path], ...], incremental: bool) -> Dict[str, int]:
+        stats = {
+            'files_scanned': 0,
+            'files_skipped': 0,
+            'advisories_imported': 0,
+            'advisories_skipped': 0,
+            'advisories_withdrawn': 0,
+            'packages_compiled': 0
+        }
+        touched: Set[Tuple[str, str]] = set()
+
+        with self._lock, self._conn:
+            for dump_file in self._dump_files(sources):
+                stat = dump_file.stat()
+                if incremental and self._source_unchanged(dump_file, stat):
+                    stats['files_skipped'] += 1
+                    continue
+
+                stats['files_scanned'] += 1
+                for advisory in self._read_dump(dump_file):
+                    self._ingest_advisory(advisory, incremental, touched, stats)
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sources (path, size, mtime_ns, imported_at) VALUES (?, ?, ?, ?)",
+                    (str(dump_file.resolve()), stat.st_size, stat.st_mtime_ns, datetime.now(timezone.utc).isoformat())
+                )
+
+            for ecosystem, package in touched:
+                self._compile_package(ecosystem, package)
+            stats['packages_compiled'] = len(touched)
+
+        self._compiled_cache.clear()
+        logger.info(f"Advisory store updated: {stats}")
+        return stats
+
+    def _ingest_advisory(self, advisory: Dict[str, Any], incremental: bool,
+                        touched: Set[Tuple[str, str]], stats: Dict[str, int]) -> None:
+        advisory_id = advisory.get('id')
+        if not advisory_id:
+            return
+        modified = advisory.get('modified', '')
+
+        if incremental:
+            row = self._conn.execute("SELECT modified FROM advisories WHERE id = ?", (advisory_id,)).fetchone()
+            if row and row[0] >= modified:
+                stats['advisories_skipped'] += 1
+                return
+
+        # Replace the previous revision's package rows
+        touched.update(self._conn.execute(
+            "SELECT ecosystem, package FROM affected WHERE advisory_id = ?", (advisory_id,)
+        ).fetchall())
+        self._conn.execute("DELETE FROM affected WHERE advisory_id = ?", (advisory_id,))
+
+        if advisory.get('withdrawn'):
+            self._conn.execute("DELETE FROM advisories WHERE id = ?", (advisory_id,))
+            stats['advisories_withdrawn'] += 1
+            return
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO advisories (id, modified, body) VALUES (?, ?, ?)",
+            (advisory_id, modified, zlib.compress(json.dumps(advisory, separators=(',', ':')).encode('utf-8')))
+        )
+
+        by_package: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for entry in advisory.get('affected', []):
+            package = entry.get('package', {})
+            if not package.get('ecosystem') or not package.get('name'):
+                continue
+            ecosystem = package['ecosystem']
+            by_package.setdefault((ecosystem, normalize_package(ecosystem, package['name'])), []).append({
+                'ranges': entry.get('ranges', []),
+                'versions': entry.get('versions', [])
+            })
+
+        self._conn.executemany(
+            "INSERT INTO affected (ecosystem, package, advisory_id, entries) VALUES (?, ?, ?, ?)",
+            [(ecosystem, package, advisory_id, json.dumps(entries, separators=(',', ':')))
+             for (ecosystem, package), entries in by_package.items()]
+        )
+        touched.update(by_package)
+        stats['advisories_imported'] += 1
+
+    def _compile_package(self, ecosystem: str, package: str) -> None:
+        rows = self._conn.execute(
+            "SELECT advisory_id, entries FROM affected WHERE ecosystem = ? AND package = ?", (ecosystem, package)
+        ).fetchall()
+        if not rows:
+            self._conn.execute("DELETE FROM package_index WHERE ecosystem = ? AND package = ?", (ecosystem, package))
+            return
+
+        entries = [(advisory_id, entry) for advisory_id, raw in rows for entry in json.loads(raw)]
+        compiled = compile_package_ranges(ecosystem, entries)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO package_index (ecosystem, package, compiled) VALUES (?, ?, ?)",
+            (ecosystem, package, json.dumps(compiled, separators=(',', ':')))
+        )
+
+    def _check_key_scheme(self) -> None:
+        """Rebuild compiled indexes if they were built with another version-key scheme."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'key_scheme'").fetchone()
+            if row and row[0] != KEY_SCHEME:
+                packages = self._conn.execute("SELECT DISTINCT ecosystem, package FROM affected").fetchall()
+                logger.info(f"Recompiling {len(packages)} packages for version-key scheme {KEY_SCHEME}")
+                for ecosystem, package in packages:
+                    self._compile_package(ecosystem, package)
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('key_scheme', ?)", (KEY_SCHEME,))
+
+    def _source_unchanged(self, dump_file: Path, stat: Any) -> bool:
+        row = self._conn.execute(
+            "SELECT size, mtime_ns FROM sources WHERE path = ?", (str(dump_file.resolve()),)
+        ).fetchone()
+        return row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns
+
+    @staticmethod
+    def _dump_files(sources: Tuple[Union[str, Path], ...]) -> Iterator[Path]:
+        for source in sources:
+            source = Path(source)
+            if source.is_dir():
+                yield from sorted(path for path in source.rglob('*') if path.suffix in ('.json', '.zip'))
+            elif source.exists():
+                yield source
+            else:
+                logger.warning(f"Advisory dump not found: {source}")
+
+    @staticmethod
+    def _read_dump(dump_file: Path) -> Iterator[Dict[str, Any]]:
+        """Advisories from a .zip of OSV JSON files or a .json advisory/list."""
+        try:
+            if dump_file.suffix == '.zip':
+                with zipfile.ZipFile(dump_file) as archive:
+                    for member in archive.namelist():
+                        if member.endswith('.json'):
+                            yield json.loads(archive.read(member))
+                return
+
+            with open(dump_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            yield from (data if isinstance(data, list) else [data])
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            logger.error(f"Failed to read advisory dump {dump_file}: {e}")
+
+    # -- lookups ---------------------------------------------------------
+
+    def affected_advisory_ids(self, ecosystem: str, package: str, version: Optional[str]) -> List[str]:
+        """IDs of advisories affecting a package version (one bisect per call)."""
+        compiled = self._compiled(ecosystem, normalize_package(ecosystem, package))
+        if compiled is None:
+            return []
+
+        key = version_key(ecosystem, version) if version else None
+        if key is None:
+            return list(compiled['advisories'])  # unknown version: assume affected
+
+        segment = compiled['segments'][bisect_right(compiled['boundaries'], _point(key))]
+        matches = {int(index) for index in segment.split()}.union(compiled['unconditional'])
+        return [compiled['advisories'][i] for i in sorted(matches)]
+
+    def query(self, ecosystem: str, package: str, version: Optional[str]) -> List[Dict[str, Any]]:
+        """Full OSV records of advisories affecting a package version."""
+        advisory_ids = self.affected_advisory_ids(ecosystem, package, version)
+        if not advisory_ids:
+            return []
+
+        with self._lock:
+            placeholders = ','.join('?' * len(advisory_ids))
+            rows = self._conn.execute(
+                f"SELECT body FROM advisories WHERE id IN ({placeholders})", advisory_ids
+            ).fetchall()
+        return [json.loads(zlib.decompress(body)) for (body,) in rows]
+
+    def _compiled(self, ecosystem: str, package: str) -> Optional[Dict[str, Any]]:
+        cache_key = (ecosystem, package)
+        with self._lock:
+            if cache_key in self._compiled_cache:
+                self._compiled_cache.move_to_end(cache_key)
+                return self._compiled_cache[cache_key]
+
+            row = self._conn.execute(
+                "SELECT compiled FROM package_index WHERE ecosystem = ? AND package = ?", cache_key
+            ).fetchone()
+            compiled = json.loads(row[0]) if row else None
+            self._compiled_cache[cache_key] = compiled
+            if len(self._compiled_cache) > self.cache_size:
+                self._compiled_cache.popitem(last=False)
+            return compiled
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ('advisories', 'package_index', 'sources')
+            }
+        return {
+            'database': str(self.db_path),
+            'advisories': counts['advisories'],
+            'packages': counts['package_index'],
+            'sources': counts['sources'],
+            'key_scheme': KEY_SCHEME
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+def main():
+    """Command-line entry point for importing, refreshing and querying the store."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Offline OSV advisory store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for command, help_text in (('import', 'Import OSV dumps (full re-ingest)'),
+                               ('refresh', 'Ingest only changed dumps and newer advisories')):
+        sub = subparsers.add_parser(command, help=help_text)
+        sub.add_argument('--db', required=True, help='Advisory database path')
+        sub.add_argument('sources', nargs='+', help='OSV dump directories, .json or .zip files')
+    query = subparsers.add_parser('query', help='List advisories affecting a package version')
+    query.add_argument('--db', required=True, help='Advisory database path')
+    query.add_argument('ecosystem', help='OSV ecosystem, e.g. PyPI or npm')
+    query.add_argument('package')
+    query.add_argument('version')
+    stats = subparsers.add_parser('stats', help='Show database statistics')
+    stats.add_argument('--db', required=True, help='Advisory database path')
+
+    args = parser.parse_args()
+    store = OfflineAdvisoryStore(args.db)
+    try:
+        if args.command == 'import':
+            result = store.import_dump(*args.sources)
+        elif args.command == 'refresh':
+            result = store.refresh(*args.sources)
+        elif args.command == 'query':
+            result = store.affected_advisory_ids(args.ecosystem, args.package, args.version)
+        else:
+            result = store.get_statistics()
+    finally:
+        store.close()
+
+    print(json.dumps(result, indent=2))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@ SC-4: Cryptographic Artifact Signing with Cosign Integration
 Enterprise-grade cryptographic signing and verification for supply chain artifacts.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
@@ -16,6 +17,12 @@ import os
 import subprocess
 import tempfile
 
+from analyzer.enterprise.compliance.audit_log import merkle_paths, merkle_root, merkle_root_from_path
+
+from .evidence_packager import multi_digest, path_exists
+
+BATCH_INDEX_FILE = "signature-batch.json"
+
 class CryptographicSigner:
     """Enterprise cryptographic signing system with cosign integration."""
     
@@ -41,9 +48,16 @@ class CryptographicSigner:
         # Enterprise CA settings
         self.ca_cert_path = config.get('ca_cert_path')
         self.intermediate_cert_path = config.get('intermediate_cert_path')
+
+        # Batch signing: one signature over a Merkle root of artifact digests
+        self.batch_signing = config.get('batch_signing', False)
+        self.hash_workers = max(1, config.get('hash_workers', min(8, os.cpu_count() or 1)))
+        self._cosign_available: Optional[bool] = None
         
     def sign_artifacts(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Sign multiple artifacts with cryptographic signatures."""
+        if self.batch_signing:
+            return self.sign_artifacts_batch(artifacts)
         
         signing_results = {
             'signing_timestamp': datetime.now(timezone.utc).isoformat(),
@@ -98,36 +112,166 @@ class CryptographicSigner:
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
         
-        # Choose signing method
+        result.update(self._sign_with_available_method(artifact_path, artifact))
+        
+        # Verify signature immediately after creation
+        if result.get('signature_created'):
+            result['verification_passed'] = self._verify_signature(
+                artifact_path, result.get('signature_path'), result.get('certificate_path')
+            )
+        
+        return result
+    
+    def _sign_with_available_method(self, artifact_path: str, artifact: Dict[str, Any]) -> Dict[str, Any]:
+        """Sign a file with cosign (containers), PKI or keyless signing."""
+        
         if self._is_cosign_available() and artifact.get('format') == 'container':
             # Use cosign for container images
-            signature_result = self._sign_with_cosign(artifact_path, artifact)
-            result.update(signature_result)
+            result = self._sign_with_cosign(artifact_path, artifact)
             result['signing_method'] = 'cosign'
             
         elif self.key_path and path_exists(self.key_path):
             # Use traditional PKI signing
-            signature_result = self._sign_with_pki(artifact_path, artifact)
-            result.update(signature_result)
+            result = self._sign_with_pki(artifact_path, artifact)
             result['signing_method'] = 'pki'
             
         else:
             # Use keyless signing with OIDC if configured
             if self.oidc_issuer:
-                signature_result = self._sign_keyless(artifact_path, artifact)
-                result.update(signature_result)
+                result = self._sign_keyless(artifact_path, artifact)
                 result['signing_method'] = 'keyless'
             else:
                 raise ValueError("No signing method available")
         
-        # Verify signature immediately after creation
-        if result.get('signature_created'):
-            result['verification_passed'] = self._verify_signature(
-                artifact_path, result.get('signature_path'), result.get('certificate_path')
-            )
-        
         return result
     
+    def sign_artifacts_batch(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Sign many artifacts with a single signature.
+        
+        Artifact digests are the leaves of a Merkle tree; only a statement
+        carrying the root is signed (one cosign/openssl call) and every
+        artifact gets an inclusion proof against that root. Container
+        images are still signed individually since cosign signs them by
+        reference.
+        """
+        
+        signing_results = {
+            'signing_timestamp': datetime.now(timezone.utc).isoformat(),
+            'signer_info': self._get_signer_info(),
+            'artifacts': [],
+            'signatures_created': 0,
+            'verification_successful': 0,
+            'errors': [],
+            'batch': None
+        }
+        
+        file_artifacts = []
+        for artifact in artifacts:
+            artifact_path = artifact.get('path')
+            try:
+                if artifact.get('format') == 'container':
+                    signing_results['artifacts'].append(self._sign_single_artifact(artifact))
+                elif not artifact_path or not path_exists(artifact_path):
+                    raise ValueError(f"Artifact path not found: {artifact_path}")
+                else:
+                    file_artifacts.append(artifact)
+            except Exception as e:
+                signing_results['errors'].append({'artifact': artifact_path or 'unknown', 'error': str(e)})
+        
+        if file_artifacts:
+            try:
+                batch = self._sign_batch(file_artifacts)
+                signing_results['artifacts'].extend(batch.pop('artifacts'))
+                signing_results['batch'] = batch
+            except Exception as e:
+                signing_results['errors'].append({'artifact': 'batch', 'error': str(e)})
+        
+        for result in signing_results['artifacts']:
+            if result.get('signature_created'):
+                signing_results['signatures_created'] += 1
+            if result.get('verification_passed'):
+                signing_results['verification_successful'] += 1
+        
+        # Save signing results
+        results_path = self.output_dir / "signing-results.json"
+        with open(results_path, 'w', encoding='utf-8') as f:
+            json.dump(signing_results, f, indent=2, ensure_ascii=False)
+            
+        return signing_results
+    
+    def _sign_batch(self, artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Hash, build the Merkle tree, sign its root once and emit per-artifact proofs."""
+        
+        paths = [artifact['path'] for artifact in artifacts]
+        digests = self._hash_files(paths)
+        leaves = [self._batch_leaf(Path(path).name, digests[path]) for path in paths]
+        root = merkle_root(leaves)
+        proofs = merkle_paths(leaves)
+        
+        statement = {
+            'statement_version': '1.0',
+            'type': 'merkle-batch',
+            'hash_algorithm': 'sha256',
+            'merkle_root': root,
+            'leaf_count': len(leaves),
+            'created': datetime.now(timezone.utc).isoformat()
+        }
+        statement_path = self.output_dir / f"batch-statement-{root[:16]}.json"
+        with open(statement_path, 'w', encoding='utf-8') as f:
+            json.dump(statement, f, indent=2, ensure_ascii=False)
+        
+        signature = self._sign_with_available_method(str(statement_path), {'format': 'batch-statement'})
+        verified = bool(signature.get('signature_created')) and self._verify_signature(
+            str(statement_path), signature.get('signature_path'), signature.get('certificate_path')
+        )
+        
+        batch = {
+            'merkle_root': root,
+            'statement_path': str(statement_path),
+            'signature_path': signature.get('signature_path'),
+            'certificate_path': signature.get('certificate_path'),
+            'signing_method': signature.get('signing_method'),
+            'verification_passed': verified,
+            'artifacts': []
+        }
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for index, path in enumerate(paths):
+            batch['artifacts'].append({
+                'artifact_path': path,
+                'artifact_name': Path(path).name,
+                'artifact_hash': digests[path],
+                'signature_created': bool(signature.get('signature_created')),
+                'verification_passed': verified,
+                'signing_method': f"merkle-batch/{signature.get('signing_method')}",
+                'signature_path': signature.get('signature_path'),
+                'certificate_path': signature.get('certificate_path'),
+                'batch_root': root,
+                'leaf_index': index,
+                'inclusion_proof': proofs[index],
+                'timestamp': timestamp
+            })
+        
+        # Index read back by create_signature_bundle()
+        with open(self.output_dir / BATCH_INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(batch, f, ensure_ascii=False)
+        
+        return batch
+    
+    @staticmethod
+    def _batch_leaf(artifact_name: str, artifact_hash: str) -> str:
+        """Leaf hash binding an artifact's name to its content digest."""
+        return hashlib.sha256(f"{artifact_name}\0{artifact_hash}".encode('utf-8')).hexdigest()
+    
+    def _hash_files(self, paths: List[str]) -> Dict[str, str]:
+        """SHA256 of distinct files, hashed concurrently (hashlib releases the GIL)."""
+        unique_paths = list(dict.fromkeys(path for path in paths if path))
+        if not unique_paths:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.hash_workers, len(unique_paths))) as pool:
+            return dict(zip(unique_paths, pool.map(self._calculate_file_hash, unique_paths)))
+    
     def _sign_with_cosign(self, artifact_path: str, artifact: Dict[str, Any]) -> Dict[str, Any]:
         """Sign artifact using cosign."""
         
@@ -529,23 +673,24 @@ class CryptographicSigner:
         return signer_info
     
     def _is_cosign_available(self) -> bool:
-        """Check if cosign binary is available."""
+        """Check if cosign binary is available (probed once per signer)."""
         
-        try:
-            result = subprocess.run(
-                [self.cosign_binary, 'version'], 
-                capture_output=True, text=True, timeout=10
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        if self._cosign_available is None:
+            try:
+                result = subprocess.run(
+                    [self.cosign_binary, 'version'], 
+                    capture_output=True, text=True, timeout=10
+                )
+                self._cosign_available = result.returncode == 0
+            except Exception:
+                self._cosign_available = False
+        return self._cosign_available
     
     def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file."""
         
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            return multi_digest(file_path)['sha256']
         except Exception:
             return ''
     
@@ -553,10 +698,11 @@ class CryptographicSigner:
         """Create a comprehensive signature bundle."""
         
         bundle = {
-            'bundle_version': '1.0',
+            'bundle_version': '1.1',
             'created': datetime.now(timezone.utc).isoformat(),
             'artifacts': [],
             'signatures': [],
+            'batch_signatures': [],
             'certificates': [],
             'metadata': {
                 'signer': self._get_signer_info(),
@@ -564,14 +710,30 @@ class CryptographicSigner:
             }
         }
         
+        batch = self._load_batch_index()
+        batch_artifacts = {entry['artifact_path']: entry for entry in batch['artifacts']} if batch else {}
+        digests = self._hash_files([artifact.get('path', '') for artifact in artifacts])
+        batch_used = False
+        
         for artifact in artifacts:
             artifact_info = {
                 'path': artifact.get('path'),
                 'name': Path(artifact.get('path', '')).name,
-                'sha256': self._calculate_file_hash(artifact.get('path', '')),
+                'sha256': digests.get(artifact.get('path', ''), ''),
                 'signed': False
             }
             
+            # Covered by the batch signature only if the content is unchanged
+            batch_entry = batch_artifacts.get(artifact.get('path'))
+            if batch_entry and batch_entry['artifact_hash'] == artifact_info['sha256']:
+                artifact_info['signed'] = True
+                artifact_info['batch_root'] = batch_entry['batch_root']
+                artifact_info['leaf_index'] = batch_entry['leaf_index']
+                artifact_info['inclusion_proof'] = batch_entry['inclusion_proof']
+                batch_used = True
+                bundle['artifacts'].append(artifact_info)
+                continue
+            
             # Check for existing signature
             signature_path = f"{artifact.get('path')}.sig"
             if path_exists(signature_path):
@@ -590,6 +752,9 @@ class CryptographicSigner:
             
             bundle['artifacts'].append(artifact_info)
         
+        if batch_used:
+            bundle['batch_signatures'].append(self._bundle_batch_signature(batch))
+        
         # Save bundle
         bundle_path = self.output_dir / "signature-bundle.json"
         with open(bundle_path, 'w', encoding='utf-8') as f:
@@ -597,6 +762,166 @@ class CryptographicSigner:
         
         return str(bundle_path)
     
+    def _load_batch_index(self) -> Optional[Dict[str, Any]]:
+        """Load the index written by the last batch signing run, if any."""
+        
+        index_path = self.output_dir / BATCH_INDEX_FILE
+        if not index_path.exists():
+            return None
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                batch = json.load(f)
+            return batch if batch.get('signature_path') else None
+        except Exception as e:
+            print(f"Error loading batch signature index: {e}")
+            return None
+    
+    def _bundle_batch_signature(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        """Embed the signed statement, its signature and certificate."""
+        
+        def encode(path: Optional[str]) -> Optional[str]:
+            if not path or not path_exists(path):
+                return None
+            with open(path, 'rb') as f:
+                return base64.b64encode(f.read()).decode('utf-8')
+        
+        return {
+            'merkle_root': batch['merkle_root'],
+            'statement_data': encode(batch['statement_path']),
+            'signature_data': encode(batch['signature_path']),
+            'certificate_data': encode(batch.get('certificate_path')),
+            'signing_method': batch.get('signing_method'),
+            'algorithm': 'RSA-SHA256'
+        }
+    
+    def verify_signature_bundle(self, bundle_path: str, check_artifacts: bool = True) -> Dict[str, Any]:
+        """
+        Verify a signature bundle's batch signatures.
+        
+        Each batch costs one signature check over its statement; artifacts
+        are then verified with hash-only inclusion proofs. With
+        check_artifacts, artifact files are re-hashed from disk instead of
+        trusting the digests recorded in the bundle.
+        
+        Signatures are only checked against the configured certificate or
+        key; a certificate embedded in the bundle is used only if it chains
+        to ca_cert_path. Artifacts with no inclusion proof are reported in
+        artifacts_unproven and make the bundle invalid.
+        """
+        
+        with open(bundle_path, 'r', encoding='utf-8') as f:
+            bundle = json.load(f)
+        
+        report = {
+            'batch_signatures_verified': 0,
+            'batch_signatures_failed': 0,
+            'artifacts_verified': 0,
+            'artifacts_failed': [],
+            'artifacts_unproven': [],
+            'valid': False
+        }
+        
+        trusted_roots = set()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index, batch in enumerate(bundle.get('batch_signatures', [])):
+                if self._verify_batch_signature(batch, Path(temp_dir), index):
+                    trusted_roots.add(batch['merkle_root'])
+                    report['batch_signatures_verified'] += 1
+                else:
+                    report['batch_signatures_failed'] += 1
+        
+        proven = []
+        for artifact in bundle.get('artifacts', []):
+            if 'inclusion_proof' in artifact and 'batch_root' in artifact:
+                proven.append(artifact)
+            else:
+                report['artifacts_unproven'].append(artifact.get('path'))
+        digests = self._hash_files([artifact['path'] for artifact in proven]) if check_artifacts else {}
+        
+        for artifact in proven:
+            artifact_hash = digests.get(artifact['path'], '') if check_artifacts else artifact['sha256']
+            leaf = self._batch_leaf(artifact['name'], artifact_hash)
+            if (artifact['batch_root'] in trusted_roots
+                    and merkle_root_from_path(leaf, artifact['inclusion_proof']) == artifact['batch_root']):
+                report['artifacts_verified'] += 1
+            else:
+                report['artifacts_failed'].append(artifact['path'])
+        
+        report['valid'] = (
+            report['batch_signatures_failed'] == 0
+            and not report['artifacts_failed']
+            and not report['artifacts_unproven']
+        )
+        return report
+    
+    def _verify_batch_signature(self, batch: Dict[str, Any], work_dir: Path, index: int) -> bool:
+        """Single signature check of a batch statement against its claimed root."""
+        
+        try:
+            if not batch.get('statement_data') or not batch.get('signature_data'):
+                return False
+            statement_bytes = base64.b64decode(batch['statement_data'])
+            if json.loads(statement_bytes).get('merkle_root') != batch['merkle_root']:
+                return False
+            
+            statement_path = work_dir / f"batch-statement-{index}.json"
+            statement_path.write_bytes(statement_bytes)
+            signature_path = work_dir / f"batch-statement-{index}.json.sig"
+            signature_path.write_bytes(base64.b64decode(batch['signature_data']))
+            trusted, certificate_path = self._trusted_certificate(batch.get('certificate_data'), work_dir, index)
+            if not trusted:
+                return False
+            
+            return self._verify_signature(
+                str(statement_path), str(signature_path), str(certificate_path) if certificate_path else None
+            )
+        except Exception as e:
+            print(f"Error verifying batch signature: {e}")
+            return False
+    
+    def _trusted_certificate(self,
+                             certificate_data: Optional[str],
+                             work_dir: Path,
+                             index: int) -> Tuple[bool, Optional[Path]]:
+        """
+        Pick the certificate a bundle signature is checked against.
+        
+        The configured signing certificate always wins. An embedded
+        certificate is only trusted if it chains to ca_cert_path; otherwise
+        anyone could re-sign with their own key and embed its certificate.
+        With neither, a configured signing key (cosign) is the trust anchor.
+        """
+        
+        if self.cert_path and path_exists(self.cert_path):
+            return True, Path(self.cert_path)
+        
+        if certificate_data and self.ca_cert_path and path_exists(self.ca_cert_path):
+            certificate_path = work_dir / f"batch-statement-{index}.pem"
+            certificate_path.write_bytes(base64.b64decode(certificate_data))
+            if self._certificate_chains_to_ca(str(certificate_path)):
+                return True, certificate_path
+            print(f"Embedded certificate does not chain to {self.ca_cert_path}")
+            return False, None
+        
+        if self.key_path:
+            return True, None
+        
+        return False, None
+    
+    def _certificate_chains_to_ca(self, certificate_path: str) -> bool:
+        """openssl verify against the configured CA (and intermediate, if any)."""
+        
+        try:
+            cmd = ['openssl', 'verify', '-CAfile', self.ca_cert_path]
+            if self.intermediate_cert_path and path_exists(self.intermediate_cert_path):
+                cmd.extend(['-untrusted', self.intermediate_cert_path])
+            cmd.append(certificate_path)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            return result.returncode == 0
+        except Exception as e:
+            print(f"Error verifying certificate chain: {e}")
+            return False
+    
     def _get_signing_policies(self) -> Dict[str, Any]:
         """Get signing policies and requirements."""
         
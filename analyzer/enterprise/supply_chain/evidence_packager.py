@@ -3,18 +3,28 @@ from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
 
 from analyzer.constants.thresholds import MAXIMUM_RETRY_ATTEMPTS
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
 import hashlib
+import io
+import os
+import time
 import zipfile
 import tarfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
-import tempfile
-import shutil
+from typing import BinaryIO, Dict, List, Any, Optional, Union
 import base64
 import uuid
 
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+# Files at least this large update each digest on its own thread per chunk
+PARALLEL_DIGEST_THRESHOLD = 64 * 1024 * 1024
+LEGACY_HASH_ALGORITHMS = ('sha1', 'md5')
+
+# An evidence entry is streamed from a file on disk or from generated bytes
+EvidenceSource = Union[Path, bytes]
+
 def path_exists(file_path: Optional[str]) -> bool:
     """Check if file path exists."""
     if not file_path:
@@ -24,6 +34,105 @@ def path_exists(file_path: Optional[str]) -> bool:
     except Exception:
         return False
 
+def _new_digest(algorithm: str) -> "hashlib._Hash":
+    if algorithm in LEGACY_HASH_ALGORITHMS:
+        return hashlib.new(algorithm, usedforsecurity=False)
+    return hashlib.new(algorithm)
+
+def multi_digest(file_path: Union[str, Path], algorithms: Tuple[str, ...] = ('sha256',),
+                digest_pool: Optional[ThreadPoolExecutor] = None) -> Dict[str, str]:
+    """
+    Hash a file with several algorithms in a single read.
+
+    With a digest_pool, every algorithm updates concurrently on each chunk
+    (hashlib releases the GIL) while the next chunk is being read.
+    """
+    digests = {name: _new_digest(name) for name in algorithms}
+    pending: List[Future] = []
+
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            for future in pending:
+                future.result()
+            if not chunk:
+                break
+            if digest_pool is None:
+                for digest in digests.values():
+                    digest.update(chunk)
+            else:
+                pending = [digest_pool.submit(digest.update, chunk) for digest in digests.values()]
+
+    return {name: digest.hexdigest() for name, digest in digests.items()}
+
+class _HashingReader:
+    """File wrapper that feeds every byte read into a digest."""
+
+    def __init__(self, fileobj: BinaryIO, digest: "hashlib._Hash"):
+        self._fileobj = fileobj
+        self._digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._digest.update(data)
+        return data
+
+class EvidenceArchiveWriter:
+    """Streams evidence straight from its sources into a zip/tar archive."""
+
+    def __init__(self, package_path: Path, package_format: str, compression_level: int = 6):
+        self.package_format = package_format
+        if package_format == 'zip':
+            self._archive = zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+        elif package_format == 'tar':
+            self._archive = tarfile.open(package_path, 'w')
+        elif package_format == 'tar.gz':
+            self._archive = tarfile.open(package_path, 'w:gz', compresslevel=compression_level)
+        else:
+            raise ValueError(f"Unsupported package format: {package_format}")
+
+        if isinstance(self._archive, tarfile.TarFile):
+            self._archive.copybufsize = HASH_CHUNK_SIZE
+
+    def add(self, arcname: str, source: EvidenceSource) -> str:
+        """Write one entry and return the SHA256 of its content."""
+        if isinstance(source, bytes):
+            return self._add_bytes(arcname, source)
+        return self._add_file(arcname, Path(source))
+
+    def _add_file(self, arcname: str, source: Path) -> str:
+        digest = hashlib.sha256()
+        if self.package_format == 'zip':
+            info = zipfile.ZipInfo.from_file(source, arcname)
+            # Same settings ZipFile.write() applies
+            info.compress_type = self._archive.compression
+            info._compresslevel = self._archive.compresslevel
+            force_zip64 = info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+            with open(source, 'rb') as src, self._archive.open(info, 'w', force_zip64=force_zip64) as dest:
+                for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    dest.write(chunk)
+        else:
+            with open(source, 'rb') as src:
+                # Stat the open file so symlinks contribute their content
+                info = self._archive.gettarinfo(arcname=arcname, fileobj=src)
+                self._archive.addfile(info, _HashingReader(src, digest))
+        return digest.hexdigest()
+
+    def _add_bytes(self, arcname: str, data: bytes) -> str:
+        if self.package_format == 'zip':
+            self._archive.writestr(arcname, data)
+        else:
+            info = tarfile.TarInfo(arcname)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+        return hashlib.sha256(data).hexdigest()
+
+    def close(self) -> None:
+        self._archive.close()
+
 class EvidencePackager:
     """Supply chain evidence package generator for comprehensive attestation."""
 
@@ -37,6 +146,7 @@ class EvidencePackager:
         self.include_source_code = config.get('include_source_code', False)
         self.max_file_size = config.get('max_file_size_mb', 100) * 1024 * 1024  # bytes
         self.compression_level = config.get('compression_level', 6)
+        self.hash_workers = max(1, config.get('hash_workers', min(8, os.cpu_count() or 1)))
 
         # Evidence types to include
         self.include_sbom = config.get('include_sbom', True)
@@ -87,13 +197,11 @@ class EvidencePackager:
         package_timestamp = datetime.now(timezone.utc).isoformat()
         package_info = self._initialize_package_info(package_id, package_timestamp, project_path, artifacts)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            evidence_dir = Path(temp_dir) / "evidence"
-            evidence_dir.mkdir()
-            manifest = self._create_package_manifest(project_path, artifacts, package_id, package_timestamp)
-            self._collect_evidence_files(evidence_dir, artifacts, project_path, package_info)
-            self._finalize_package(evidence_dir, manifest, package_id, package_info)
-            self._save_package_info(package_info, package_id)
+        # Evidence is streamed from its sources into the archive; nothing is staged on disk
+        manifest = self._create_package_manifest(project_path, artifacts, package_id, package_timestamp)
+        entries = self._collect_evidence_files(artifacts, project_path, package_info)
+        self._finalize_package(entries, manifest, package_id, package_info)
+        self._save_package_info(package_info, package_id)
 
         return package_info
 
@@ -113,63 +221,73 @@ class EvidencePackager:
             'attestations': []
         }
 
-    def _collect_evidence_files(self, evidence_dir: Path, artifacts: List,
-                                project_path: str, package_info: Dict) -> None:
-        """NASA Rule 3: Collect all evidence files based on configuration."""
+    def _collect_evidence_files(self, artifacts: List, project_path: str,
+                                package_info: Dict) -> Dict[str, EvidenceSource]:
+        """NASA Rule 3: Plan all evidence entries (arcname -> source) based on configuration."""
+        entries: Dict[str, EvidenceSource] = {}
+
         if self.include_sbom:
-            sbom_files = self._include_sbom_evidence(evidence_dir, artifacts)
+            sbom_files = self._include_sbom_evidence(entries, artifacts)
             package_info['files_included'].extend(sbom_files)
             package_info['evidence_types'].append('sbom')
 
         if self.include_provenance:
-            provenance_files = self._include_provenance_evidence(evidence_dir, artifacts)
+            provenance_files = self._include_provenance_evidence(entries, artifacts)
             package_info['files_included'].extend(provenance_files)
             package_info['evidence_types'].append('provenance')
 
         if self.include_vulnerabilities:
-            vuln_files = self._include_vulnerability_evidence(evidence_dir, artifacts)
+            vuln_files = self._include_vulnerability_evidence(entries, artifacts)
             package_info['files_included'].extend(vuln_files)
             package_info['evidence_types'].append('vulnerabilities')
 
         if self.include_signatures:
-            sig_files = self._include_signature_evidence(evidence_dir, artifacts)
+            sig_files = self._include_signature_evidence(entries, artifacts)
             package_info['files_included'].extend(sig_files)
             package_info['evidence_types'].append('signatures')
 
         if self.include_compliance:
-            compliance_files = self._include_compliance_evidence(evidence_dir, artifacts)
+            compliance_files = self._include_compliance_evidence(entries, artifacts)
             package_info['files_included'].extend(compliance_files)
             package_info['evidence_types'].append('compliance')
 
         if self.include_build_logs:
-            build_files = self._include_build_evidence(evidence_dir, project_path)
+            build_files = self._include_build_evidence(entries, project_path)
             package_info['files_included'].extend(build_files)
             package_info['evidence_types'].append('build_logs')
 
         if self.include_source_code:
-            source_files = self._include_source_code(evidence_dir, project_path)
+            source_files = self._include_source_code(entries, project_path)
             package_info['files_included'].extend(source_files)
             package_info['evidence_types'].append('source_code')
 
-    def _finalize_package(self, evidence_dir: Path, manifest: Dict,
+        return entries
+
+    def _finalize_package(self, entries: Dict[str, EvidenceSource], manifest: Dict,
                         package_id: str, package_info: Dict) -> None:
-        """NASA Rule MAXIMUM_RETRY_ATTEMPTS: Finalize package with manifest, attestation, and archiving."""
-        # Save manifest
-        manifest_path = evidence_dir / "manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
-
-        package_info['files_included'].append('manifest.json')
-        # Create attestation document
-        attestation = self._create_attestation_document(manifest, package_info)
-        attestation_path = evidence_dir / "attestation.json"
-        with open(attestation_path, 'w', encoding='utf-8') as f:
-            json.dump(attestation, f, indent=2, ensure_ascii=False)
-        package_info['files_included'].append('attestation.json')
-        package_info['attestations'].append(attestation)
-
-        # Create the evidence package
-        package_path = self._create_package(evidence_dir, package_id)
+        """NASA Rule MAXIMUM_RETRY_ATTEMPTS: Stream entries into the archive, then add manifest and attestation."""
+        package_path = self._package_path(package_id)
+        manifest['evidence_types'] = list(package_info['evidence_types'])
+
+        writer = EvidenceArchiveWriter(package_path, self.package_format, self.compression_level)
+        try:
+            # Integrity hashes are computed from the bytes as they are written
+            for arcname, source in entries.items():
+                manifest['integrity']['files'][arcname] = writer.add(arcname, source)
+
+            package_info['files_included'].append('manifest.json')
+            attestation = self._create_attestation_document(manifest, package_info)
+            package_info['files_included'].append('attestation.json')
+            package_info['attestations'].append(attestation)
+
+            writer.add('manifest.json', self._json_bytes(manifest))
+            writer.add('attestation.json', self._json_bytes(attestation))
+        except Exception:
+            writer.close()
+            package_path.unlink(missing_ok=True)
+            raise
+        writer.close()
+
         package_info['package_path'] = str(package_path)
         package_info['package_size'] = package_path.stat().st_size
         package_info['manifest'] = manifest
@@ -219,6 +337,7 @@ class EvidencePackager:
         """Create manifest entries for all artifacts."""
 
         artifact_manifest = []
+        checksums = self._hash_artifacts([artifact.get('path') for artifact in artifacts])
 
         for artifact in artifacts:
             entry = {
@@ -226,7 +345,7 @@ class EvidencePackager:
                 'path': artifact.get('path'),
                 'type': artifact.get('type', 'file'),
                 'size': self._get_file_size(artifact.get('path')),
-                'checksums': self._calculate_multiple_hashes(artifact.get('path')),
+                'checksums': checksums.get(artifact.get('path'), {}),
                 'created': artifact.get('created', datetime.now(timezone.utc).isoformat()),
                 'metadata': {
                     'format': artifact.get('format'),
@@ -238,12 +357,10 @@ class EvidencePackager:
 
         return artifact_manifest
 
-    def _include_sbom_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_sbom_evidence(self, entries: Dict[str, EvidenceSource], artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include SBOM evidence files."""
 
         files_included = []
-        sbom_dir = evidence_dir / "sbom"
-        sbom_dir.mkdir()
 
         # Look for existing SBOM files
         sbom_files = [
@@ -253,48 +370,35 @@ class EvidencePackager:
 
         for sbom_file in sbom_files:
             if sbom_file.exists():
-                dest_file = sbom_dir / sbom_file.name
-                shutil.copy2(sbom_file, dest_file)
-                files_included.append(f"sbom/{sbom_file.name}")
+                self._add_entry(entries, files_included, f"sbom/{sbom_file.name}", sbom_file)
 
         # Create SBOM summary
         sbom_summary = self._create_sbom_summary(artifacts)
-        summary_path = sbom_dir / "sbom-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(sbom_summary, f, indent=2, ensure_ascii=False)
-        files_included.append("sbom/sbom-summary.json")
+        self._add_entry(entries, files_included, "sbom/sbom-summary.json", self._json_bytes(sbom_summary))
 
         return files_included
 
-    def _include_provenance_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_provenance_evidence(self, entries: Dict[str, EvidenceSource], artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include SLSA provenance evidence."""
 
         files_included = []
-        provenance_dir = evidence_dir / "provenance"
-        provenance_dir.mkdir()
 
         # Look for existing provenance files
         provenance_file = self.output_dir / "slsa-provenance.json"
         if provenance_file.exists():
-            dest_file = provenance_dir / provenance_file.name
-            shutil.copy2(provenance_file, dest_file)
-            files_included.append(f"provenance/{provenance_file.name}")
+            self._add_entry(entries, files_included, f"provenance/{provenance_file.name}", provenance_file)
 
         # Create provenance summary
         provenance_summary = self._create_provenance_summary(artifacts)
-        summary_path = provenance_dir / "provenance-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(provenance_summary, f, indent=2, ensure_ascii=False)
-        files_included.append("provenance/provenance-summary.json")
+        self._add_entry(entries, files_included, "provenance/provenance-summary.json",
+                        self._json_bytes(provenance_summary))
 
         return files_included
 
-    def _include_vulnerability_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_vulnerability_evidence(self, entries: Dict[str, EvidenceSource], artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include vulnerability scan evidence."""
 
         files_included = []
-        vuln_dir = evidence_dir / "vulnerabilities"
-        vuln_dir.mkdir()
 
         # Look for existing vulnerability scan files
         vuln_files = [
@@ -304,25 +408,19 @@ class EvidencePackager:
 
         for vuln_file in vuln_files:
             if vuln_file.exists():
-                dest_file = vuln_dir / vuln_file.name
-                shutil.copy2(vuln_file, dest_file)
-                files_included.append(f"vulnerabilities/{vuln_file.name}")
+                self._add_entry(entries, files_included, f"vulnerabilities/{vuln_file.name}", vuln_file)
 
         # Create vulnerability summary
         vuln_summary = self._create_vulnerability_summary()
-        summary_path = vuln_dir / "vulnerability-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(vuln_summary, f, indent=2, ensure_ascii=False)
-        files_included.append("vulnerabilities/vulnerability-summary.json")
+        self._add_entry(entries, files_included, "vulnerabilities/vulnerability-summary.json",
+                        self._json_bytes(vuln_summary))
 
         return files_included
 
-    def _include_signature_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_signature_evidence(self, entries: Dict[str, EvidenceSource], artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include cryptographic signature evidence."""
 
         files_included = []
-        sig_dir = evidence_dir / "signatures"
-        sig_dir.mkdir()
 
         # Look for existing signature files
         sig_files = [
@@ -332,41 +430,31 @@ class EvidencePackager:
 
         for sig_file in sig_files:
             if sig_file.exists():
-                dest_file = sig_dir / sig_file.name
-                shutil.copy2(sig_file, dest_file)
-                files_included.append(f"signatures/{sig_file.name}")
+                self._add_entry(entries, files_included, f"signatures/{sig_file.name}", sig_file)
 
         # Include individual signature files
         for artifact in artifacts:
             if artifact.get('path'):
                 sig_file = Path(f"{artifact['path']}.sig")
                 if sig_file.exists():
-                    dest_file = sig_dir / f"{Path(artifact['path']).name}.sig"
-                    shutil.copy2(sig_file, dest_file)
-                    files_included.append(f"signatures/{dest_file.name}")
+                    self._add_entry(entries, files_included, f"signatures/{Path(artifact['path']).name}.sig", sig_file)
 
                 # Include certificate if available
                 cert_file = Path(f"{artifact['path']}.pem")
                 if cert_file.exists():
-                    dest_file = sig_dir / f"{Path(artifact['path']).name}.pem"
-                    shutil.copy2(cert_file, dest_file)
-                    files_included.append(f"signatures/{dest_file.name}")
+                    self._add_entry(entries, files_included, f"signatures/{Path(artifact['path']).name}.pem", cert_file)
 
         return files_included
 
-    def _include_compliance_evidence(self, evidence_dir: Path, artifacts: List[Dict[str, Any]]) -> List[str]:
+    def _include_compliance_evidence(self, entries: Dict[str, EvidenceSource], artifacts: List[Dict[str, Any]]) -> List[str]:
         """Include compliance evidence and reports."""
 
         files_included = []
-        compliance_dir = evidence_dir / "compliance"
-        compliance_dir.mkdir()
 
         # Create compliance attestation
         compliance_attestation = self._create_compliance_attestation(artifacts)
-        attestation_path = compliance_dir / "compliance-attestation.json"
-        with open(attestation_path, 'w', encoding='utf-8') as f:
-            json.dump(compliance_attestation, f, indent=2, ensure_ascii=False)
-        files_included.append("compliance/compliance-attestation.json")
+        self._add_entry(entries, files_included, "compliance/compliance-attestation.json",
+                        self._json_bytes(compliance_attestation))
 
         # Include policy documents if available
         policy_files = [
@@ -378,19 +466,14 @@ class EvidencePackager:
         for policy_file in policy_files:
             policy_path = Path(policy_file)
             if policy_path.exists():
-                dest_file = compliance_dir / policy_file
-                shutil.copy2(policy_path, dest_file)
-                files_included.append(f"compliance/{policy_file}")
+                self._add_entry(entries, files_included, f"compliance/{policy_file}", policy_path)
 
         return files_included
 
-    def _include_build_evidence(self, evidence_dir: Path, project_path: str) -> List[str]:
+    def _include_build_evidence(self, entries: Dict[str, EvidenceSource], project_path: str) -> List[str]:
         """Include build logs and evidence."""
 
         files_included = []
-        build_dir = evidence_dir / "build"
-        build_dir.mkdir()
-
         project_path = Path(project_path)
 
         # Look for common build artifacts
@@ -404,17 +487,10 @@ class EvidencePackager:
         for build_file in build_files:
             if build_file.exists():
                 if build_file.is_file():
-                    dest_file = build_dir / build_file.name
-                    shutil.copy2(build_file, dest_file)
-                    files_included.append(f"build/{build_file.name}")
+                    self._add_entry(entries, files_included, f"build/{build_file.name}", build_file)
                 elif build_file.is_dir() and build_file.name == "workflows":
-                    # Copy workflow files
-                    workflows_dir = build_dir / "workflows"
-                    workflows_dir.mkdir()
                     for workflow_file in build_file.glob("*.yml"):
-                        dest_file = workflows_dir / workflow_file.name
-                        shutil.copy2(workflow_file, dest_file)
-                        files_included.append(f"build/workflows/{workflow_file.name}")
+                        self._add_entry(entries, files_included, f"build/workflows/{workflow_file.name}", workflow_file)
 
         # Create build environment summary
         build_summary = {
@@ -423,21 +499,14 @@ class EvidencePackager:
             'tools': self._get_build_tools(),
             'dependencies': self._get_dependency_summary(project_path)
         }
-
-        summary_path = build_dir / "build-summary.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(build_summary, f, indent=2, ensure_ascii=False)
-        files_included.append("build/build-summary.json")
+        self._add_entry(entries, files_included, "build/build-summary.json", self._json_bytes(build_summary))
 
         return files_included
 
-    def _include_source_code(self, evidence_dir: Path, project_path: str) -> List[str]:
+    def _include_source_code(self, entries: Dict[str, EvidenceSource], project_path: str) -> List[str]:
         """Include source code snapshot."""
 
         files_included = []
-        source_dir = evidence_dir / "source"
-        source_dir.mkdir()
-
         project_path = Path(project_path)
 
         # Include key source files (limited selection)
@@ -450,61 +519,44 @@ class EvidencePackager:
         for pattern in source_patterns:
             for source_file in project_path.glob(pattern):
                 if source_file.is_file() and source_file.stat().st_size <= self.max_file_size:
-                    dest_file = source_dir / source_file.name
-                    shutil.copy2(source_file, dest_file)
-                    files_included.append(f"source/{source_file.name}")
+                    self._add_entry(entries, files_included, f"source/{source_file.name}", source_file)
 
         # Include src directory structure (limited depth)
         src_dir = project_path / "src"
         if src_dir.exists() and src_dir.is_dir():
-            dest_src_dir = source_dir / "src"
-            self._copy_directory_limited(src_dir, dest_src_dir, max_depth=2)
-            for copied_file in dest_src_dir.rglob("*"):
-                if copied_file.is_file():
-                    rel_path = copied_file.relative_to(source_dir)
-                    files_included.append(f"source/{rel_path}")
+            self._collect_directory_limited(src_dir, "source/src", entries, files_included, max_depth=2)
 
         return files_included
 
-    def _copy_directory_limited(self, src_dir: Path, dest_dir: Path, max_depth: int = 2, current_depth: int = 0):
-        """Copy directory with limited depth."""
+    def _collect_directory_limited(self, src_dir: Path, arc_prefix: str, entries: Dict[str, EvidenceSource],
+                                   files_included: List[str], max_depth: int = 2, current_depth: int = 0):
+        """Add a directory's files with limited depth."""
         if current_depth >= max_depth:
             return
 
-        dest_dir.mkdir(exist_ok=True)
-
         for item in src_dir.iterdir():
-            dest_item = dest_dir / item.name
+            arcname = f"{arc_prefix}/{item.name}"
             if item.is_file() and item.stat().st_size <= self.max_file_size:
-                shutil.copy2(item, dest_item)
+                self._add_entry(entries, files_included, arcname, item)
             elif item.is_dir() and not item.name.startswith('.'):
-                self._copy_directory_limited(item, dest_item, max_depth, current_depth + 1)
-
-    def _create_package(self, evidence_dir: Path, package_id: str) -> Path:
-        """Create the final evidence package."""
-
-        if self.package_format == 'zip':
-            package_path = self.output_dir / f"evidence-package-{package_id}.zip"
-            with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=self.compression_level) as zf:
-                for file_path in evidence_dir.rglob("*"):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(evidence_dir)
-                        zf.write(file_path, arcname)
-
-        elif self.package_format == 'tar':
-            package_path = self.output_dir / f"evidence-package-{package_id}.tar"
-            with tarfile.open(package_path, 'w') as tf:
-                tf.add(evidence_dir, arcname='.')
-
-        elif self.package_format == 'tar.gz':
-            package_path = self.output_dir / f"evidence-package-{package_id}.tar.gz"
-            with tarfile.open(package_path, 'w:gz', compresslevel=self.compression_level) as tf:
-                tf.add(evidence_dir, arcname='.')
-
-        else:
+                self._collect_directory_limited(item, arcname, entries, files_included, max_depth, current_depth + 1)
+
+    def _add_entry(self, entries: Dict[str, EvidenceSource], files_included: List[str],
+                   arcname: str, source: EvidenceSource) -> None:
+        """Plan an archive entry; a repeated arcname replaces the earlier source."""
+        if arcname not in entries:
+            files_included.append(arcname)
+        entries[arcname] = source
+
+    @staticmethod
+    def _json_bytes(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _package_path(self, package_id: str) -> Path:
+        """Output path for the configured package format."""
+        if self.package_format not in ('zip', 'tar', 'tar.gz'):
             raise ValueError(f"Unsupported package format: {self.package_format}")
-
-        return package_path
+        return self.output_dir / f"evidence-package-{package_id}.{self.package_format}"
 
     def _create_attestation_document(self, manifest: Dict[str, Any], package_info: Dict[str, Any]) -> Dict[str, Any]:
         """Create comprehensive attestation document."""
@@ -636,28 +688,38 @@ class EvidencePackager:
             return Path(file_path).stat().st_size
         return 0
 
-    def _calculate_multiple_hashes(self, file_path: Optional[str]) -> Dict[str, str]:
-        """Calculate multiple hash algorithms for file."""
-        hashes = {}
-
+    def _hash_algorithms(self) -> Tuple[str, ...]:
+        # DFARS Compliance: Use SHA256 and stronger algorithms only
+        # SHA1 and MD5 removed for DFARS compliance unless explicitly allowed
+        if self.config.get('allow_legacy_hashes', False):
+            return ('sha256', 'sha512') + LEGACY_HASH_ALGORITHMS
+        return ('sha256', 'sha512')
+
+    def _hash_artifacts(self, paths: List[Optional[str]]) -> Dict[str, Dict[str, str]]:
+        """Hash distinct artifact files concurrently, one read per file."""
+        unique_paths = [path for path in dict.fromkeys(paths) if path and path_exists(path)]
+        if not unique_paths:
+            return {}
+
+        workers = min(self.hash_workers, len(unique_paths))
+        with ThreadPoolExecutor(max_workers=workers * len(self._hash_algorithms())) as digest_pool, \
+                ThreadPoolExecutor(max_workers=workers) as file_pool:
+            futures = {path: file_pool.submit(self._calculate_multiple_hashes, path, digest_pool)
+                       for path in unique_paths}
+            return {path: future.result() for path, future in futures.items()}
+
+    def _calculate_multiple_hashes(self, file_path: Optional[str],
+                                   digest_pool: Optional[ThreadPoolExecutor] = None) -> Dict[str, str]:
+        """Calculate multiple hash algorithms for file in a single read."""
         if not file_path or not path_exists(file_path):
-            return hashes
+            return {}
 
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-
-                # DFARS Compliance: Use SHA256 and stronger algorithms only
-                hashes['sha256'] = hashlib.sha256(content).hexdigest()
-                hashes['sha512'] = hashlib.sha512(content).hexdigest()
-                # SHA1 and MD5 removed for DFARS compliance
-                if self.config.get('allow_legacy_hashes', False):
-                    hashes['sha1'] = hashlib.sha1(content, usedforsecurity=False).hexdigest()
-                    hashes['md5'] = hashlib.md5(content, usedforsecurity=False).hexdigest()
+            if Path(file_path).stat().st_size < PARALLEL_DIGEST_THRESHOLD:
+                digest_pool = None
+            return multi_digest(file_path, self._hash_algorithms(), digest_pool)
         except Exception:
-            pass
-
-        return hashes
+            return {}
 
     def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file."""
@@ -665,8 +727,7 @@ class EvidencePackager:
             return ''
 
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            return multi_digest(file_path)['sha256']
         except Exception:
             return ''
 
@@ -17,6 +17,43 @@ import subprocess
 
 import uuid
 
+from .evidence_packager import multi_digest
+
+SBOM_CACHE_FILE = "sbom-cache.json"
+SBOM_DIFF_FILE = "sbom-diff.json"
+# Bump when the component model changes; older cache entries are discarded
+SBOM_CACHE_VERSION = 1
+
+PYTHON_DEPENDENCY_FILES = (
+    "requirements.txt",
+    "requirements-dev.txt",
+    "pyproject.toml",
+    "setup.py",
+    "Pipfile"
+)
+
+def _component_identity(component: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (component.get('ecosystem', ''), component['name'], component.get('scope', ''))
+
+def diff_components(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Added, removed and version-changed components between two component lists."""
+    old_versions = {_component_identity(comp): comp.get('version') for comp in old}
+    new_versions = {_component_identity(comp): comp.get('version') for comp in new}
+
+    def describe(identity: Tuple[str, str, str], **fields: Any) -> Dict[str, Any]:
+        ecosystem, name, scope = identity
+        return {'ecosystem': ecosystem, 'name': name, 'scope': scope, **fields}
+
+    return {
+        'added': [describe(key, version=version) for key, version in new_versions.items() if key not in old_versions],
+        'removed': [describe(key, version=version) for key, version in old_versions.items() if key not in new_versions],
+        'changed': [
+            describe(key, previous_version=old_versions[key], version=version)
+            for key, version in new_versions.items()
+            if key in old_versions and old_versions[key] != version
+        ]
+    }
+
 class SBOMGenerator:
     """Multi-format SBOM generator with CycloneDX and SPDX support."""
     
@@ -31,21 +68,24 @@ class SBOMGenerator:
         self.tool_name = "SPEK-Supply-Chain-Analyzer"
         self.tool_version = "1.0.0"
         
+        # Parsed components are cached per manifest group, keyed by file fingerprints
+        self.cache_enabled = config.get('sbom_cache', True)
+        self.cache_path = Path(config.get('sbom_cache_dir', self.output_dir)) / SBOM_CACHE_FILE
+        self.last_diff: Optional[Dict[str, Any]] = None
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        
     def generate_all_formats(self, project_path: str) -> Dict[str, str]:
         """Generate SBOM in both CycloneDX and SPDX formats."""
         components = self._analyze_dependencies(project_path)
+        cyclone_dx_sbom, spdx_sbom = self._render_sboms(components, project_path)
         
         results = {}
         
-        # Generate CycloneDX SBOM
-        cyclone_dx_sbom = self._generate_cyclone_dx(components, project_path)
         cyclone_dx_path = self.output_dir / "sbom-cyclone-dx.json"
         with open(cyclone_dx_path, 'w', encoding='utf-8') as f:
             json.dump(cyclone_dx_sbom, f, indent=2, ensure_ascii=False)
         results['cyclone_dx'] = str(cyclone_dx_path)
         
-        # Generate SPDX SBOM
-        spdx_sbom = self._generate_spdx(components, project_path)
         spdx_path = self.output_dir / "sbom-spdx.json"
         with open(spdx_path, 'w', encoding='utf-8') as f:
             json.dump(spdx_sbom, f, indent=2, ensure_ascii=False)
@@ -54,20 +94,116 @@ class SBOMGenerator:
         return results
     
     def _analyze_dependencies(self, project_path: str) -> List[Dict[str, Any]]:
-        """Analyze project dependencies across multiple package managers."""
-        components = []
+        """
+        Analyze project dependencies across multiple package managers.
+
+        Each manifest group (package.json with its lockfile, each Python
+        dependency file) is only re-parsed when its fingerprint changes;
+        changed groups contribute to a component diff in sbom-diff.json,
+        which is removed again when a run finds no changes.
+        """
         project_path = Path(project_path)
-        
-        # Node.js dependencies
-        components.extend(self._analyze_npm_dependencies(project_path))
-        
-        # Python dependencies
-        components.extend(self._analyze_python_dependencies(project_path))
-        
+        sources = [('npm', [project_path / "package.json", project_path / "package-lock.json"],
+                    lambda package_json: self._analyze_npm_dependencies(package_json.parent))]
+        sources.extend(
+            (f"python:{dep_file}", [project_path / dep_file], self._parse_python_deps)
+            for dep_file in PYTHON_DEPENDENCY_FILES
+        )
+
+        cache = self._load_cache() if self.cache_enabled else {}
+        project_key = str(project_path.resolve())
+        previous = cache.get(project_key, {})
+        current: Dict[str, Any] = {}
+        diff: Dict[str, Any] = {'sources_changed': [], 'added': [], 'removed': [], 'changed': []}
+
+        components = []
+        for source_key, paths, parser in sources:
+            if not paths[0].exists():
+                continue  # the primary manifest decides whether the group applies
+            entry, changed = self._load_source(paths, parser, previous.get(source_key))
+            current[source_key] = entry
+            components.extend(entry['components'])
+            if changed and source_key in previous:
+                diff['sources_changed'].append(source_key)
+                for kind, items in diff_components(previous[source_key]['components'], entry['components']).items():
+                    diff[kind].extend(items)
+
+        # Groups whose manifest disappeared are removals too
+        for source_key in previous.keys() - current.keys():
+            diff['sources_changed'].append(source_key)
+            diff['removed'].extend(diff_components(previous[source_key]['components'], [])['removed'])
+
+        self.last_diff = diff if diff['sources_changed'] else None
+        diff_file = self.output_dir / SBOM_DIFF_FILE
+        if self.last_diff:
+            with open(diff_file, 'w', encoding='utf-8') as f:
+                json.dump(self.last_diff, f, indent=2, ensure_ascii=False)
+        else:
+            # A diff left over from an earlier run would describe stale changes
+            diff_file.unlink(missing_ok=True)
+
+        if self.cache_enabled and current != previous:
+            cache[project_key] = current
+            self._save_cache(cache)
+
         # System/OS components
         components.extend(self._analyze_system_components())
         
         return components
+
+    def _load_source(self, paths: List[Path], parser: Callable[[Path], List[Dict[str, Any]]],
+                     cached: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """Return the cache entry for one manifest group and whether it was re-parsed."""
+        files = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files[path.name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+        if cached and cached['files'].keys() == files.keys():
+            # Fast path: size and mtime unchanged
+            if all(cached['files'][name]['size'] == info['size'] and cached['files'][name]['mtime_ns'] == info['mtime_ns']
+                   for name, info in files.items()):
+                self.cache_stats['hits'] += 1
+                return cached, False
+
+        # Content hashes catch touched-but-identical files (e.g. fresh CI checkouts)
+        for path in paths:
+            if path.name in files:
+                files[path.name]['sha256'] = multi_digest(path)['sha256']
+
+        if cached and cached['files'].keys() == files.keys() and all(
+                cached['files'][name].get('sha256') == info['sha256'] for name, info in files.items()):
+            self.cache_stats['hits'] += 1
+            return {'files': files, 'components': cached['components']}, False
+
+        self.cache_stats['misses'] += 1
+        return {'files': files, 'components': parser(paths[0])}, True
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable SBOM cache {self.cache_path}: {e}")
+            return {}
+        if cache.get('version') != SBOM_CACHE_VERSION:
+            return {}
+        return cache.get('projects', {})
+
+    def _save_cache(self, projects: Dict[str, Any]) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': SBOM_CACHE_VERSION, 'projects': projects}, f, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Error writing SBOM cache {self.cache_path}: {e}")
     
     def _analyze_npm_dependencies(self, project_path: Path) -> List[Dict[str, Any]]:
         """Analyze npm/yarn dependencies."""
@@ -114,26 +250,6 @@ class SBOMGenerator:
             
         return components
     
-    def _analyze_python_dependencies(self, project_path: Path) -> List[Dict[str, Any]]:
-        """Analyze Python dependencies from requirements files."""
-        components = []
-        
-        # Check for various Python dependency files
-        dep_files = [
-            "requirements.txt",
-            "requirements-dev.txt", 
-            "pyproject.toml",
-            "setup.py",
-            "Pipfile"
-        ]
-        
-        for dep_file in dep_files:
-            dep_path = project_path / dep_file
-            if dep_path.exists():
-                components.extend(self._parse_python_deps(dep_path))
-                
-        return components
-    
     def _analyze_system_components(self) -> List[Dict[str, Any]]:
         """Analyze system-level components."""
         components = []
@@ -162,9 +278,11 @@ class SBOMGenerator:
             
         return components
     
-    def _generate_cyclone_dx(self, components: List[Dict[str, Any]], project_path: str) -> Dict[str, Any]:
-        """Generate CycloneDX 1.4 format SBOM."""
+    def _render_sboms(self, components: List[Dict[str, Any]], project_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Render CycloneDX 1.4 and SPDX 2.3 documents in a single pass over the components."""
         project_name = Path(project_path).name
+        project_version = self._get_project_version(project_path)
+        timestamp = datetime.now(timezone.utc).isoformat()
         
         cyclone_dx_sbom = {
             "bomFormat": "CycloneDX",
@@ -172,7 +290,7 @@ class SBOMGenerator:
             "serialNumber": f"urn:uuid:{uuid.uuid4()}",
             "version": 1,
             "metadata": {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": timestamp,
                 "tools": [
                     {
                         "vendor": "SPEK",
@@ -183,15 +301,43 @@ class SBOMGenerator:
                 "component": {
                     "type": "application",
                     "name": project_name,
-                    "version": self._get_project_version(project_path),
+                    "version": project_version,
                     "description": f"SBOM for {project_name} project"
                 }
             },
             "components": []
         }
         
-        # Convert internal components to CycloneDX format
-        for comp in components:
+        spdx_sbom = {
+            "spdxVersion": self.spdx_version,
+            "dataLicense": "CC0-1.0",
+            "SPDXID": "SPDXRef-DOCUMENT",
+            "name": f"{project_name}-SBOM",
+            "documentNamespace": f"https://spek.dev/spdx/{uuid.uuid4()}",
+            "creationInfo": {
+                "created": timestamp,
+                "creators": [f"Tool: {self.tool_name}-{self.tool_version}"],
+                "licenseListVersion": "3.19"
+            },
+            "packages": [
+                {
+                    "SPDXID": "SPDXRef-Package-Root",
+                    "name": project_name,
+                    "downloadLocation": "NOASSERTION",
+                    "filesAnalyzed": False,
+                    "versionInfo": project_version,
+                    "supplier": "NOASSERTION",
+                    "copyrightText": "NOASSERTION"
+                }
+            ]
+        }
+        relationships = []
+        
+        for i, comp in enumerate(components):
+            hashes = comp.get('hashes')
+            licenses = comp.get('licenses')
+            
+            # CycloneDX component
             cyclone_component = {
                 "type": comp.get('type', 'library'),
                 "name": comp['name'],
@@ -199,66 +345,22 @@ class SBOMGenerator:
                 "purl": comp.get('purl', ''),
                 "scope": comp.get('scope', 'required')
             }
-            
-            # Add hashes if available
-            if comp.get('hashes'):
+            if hashes:
                 cyclone_component["hashes"] = [
                     {"alg": alg, "content": hash_val}
-                    for alg, hash_val in comp['hashes'].items()
+                    for alg, hash_val in hashes.items()
                 ]
-            
-            # Add licenses if available
-            if comp.get('licenses'):
+            if licenses:
                 cyclone_component["licenses"] = [
                     {"license": {"id": lic}} if self._is_spdx_license(lic) else {"license": {"name": lic}}
-                    for lic in comp['licenses']
+                    for lic in licenses
                 ]
-            
-            # Add supplier if available
             if comp.get('supplier'):
                 cyclone_component["supplier"] = comp['supplier']
-                
             cyclone_dx_sbom["components"].append(cyclone_component)
-        
-        return cyclone_dx_sbom
-    
-    def _generate_spdx(self, components: List[Dict[str, Any]], project_path: str) -> Dict[str, Any]:
-        """Generate SPDX 2.3 format SBOM."""
-        project_name = Path(project_path).name
-        document_name = f"{project_name}-SBOM"
-        
-        spdx_sbom = {
-            "spdxVersion": self.spdx_version,
-            "dataLicense": "CC0-1.0",
-            "SPDXID": "SPDXRef-DOCUMENT",
-            "name": document_name,
-            "documentNamespace": f"https://spek.dev/spdx/{uuid.uuid4()}",
-            "creationInfo": {
-                "created": datetime.now(timezone.utc).isoformat(),
-                "creators": [f"Tool: {self.tool_name}-{self.tool_version}"],
-                "licenseListVersion": "3.19"
-            },
-            "packages": []
-        }
-        
-        # Root package
-        root_package = {
-            "SPDXID": "SPDXRef-Package-Root",
-            "name": project_name,
-            "downloadLocation": "NOASSERTION",
-            "filesAnalyzed": False,
-            "versionInfo": self._get_project_version(project_path),
-            "supplier": "NOASSERTION",
-            "copyrightText": "NOASSERTION"
-        }
-        spdx_sbom["packages"].append(root_package)
-        
-        # Convert internal components to SPDX format
-        relationships = []
-        
-        for i, comp in enumerate(components):
-            spdx_id = f"SPDXRef-Package-{i+1}"
             
+            # SPDX package
+            spdx_id = f"SPDXRef-Package-{i+1}"
             spdx_package = {
                 "SPDXID": spdx_id,
                 "name": comp['name'],
@@ -268,8 +370,6 @@ class SBOMGenerator:
                 "supplier": f"Organization: {comp.get('supplier', {}).get('name', 'NOASSERTION')}",
                 "copyrightText": "NOASSERTION"
             }
-            
-            # Add external refs (purl)
             if comp.get('purl'):
                 spdx_package["externalRefs"] = [
                     {
@@ -278,25 +378,16 @@ class SBOMGenerator:
                         "referenceLocator": comp['purl']
                     }
                 ]
-            
-            # Add checksums if available
-            if comp.get('hashes'):
+            if hashes:
                 spdx_package["checksums"] = [
                     {"algorithm": alg.upper(), "checksumValue": hash_val}
-                    for alg, hash_val in comp['hashes'].items()
+                    for alg, hash_val in hashes.items()
                 ]
-            
-            # Add license information
-            if comp.get('licenses'):
-                spdx_package["licenseConcluded"] = " OR ".join(comp['licenses'])
-                spdx_package["licenseDeclared"] = " OR ".join(comp['licenses'])
-            else:
-                spdx_package["licenseConcluded"] = "NOASSERTION"
-                spdx_package["licenseDeclared"] = "NOASSERTION"
-            
+            license_expression = " OR ".join(licenses) if licenses else "NOASSERTION"
+            spdx_package["licenseConcluded"] = license_expression
+            spdx_package["licenseDeclared"] = license_expression
             spdx_sbom["packages"].append(spdx_package)
             
-            # Add relationship
             relationship_type = "DEPENDS_ON" if comp.get('scope') != 'devDependencies' else "BUILD_DEPENDENCY_OF"
             relationships.append({
                 "spdxElementId": "SPDXRef-Package-Root",
@@ -306,18 +397,14 @@ class SBOMGenerator:
         
         spdx_sbom["relationships"] = relationships
         
-        return spdx_sbom
+        return cyclone_dx_sbom, spdx_sbom
     
     def _get_npm_actual_version(self, package_name: str, lock_data: Dict) -> Optional[str]:
         """Get actual version from package-lock.json."""
         try:
-            packages = lock_data.get('packages', {})
-            for path, pkg_info in packages.items():
-                if path == f"node_modules/{package_name}":
-                    return pkg_info.get('version')
-        except Exception:
-            pass
-        return None
+            return lock_data.get('packages', {}).get(f"node_modules/{package_name}", {}).get('version')
+        except AttributeError:
+            return None
     
     def _get_npm_hashes(self, package_name: str, version: str) -> Dict[str, str]:
         """Get package hashes (simplified implementation)."""
@@ -6,7 +6,6 @@ from analyzer.constants.thresholds import API_TIMEOUT_SECONDS, DAYS_RETENTION_PE
 import json
 import hashlib
 import asyncio
-import aiohttp
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
@@ -14,6 +13,15 @@ import re
 import subprocess
 import os
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from .advisory_store import OfflineAdvisoryStore
+
 class VulnerabilityScanner:
     """Enterprise vulnerability scanning and license compliance engine."""
     
@@ -27,6 +35,11 @@ class VulnerabilityScanner:
         self.osv_api_url = "https://api.osv.dev/v1"
         self.github_api_key = config.get('github_api_key')
         
+        # Offline advisory store for air-gapped scans (zero network calls)
+        self.advisory_db_path = config.get('advisory_db_path')
+        self.offline_mode = config.get('offline_mode', bool(self.advisory_db_path))
+        self.advisory_store = OfflineAdvisoryStore(self.advisory_db_path) if self.advisory_db_path else None
+        
         # License compliance
         self.allowed_licenses = set(config.get('allowed_licenses', [
             'MIT', 'Apache-2.0', 'BSD-3-Clause', 'ISC', 'BSD-2-Clause'
@@ -60,18 +73,25 @@ class VulnerabilityScanner:
                 'total': 0
             },
             'license_compliance': await self.check_license_compliance(components),
-            'components_scanned': []
+            'components_scanned': [],
+            'scan_mode': 'offline' if self.offline_mode else 'online'
         }
         
-        # Scan each component
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            for component in components:
-                if component.get('ecosystem') in ['npm', 'pypi', 'maven', 'nuget']:
-                    task = self._scan_component_vulnerabilities(session, component)
-                    tasks.append(task)
-            
-            component_results = await asyncio.gather(*tasks, return_exceptions=True)
+        if self.offline_mode:
+            component_results = self._scan_offline(components)
+        else:
+            if not AIOHTTP_AVAILABLE:
+                raise RuntimeError("aiohttp is required for online scans; set advisory_db_path to scan offline")
+            
+            # Scan each component
+            async with aiohttp.ClientSession() as session:
+                tasks = []
+                for component in components:
+                    if component.get('ecosystem') in ['npm', 'pypi', 'maven', 'nuget']:
+                        task = self._scan_component_vulnerabilities(session, component)
+                        tasks.append(task)
+                
+                component_results = await asyncio.gather(*tasks, return_exceptions=True)
             
         # Process results
         for i, result in enumerate(component_results):
@@ -95,18 +115,45 @@ class VulnerabilityScanner:
             
         return scan_results
     
+    def _scan_offline(self, components: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scan components against the local advisory store: one indexed lookup each."""
+        
+        if self.advisory_store is None:
+            raise ValueError("offline_mode requires advisory_db_path")
+        
+        component_results = []
+        for component in components:
+            if not component.get('ecosystem') or not component.get('name'):
+                continue
+            
+            # The store already matched the version against precompiled ranges
+            advisories = self.advisory_store.query(
+                self._map_ecosystem_to_osv(component['ecosystem']), component['name'], component.get('version')
+            )
+            vulnerabilities = [self._process_osv_vulnerability(advisory, component, check_version=False)
+                               for advisory in advisories]
+            component_results.append({
+                'component': self._component_summary(component),
+                'vulnerabilities': self._deduplicate_vulnerabilities([v for v in vulnerabilities if v])
+            })
+        
+        return component_results
+    
+    def _component_summary(self, component: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'name': component.get('name'),
+            'version': component.get('version'),
+            'ecosystem': component.get('ecosystem'),
+            'purl': component.get('purl')
+        }
+    
     async def _scan_component_vulnerabilities(self, 
-                                            session: aiohttp.ClientSession,
+                                            session: 'aiohttp.ClientSession',
                                             component: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Scan individual component for vulnerabilities."""
         
         component_result = {
-            'component': {
-                'name': component.get('name'),
-                'version': component.get('version'),
-                'ecosystem': component.get('ecosystem'),
-                'purl': component.get('purl')
-            },
+            'component': self._component_summary(component),
             'vulnerabilities': []
         }
         
@@ -131,7 +178,7 @@ class VulnerabilityScanner:
         return component_result
     
     async def _query_osv_database(self, 
-                                session: aiohttp.ClientSession,
+                                session: 'aiohttp.ClientSession',
                                 component: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Query OSV (Open Source Vulnerabilities) database."""
         
@@ -167,7 +214,7 @@ class VulnerabilityScanner:
         return vulnerabilities
     
     async def _query_github_advisories(self, 
-                                    session: aiohttp.ClientSession,
+                                    session: 'aiohttp.ClientSession',
                                     component: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Query GitHub Security Advisories."""
         
@@ -202,12 +249,13 @@ class VulnerabilityScanner:
     
     def _process_osv_vulnerability(self, 
                                     vuln_data: Dict[str, Any],
-                                    component: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                                    component: Dict[str, Any],
+                                    check_version: bool = True) -> Optional[Dict[str, Any]]:
         """Process OSV vulnerability data."""
         
         try:
             # Check if component version is affected
-            if not self._is_version_affected(component.get('version'), vuln_data):
+            if check_version and not self._is_version_affected(component.get('version'), vuln_data):
                 return None
             
             # Extract severity
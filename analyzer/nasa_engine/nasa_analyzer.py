@@ -78,13 +78,16 @@ class NASAAnalyzer:
         self.global_variables: List[ast.Name] = []
         self.loops: List[ast.AST] = []
 
-    def analyze_file(self, file_path: str, content: Optional[str] = None) -> List[ConnascenceViolation]:
+    def analyze_file(self, file_path: str, content: Optional[str] = None,
+                    tree: Optional[ast.AST] = None) -> List[ConnascenceViolation]:
         """
         Analyze a single file for NASA Power of Ten compliance.
 
         Args:
             file_path: Path to the file to analyze
             content: Optional file content (if None, will read from file_path)
+            tree: Optional pre-parsed AST of content (skips parsing, e.g. from
+                the pipelined engine's parse stage)
 
         Returns:
             List of NASA compliance violations found
@@ -97,7 +100,7 @@ class NASAAnalyzer:
             self.loops.clear()
 
             # Get file content
-            if content is None:
+            if content is None and tree is None:
                 if CACHE_AVAILABLE:
                     content = cached_file_content(file_path)
                 else:
@@ -108,11 +111,11 @@ class NASAAnalyzer:
             if not file_path.endswith(('.py', '.pyx')):
                 return []
 
-            # Parse AST
+            # Parse AST (unless the caller already did)
             try:
-                if CACHE_AVAILABLE:
+                if tree is None and CACHE_AVAILABLE:
                     tree = cached_ast_tree(file_path, content)
-                else:
+                elif tree is None:
                     tree = ast.parse(content, filename=file_path)
             except SyntaxError as e:
                 # Return syntax error as violation
@@ -11,12 +11,15 @@ during streaming operations.
 NASA Rule 7 Compliant: Bounded resource usage with automatic cleanup.
 """
 
+from collections import defaultdict, deque
 from typing import Dict, Any, List, Optional, Callable
 import logging
 import time
 
 from dataclasses import dataclass, field
-from threading import Lock
+from threading import Lock, RLock
+
+from .memory_monitor import MemoryLeakDetector
 
 logger = logging.getLogger(__name__)
 
@@ -5,6 +5,7 @@ Performance enhancement module.
 """
 
 from .parallel_analyzer import ParallelAnalysisConfig, ParallelAnalysisResult, ParallelConnascenceAnalyzer
+from .pipeline_engine import PipelineConfig, PipelinedAnalysisEngine
 
 # Import missing performance modules with fallback
 try:
@@ -25,6 +26,8 @@ __all__ = [
     "ParallelConnascenceAnalyzer",
     "ParallelAnalysisConfig",
     "ParallelAnalysisResult",
+    "PipelineConfig",
+    "PipelinedAnalysisEngine",
     "RealTimeMonitor",
     "CachePerformanceProfiler"
 ]
@@ -22,9 +22,18 @@ import logging
 import multiprocessing as mp
 import time
 import threading
-from typing import Any, List, Dict, Optional, Union, Tuple
+from typing import Any, Iterator, List, Dict, Optional, Union, Tuple
 from pathlib import Path
 
+from .pipeline_engine import PipelineConfig, PipelinedAnalysisEngine
+from .shared_violation_buffer import (
+    ensure_resource_tracker,
+    read_violation_segment,
+    release_violation_segment,
+    shared_memory_supported,
+    write_violation_segment,
+)
+
 try:
     import psutil
 except ImportError:
@@ -53,6 +62,9 @@ class ParallelAnalysisConfig:
     memory_limit_mb: int = 1024  # 1GB per worker
     enable_profiling: bool = False
     worker_initialization_timeout: int = 30
+    use_shared_memory: bool = True  # Return process results via shared memory segments
+    use_pipeline: bool = False  # Overlap file I/O with parsing/detection (see pipeline_engine)
+    pipeline_io_workers: int = 8  # Prefetch threads for the pipeline I/O stage
 
 @dataclass
 class ParallelAnalysisResult:
@@ -100,6 +112,14 @@ class ParallelConnascenceAnalyzer:
 
         logger.info(f"Parallel analyzer initialized with {self.config.max_workers} workers")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop parent-only state so chunk tasks can be pickled to process workers."""
+        state = self.__dict__.copy()
+        state["base_analyzer"] = None
+        state["resource_monitor"] = None
+        state["worker_pool"] = None
+        return state
+
     def analyze_project_parallel(
         self,
         project_path: Union[str, Path],
@@ -189,6 +209,41 @@ class ParallelConnascenceAnalyzer:
             logger.info("Falling back to sequential analysis")
             return self._fallback_sequential_analysis(project_path, policy_preset, options, start_time)
 
+    def iter_results(
+        self,
+        project_path: Union[str, Path],
+        policy_preset: str = "service-defaults",
+        options: Optional[Dict[str, Any]] = None,
+        ordered: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-file analysis results as worker chunks complete.
+
+        Args:
+            project_path: Path to project directory
+            policy_preset: Policy configuration to use
+            options: Additional analysis options
+            ordered: Yield files in discovery order instead of completion order
+
+        Yields:
+            One result dict per analyzed file
+        """
+
+        project_path = Path(project_path)
+        file_chunks = self._create_file_chunks(self._discover_files(project_path))
+        pending: Dict[int, Dict[str, Any]] = {}
+        next_index = 0
+
+        for chunk_index, result, _ in self._iter_chunk_results(file_chunks, policy_preset, options or {}):
+            if not ordered:
+                yield from self._split_chunk_by_file(result)
+                continue
+
+            pending[chunk_index] = result
+            while next_index in pending:
+                yield from self._split_chunk_by_file(pending.pop(next_index))
+                next_index += 1
+
     def analyze_files_batch(
         self, file_paths: List[Union[str, Path]], policy_preset: str = "service-defaults"
     ) -> Dict[str, Any]:
@@ -355,40 +410,94 @@ class ParallelConnascenceAnalyzer:
         chunk_results = []
         chunk_times = []
 
+        for _, result, processing_time in self._iter_chunk_results(file_chunks, policy_preset, options):
+            chunk_results.append(result)
+            chunk_times.append(processing_time)
+
+        return chunk_results, chunk_times
+
+    def _iter_chunk_results(
+        self, file_chunks: List[List[Path]], policy_preset: str, options: Dict[str, Any]
+    ) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+        """Yield (chunk_index, result, processing_time) as chunks complete."""
+
+        if self.config.use_pipeline:
+            yield from self._iter_pipeline_results(file_chunks)
+            return
+
         executor_class = ProcessPoolExecutor if self.config.use_processes else ThreadPoolExecutor
 
-        with executor_class(max_workers=self.config.max_workers) as executor:
+        # Only process workers pay the pickling cost that shared memory avoids
+        use_shared_memory = (
+            self.config.use_processes and self.config.use_shared_memory and shared_memory_supported()
+        )
+        if use_shared_memory:
+            ensure_resource_tracker()
+
+        executor = executor_class(max_workers=self.config.max_workers)
+        future_to_chunk = {}
+        consumed = set()
+        try:
             # Submit all chunks for processing
             future_to_chunk = {
-                executor.submit(self._analyze_chunk, chunk, policy_preset, options): i
+                executor.submit(self._analyze_chunk, chunk, policy_preset, options, use_shared_memory): i
                 for i, chunk in enumerate(file_chunks)
             }
 
             # Collect results as they complete
             for future in as_completed(future_to_chunk, timeout=self.config.timeout_seconds):
                 chunk_index = future_to_chunk[future]
+                consumed.add(future)
 
                 try:
                     start_time = time.time()
-                    result = future.result()
+                    result = self._load_shared_violations(future.result())
                     processing_time = time.time() - start_time
 
-                    chunk_results.append(result)
-                    chunk_times.append(processing_time)
-
                     logger.debug(f"Chunk {chunk_index} completed in {processing_time:.2f}s")
 
                 except Exception as e:
                     logger.error(f"Chunk {chunk_index} failed: {e}")
                     # Add empty result to maintain ordering
-                    chunk_results.append(
-                        {"error": str(e), "violations": [], "nasa_violations": [], "duplication_clusters": []}
-                    )
-                    chunk_times.append(0.0)
-
-        return chunk_results, chunk_times
+                    result = {"error": str(e), "violations": [], "nasa_violations": [], "duplication_clusters": []}
+                    processing_time = 0.0
+
+                yield chunk_index, result, processing_time
+        finally:
+            # Streaming consumers may stop early; drop chunks that have not started
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._release_unconsumed_segments(future_to_chunk, consumed)
+
+    def _iter_pipeline_results(self, file_chunks: List[List[Path]]) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+        """Run files through the staged pipeline, one single-file 'chunk' per result."""
+
+        engine = PipelinedAnalysisEngine(
+            PipelineConfig(
+                io_workers=self.config.pipeline_io_workers,
+                detect_workers=self.config.max_workers,
+                use_processes=self.config.use_processes,
+            )
+        )
+        files = [file_path for chunk in file_chunks for file_path in chunk]
+        try:
+            for result in engine.iter_results(files):
+                analyzed = "error" not in result
+                chunk_result = {
+                    "chunk_size": 1,
+                    "files_processed": int(analyzed),
+                    "file_paths": [result["file_path"]] if analyzed else [],
+                    "violations": result["violations"],
+                    "nasa_violations": [],
+                    "duplication_clusters": [],
+                    "processing_successful": True,
+                }
+                yield result["index"], chunk_result, (result["parse_ms"] + result["detect_ms"]) / 1000
+        finally:
+            self.execution_stats["pipeline_stages"] = engine.get_stage_stats()
 
-    def _analyze_chunk(self, file_chunk: List[Path], policy_preset: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_chunk(
+        self, file_chunk: List[Path], policy_preset: str, options: Dict[str, Any], use_shared_memory: bool = False
+    ) -> Dict[str, Any]:
         """Analyze a chunk of files with REAL detector execution."""
 
         try:
@@ -401,16 +510,24 @@ class ParallelConnascenceAnalyzer:
             if str(analyzer_path) not in sys.path:
                 sys.path.insert(0, str(analyzer_path))
 
-            from detectors import (
-                PositionDetector, MagicLiteralDetector, AlgorithmDetector,
-                GodObjectDetector, TimingDetector, ConventionDetector,
-                ValuesDetector, ExecutionDetector
-            )
+            try:
+                from analyzer.detectors import (
+                    PositionDetector, MagicLiteralDetector, AlgorithmDetector,
+                    GodObjectDetector, TimingDetector, ConventionDetector,
+                    ValuesDetector, ExecutionDetector
+                )
+            except ImportError:
+                from detectors import (
+                    PositionDetector, MagicLiteralDetector, AlgorithmDetector,
+                    GodObjectDetector, TimingDetector, ConventionDetector,
+                    ValuesDetector, ExecutionDetector
+                )
 
             all_violations = []
             all_nasa_violations = []
             all_duplication_clusters = []
             files_processed = 0
+            processed_paths = []
 
             for file_path in file_chunk:
                 try:
@@ -445,20 +562,31 @@ class ParallelConnascenceAnalyzer:
                             logger.warning(f"Detector {detector.__class__.__name__} failed on {file_path}: {e}")
 
                     files_processed += 1
+                    processed_paths.append(str(file_path))
 
                 except Exception as e:
                     logger.warning(f"Failed to analyze {file_path}: {e}")
                     continue
 
-            return {
+            chunk_result = {
                 "chunk_size": len(file_chunk),
                 "files_processed": files_processed,
+                "file_paths": processed_paths,
                 "violations": all_violations,
                 "nasa_violations": all_nasa_violations,
                 "duplication_clusters": all_duplication_clusters,
                 "processing_successful": True,
             }
 
+            if use_shared_memory and all_violations:
+                try:
+                    chunk_result["violations_segment"] = write_violation_segment(all_violations)
+                    chunk_result["violations"] = []
+                except Exception as e:
+                    logger.warning(f"Shared memory transport unavailable, returning pickled violations: {e}")
+
+            return chunk_result
+
         except Exception as e:
             logger.error(f"Chunk analysis failed: {e}")
             return {
@@ -471,6 +599,33 @@ class ParallelConnascenceAnalyzer:
                 "error": str(e),
             }
 
+    def _release_unconsumed_segments(self, futures: Dict[Any, int], consumed: set) -> None:
+        """Unlink shared memory written by chunks whose results were never read."""
+        for future in futures:
+            if future in consumed or future.cancelled() or future.exception() is not None:
+                continue
+            handle = future.result().get("violations_segment")
+            if handle:
+                release_violation_segment(handle)
+
+    def _split_chunk_by_file(self, chunk_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Group a chunk's violations into per-file results."""
+        by_file: Dict[str, List[Dict[str, Any]]] = {path: [] for path in chunk_result.get("file_paths", [])}
+        for violation in chunk_result.get("violations", []):
+            by_file.setdefault(violation.get("file_path", "unknown"), []).append(violation)
+
+        return [
+            {"file_path": path, "violations": violations, "violation_count": len(violations)}
+            for path, violations in by_file.items()
+        ]
+
+    def _load_shared_violations(self, chunk_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a worker's shared memory handle with a lazy reader over its violations."""
+        handle = chunk_result.pop("violations_segment", None)
+        if handle:
+            chunk_result["violations"] = read_violation_segment(handle)
+        return chunk_result
+
     def _violation_to_dict(self, violation) -> Dict[str, Any]:
         """Convert violation object to dictionary."""
         if isinstance(violation, dict):
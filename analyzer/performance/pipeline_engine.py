@@ -0,0 +1,363 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Pipelined Read / Parse / Detect Engine
+======================================
+
+Staged alternative to per-file serial analysis, where each worker reads,
+parses and runs detectors on one file before touching the next:
+
+    I/O stage     thread pool, prefetches file bytes
+    parse stage   ast.parse in the detect worker (trees are not shipped
+                  between processes; re-pickling an AST costs more than
+                  parsing the bytes)
+    detect stage  process pool, runs detectors on the parsed tree
+
+The stages are connected by bounded in-flight sets: at most
+``io_queue_depth`` files are being read or waiting for a detect worker, and
+at most ``detect_queue_depth`` batches are queued on the detect pool. Disk
+and network filesystem latency therefore overlaps with CPU work while
+memory stays bounded by the queue depths.
+
+Per-stage counters (items, bytes, busy time, throughput, queue high-water
+marks) and the time the detect stage sat starved waiting on I/O are
+available from ``get_stage_stats()``.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import ast
+import logging
+import multiprocessing as mp
+import time
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PipelineConfig:
+    """Configuration for the pipelined analysis engine."""
+
+    io_workers: int = 8  # Concurrent reads; raise on high-latency filesystems
+    detect_workers: int = field(default_factory=lambda: min(8, mp.cpu_count()))
+    io_queue_depth: int = 64  # Files being read or waiting for a detect worker
+    detect_queue_depth: int = 0  # Batches queued on the detect pool (0 = 2 * detect_workers)
+    batch_files: int = 8  # Max files per detect task
+    batch_bytes: int = 512 * 1024  # Max source bytes per detect task
+    use_processes: bool = True  # Process pool for the detect stage
+    detector: str = "connascence"  # Key into DETECT_STAGES
+
+@dataclass
+class StageCounters:
+    """Throughput counters for one pipeline stage."""
+
+    items: int = 0
+    bytes: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+    def to_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        wall = max(wall_seconds, 1e-9)
+        return {
+            "items": self.items,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "busy_seconds": self.busy_seconds,
+            "max_queue_depth": self.max_queue_depth,
+            "items_per_second": self.items / wall,
+            "mb_per_second": self.bytes / wall / (1024 * 1024),
+        }
+
+# Detect stage implementations (module level so process workers can pickle them)
+
+def _violation_to_dict(violation: Any) -> Dict[str, Any]:
+    """Convert violation object to dictionary."""
+    if isinstance(violation, dict):
+        return violation
+    elif hasattr(violation, '__dict__'):
+        return dict(violation.__dict__)
+    elif hasattr(violation, '_asdict'):
+        return violation._asdict()
+    return {"description": str(violation), "type": "unknown", "severity": "medium"}
+
+def detect_connascence(file_path: str, source: str, tree: ast.AST) -> List[Dict[str, Any]]:
+    """Run the connascence detector suite on a parsed file."""
+    from analyzer.detectors import (
+        AlgorithmDetector, ConventionDetector, ExecutionDetector, GodObjectDetector,
+        MagicLiteralDetector, PositionDetector, TimingDetector, ValuesDetector
+    )
+
+    source_lines = source.splitlines()
+    violations = []
+    for detector_class in (
+        PositionDetector, MagicLiteralDetector, AlgorithmDetector, GodObjectDetector,
+        TimingDetector, ConventionDetector, ValuesDetector, ExecutionDetector
+    ):
+        try:
+            detector = detector_class(file_path, source_lines)
+            violations.extend(_violation_to_dict(v) for v in detector.detect_violations(tree))
+        except Exception as e:
+            logger.warning(f"Detector {detector_class.__name__} failed on {file_path}: {e}")
+    return violations
+
+_nasa_analyzer = None
+
+def detect_nasa(file_path: str, source: str, tree: ast.AST) -> List[Dict[str, Any]]:
+    """Run NASA Power of Ten checks with a worker-resident analyzer."""
+    global _nasa_analyzer
+    if _nasa_analyzer is None:
+        from analyzer.nasa_engine.nasa_analyzer import NASAAnalyzer
+        _nasa_analyzer = NASAAnalyzer()
+    return [_violation_to_dict(v) for v in _nasa_analyzer.analyze_file(file_path, source, tree=tree)]
+
+DETECT_STAGES: Dict[str, Callable[[str, str, ast.AST], List[Dict[str, Any]]]] = {
+    "connascence": detect_connascence,
+    "nasa": detect_nasa,
+}
+
+# Stage tasks
+
+def _read_file(index: int, file_path: str) -> Tuple[int, str, Optional[bytes], float, Optional[str]]:
+    """I/O stage: read raw bytes. Returns (index, path, data, seconds, error)."""
+    start = time.perf_counter()
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+        return index, file_path, data, time.perf_counter() - start, None
+    except OSError as e:
+        return index, file_path, None, time.perf_counter() - start, str(e)
+
+def _parse_and_detect_batch(batch: List[Tuple[int, str, bytes]], detector: str) -> List[Dict[str, Any]]:
+    """Parse and detect stages for a batch of prefetched files."""
+    detect = DETECT_STAGES[detector]
+    results = []
+    for index, file_path, data in batch:
+        result: Dict[str, Any] = {"index": index, "file_path": file_path, "bytes": len(data)}
+        start = time.perf_counter()
+        try:
+            source = data.decode("utf-8", errors="replace")
+            tree = ast.parse(source, file_path)
+        except (SyntaxError, ValueError) as e:
+            result.update(violations=[], violation_count=0, error=f"{type(e).__name__}: {e}",
+                          parse_ms=(time.perf_counter() - start) * 1000, detect_ms=0.0)
+            results.append(result)
+            continue
+
+        parsed = time.perf_counter()
+        try:
+            violations = detect(file_path, source, tree)
+        except Exception as e:
+            # One failing file must not take the rest of its batch with it
+            result.update(violations=[], violation_count=0, error=f"detect failed: {type(e).__name__}: {e}",
+                          detect_failed=True, parse_ms=(parsed - start) * 1000,
+                          detect_ms=(time.perf_counter() - parsed) * 1000)
+            results.append(result)
+            continue
+        result.update(
+            violations=violations,
+            violation_count=len(violations),
+            parse_ms=(parsed - start) * 1000,
+            detect_ms=(time.perf_counter() - parsed) * 1000,
+        )
+        results.append(result)
+    return results
+
+class PipelinedAnalysisEngine:
+    """
+    Streams files through bounded I/O, parse and detect stages.
+
+    NASA Rule 7: Every queue between stages is bounded
+    """
+
+    def __init__(self, config: Optional[PipelineConfig] = None):
+        """Initialize pipeline engine with configuration."""
+        self.config = config or PipelineConfig()
+        if self.config.detector not in DETECT_STAGES:
+            raise ValueError(f"Unknown detector stage: {self.config.detector}")
+        self.detect_queue_depth = self.config.detect_queue_depth or 2 * self.config.detect_workers
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.stages = {"io": StageCounters(), "parse": StageCounters(), "detect": StageCounters()}
+        self.io_stall_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def get_stage_stats(self) -> Dict[str, Any]:
+        """Per-stage throughput counters from the most recent run."""
+        stats: Dict[str, Any] = {name: c.to_dict(self.wall_seconds) for name, c in self.stages.items()}
+        stats["wall_seconds"] = self.wall_seconds
+        # Time the detect stage had free capacity but no prefetched input
+        stats["io_stall_seconds"] = self.io_stall_seconds
+        return stats
+
+    def analyze_files(self, file_paths: Iterable[Union[str, Path]]) -> Dict[str, Any]:
+        """Analyze files and return combined violations plus stage statistics."""
+        file_results = list(self.iter_results(file_paths, ordered=True))
+        violations = [v for result in file_results for v in result["violations"]]
+        return {
+            "files_analyzed": len(file_results),
+            "total_violations": len(violations),
+            "violations": violations,
+            "file_results": file_results,
+            "execution_time_ms": self.wall_seconds * 1000,
+            "stage_stats": self.get_stage_stats(),
+        }
+
+    def iter_results(self, file_paths: Iterable[Union[str, Path]], ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-file results through the pipeline.
+
+        Args:
+            file_paths: Files to analyze; consumed lazily as I/O capacity frees up
+            ordered: Yield in input order instead of completion order
+
+        Yields:
+            Result dicts with file_path, violations, violation_count,
+            parse_ms, detect_ms and error (when a file could not be read or parsed)
+        """
+        self._reset_counters()
+        started = time.perf_counter()
+        io_pool = ThreadPoolExecutor(max_workers=self.config.io_workers, thread_name_prefix="PipelineIO")
+        detect_pool = (ProcessPoolExecutor if self.config.use_processes else ThreadPoolExecutor)(
+            max_workers=self.config.detect_workers
+        )
+        reads: Set[Future] = set()
+        detects: Dict[Future, List[Tuple[int, str, int]]] = {}
+        try:
+            results = self._run(iter(file_paths), io_pool, detect_pool, reads, detects)
+            yield from (self._in_order(results) if ordered else results)
+        finally:
+            # Consumers may stop early; drop queued work on both pools
+            for future in reads | set(detects):
+                future.cancel()
+            io_pool.shutdown(wait=True, cancel_futures=True)
+            detect_pool.shutdown(wait=True, cancel_futures=True)
+            self.wall_seconds = time.perf_counter() - started
+
+    def _run(
+        self,
+        paths: Iterator[Union[str, Path]],
+        io_pool: ThreadPoolExecutor,
+        detect_pool: Any,
+        reads: Set[Future],
+        detects: Dict[Future, List[Tuple[int, str, int]]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Scheduler loop: keep both stages fed within their queue bounds."""
+        ready: Deque[Tuple[int, str, bytes]] = deque()
+        next_index = 0
+        exhausted = False
+
+        while True:
+            while not exhausted and len(reads) + len(ready) < self.config.io_queue_depth:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                reads.add(io_pool.submit(_read_file, next_index, str(path)))
+                next_index += 1
+            self._note_depth("io", len(reads) + len(ready))
+
+            while ready and len(detects) < self.detect_queue_depth:
+                batch = self._take_batch(ready)
+                future = detect_pool.submit(_parse_and_detect_batch, batch, self.config.detector)
+                # Batch members, so a batch-level failure can still report every file
+                detects[future] = [(index, file_path, len(data)) for index, file_path, data in batch]
+            self._note_depth("detect", len(detects))
+
+            if not reads and not detects:
+                if exhausted and not ready:
+                    return
+                continue
+
+            starved = not ready and reads and len(detects) < self.detect_queue_depth
+            wait_start = time.perf_counter()
+            done, _ = wait(reads | set(detects), return_when=FIRST_COMPLETED)
+            if starved:
+                self.io_stall_seconds += time.perf_counter() - wait_start
+
+            for future in done:
+                if future in reads:
+                    reads.discard(future)
+                    failed = self._collect_read(future.result(), ready)
+                    if failed is not None:
+                        yield failed
+                else:
+                    yield from self._collect_detect(future, detects.pop(future))
+
+    def _take_batch(self, ready: Deque[Tuple[int, str, bytes]]) -> List[Tuple[int, str, bytes]]:
+        """Pop up to batch_files / batch_bytes of prefetched files without waiting for more."""
+        batch = [ready.popleft()]
+        size = len(batch[0][2])
+        while ready and len(batch) < self.config.batch_files and size + len(ready[0][2]) <= self.config.batch_bytes:
+            item = ready.popleft()
+            batch.append(item)
+            size += len(item[2])
+        return batch
+
+    def _collect_read(self, read: Tuple[int, str, Optional[bytes], float, Optional[str]],
+                      ready: Deque[Tuple[int, str, bytes]]) -> Optional[Dict[str, Any]]:
+        """Account for a finished read; returns an error result if it failed."""
+        index, file_path, data, seconds, error = read
+        counters = self.stages["io"]
+        counters.busy_seconds += seconds
+        if error is not None:
+            counters.errors += 1
+            logger.warning(f"Failed to read {file_path}: {error}")
+            return {"index": index, "file_path": file_path, "violations": [], "violation_count": 0,
+                    "parse_ms": 0.0, "detect_ms": 0.0, "error": error}
+        counters.items += 1
+        counters.bytes += len(data)
+        ready.append((index, file_path, data))
+        return None
+
+    def _collect_detect(self, future: Future, members: List[Tuple[int, str, int]]) -> Iterator[Dict[str, Any]]:
+        """Account for a finished detect batch and yield its per-file results."""
+        try:
+            batch_results = future.result()
+        except Exception as e:
+            # Worker died or the batch could not be shipped: one error result per file
+            logger.error(f"Detect batch failed: {e}")
+            self.stages["detect"].errors += len(members)
+            for index, file_path, size in members:
+                yield {"index": index, "file_path": file_path, "bytes": size, "violations": [],
+                       "violation_count": 0, "parse_ms": 0.0, "detect_ms": 0.0,
+                       "error": f"detect batch failed: {type(e).__name__}: {e}"}
+            return
+
+        parse, detect = self.stages["parse"], self.stages["detect"]
+        for result in batch_results:
+            parse.items += 1
+            parse.bytes += result["bytes"]
+            parse.busy_seconds += result["parse_ms"] / 1000
+            if result.pop("detect_failed", False):
+                detect.errors += 1
+                detect.busy_seconds += result["detect_ms"] / 1000
+                logger.warning(f"Detect failed on {result['file_path']}: {result['error']}")
+            elif "error" in result:
+                parse.errors += 1
+            else:
+                detect.items += 1
+                detect.bytes += result["bytes"]
+                detect.busy_seconds += result["detect_ms"] / 1000
+            yield result
+
+    def _note_depth(self, stage: str, depth: int) -> None:
+        counters = self.stages[stage]
+        counters.max_queue_depth = max(counters.max_queue_depth, depth)
+
+    @staticmethod
+    def _in_order(results: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Re-sequence completion-ordered results by input index."""
+        pending: Dict[int, Dict[str, Any]] = {}
+        next_index = 0
+        for result in results:
+            pending[result["index"]] = result
+            while next_index in pending:
+                yield pending.pop(next_index)
+                next_index += 1
+        # A gap means a result never arrived; don't hold back the files after it
+        for index in sorted(pending):
+            yield pending[index]
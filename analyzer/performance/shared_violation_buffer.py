@@ -0,0 +1,279 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Shared-Memory Violation Transport
+=================================
+
+Compact binary record format for moving violation lists from process
+workers back to the parent without pickling every dict.
+
+Layout of a segment (little endian):
+
+    header   : magic, version, reserved, record_count, string_count, strings_offset
+    records  : record_count * (type, severity, file, description, line, column, weight, extra, shape)
+    offsets  : (string_count + 1) * uint32 offsets into the string blob
+    strings  : blob of interned UTF-8 strings and pickled extras
+
+String columns are interned, so repeated types, severities and file paths
+are stored once per segment. ``shape`` is the interned key order of the
+original dict, so decoded dicts have exactly the original keys in the same
+order. Values the fixed columns cannot reproduce exactly (other keys, or a
+column key holding another type, e.g. an int weight) are pickled into the
+``extra`` column, so values keep their types.
+
+Workers call ``write_violation_segment`` and return the small handle dict;
+the parent calls ``read_violation_segment``, which returns a lazy iterator
+decoding straight from the mapped buffer and unlinks the segment once the
+iterator is exhausted, closed or garbage collected.
+"""
+
+import logging
+import os
+import pickle
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - Python < 3.8
+    shared_memory = None
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"SPKV"
+SEGMENT_VERSION = 2
+NULL_INDEX = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHIII")
+_RECORD = struct.Struct("<IIIIiidII")
+_OFFSET = struct.Struct("<I")
+_INT32_RANGE = range(-2**31, 2**31)
+
+# Keys stored in dedicated columns (in record order); everything else goes to ``extra``
+_STRING_COLUMNS = ("type", "severity", "file_path", "description")
+_INT_COLUMNS = ("line_number", "column")
+_COLUMN_POSITION = {key: i for i, key in enumerate(_STRING_COLUMNS + _INT_COLUMNS + ("weight",))}
+
+# Separates key names in a record's interned shape string
+_KEY_SEPARATOR = "\x1f"
+
+def shared_memory_supported() -> bool:
+    """Return True when segments can outlive the worker that created them."""
+    # Windows frees a segment as soon as its last handle closes, which
+    # happens when the worker returns, so only POSIX platforms qualify.
+    return shared_memory is not None and os.name == "posix"
+
+def ensure_resource_tracker() -> None:
+    """Start the resource tracker before workers fork so they share it."""
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+    except Exception as e:  # pragma: no cover - platform dependent
+        logger.debug(f"Resource tracker unavailable: {e}")
+
+class _StringTable:
+    """Interns strings and byte strings and assigns stable indices."""
+
+    def __init__(self):
+        self.index: Dict[Union[str, bytes], int] = {}
+        self.values: List[bytes] = []
+
+    def intern(self, value: Optional[Union[str, bytes]]) -> int:
+        if value is None:
+            return NULL_INDEX
+        idx = self.index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.index[value] = idx
+            self.values.append(value if isinstance(value, bytes) else value.encode("utf-8"))
+        return idx
+
+def _in_column(key: str, value: Any) -> bool:
+    """True when the column for key reproduces value with its exact type."""
+    if key in _STRING_COLUMNS:
+        return value is None or type(value) is str
+    if key in _INT_COLUMNS:
+        return type(value) is int and value in _INT32_RANGE
+    return key == "weight" and type(value) is float
+
+def encode_violations(violations: List[Dict[str, Any]]) -> bytes:
+    """Encode violation dicts into the compact binary record format."""
+    strings = _StringTable()
+    records = bytearray(_RECORD.size * len(violations))
+
+    for i, violation in enumerate(violations):
+        keys = list(violation)
+        if all(type(key) is str and _KEY_SEPARATOR not in key for key in keys):
+            shape_idx = strings.intern(_KEY_SEPARATOR.join(keys))
+            columns = {k: v for k, v in violation.items() if _in_column(k, v)}
+            extra = {k: v for k, v in violation.items() if k not in columns}
+        else:
+            # Keys the shape string cannot carry; the whole dict goes to extra
+            shape_idx = NULL_INDEX
+            columns, extra = {}, violation
+
+        extra_idx = NULL_INDEX
+        if extra or shape_idx == NULL_INDEX:
+            extra_idx = strings.intern(pickle.dumps(extra, protocol=pickle.HIGHEST_PROTOCOL))
+
+        _RECORD.pack_into(
+            records,
+            i * _RECORD.size,
+            strings.intern(columns.get("type")),
+            strings.intern(columns.get("severity")),
+            strings.intern(columns.get("file_path")),
+            strings.intern(columns.get("description")),
+            columns.get("line_number", 0),
+            columns.get("column", 0),
+            columns.get("weight", 0.0),
+            extra_idx,
+            shape_idx,
+        )
+
+    offsets = bytearray(_OFFSET.size * (len(strings.values) + 1))
+    position = 0
+    for i, value in enumerate(strings.values):
+        _OFFSET.pack_into(offsets, i * _OFFSET.size, position)
+        position += len(value)
+    _OFFSET.pack_into(offsets, len(strings.values) * _OFFSET.size, position)
+
+    strings_offset = _HEADER.size + len(records)
+    header = _HEADER.pack(
+        SEGMENT_MAGIC, SEGMENT_VERSION, 0, len(violations), len(strings.values), strings_offset
+    )
+    return b"".join((header, bytes(records), bytes(offsets), b"".join(strings.values)))
+
+def iter_decoded_violations(buffer: memoryview) -> Iterator[Dict[str, Any]]:
+    """
+    Decode violation dicts directly from a buffer without copying it.
+
+    Each dict is built only when the iterator reaches it, with the keys,
+    key order and value types of the encoded original.
+    """
+    magic, version, _reserved, count, string_count, strings_offset = _HEADER.unpack_from(buffer, 0)
+    if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+        raise ValueError(f"Unsupported violation segment (magic={magic!r}, version={version})")
+
+    offsets_start = strings_offset
+    blob_start = offsets_start + (string_count + 1) * _OFFSET.size
+    offsets = [
+        _OFFSET.unpack_from(buffer, offsets_start + i * _OFFSET.size)[0]
+        for i in range(string_count + 1)
+    ]
+    cache: Dict[int, str] = {}
+    shapes: Dict[int, List[str]] = {}
+
+    def raw(idx: int) -> bytes:
+        return bytes(buffer[blob_start + offsets[idx]:blob_start + offsets[idx + 1]])
+
+    def lookup(idx: int) -> Optional[str]:
+        if idx == NULL_INDEX:
+            return None
+        value = cache.get(idx)
+        if value is None:
+            value = str(buffer[blob_start + offsets[idx]:blob_start + offsets[idx + 1]], "utf-8")
+            cache[idx] = value
+        return value
+
+    records = buffer[_HEADER.size:strings_offset]
+    try:
+        for record in _RECORD.iter_unpack(records):
+            extra_idx, shape_idx = record[7], record[8]
+            # Pickled extras come from our own workers' segments
+            extra = pickle.loads(raw(extra_idx)) if extra_idx != NULL_INDEX else {}
+            if shape_idx == NULL_INDEX:
+                yield extra
+                continue
+
+            keys = shapes.get(shape_idx)
+            if keys is None:
+                text = lookup(shape_idx)
+                keys = shapes[shape_idx] = text.split(_KEY_SEPARATOR) if text else []
+            violation: Dict[str, Any] = {}
+            for key in keys:
+                if key in extra:
+                    violation[key] = extra[key]
+                else:
+                    position = _COLUMN_POSITION[key]
+                    violation[key] = lookup(record[position]) if position < len(_STRING_COLUMNS) else record[position]
+            yield violation
+    finally:
+        records.release()
+
+def write_violation_segment(violations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Encode violations into a new shared memory segment.
+
+    Returns a small, cheaply picklable handle describing the segment.
+    The creating process closes its mapping; the reader owns unlinking.
+    """
+    payload = encode_violations(violations)
+    segment = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    try:
+        segment.buf[:len(payload)] = payload
+    except Exception:
+        segment.close()
+        segment.unlink()
+        raise
+    handle = {"name": segment.name, "size": len(payload), "count": len(violations)}
+    segment.close()
+    return handle
+
+class ViolationSegmentReader:
+    """
+    Lazy iterator over a mapped violation segment.
+
+    Violations are decoded one at a time as the iterator advances. The
+    segment is unmapped and unlinked when the iterator is exhausted,
+    closed or garbage collected, whichever comes first.
+    """
+
+    def __init__(self, handle: Dict[str, Any]):
+        self.count = handle["count"]
+        self._segment = shared_memory.SharedMemory(name=handle["name"])
+        self._view = self._segment.buf[:handle["size"]]
+        self._records: Optional[Iterator[Dict[str, Any]]] = iter_decoded_violations(self._view)
+
+    def __iter__(self) -> "ViolationSegmentReader":
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        if self._records is None:
+            raise StopIteration
+        try:
+            return next(self._records)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop decoding and release the segment."""
+        if self._records is None:
+            return
+        self._records.close()
+        self._records = None
+        self._view.release()
+        self._segment.close()
+        release_violation_segment(self._segment)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+def read_violation_segment(handle: Dict[str, Any]) -> ViolationSegmentReader:
+    """Map a segment and return a lazy iterator over its violations."""
+    return ViolationSegmentReader(handle)
+
+def release_violation_segment(segment_or_handle: Any) -> None:
+    """Unlink a segment, ignoring segments that are already gone."""
+    try:
+        if isinstance(segment_or_handle, dict):
+            segment_or_handle = shared_memory.SharedMemory(name=segment_or_handle["name"])
+            segment_or_handle.close()
+        segment_or_handle.unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to release shared violation segment: {e}")
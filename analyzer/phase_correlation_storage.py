@@ -1,15 +1,15 @@
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
-
-from analyzer.constants.thresholds import API_TIMEOUT_SECONDS, DAYS_RETENTION_PERIOD
-
 """
 Advanced persistent storage system for cross-phase memory correlations with 
 intelligent indexing, performance optimization, and NASA POT10 Rule DAYS_RETENTION_PERIOD compliance.
 
-"""
 Features:
 - High-performance SQLite storage with WAL mode
+- Write-behind ingestion: records are queued in memory and committed by a
+  background writer thread in batched executemany transactions
+- Compressed payloads stored as BLOBs
+- Minute/hour/day rollup tables maintained on insert for trend queries
+- Daily per-metric trend rollups serving get_performance_trends
+- Query result cache invalidated by per-table write epochs
 - Intelligent indexing and query optimization
 - Thread-safe operations with connection pooling
 - Memory-bounded operations with cleanup strategies
@@ -18,14 +18,236 @@ Features:
 - Backup and recovery mechanisms
 """
 
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union, Tuple, Callable, Set
 import asyncio
+import atexit
+import gzip
 import json
+import math
+import queue
 import sqlite3
+import statistics
 import threading
 import time
 import logging
+
+from analyzer.constants.thresholds import API_TIMEOUT_SECONDS, DAYS_RETENTION_PERIOD
+
+try:
+    from .unified_memory_model import MemoryCorrelation, PerformanceCorrelation, PhaseMemoryEntry
+    UNIFIED_MODEL_AVAILABLE = True
+except ImportError:
+    MemoryCorrelation = PerformanceCorrelation = PhaseMemoryEntry = None
+    UNIFIED_MODEL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Compressed payloads start with the gzip magic number; legacy rows stored
+# them as latin-1 decoded TEXT, new rows as BLOBs.
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Bounded history of rows the write-behind writer could not commit
+MAX_FAILED_ROWS = 1000
+
+# Reads wait at most this long for queued writes before querying anyway
+READ_FLUSH_TIMEOUT_SECONDS = 5.0
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """Apply the WAL and cache pragmas shared by pool and writer connections."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    # NORMAL only syncs at checkpoints under WAL: committed transactions stay
+    # consistent after a crash, at most the last few are lost on power failure
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=10000")  # 10MB cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+def _encode_payload(payload: Any, compress: bool, threshold: int) -> Union[str, bytes]:
+    """Serialize to JSON; payloads over threshold become gzip BLOBs."""
+    payload_json = json.dumps(payload)
+    if compress and len(payload_json) > threshold:
+        return gzip.compress(payload_json.encode("utf-8"))
+    return payload_json
+
+def _decode_payload(value: Union[str, bytes, None]) -> Any:
+    """Inverse of _encode_payload, also reading legacy latin-1 TEXT rows."""
+    if not value:
+        return {}
+    if isinstance(value, str):
+        if value[0] in '{["':
+            return json.loads(value)
+        value = value.encode("latin-1")
+    if value[:2] == _GZIP_MAGIC:
+        value = gzip.decompress(value)
+    return json.loads(value.decode("utf-8"))
+
+class WriteBehindWriter:
+    """
+    Background writer that batches inserts into single transactions.
+
+    Producers enqueue (statement, params) pairs and return immediately; the
+    writer thread drains up to batch_size records at a time, groups them by
+    statement and commits each batch with executemany in one transaction.
+    The queue is bounded (NASA Rule 7), so producers block rather than grow
+    memory without limit when the disk falls behind. close() - also run at
+    interpreter exit - drains and commits everything still queued.
+
+    on_batch(conn, rows_by_statement) runs inside each batch transaction
+    (e.g. to maintain rollups); on_commit(statements) runs after it commits.
+    A batch that raises is retried row by row; rows that still fail are
+    counted and kept in failed_rows, and every dequeued row advances the
+    committed count so flush() never waits on a row that will not land.
+    """
+
+    def __init__(self,
+                database_path: str,
+                batch_size: int = 2000,
+                flush_interval_seconds: float = 0.05,
+                max_pending: int = 100000,
+                on_batch: Optional[Callable[[sqlite3.Connection, Dict[str, List[tuple]]], None]] = None,
+                on_commit: Optional[Callable[[Iterable[str]], None]] = None):
+        assert batch_size > 0, "batch_size must be positive"
+        assert max_pending >= batch_size, "max_pending must hold at least one batch"
+
+        self.database_path = database_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_seconds
+        self.on_batch = on_batch
+        self.on_commit = on_commit
+
+        self._queue: "queue.Queue[Optional[Tuple[str, tuple]]]" = queue.Queue(maxsize=max_pending)
+        # Most recent rows that could not be written: (statement, params, error)
+        self.failed_rows: "deque[Tuple[str, tuple, str]]" = deque(maxlen=MAX_FAILED_ROWS)
+        self._progress = threading.Condition()
+        self._submitted = 0
+        self._committed = 0
+        self._closed = False
+
+        self.stats = {
+            "records_written": 0,
+            "records_failed": 0,
+            "batches_written": 0,
+            "largest_batch": 0
+        }
+
+        self._conn = sqlite3.connect(database_path, timeout=float(API_TIMEOUT_SECONDS), check_same_thread=False)
+        _configure_connection(self._conn)
+
+        self._thread = threading.Thread(target=self._run, name="phase-storage-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, statement: str, params: tuple) -> None:
+        """Queue one row for the next batch."""
+        if self._closed:
+            raise RuntimeError("WriteBehindWriter is closed")
+        if not self._thread.is_alive():
+            raise RuntimeError("WriteBehindWriter thread is not running")
+        with self._progress:
+            self._submitted += 1
+        self._queue.put((statement, params))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every row submitted so far is committed."""
+        with self._progress:
+            target = self._submitted
+            return self._progress.wait_for(lambda: self._committed >= target, timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        with self._progress:
+            return self._submitted - self._committed
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Commit everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error(f"Write-behind writer did not finish within {timeout}s; {self.pending} rows pending")
+            return
+        self._conn.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if stopping:  # drained after close()
+                    return
+                continue
+
+            # Drain whatever has accumulated, up to one batch
+            batch = []
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:  # keep the writer alive whatever a hook does
+                    logger.error(f"Write-behind batch of {len(batch)} rows failed: {e}")
+
+    def _write_batch(self, batch: List[Tuple[str, tuple]]) -> None:
+        grouped: Dict[str, List[tuple]] = defaultdict(list)
+        for statement, params in batch:
+            grouped[statement].append(params)
+
+        written = 0
+        try:
+            try:
+                with self._conn:  # one transaction per batch
+                    for statement, rows in grouped.items():
+                        self._conn.executemany(statement, rows)
+                    if self.on_batch:
+                        self.on_batch(self._conn, grouped)
+                written = len(batch)
+            except Exception as e:
+                # Isolate the bad rows instead of losing the whole batch
+                logger.error(f"Batch write failed ({e}); retrying {len(batch)} rows individually")
+                written = self._write_rows(batch)
+
+            if self.on_commit:
+                self.on_commit(grouped.keys())
+        finally:
+            self.stats["records_written"] += written
+            self.stats["batches_written"] += 1
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+            with self._progress:
+                self._committed += len(batch)
+                self._progress.notify_all()
+
+    def _write_rows(self, batch: List[Tuple[str, tuple]]) -> int:
+        """Commit rows one transaction each; returns how many were written."""
+        written = 0
+        for statement, params in batch:
+            try:
+                with self._conn:
+                    self._conn.execute(statement, params)
+                    if self.on_batch:
+                        self.on_batch(self._conn, {statement: [params]})
+                written += 1
+            except Exception as row_error:
+                self.stats["records_failed"] += 1
+                self.failed_rows.append((statement, params, str(row_error)))
+                logger.error(f"Dropped row for statement {statement.split('(')[0].strip()}: {row_error}")
+        return written
+
 class ConnectionPool:
     """Thread-safe SQLite connection pool for high-performance operations."""
     
@@ -46,15 +268,12 @@ class ConnectionPool:
             for _ in range(self.pool_size):
                 conn = sqlite3.connect(
                     self.database_path,
-                    timeout=API_TIMEOUT_SECONDS.0,
+                    timeout=float(API_TIMEOUT_SECONDS),
                     check_same_thread=False
                 )
                 
                 # Enable WAL mode for better concurrency
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-                conn.execute("PRAGMA cache_size=10000")  # 10MB cache
-                conn.execute("PRAGMA temp_store=MEMORY")
+                _configure_connection(conn)
                 
                 self.connections.append(conn)
                 self.available_connections.append(True)
@@ -79,7 +298,7 @@ class ConnectionPool:
             logger.warning("Connection pool exhausted, creating temporary connection")
             connection = sqlite3.connect(
                 self.database_path,
-                timeout=API_TIMEOUT_SECONDS.0,
+                timeout=float(API_TIMEOUT_SECONDS),
                 check_same_thread=False
             )
         
@@ -103,22 +322,46 @@ class ConnectionPool:
             self.available_connections.clear()
 
 class QueryOptimizer:
-    """Query optimization and caching system."""
+    """
+    Query optimization and caching system.
+
+    Each table has a write epoch that is bumped after every commit touching
+    it. Cached results remember the epochs of the tables they read, taken
+    before the query ran, and are discarded once any of them has moved on.
+    """
     
     def __init__(self):
         """Initialize query optimizer."""
-        self.query_cache: Dict[str, Any] = {}
+        self.query_cache: Dict[str, Tuple[Tuple[int, ...], Any]] = {}
         self.query_performance: Dict[str, List[float]] = defaultdict(list)
+        self.table_epochs: Dict[str, int] = defaultdict(int)
         self.cache_lock = threading.RLock()
         self.max_cache_size = 1000
+
+    def current_epochs(self, tables: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Current write epochs for the given tables."""
+        with self.cache_lock:
+            return tuple(self.table_epochs[table] for table in tables)
+
+    def bump_epochs(self, tables: Iterable[str]) -> None:
+        """Invalidate cached results that read any of these tables."""
+        with self.cache_lock:
+            for table in tables:
+                self.table_epochs[table] += 1
     
-    def get_cached_result(self, query_hash: str) -> Optional[Any]:
-        """Get cached query result."""
+    def get_cached_result(self, query_hash: str, epochs: Tuple[int, ...] = ()) -> Optional[Any]:
+        """Get cached query result if it was read at the given epochs."""
         with self.cache_lock:
-            return self.query_cache.get(query_hash)
+            entry = self.query_cache.get(query_hash)
+            if entry is None:
+                return None
+            if entry[0] != epochs:
+                del self.query_cache[query_hash]
+                return None
+            return entry[1]
     
-    def cache_result(self, query_hash: str, result: Any) -> None:
-        """Cache query result."""
+    def cache_result(self, query_hash: str, result: Any, epochs: Tuple[int, ...] = ()) -> None:
+        """Cache query result read at the given epochs."""
         with self.cache_lock:
             if len(self.query_cache) >= self.max_cache_size:
                 # Remove oldest entries (simple FIFO)
@@ -126,7 +369,7 @@ class QueryOptimizer:
                 for key in oldest_keys:
                     del self.query_cache[key]
             
-            self.query_cache[query_hash] = result
+            self.query_cache[query_hash] = (epochs, result)
     
     def record_query_performance(self, query_type: str, execution_time: float) -> None:
         """Record query performance for optimization."""
@@ -153,17 +396,173 @@ class QueryOptimizer:
         
         return stats
 
+_INSERT_CORRELATION = """
+    INSERT INTO phase_correlations 
+    (source_phase, target_phase, correlation_type, 
+    correlation_strength, metadata, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PERFORMANCE_CORRELATION = """
+    INSERT INTO performance_correlations 
+    (phase, metric_name, baseline_value, current_value,
+    improvement_percentage, correlation_factors, 
+    measurement_timestamp, validation_status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_MEMORY_ENTRY = """
+    INSERT OR REPLACE INTO memory_entries 
+    (phase_id, entry_id, entry_type, content_data,
+    access_count, last_access, created_at, ttl_seconds, tags)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rollup granularities (bucket width and retention)
+ROLLUP_BUCKET_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+ROLLUP_RETENTION_DAYS = {"minute": 2, "hour": DAYS_RETENTION_PERIOD, "day": 5 * 365}
+
+_UPSERT_PERFORMANCE_ROLLUP = """
+    INSERT INTO performance_rollups
+    (bucket, bucket_start, phase, metric_name, sample_count, improvement_sum,
+    improvement_min, improvement_max, current_value_sum, validated_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bucket, phase, metric_name, bucket_start) DO UPDATE SET
+        sample_count = sample_count + excluded.sample_count,
+        improvement_sum = improvement_sum + excluded.improvement_sum,
+        improvement_min = MIN(improvement_min, excluded.improvement_min),
+        improvement_max = MAX(improvement_max, excluded.improvement_max),
+        current_value_sum = current_value_sum + excluded.current_value_sum,
+        validated_count = validated_count + excluded.validated_count
+"""
+
+_UPSERT_CORRELATION_ROLLUP = """
+    INSERT INTO correlation_rollups
+    (bucket, bucket_start, source_phase, target_phase, correlation_type,
+    correlation_count, strength_sum, strength_max)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(bucket, source_phase, target_phase, correlation_type, bucket_start) DO UPDATE SET
+        correlation_count = correlation_count + excluded.correlation_count,
+        strength_sum = strength_sum + excluded.strength_sum,
+        strength_max = MAX(strength_max, excluded.strength_max)
+"""
+
+# Daily trend rollups keep the dimensions trend consumers filter on
+# (validation status and correlation factors) that performance_rollups drops
+_UPSERT_PERFORMANCE_TREND_ROLLUP = """
+    INSERT INTO performance_trend_rollups
+    (bucket_start, phase, metric_name, validation_status, correlation_factors,
+    sample_count, baseline_value_sum, current_value_sum, improvement_sum, last_timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(phase, metric_name, validation_status, correlation_factors, bucket_start) DO UPDATE SET
+        sample_count = sample_count + excluded.sample_count,
+        baseline_value_sum = baseline_value_sum + excluded.baseline_value_sum,
+        current_value_sum = current_value_sum + excluded.current_value_sum,
+        improvement_sum = improvement_sum + excluded.improvement_sum,
+        last_timestamp = MAX(last_timestamp, excluded.last_timestamp)
+"""
+
+# Tables whose write epoch moves when a statement commits
+_STATEMENT_TABLES = {
+    _INSERT_CORRELATION: ("phase_correlations", "correlation_rollups"),
+    _INSERT_PERFORMANCE_CORRELATION: (
+        "performance_correlations", "performance_rollups", "performance_trend_rollups"
+    ),
+    _INSERT_MEMORY_ENTRY: ("memory_entries",)
+}
+
+def _coerce_timestamp(value: Any) -> float:
+    """Epoch seconds as a finite float; rejects values rollups cannot bucket."""
+    if isinstance(value, bool):
+        raise TypeError(f"Invalid timestamp: {value!r}")
+    timestamp = float(value)
+    if not math.isfinite(timestamp):
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    return timestamp
+
+def _bucket_starts(timestamp: float) -> Iterable[Tuple[str, float]]:
+    for bucket, width in ROLLUP_BUCKET_SECONDS.items():
+        yield bucket, float(int(timestamp // width) * width)
+
+def _fold_performance_rollups(rows: List[tuple]) -> List[tuple]:
+    """Pre-aggregate inserted performance rows into one upsert per bucket."""
+    folded: Dict[tuple, List[float]] = {}
+    for phase, metric_name, _, current_value, improvement, _, timestamp, status in rows:
+        for bucket, bucket_start in _bucket_starts(timestamp):
+            acc = folded.get((bucket, bucket_start, phase, metric_name))
+            if acc is None:
+                folded[(bucket, bucket_start, phase, metric_name)] = [
+                    1, improvement, improvement, improvement, current_value, int(status == "validated")
+                ]
+            else:
+                acc[0] += 1
+                acc[1] += improvement
+                acc[2] = min(acc[2], improvement)
+                acc[3] = max(acc[3], improvement)
+                acc[4] += current_value
+                acc[5] += status == "validated"
+    return [key + tuple(acc) for key, acc in folded.items()]
+
+def _fold_performance_trend_rollups(rows: List[tuple]) -> List[tuple]:
+    """Pre-aggregate inserted performance rows into one upsert per trend day."""
+    width = ROLLUP_BUCKET_SECONDS["day"]
+    folded: Dict[tuple, List[float]] = {}
+    for phase, metric_name, baseline_value, current_value, improvement, factors, timestamp, status in rows:
+        key = (float(int(timestamp // width) * width), phase, metric_name, status, factors)
+        acc = folded.get(key)
+        if acc is None:
+            folded[key] = [1, baseline_value, current_value, improvement, timestamp]
+        else:
+            acc[0] += 1
+            acc[1] += baseline_value
+            acc[2] += current_value
+            acc[3] += improvement
+            acc[4] = max(acc[4], timestamp)
+    return [key + tuple(acc) for key, acc in folded.items()]
+
+def _fold_correlation_rollups(rows: List[tuple]) -> List[tuple]:
+    """Pre-aggregate inserted correlation rows into one upsert per bucket."""
+    folded: Dict[tuple, List[float]] = {}
+    for source_phase, target_phase, correlation_type, strength, _, timestamp in rows:
+        for bucket, bucket_start in _bucket_starts(timestamp):
+            key = (bucket, bucket_start, source_phase, target_phase, correlation_type)
+            acc = folded.get(key)
+            if acc is None:
+                folded[key] = [1, strength, strength]
+            else:
+                acc[0] += 1
+                acc[1] += strength
+                acc[2] = max(acc[2], strength)
+    return [key + tuple(acc) for key, acc in folded.items()]
+
 class PhaseCorrelationStorage:
-    """Advanced persistent storage for cross-phase memory correlations."""
+    """
+    Advanced persistent storage for cross-phase memory correlations.
+
+    With write_behind enabled (the default) the store_* methods for
+    correlations, performance correlations and memory entries only queue
+    the row; a WriteBehindWriter commits them in batches. Reads flush the
+    queue first, so callers always see their own writes.
+
+    Trend queries read the minute/hour/day rollup tables, which are updated
+    in the same transaction as the raw rows, and query results are cached
+    until a write to one of the tables they read bumps its epoch. Reads wait
+    at most read_flush_timeout seconds for the queue; past that they run
+    against what is already committed rather than block.
+    """
     
     def __init__(self, 
                 storage_path: Optional[str] = None,
                 enable_compression: bool = True,
-                backup_enabled: bool = True):
+                backup_enabled: bool = True,
+                write_behind: bool = True,
+                write_batch_size: int = 2000,
+                read_flush_timeout: float = READ_FLUSH_TIMEOUT_SECONDS):
         """Initialize phase correlation storage."""
         self.storage_path = storage_path or "analyzer/phase_correlation_storage.db"
         self.enable_compression = enable_compression
         self.backup_enabled = backup_enabled
+        self.read_flush_timeout = read_flush_timeout
         
         # Ensure storage directory exists
         self._ensure_storage_path()
@@ -176,6 +575,16 @@ class PhaseCorrelationStorage:
         
         # Initialize database schema
         self._init_database_schema()
+
+        # Batched background writer for the high-volume tables
+        self.writer: Optional[WriteBehindWriter] = (
+            WriteBehindWriter(
+                self.storage_path,
+                batch_size=write_batch_size,
+                on_batch=self._apply_rollups,
+                on_commit=self._bump_epochs
+            ) if write_behind else None
+        )
         
         # In-memory caches for performance
         self.correlation_cache: Dict[str, List[MemoryCorrelation]] = defaultdict(list)
@@ -214,7 +623,7 @@ class PhaseCorrelationStorage:
                 target_phase TEXT NOT NULL,
                 correlation_type TEXT NOT NULL,
                 correlation_strength REAL NOT NULL,
-                metadata TEXT NOT NULL,
+                metadata BLOB NOT NULL,
                 timestamp REAL NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
@@ -243,7 +652,7 @@ class PhaseCorrelationStorage:
                 phase_id TEXT NOT NULL,
                 entry_id TEXT NOT NULL,
                 entry_type TEXT NOT NULL,
-                content_data TEXT NOT NULL,
+                content_data BLOB NOT NULL,
                 access_count INTEGER DEFAULT 0,
                 last_access REAL NOT NULL,
                 created_at REAL NOT NULL,
@@ -268,6 +677,51 @@ class PhaseCorrelationStorage:
             )
             """,
             
+            # Rollups maintained on insert for trend queries
+            """
+            CREATE TABLE IF NOT EXISTS performance_rollups (
+                bucket TEXT NOT NULL,
+                bucket_start REAL NOT NULL,
+                phase TEXT NOT NULL,
+                metric_name TEXT NOT NULL,
+                sample_count INTEGER NOT NULL,
+                improvement_sum REAL NOT NULL,
+                improvement_min REAL NOT NULL,
+                improvement_max REAL NOT NULL,
+                current_value_sum REAL NOT NULL,
+                validated_count INTEGER NOT NULL,
+                PRIMARY KEY (bucket, phase, metric_name, bucket_start)
+            ) WITHOUT ROWID
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS correlation_rollups (
+                bucket TEXT NOT NULL,
+                bucket_start REAL NOT NULL,
+                source_phase TEXT NOT NULL,
+                target_phase TEXT NOT NULL,
+                correlation_type TEXT NOT NULL,
+                correlation_count INTEGER NOT NULL,
+                strength_sum REAL NOT NULL,
+                strength_max REAL NOT NULL,
+                PRIMARY KEY (bucket, source_phase, target_phase, correlation_type, bucket_start)
+            ) WITHOUT ROWID
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS performance_trend_rollups (
+                bucket_start REAL NOT NULL,
+                phase TEXT NOT NULL,
+                metric_name TEXT NOT NULL,
+                validation_status TEXT NOT NULL,
+                correlation_factors TEXT NOT NULL,
+                sample_count INTEGER NOT NULL,
+                baseline_value_sum REAL NOT NULL,
+                current_value_sum REAL NOT NULL,
+                improvement_sum REAL NOT NULL,
+                last_timestamp REAL NOT NULL,
+                PRIMARY KEY (phase, metric_name, validation_status, correlation_factors, bucket_start)
+            ) WITHOUT ROWID
+            """,
+            
             # Storage statistics table
             """
             CREATE TABLE IF NOT EXISTS storage_statistics (
@@ -279,15 +733,22 @@ class PhaseCorrelationStorage:
             """
         ]
         
-        # Create indexes for query optimization
+        # Create indexes for query optimization. The phase lookups carry the
+        # sort columns so "ORDER BY ... LIMIT" is answered by an index walk.
         index_queries = [
-            "CREATE INDEX IF NOT EXISTS idx_phase_correlations_source ON phase_correlations(source_phase)",
-            "CREATE INDEX IF NOT EXISTS idx_phase_correlations_target ON phase_correlations(target_phase)",
+            "DROP INDEX IF EXISTS idx_phase_correlations_source",
+            "DROP INDEX IF EXISTS idx_phase_correlations_target",
+            "DROP INDEX IF EXISTS idx_performance_correlations_phase",
+            "DROP INDEX IF EXISTS idx_performance_correlations_metric",
+            "CREATE INDEX IF NOT EXISTS idx_phase_correlations_source_rank ON phase_correlations(source_phase, correlation_strength, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_phase_correlations_target_rank ON phase_correlations(target_phase, correlation_strength, timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_phase_correlations_type ON phase_correlations(correlation_type)",
             "CREATE INDEX IF NOT EXISTS idx_phase_correlations_timestamp ON phase_correlations(timestamp)",
-            "CREATE INDEX IF NOT EXISTS idx_performance_correlations_phase ON performance_correlations(phase)",
-            "CREATE INDEX IF NOT EXISTS idx_performance_correlations_metric ON performance_correlations(metric_name)",
+            "CREATE INDEX IF NOT EXISTS idx_performance_correlations_phase_time ON performance_correlations(phase, measurement_timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_performance_correlations_metric_time ON performance_correlations(metric_name, measurement_timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_performance_correlations_validation ON performance_correlations(validation_status)",
+            "CREATE INDEX IF NOT EXISTS idx_performance_rollups_metric ON performance_rollups(bucket, metric_name, bucket_start)",
+            "CREATE INDEX IF NOT EXISTS idx_performance_trend_rollups_day ON performance_trend_rollups(bucket_start)",
             "CREATE INDEX IF NOT EXISTS idx_memory_entries_phase ON memory_entries(phase_id)",
             "CREATE INDEX IF NOT EXISTS idx_memory_entries_type ON memory_entries(entry_type)",
             "CREATE INDEX IF NOT EXISTS idx_memory_entries_access ON memory_entries(last_access)",
@@ -303,38 +764,69 @@ class PhaseCorrelationStorage:
             # Create indexes
             for query in index_queries:
                 conn.execute(query)
+
+            self._backfill_rollups(conn)
             
             conn.commit()
         
         logger.info("Database schema initialized with optimization indexes")
+
+    def _backfill_rollups(self, conn: sqlite3.Connection) -> None:
+        """Build rollups for raw rows written before the rollup tables existed."""
+        if (conn.execute("SELECT 1 FROM performance_rollups LIMIT 1").fetchone() is None and
+                conn.execute("SELECT 1 FROM performance_correlations LIMIT 1").fetchone() is not None):
+            for bucket, width in ROLLUP_BUCKET_SECONDS.items():
+                conn.execute("""
+                    INSERT INTO performance_rollups
+                    SELECT ?, CAST(measurement_timestamp / ? AS INTEGER) * ?, phase, metric_name,
+                            COUNT(*), SUM(improvement_percentage), MIN(improvement_percentage),
+                            MAX(improvement_percentage), SUM(current_value),
+                            SUM(validation_status = 'validated')
+                    FROM performance_correlations
+                    GROUP BY 2, phase, metric_name
+                """, (bucket, width, width))
+
+        if (conn.execute("SELECT 1 FROM performance_trend_rollups LIMIT 1").fetchone() is None and
+                conn.execute("SELECT 1 FROM performance_correlations LIMIT 1").fetchone() is not None):
+            width = ROLLUP_BUCKET_SECONDS["day"]
+            conn.execute("""
+                INSERT INTO performance_trend_rollups
+                SELECT CAST(measurement_timestamp / ? AS INTEGER) * ?, phase, metric_name,
+                        validation_status, correlation_factors, COUNT(*), SUM(baseline_value),
+                        SUM(current_value), SUM(improvement_percentage), MAX(measurement_timestamp)
+                FROM performance_correlations
+                GROUP BY 1, phase, metric_name, validation_status, correlation_factors
+            """, (width, width))
+
+        if (conn.execute("SELECT 1 FROM correlation_rollups LIMIT 1").fetchone() is None and
+                conn.execute("SELECT 1 FROM phase_correlations LIMIT 1").fetchone() is not None):
+            for bucket, width in ROLLUP_BUCKET_SECONDS.items():
+                conn.execute("""
+                    INSERT INTO correlation_rollups
+                    SELECT ?, CAST(timestamp / ? AS INTEGER) * ?, source_phase, target_phase,
+                            correlation_type, COUNT(*), SUM(correlation_strength),
+                            MAX(correlation_strength)
+                    FROM phase_correlations
+                    GROUP BY 2, source_phase, target_phase, correlation_type
+                """, (bucket, width, width))
     
     def store_correlation(self, correlation: MemoryCorrelation) -> bool:
         """Store memory correlation with compression and caching."""
         try:
             start_time = time.time()
             
-            # Prepare data
-            metadata_json = json.dumps(correlation.metadata)
-            if self.enable_compression and len(metadata_json) > 1000:
-                # Compress large metadata
-                metadata_json = gzip.compress(metadata_json.encode()).decode('latin-1')
+            # Prepare data (large metadata is compressed)
+            metadata = _encode_payload(correlation.metadata, self.enable_compression, 1000)
             
             # Store in database
-            with self.connection_pool.get_connection() as conn:
-                conn.execute("""
-                    INSERT INTO phase_correlations 
-                    (source_phase, target_phase, correlation_type, 
-                    correlation_strength, metadata, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    correlation.source_phase,
-                    correlation.target_phase,
-                    correlation.correlation_type,
-                    correlation.correlation_strength,
-                    metadata_json,
-                    correlation.timestamp
-                ))
-                conn.commit()
+            self._write(_INSERT_CORRELATION, (
+                correlation.source_phase,
+                correlation.target_phase,
+                correlation.correlation_type,
+                correlation.correlation_strength,
+                metadata,
+                _coerce_timestamp(correlation.timestamp)
+            ))
             
             # Update cache
             cache_key = f"{correlation.source_phase}-{correlation.target_phase}"
@@ -370,24 +862,16 @@ class PhaseCorrelationStorage:
                 return False
             
             # Store in database
-            with self.connection_pool.get_connection() as conn:
-                conn.execute("""
-                    INSERT INTO performance_correlations 
-                    (phase, metric_name, baseline_value, current_value,
-                    improvement_percentage, correlation_factors, 
-                    measurement_timestamp, validation_status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    perf_corr.phase,
-                    perf_corr.metric_name,
-                    perf_corr.baseline_value,
-                    perf_corr.current_value,
-                    perf_corr.improvement_percentage,
-                    json.dumps(perf_corr.correlation_factors),
-                    perf_corr.measurement_timestamp,
-                    perf_corr.validation_status
-                ))
-                conn.commit()
+            self._write(_INSERT_PERFORMANCE_CORRELATION, (
+                perf_corr.phase,
+                perf_corr.metric_name,
+                perf_corr.baseline_value,
+                perf_corr.current_value,
+                perf_corr.improvement_percentage,
+                json.dumps(perf_corr.correlation_factors),
+                _coerce_timestamp(perf_corr.measurement_timestamp),
+                perf_corr.validation_status
+            ))
             
             # Update cache
             with self.cache_lock:
@@ -421,29 +905,20 @@ class PhaseCorrelationStorage:
             start_time = time.time()
             
             # Serialize entry content
-            content_json = json.dumps(entry.content)
-            if self.enable_compression and len(content_json) > 2000:
-                content_json = gzip.compress(content_json.encode()).decode('latin-1')
+            content = _encode_payload(entry.content, self.enable_compression, 2000)
             
             # Store in database
-            with self.connection_pool.get_connection() as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO memory_entries 
-                    (phase_id, entry_id, entry_type, content_data,
-                    access_count, last_access, created_at, ttl_seconds, tags)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    entry.phase_id,
-                    entry.entry_id,
-                    entry.entry_type,
-                    content_json,
-                    entry.access_count,
-                    entry.last_access,
-                    entry.created_at,
-                    entry.ttl_seconds,
-                    json.dumps(list(entry.tags)) if entry.tags else "[]"
-                ))
-                conn.commit()
+            self._write(_INSERT_MEMORY_ENTRY, (
+                entry.phase_id,
+                entry.entry_id,
+                entry.entry_type,
+                content,
+                entry.access_count,
+                entry.last_access,
+                entry.created_at,
+                entry.ttl_seconds,
+                json.dumps(list(entry.tags)) if entry.tags else "[]"
+            ))
             
             # Record performance
             execution_time = (time.time() - start_time) * 1000
@@ -456,6 +931,74 @@ class PhaseCorrelationStorage:
             logger.error(f"Failed to store memory entry: {e}")
             return False
     
+    def _write(self, statement: str, params: tuple) -> None:
+        """Queue a row for the background writer, or commit it directly."""
+        if self.writer is not None:
+            self.writer.submit(statement, params)
+            return
+
+        with self.connection_pool.get_connection() as conn:
+            conn.execute(statement, params)
+            self._apply_rollups(conn, {statement: [params]})
+            conn.commit()
+        self._bump_epochs([statement])
+
+    def _apply_rollups(self, conn: sqlite3.Connection, rows_by_statement: Dict[str, List[tuple]]) -> None:
+        """Fold newly inserted rows into the rollup tables (same transaction)."""
+        performance_rows = rows_by_statement.get(_INSERT_PERFORMANCE_CORRELATION)
+        if performance_rows:
+            conn.executemany(_UPSERT_PERFORMANCE_ROLLUP, _fold_performance_rollups(performance_rows))
+            conn.executemany(_UPSERT_PERFORMANCE_TREND_ROLLUP, _fold_performance_trend_rollups(performance_rows))
+
+        correlation_rows = rows_by_statement.get(_INSERT_CORRELATION)
+        if correlation_rows:
+            conn.executemany(_UPSERT_CORRELATION_ROLLUP, _fold_correlation_rollups(correlation_rows))
+
+    def _bump_epochs(self, statements: Iterable[str]) -> None:
+        tables = set()
+        for statement in statements:
+            tables.update(_STATEMENT_TABLES.get(statement, ()))
+        self.query_optimizer.bump_epochs(tables)
+
+    def _cached_query(self,
+                    query_hash: str,
+                    tables: Tuple[str, ...],
+                    run: Callable[[], List[Any]],
+                    use_cache: bool = True) -> List[Any]:
+        """
+        Run a read through the epoch-validated query cache.
+
+        Pending writes are flushed and the epochs captured before the query
+        runs, so a result is never cached under an epoch newer than its data.
+        """
+        self._flush_for_read()
+        epochs = self.query_optimizer.current_epochs(tables)
+        if use_cache:
+            cached = self.query_optimizer.get_cached_result(query_hash, epochs)
+            if cached is not None:
+                self.storage_stats["cache_hits"] += 1
+                return list(cached)
+
+        self.storage_stats["cache_misses"] += 1
+        result = run()
+        if use_cache:
+            self.query_optimizer.cache_result(query_hash, result, epochs)
+        return list(result)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued writes are committed."""
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+
+    def _flush_for_read(self) -> bool:
+        """Bounded flush before a read; a stalled writer never blocks readers."""
+        if self.flush(self.read_flush_timeout):
+            return True
+        logger.warning(f"Write-behind queue not drained within {self.read_flush_timeout}s; "
+                       f"reading without {self.writer.pending} pending rows")
+        return False
+
     def _validate_performance_correlation(self, perf_corr: PerformanceCorrelation) -> bool:
         """Validate performance correlation data for quality assurance."""
         # Basic data validation
@@ -480,38 +1023,40 @@ class PhaseCorrelationStorage:
         return True
     
     def get_correlations_by_phase(self, phase: str, use_cache: bool = True) -> List[MemoryCorrelation]:
-        """Get correlations involving a specific phase with intelligent caching."""
-        # Check cache first
-        if use_cache:
-            cached_result = self._get_cached_correlations(phase)
-            if cached_result:
-                self.storage_stats["cache_hits"] += 1
-                return cached_result
-        
-        self.storage_stats["cache_misses"] += 1
+        """Get correlations involving a specific phase, strongest first."""
         start_time = time.time()
-        correlations = []
-        
-        try:
+
+        def run() -> List[MemoryCorrelation]:
+            correlations = []
             with self.connection_pool.get_connection() as conn:
+                # One ranked index walk per side instead of an OR over the table
                 cursor = conn.execute("""
-                    SELECT source_phase, target_phase, correlation_type,
-                            correlation_strength, metadata, timestamp
-                    FROM phase_correlations 
-                    WHERE source_phase = ? OR target_phase = ?
+                    SELECT * FROM (
+                        SELECT source_phase, target_phase, correlation_type,
+                                correlation_strength, metadata, timestamp
+                        FROM phase_correlations
+                        WHERE source_phase = ?
+                        ORDER BY correlation_strength DESC, timestamp DESC
+                        LIMIT 1000
+                    )
+                    UNION ALL
+                    SELECT * FROM (
+                        SELECT source_phase, target_phase, correlation_type,
+                                correlation_strength, metadata, timestamp
+                        FROM phase_correlations
+                        WHERE target_phase = ? AND source_phase != ?
+                        ORDER BY correlation_strength DESC, timestamp DESC
+                        LIMIT 1000
+                    )
                     ORDER BY correlation_strength DESC, timestamp DESC
                     LIMIT 1000
-                """, (phase, phase))
+                """, (phase, phase, phase))
                 
                 for row in cursor.fetchall():
                     # Decompress metadata if needed
-                    metadata_str = row[4]
                     try:
-                        # Try to decompress
-                        if len(metadata_str) > 0 and metadata_str[0] not in '{["':
-                            metadata_str = gzip.decompress(metadata_str.encode('latin-1')).decode()
-                        metadata = json.loads(metadata_str)
-                    except:
+                        metadata = _decode_payload(row[4])
+                    except (OSError, UnicodeError, ValueError):
                         metadata = {}
                     
                     correlation = MemoryCorrelation(
@@ -523,13 +1068,15 @@ class PhaseCorrelationStorage:
                         timestamp=row[5]
                     )
                     correlations.append(correlation)
-            
-            # Update cache
-            if use_cache:
-                self._cache_correlations(phase, correlations)
-        
+            return correlations
+
+        try:
+            correlations = self._cached_query(
+                f"correlations_by_phase:{phase}", ("phase_correlations",), run, use_cache
+            )
         except Exception as e:
             logger.error(f"Failed to get correlations for phase {phase}: {e}")
+            correlations = []
         
         # Record performance
         execution_time = (time.time() - start_time) * 1000
@@ -540,62 +1087,207 @@ class PhaseCorrelationStorage:
     def get_performance_trends(self, 
                                 phase: Optional[str] = None,
                                 metric_name: Optional[str] = None,
-                                validation_status: Optional[str] = None) -> List[PerformanceCorrelation]:
-        """Get performance trends with advanced filtering."""
+                                validation_status: Optional[str] = None,
+                                since: Optional[float] = None) -> List[PerformanceCorrelation]:
+        """
+        Get performance trends from the daily trend rollups.
+
+        Each trend summarises every measurement sharing a phase, metric,
+        validation status and set of correlation factors: values are the
+        means over the window and measurement_timestamp is the latest one.
+
+        Args:
+            phase: Restrict to one phase
+            metric_name: Restrict to one metric
+            validation_status: Restrict to one validation status
+            since: Earliest day bucket (epoch seconds); defaults to the
+                raw row retention window
+
+        Returns:
+            Trends ordered by most recent measurement, at most 1000
+        """
         start_time = time.time()
-        trends = []
-        
-        # Build dynamic query
-        where_clauses = []
-        params = []
-        
-        if phase:
-            where_clauses.append("phase = ?")
-            params.append(phase)
-        
-        if metric_name:
-            where_clauses.append("metric_name = ?")
-            params.append(metric_name)
-        
-        if validation_status:
-            where_clauses.append("validation_status = ?")
-            params.append(validation_status)
-        
-        where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        try:
+        if since is None:
+            since = start_time - DAYS_RETENTION_PERIOD * 24 * 3600
+        since = float(int(since // ROLLUP_BUCKET_SECONDS["day"]) * ROLLUP_BUCKET_SECONDS["day"])
+
+        where_clauses = ["bucket_start >= ?"]
+        params: List[Any] = [since]
+        for column, value in (("phase", phase), ("metric_name", metric_name),
+                                ("validation_status", validation_status)):
+            if value is not None:
+                where_clauses.append(f"{column} = ?")
+                params.append(value)
+
+        def run() -> List[PerformanceCorrelation]:
             with self.connection_pool.get_connection() as conn:
                 cursor = conn.execute(f"""
-                    SELECT phase, metric_name, baseline_value, current_value,
-                            improvement_percentage, correlation_factors,
-                            measurement_timestamp, validation_status
-                    FROM performance_correlations 
-                    WHERE {where_sql}
-                    ORDER BY measurement_timestamp DESC
+                    SELECT phase, metric_name, validation_status, correlation_factors,
+                            SUM(sample_count), SUM(baseline_value_sum), SUM(current_value_sum),
+                            SUM(improvement_sum), MAX(last_timestamp) AS latest
+                    FROM performance_trend_rollups
+                    WHERE {" AND ".join(where_clauses)}
+                    GROUP BY phase, metric_name, validation_status, correlation_factors
+                    ORDER BY latest DESC
                     LIMIT 1000
                 """, params)
-                
-                for row in cursor.fetchall():
-                    trend = PerformanceCorrelation(
+                return [
+                    PerformanceCorrelation(
                         phase=row[0],
                         metric_name=row[1],
-                        baseline_value=row[2],
-                        current_value=row[3],
-                        improvement_percentage=row[4],
-                        correlation_factors=json.loads(row[5]),
-                        measurement_timestamp=row[6],
-                        validation_status=row[7]
+                        baseline_value=row[5] / row[4],
+                        current_value=row[6] / row[4],
+                        improvement_percentage=row[7] / row[4],
+                        correlation_factors=json.loads(row[3]),
+                        measurement_timestamp=row[8],
+                        validation_status=row[2]
                     )
-                    trends.append(trend)
+                    for row in cursor.fetchall()
+                ]
         
+        try:
+            trends = self._cached_query(
+                f"performance_trends:{phase}:{metric_name}:{validation_status}:{since}",
+                ("performance_trend_rollups",),
+                run
+            )
         except Exception as e:
             logger.error(f"Failed to get performance trends: {e}")
+            trends = []
         
         # Record performance
         execution_time = (time.time() - start_time) * 1000
         self.query_optimizer.record_query_performance("get_performance_trends", execution_time)
         
         return trends
+
+    def get_performance_rollups(self,
+                                phase: Optional[str] = None,
+                                metric_name: Optional[str] = None,
+                                bucket: str = "hour",
+                                since: Optional[float] = None,
+                                until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Get bucketed performance trends from the rollup tables.
+
+        Args:
+            phase: Restrict to one phase
+            metric_name: Restrict to one metric
+            bucket: 'minute', 'hour' or 'day'
+            since: Earliest bucket start (epoch seconds)
+            until: Latest bucket start (epoch seconds)
+
+        Returns:
+            One dict per (phase, metric, bucket) ordered by bucket start
+        """
+        if bucket not in ROLLUP_BUCKET_SECONDS:
+            raise ValueError(f"Unsupported rollup bucket: {bucket}")
+
+        start_time = time.time()
+        where_clauses = ["bucket = ?"]
+        params: List[Any] = [bucket]
+        for column, value in (("phase", phase), ("metric_name", metric_name)):
+            if value is not None:
+                where_clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            where_clauses.append("bucket_start >= ?")
+            params.append(since)
+        if until is not None:
+            where_clauses.append("bucket_start <= ?")
+            params.append(until)
+
+        def run() -> List[Dict[str, Any]]:
+            with self.connection_pool.get_connection() as conn:
+                cursor = conn.execute(f"""
+                    SELECT bucket_start, phase, metric_name, sample_count, improvement_sum,
+                            improvement_min, improvement_max, current_value_sum, validated_count
+                    FROM performance_rollups
+                    WHERE {" AND ".join(where_clauses)}
+                    ORDER BY bucket_start, phase, metric_name
+                """, params)
+                return [
+                    {
+                        "bucket_start": row[0],
+                        "phase": row[1],
+                        "metric_name": row[2],
+                        "sample_count": row[3],
+                        "average_improvement": row[4] / row[3],
+                        "min_improvement": row[5],
+                        "max_improvement": row[6],
+                        "average_value": row[7] / row[3],
+                        "validated_count": row[8]
+                    }
+                    for row in cursor.fetchall()
+                ]
+
+        try:
+            rollups = self._cached_query(
+                f"performance_rollups:{bucket}:{phase}:{metric_name}:{since}:{until}",
+                ("performance_rollups",),
+                run
+            )
+        except Exception as e:
+            logger.error(f"Failed to get performance rollups: {e}")
+            rollups = []
+
+        execution_time = (time.time() - start_time) * 1000
+        self.query_optimizer.record_query_performance("get_performance_rollups", execution_time)
+
+        return rollups
+
+    def get_correlation_rollups(self,
+                                phase: Optional[str] = None,
+                                bucket: str = "day",
+                                since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Get bucketed correlation counts and strengths from the rollup tables."""
+        if bucket not in ROLLUP_BUCKET_SECONDS:
+            raise ValueError(f"Unsupported rollup bucket: {bucket}")
+
+        start_time = time.time()
+        where_clauses = ["bucket = ?"]
+        params: List[Any] = [bucket]
+        if phase is not None:
+            where_clauses.append("(source_phase = ? OR target_phase = ?)")
+            params.extend([phase, phase])
+        if since is not None:
+            where_clauses.append("bucket_start >= ?")
+            params.append(since)
+
+        def run() -> List[Dict[str, Any]]:
+            with self.connection_pool.get_connection() as conn:
+                cursor = conn.execute(f"""
+                    SELECT bucket_start, source_phase, target_phase, correlation_type,
+                            correlation_count, strength_sum, strength_max
+                    FROM correlation_rollups
+                    WHERE {" AND ".join(where_clauses)}
+                    ORDER BY bucket_start, source_phase, target_phase
+                """, params)
+                return [
+                    {
+                        "bucket_start": row[0],
+                        "source_phase": row[1],
+                        "target_phase": row[2],
+                        "correlation_type": row[3],
+                        "correlation_count": row[4],
+                        "average_strength": row[5] / row[4],
+                        "max_strength": row[6]
+                    }
+                    for row in cursor.fetchall()
+                ]
+
+        try:
+            rollups = self._cached_query(
+                f"correlation_rollups:{bucket}:{phase}:{since}", ("correlation_rollups",), run
+            )
+        except Exception as e:
+            logger.error(f"Failed to get correlation rollups: {e}")
+            rollups = []
+
+        execution_time = (time.time() - start_time) * 1000
+        self.query_optimizer.record_query_performance("get_correlation_rollups", execution_time)
+
+        return rollups
     
     def store_learning_pattern(self, 
                                 pattern_key: str,
@@ -672,27 +1364,6 @@ class PhaseCorrelationStorage:
         
         return patterns
     
-    def _get_cached_correlations(self, phase: str) -> Optional[List[MemoryCorrelation]]:
-        """Get cached correlations for a phase."""
-        with self.cache_lock:
-            for cache_key, correlations in self.correlation_cache.items():
-                if phase in cache_key:
-                    return correlations
-        return None
-    
-    def _cache_correlations(self, phase: str, correlations: List[MemoryCorrelation]) -> None:
-        """Cache correlations for a phase."""
-        cache_key = f"phase-{phase}"
-        
-        with self.cache_lock:
-            self.correlation_cache[cache_key] = correlations
-            
-            # Limit total cache size
-            if len(self.correlation_cache) > 50:
-                # Remove oldest cache entries
-                oldest_key = min(self.correlation_cache.keys())
-                del self.correlation_cache[oldest_key]
-    
     async def start_maintenance_tasks(self) -> None:
         """Start background maintenance tasks."""
         if self.maintenance_task and not self.maintenance_task.done():
@@ -768,8 +1439,12 @@ class PhaseCorrelationStorage:
     
     async def _cleanup_old_entries(self) -> int:
         """Clean up old entries to maintain bounded storage."""
+        return self.cleanup_old_correlations()
+
+    def cleanup_old_correlations(self, max_age_days: int = 30) -> int:
+        """Delete raw rows older than max_age_days; rollups are kept longer."""
         cleanup_count = 0
-        cutoff_time = time.time() - (30 * 24 * 3600)  # 30 days
+        cutoff_time = time.time() - (max_age_days * 24 * 3600)
         
         cleanup_queries = [
             ("phase_correlations", "timestamp", cutoff_time),
@@ -779,10 +1454,25 @@ class PhaseCorrelationStorage:
         ]
         
         try:
+            self._flush_for_read()
             with self.connection_pool.get_connection() as conn:
                 for table, time_column, cutoff in cleanup_queries:
                     cursor = conn.execute(f"DELETE FROM {table} WHERE {time_column} < ?", (cutoff,))
                     cleanup_count += cursor.rowcount
+
+                # Rollups outlive the raw rows, coarser buckets longest
+                for bucket, retention_days in ROLLUP_RETENTION_DAYS.items():
+                    cutoff = time.time() - retention_days * 24 * 3600
+                    for table in ("performance_rollups", "correlation_rollups"):
+                        cursor = conn.execute(
+                            f"DELETE FROM {table} WHERE bucket = ? AND bucket_start < ?", (bucket, cutoff)
+                        )
+                        cleanup_count += cursor.rowcount
+                cursor = conn.execute(
+                    "DELETE FROM performance_trend_rollups WHERE bucket_start < ?",
+                    (time.time() - ROLLUP_RETENTION_DAYS["day"] * 24 * 3600,)
+                )
+                cleanup_count += cursor.rowcount
                 
                 conn.commit()
             
@@ -790,6 +1480,9 @@ class PhaseCorrelationStorage:
             with self.cache_lock:
                 self.correlation_cache.clear()
                 self.performance_cache.clear()
+            self.query_optimizer.bump_epochs(
+                table for tables in _STATEMENT_TABLES.values() for table in tables
+            )
             
             logger.info(f"Cleaned up {cleanup_count} old entries")
             
@@ -818,8 +1511,13 @@ class PhaseCorrelationStorage:
             return False
         
         try:
+            self._flush_for_read()
             backup_path = f"{self.storage_path}.backup.{int(time.time())}"
-            shutil.copy2(self.storage_path, backup_path)
+            with self.connection_pool.get_connection() as conn:
+                # Copies committed WAL content too, unlike a raw file copy
+                with sqlite3.connect(backup_path) as backup_conn:
+                    conn.backup(backup_conn)
+                backup_conn.close()
             
             # Keep only last 7 backups
             backup_dir = Path(self.storage_path).parent
@@ -853,6 +1551,9 @@ class PhaseCorrelationStorage:
         
         # Add connection pool stats
         stats["connection_pool_size"] = self.connection_pool.pool_size
+
+        if self.writer is not None:
+            stats["write_behind"] = {**self.writer.stats, "pending": self.writer.pending}
         
         # Calculate cache hit rate
         total_requests = stats["cache_hits"] + stats["cache_misses"]
@@ -867,6 +1568,10 @@ class PhaseCorrelationStorage:
         # Stop maintenance tasks
         if self.maintenance_task:
             self.maintenance_task.cancel()
+
+        # Commit queued writes before the connections go away
+        if self.writer is not None:
+            self.writer.close()
         
         # Close connection pool
         self.connection_pool.close_all()
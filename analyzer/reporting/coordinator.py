@@ -16,18 +16,75 @@ Central coordinator for all reporting formats that leverages existing infrastruc
 
 This provides a single entry point for generating reports in any format
 while maintaining compatibility with all existing components.
+
+Multi-format runs share one ReportModel (legacy conversion, chart series,
+tabular violation rows) and render every format from it in parallel. Model data is computed on
+first use, so a format that does not need it never pays for it.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 from analyzer.analyzer_types import UnifiedAnalysisResult
 from analyzer.reporting.json import JSONReporter
 from analyzer.reporting.sarif import SARIFReporter
 from analyzer.reporting.markdown import MarkdownReporter
+from analyzer.reporting.paged_html import PagedHTMLReporter
 
 logger = logging.getLogger(__name__)
 
+class ReportModel:
+    """
+    Intermediate data shared by every report format for one analysis result.
+
+    The legacy conversion, the chart series and the tabular violation rows
+    are built on first access and then reused by every format rendered from
+    this model, including formats rendering concurrently on other threads.
+    """
+
+    def __init__(self, analysis_result: UnifiedAnalysisResult, coordinator: "UnifiedReportingCoordinator"):
+        self.analysis_result = analysis_result
+        self._coordinator = coordinator
+        self._lock = threading.Lock()
+        self._legacy_result: Any = None
+        self._charts: Optional[Dict[str, Dict[str, Any]]] = None
+        self._violation_rows: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def legacy_result(self) -> Any:
+        with self._lock:
+            if self._legacy_result is None:
+                self._legacy_result = self._coordinator._convert_to_legacy_format(self.analysis_result)
+            return self._legacy_result
+
+    @property
+    def severity_chart(self) -> Dict[str, Any]:
+        return self._chart("severity")
+
+    @property
+    def file_chart(self) -> Dict[str, Any]:
+        return self._chart("file")
+
+    @property
+    def type_chart(self) -> Dict[str, Any]:
+        return self._chart("type")
+
+    @property
+    def violation_rows(self) -> List[Dict[str, Any]]:
+        """Connascence then NASA violations normalized to one row shape."""
+        with self._lock:
+            if self._violation_rows is None:
+                self._violation_rows = self._coordinator._create_violation_rows(self.analysis_result)
+            return self._violation_rows
+
+    def _chart(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            if self._charts is None:
+                self._charts = self._coordinator._create_chart_data(self.analysis_result)
+            return self._charts[name]
+
 class UnifiedReportingCoordinator:
     """
     Central coordinator for all reporting formats.
@@ -47,6 +104,19 @@ class UnifiedReportingCoordinator:
         "summary",  # Executive summary
     ]
 
+    FORMAT_EXTENSIONS = {
+        "json": "json",
+        "sarif": "sarif",
+        "markdown": "md",
+        "html": "html",
+        "text": "txt",
+        "csv": "csv",
+        "xml": "xml",
+        "summary": "txt",
+    }
+
+    MAX_RENDER_WORKERS = 8
+
     def __init__(self):
         """Initialize the reporting coordinator with all format handlers."""
 
@@ -83,35 +153,12 @@ class UnifiedReportingCoordinator:
         options = options or {}
         logger.info(f"Generating {format_type} report for {analysis_result.project_path}")
 
-        # Route to appropriate reporter
-        if format_type == "json":
-            content = self._generate_json_report(analysis_result, options)
-        elif format_type == "sarif":
-            content = self._generate_sarif_report(analysis_result, options)
-        elif format_type == "markdown":
-            content = self._generate_markdown_report(analysis_result, options)
-        elif format_type == "html":
-            content = self._generate_html_report(analysis_result, options)
-        elif format_type == "text":
-            content = self._generate_text_report(analysis_result, options)
-        elif format_type == "csv":
-            content = self._generate_csv_report(analysis_result, options)
-        elif format_type == "xml":
-            content = self._generate_xml_report(analysis_result, options)
-        elif format_type == "summary":
-            content = self._generate_summary_report(analysis_result, options)
-        else:
-            raise ValueError(f"Format handler not implemented: {format_type}")
+        model = self.build_report_model(analysis_result)
+        content = self._render(format_type, model, options)
 
         # Save to file if path provided
         if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-            logger.info(f"Report saved to {output_path}")
+            self._write_report(content, Path(output_path))
 
         return content
 
@@ -125,6 +172,9 @@ class UnifiedReportingCoordinator:
         """
         Generate reports in multiple formats simultaneously.
 
+        The shared report model is computed once; each format is then
+        rendered on its own thread and written straight to its file.
+
         Args:
             analysis_result: Results from unified analysis
             formats: List of format types to generate
@@ -138,40 +188,117 @@ class UnifiedReportingCoordinator:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        generated_files = {}
-
-        for format_type in formats:
+        requested = []
+        for format_type in dict.fromkeys(formats):
             if format_type not in self.SUPPORTED_FORMATS:
                 logger.warning(f"Skipping unsupported format: {format_type}")
                 continue
+            requested.append(format_type)
 
-            # Determine file extension
-            extension_map = {
-                "json": "json",
-                "sarif": "sarif",
-                "markdown": "md",
-                "html": "html",
-                "text": "txt",
-                "csv": "csv",
-                "xml": "xml",
-                "summary": "txt",
-            }
+        if not requested:
+            return {}
 
-            extension = extension_map.get(format_type, format_type)
-            output_file = output_dir / f"{base_filename}.{extension}"
+        model = self.build_report_model(analysis_result)
+        generated_files = {}
 
-            try:
-                self.generate_report(analysis_result, format_type, output_file)
-                generated_files[format_type] = str(output_file)
-                logger.info(f"Generated {format_type} report: {output_file}")
-            except Exception as e:
-                logger.error(f"Failed to generate {format_type} report: {e}")
+        def render_to_file(format_type: str) -> Path:
+            extension = self.FORMAT_EXTENSIONS.get(format_type, format_type)
+            output_file = output_dir / f"{base_filename}.{extension}"
+            # text and summary share an extension; keep both files
+            if format_type == "summary" and "text" in requested:
+                output_file = output_dir / f"{base_filename}_summary.{extension}"
+            self._write_report(self._render(format_type, model, {}), output_file)
+            return output_file
+
+        workers = min(len(requested), self.MAX_RENDER_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {format_type: executor.submit(render_to_file, format_type) for format_type in requested}
+
+            for format_type, future in futures.items():
+                try:
+                    output_file = future.result()
+                    generated_files[format_type] = str(output_file)
+                    logger.info(f"Generated {format_type} report: {output_file}")
+                except Exception as e:
+                    logger.error(f"Failed to generate {format_type} report: {e}")
 
         return generated_files
 
-    def get_dashboard_report_data(self, analysis_result: UnifiedAnalysisResult) -> Dict[str, Any]:
+    def generate_paged_html_report(
+        self,
+        analysis_result: UnifiedAnalysisResult,
+        output_dir: Union[str, Path],
+        page_size: int = 1000,
+        shard_by: str = "count",
+        compress: bool = True,
+    ) -> str:
+        """
+        Generate a paged HTML report for very large result sets.
+
+        Writes a shell page, a summary index and sharded JSON data pages
+        that the browser loads on demand instead of one inlined document.
+
+        Args:
+            analysis_result: Results from unified analysis
+            output_dir: Directory that receives index.html and data/
+            page_size: Violations per data page
+            shard_by: 'count' for fixed-size pages or 'directory' to group by directory
+            compress: gzip the data pages
+
+        Returns:
+            Path to the generated index.html
+        """
+
+        reporter = PagedHTMLReporter(page_size=page_size, shard_by=shard_by, compress=compress)
+        metadata = {
+            "project": Path(analysis_result.project_path).name,
+            "path": analysis_result.project_path,
+            "policy": analysis_result.policy_preset,
+            "files_analyzed": analysis_result.files_analyzed,
+            "timestamp": analysis_result.timestamp,
+            "overall_score": analysis_result.overall_quality_score,
+            "nasa_compliance": analysis_result.nasa_compliance_score,
+        }
+        index_path = reporter.write(analysis_result.connascence_violations, output_dir, metadata)
+        return str(index_path)
+
+    def build_report_model(self, analysis_result: UnifiedAnalysisResult) -> ReportModel:
+        """Create the shared model; its data is computed when a format first needs it."""
+        return ReportModel(analysis_result, self)
+
+    def _render(self, format_type: str, model: ReportModel, options: Dict[str, Any]) -> str:
+        """Route a format to its renderer using the shared model."""
+        renderers = {
+            "json": self._generate_json_report,
+            "sarif": self._generate_sarif_report,
+            "markdown": self._generate_markdown_report,
+            "html": self._generate_html_report,
+            "text": self._generate_text_report,
+            "csv": self._generate_csv_report,
+            "xml": self._generate_xml_report,
+            "summary": self._generate_summary_report,
+        }
+        renderer = renderers.get(format_type)
+        if renderer is None:
+            raise ValueError(f"Format handler not implemented: {format_type}")
+        return renderer(model, options)
+
+    def _write_report(self, content: str, output_path: Path) -> None:
+        """Write rendered report content to disk."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        logger.info(f"Report saved to {output_path}")
+
+    def get_dashboard_report_data(
+        self, analysis_result: UnifiedAnalysisResult, model: Optional[ReportModel] = None
+    ) -> Dict[str, Any]:
         """Generate data optimized for dashboard display with enhanced cross-phase integration."""
 
+        model = model or self.build_report_model(analysis_result)
+
         # Extract enhanced metadata if available
         audit_trail = getattr(analysis_result, 'audit_trail', [])
         correlations = getattr(analysis_result, 'correlations', [])
@@ -214,9 +341,9 @@ class UnifiedReportingCoordinator:
                 "smart_recommendations": smart_recommendations,
             },
             "charts": {
-                "severity_distribution": self._create_severity_chart_data(analysis_result),
-                "file_distribution": self._create_file_chart_data(analysis_result),
-                "type_distribution": self._create_type_chart_data(analysis_result),
+                "severity_distribution": model.severity_chart,
+                "file_distribution": model.file_chart,
+                "type_distribution": model.type_chart,
                 "trend_data": self._create_trend_chart_data(analysis_result),
                 "correlation_network": self._create_correlation_chart_data(correlations),
             },
@@ -283,25 +410,22 @@ class UnifiedReportingCoordinator:
 
     # Format-specific generators
 
-    def _generate_json_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_json_report(self, model: ReportModel, options: Dict) -> str:
         """Generate JSON report using existing JSONReporter."""
-        # Convert UnifiedAnalysisResult to format expected by JSONReporter
-        legacy_result = self._convert_to_legacy_format(analysis_result)
-        return self.json_reporter.generate(legacy_result)
+        # JSONReporter expects the legacy AnalysisResult format
+        return self.json_reporter.generate(model.legacy_result)
 
-    def _generate_sarif_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_sarif_report(self, model: ReportModel, options: Dict) -> str:
         """Generate SARIF report using existing SARIFReporter."""
-        legacy_result = self._convert_to_legacy_format(analysis_result)
-        return self.sarif_reporter.generate(legacy_result)
+        return self.sarif_reporter.generate(model.legacy_result)
 
-    def _generate_markdown_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_markdown_report(self, model: ReportModel, options: Dict) -> str:
         """Generate Markdown report using existing MarkdownReporter."""
-        legacy_result = self._convert_to_legacy_format(analysis_result)
-        return self.markdown_reporter.generate(legacy_result)
+        return self.markdown_reporter.generate(model.legacy_result)
 
-    def _generate_html_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_html_report(self, model: ReportModel, options: Dict) -> str:
         """Generate HTML report for dashboard."""
-        self.get_dashboard_report_data(analysis_result)
+        analysis_result = model.analysis_result
 
         html_template = """
 <!DOCTYPE html>
@@ -364,11 +488,11 @@ class UnifiedReportingCoordinator:
             priority_fixes_html=priority_fixes_html,
         )
 
-    def _generate_text_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_text_report(self, model: ReportModel, options: Dict) -> str:
         """Generate plain text report."""
-        return self.get_cli_summary(analysis_result, verbose=options.get("verbose", False))
+        return self.get_cli_summary(model.analysis_result, verbose=options.get("verbose", False))
 
-    def _generate_csv_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_csv_report(self, model: ReportModel, options: Dict) -> str:
         """Generate CSV report."""
         import csv
         import io
@@ -379,38 +503,24 @@ class UnifiedReportingCoordinator:
         # Header
         writer.writerow(["File Path", "Line Number", "Type", "Severity", "Description", "Weight", "Category"])
 
-        # Connascence violations
-        for violation in analysis_result.connascence_violations:
-            writer.writerow(
-                [
-                    violation.get("file_path", ""),
-                    violation.get("line_number", 0),
-                    violation.get("type", ""),
-                    violation.get("severity", ""),
-                    violation.get("description", ""),
-                    violation.get("weight", 1),
-                    "Connascence",
-                ]
-            )
-
-        # NASA violations
-        for violation in analysis_result.nasa_violations:
+        for row in model.violation_rows:
             writer.writerow(
                 [
-                    "",  # file_path
-                    "",  # line_number
-                    violation.get("rule_id", ""),
-                    violation.get("severity", ""),
-                    violation.get("rule_title", ""),
-                    1,  # weight
-                    "NASA",
+                    row["file_path"],
+                    row["line_number"],
+                    row["type"],
+                    row["severity"],
+                    row["description"],
+                    row["weight"],
+                    row["category"],
                 ]
             )
 
         return output.getvalue()
 
-    def _generate_xml_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_xml_report(self, model: ReportModel, options: Dict) -> str:
         """Generate XML report for enterprise integration."""
+        analysis_result = model.analysis_result
         xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <connascence-report>
     <metadata>
@@ -439,13 +549,15 @@ class UnifiedReportingCoordinator:
     <violations>
 """
 
-        for violation in analysis_result.connascence_violations[:10]:  # Limit for brevity
+        # Connascence rows come first; limit for brevity
+        connascence_rows = [row for row in model.violation_rows if row["category"] == "Connascence"]
+        for row in connascence_rows[:10]:
             xml_content += f"""        <violation>
-            <type>{violation.get('type', '')}</type>
-            <severity>{violation.get('severity', '')}</severity>
-            <file>{violation.get('file_path', '')}</file>
-            <line>{violation.get('line_number', 0)}</line>
-            <description>{violation.get('description', '')}</description>
+            <type>{row['type']}</type>
+            <severity>{row['severity']}</severity>
+            <file>{row['file_path']}</file>
+            <line>{row['line_number']}</line>
+            <description>{row['description']}</description>
         </violation>
 """
 
@@ -454,8 +566,9 @@ class UnifiedReportingCoordinator:
 
         return xml_content
 
-    def _generate_summary_report(self, analysis_result: UnifiedAnalysisResult, options: Dict) -> str:
+    def _generate_summary_report(self, model: ReportModel, options: Dict) -> str:
         """Generate executive summary report."""
+        analysis_result = model.analysis_result
 
         # Calculate quality rating
         score = analysis_result.overall_quality_score
@@ -500,6 +613,55 @@ PRIORITY ACTIONS:
 
     # Helper methods for chart data and legacy conversion
 
+    def _create_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict[str, Dict[str, Any]]:
+        """Create severity, file and type chart series in a single pass over the violations."""
+        file_counts: Dict[str, int] = {}
+        type_counts: Dict[str, int] = {}
+
+        for violation in analysis_result.connascence_violations:
+            file_name = Path(violation.get("file_path", "")).name
+            file_counts[file_name] = file_counts.get(file_name, 0) + 1
+
+            viol_type = violation.get("type", "unknown")
+            type_counts[viol_type] = type_counts.get(viol_type, 0) + 1
+
+        # Get top 10 files
+        sorted_files = sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+
+        return {
+            "severity": self._create_severity_chart_data(analysis_result),
+            "file": {"labels": [item[0] for item in sorted_files], "data": [item[1] for item in sorted_files]},
+            "type": {"labels": list(type_counts.keys()), "data": list(type_counts.values())},
+        }
+
+    def _create_violation_rows(self, analysis_result: UnifiedAnalysisResult) -> List[Dict[str, Any]]:
+        """Normalize connascence and NASA violations to the tabular report columns."""
+        rows = [
+            {
+                "file_path": violation.get("file_path", ""),
+                "line_number": violation.get("line_number", 0),
+                "type": violation.get("type", ""),
+                "severity": violation.get("severity", ""),
+                "description": violation.get("description", ""),
+                "weight": violation.get("weight", 1),
+                "category": "Connascence",
+            }
+            for violation in analysis_result.connascence_violations
+        ]
+        rows.extend(
+            {
+                "file_path": "",
+                "line_number": "",
+                "type": violation.get("rule_id", ""),
+                "severity": violation.get("severity", ""),
+                "description": violation.get("rule_title", ""),
+                "weight": 1,
+                "category": "NASA",
+            }
+            for violation in analysis_result.nasa_violations
+        )
+        return rows
+
     def _create_severity_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
         """Create chart data for severity distribution."""
         return {
@@ -512,27 +674,6 @@ PRIORITY ACTIONS:
             ],
         }
 
-    def _create_file_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
-        """Create chart data for file distribution."""
-        file_counts = {}
-        for violation in analysis_result.connascence_violations:
-            file_path = Path(violation.get("file_path", "")).name
-            file_counts[file_path] = file_counts.get(file_path, 0) + 1
-
-        # Get top 10 files
-        sorted_files = sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        return {"labels": [item[0] for item in sorted_files], "data": [item[1] for item in sorted_files]}
-
-    def _create_type_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
-        """Create chart data for violation type distribution."""
-        type_counts = {}
-        for violation in analysis_result.connascence_violations:
-            viol_type = violation.get("type", "unknown")
-            type_counts[viol_type] = type_counts.get(viol_type, 0) + 1
-
-        return {"labels": list(type_counts.keys()), "data": list(type_counts.values())}
-
     def _create_trend_chart_data(self, analysis_result: UnifiedAnalysisResult) -> Dict:
         """Create placeholder trend data (would be populated by historical tracking)."""
         return {
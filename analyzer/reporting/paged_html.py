@@ -0,0 +1,339 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Paged HTML Report for Large Result Sets
+
+Writes a small static shell page plus sharded, gzip-compressed JSON data
+pages and a summary index instead of one monolithic HTML document:
+
+    <output_dir>/
+        index.html              # shell page (constant size)
+        data/summary.json       # totals, chart series and the page index
+        data/page-00000.json.gz # violations, page_size per shard
+
+Violations are consumed as a stream and flushed page by page, so report
+generation is O(n) with memory bounded by the page size. Directory sharding
+keeps at most max_open_pages partial pages open; when another directory
+arrives, the least recently extended one is spilled as a short page. The browser only
+loads the summary up front and fetches pages on demand; the page index
+carries per-page severity counts and directories so filters skip pages
+that cannot match.
+
+Compressed pages are decoded with the browser's DecompressionStream, which
+requires the report to be served over HTTP (for example
+``python -m http.server`` in the output directory). Pass compress=False
+for uncompressed pages.
+"""
+
+from collections import OrderedDict
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+SHARD_BY_COUNT = "count"
+SHARD_BY_DIRECTORY = "directory"
+
+class PagedHTMLReporter:
+    """Streaming writer for paged, lazily-loaded HTML reports."""
+
+    def __init__(
+        self,
+        page_size: int = 1000,
+        shard_by: str = SHARD_BY_COUNT,
+        compress: bool = True,
+        max_open_pages: int = 8,
+    ):
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        if max_open_pages <= 0:
+            raise ValueError("max_open_pages must be positive")
+        if shard_by not in (SHARD_BY_COUNT, SHARD_BY_DIRECTORY):
+            raise ValueError(f"Unsupported shard_by: {shard_by}")
+
+        self.page_size = page_size
+        self.shard_by = shard_by
+        self.compress = compress
+        self.max_open_pages = max_open_pages
+
+    def write(
+        self,
+        violations: Iterable[Dict[str, Any]],
+        output_dir: Union[str, Path],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        Stream violations into data pages and write the shell and index.
+
+        Args:
+            violations: Violation dicts, consumed once
+            output_dir: Directory that receives index.html and data/
+            metadata: Project details shown in the page header
+
+        Returns:
+            Path to index.html
+        """
+        output_dir = Path(output_dir)
+        data_dir = output_dir / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        writer = _PageWriter(data_dir, self.page_size, self.compress)
+        # Open partial pages, least recently extended first
+        buffers: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
+        for violation in violations:
+            key = self._shard_key(violation)
+            buffer = buffers.get(key)
+            if buffer is None:
+                if len(buffers) >= self.max_open_pages:
+                    spilled_key, spilled = buffers.popitem(last=False)
+                    writer.flush(spilled, spilled_key)
+                buffer = buffers[key] = []
+            else:
+                buffers.move_to_end(key)
+            buffer.append(violation)
+            if len(buffer) >= self.page_size:
+                writer.flush(buffers.pop(key), key)
+
+        for key, buffer in buffers.items():
+            writer.flush(buffer, key)
+
+        summary = writer.summary(metadata or {}, self.shard_by)
+        with open(data_dir / "summary.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, default=str)
+
+        index_path = output_dir / "index.html"
+        index_path.write_text(_SHELL_PAGE, encoding="utf-8")
+
+        logger.info(
+            f"Paged HTML report written to {index_path} "
+            f"({summary['total_violations']} violations in {len(summary['pages'])} pages)"
+        )
+        return index_path
+
+    def write_file_results(
+        self,
+        file_results: Iterable[Dict[str, Any]],
+        output_dir: Union[str, Path],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """Write a paged report from per-file streaming results (iter_results)."""
+
+        def flatten():
+            for file_result in file_results:
+                yield from file_result.get("violations", [])
+
+        return self.write(flatten(), output_dir, metadata)
+
+    def _shard_key(self, violation: Dict[str, Any]) -> str:
+        if self.shard_by == SHARD_BY_DIRECTORY:
+            return Path(violation.get("file_path") or "").parent.as_posix()
+        return ""
+
+class _PageWriter:
+    """Writes data pages and accumulates the summary index."""
+
+    SEVERITIES = ("critical", "high", "medium", "low")
+
+    def __init__(self, data_dir: Path, page_size: int, compress: bool):
+        self.data_dir = data_dir
+        self.page_size = page_size
+        self.compress = compress
+        self.pages: List[Dict[str, Any]] = []
+        self.total = 0
+        self.severity_counts: Dict[str, int] = {s: 0 for s in self.SEVERITIES}
+        self.type_counts: Dict[str, int] = {}
+        self.file_counts: Dict[str, int] = {}
+
+    def flush(self, violations: List[Dict[str, Any]], directory: str) -> None:
+        if not violations:
+            return
+
+        page_severities: Dict[str, int] = {}
+        rows = []
+        for violation in violations:
+            severity = violation.get("severity", "medium")
+            file_path = violation.get("file_path", "")
+            viol_type = str(violation.get("type", "unknown"))
+
+            page_severities[severity] = page_severities.get(severity, 0) + 1
+            self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
+            self.type_counts[viol_type] = self.type_counts.get(viol_type, 0) + 1
+            self.file_counts[file_path] = self.file_counts.get(file_path, 0) + 1
+
+            rows.append([
+                file_path,
+                violation.get("line_number", 0),
+                viol_type,
+                severity,
+                violation.get("description", ""),
+            ])
+
+        suffix = ".json.gz" if self.compress else ".json"
+        name = f"page-{len(self.pages):05d}{suffix}"
+        payload = json.dumps(rows, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+        if self.compress:
+            payload = gzip.compress(payload, compresslevel=6)
+        (self.data_dir / name).write_bytes(payload)
+
+        self.pages.append({
+            "file": name,
+            "count": len(rows),
+            "offset": self.total,
+            "directory": directory,
+            "severities": page_severities,
+        })
+        self.total += len(rows)
+
+    def summary(self, metadata: Dict[str, Any], shard_by: str) -> Dict[str, Any]:
+        top_files = sorted(self.file_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        return {
+            "metadata": metadata,
+            "total_violations": self.total,
+            "page_size": self.page_size,
+            "shard_by": shard_by,
+            "compressed": self.compress,
+            "columns": ["file_path", "line_number", "type", "severity", "description"],
+            "charts": {
+                "severity_distribution": {
+                    "labels": list(self.severity_counts.keys()),
+                    "data": list(self.severity_counts.values()),
+                },
+                "type_distribution": {
+                    "labels": list(self.type_counts.keys()),
+                    "data": list(self.type_counts.values()),
+                },
+                "file_distribution": {
+                    "labels": [Path(f).name for f, _ in top_files],
+                    "data": [c for _, c in top_files],
+                },
+            },
+            "pages": self.pages,
+        }
+
+_SHELL_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Connascence Analysis Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .header { background: #f5f5f5; padding: 20px; border-radius: 5px; }
+        .metrics { display: flex; gap: 20px; margin: 20px 0; }
+        .metric { flex: 1; padding: 15px; background: #e9f4ff; border-radius: 5px; text-align: center; }
+        .controls { display: flex; gap: 10px; margin: 20px 0; align-items: center; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { text-align: left; padding: 6px; border-bottom: 1px solid #eee; font-size: 13px; }
+        .critical { border-left: 4px solid #d73a49; }
+        .high { border-left: 4px solid #fb8500; }
+        .medium { border-left: 4px solid #ffd60a; }
+        .low { border-left: 4px solid #28a745; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Connascence Analysis Report</h1>
+        <p><strong>Project:</strong> <span id="project"></span></p>
+        <p><strong>Analysis Time:</strong> <span id="timestamp"></span></p>
+    </div>
+    <div class="metrics" id="metrics"></div>
+    <div class="controls">
+        <select id="severity">
+            <option value="">All severities</option>
+            <option>critical</option><option>high</option><option>medium</option><option>low</option>
+        </select>
+        <input id="path" placeholder="Path prefix">
+        <input id="text" placeholder="Search description">
+        <button id="prev">&laquo; Prev</button>
+        <span id="position"></span>
+        <button id="next">Next &raquo;</button>
+    </div>
+    <table>
+        <thead><tr><th>File</th><th>Line</th><th>Type</th><th>Severity</th><th>Description</th></tr></thead>
+        <tbody id="rows"></tbody>
+    </table>
+<script>
+(function () {
+    var summary = null, pages = [], cursor = 0, cache = {};
+    var el = function (id) { return document.getElementById(id); };
+
+    function loadPage(page) {
+        if (cache[page.file]) { return Promise.resolve(cache[page.file]); }
+        return fetch("data/" + page.file).then(function (response) {
+            if (!summary.compressed) { return response.json(); }
+            var stream = response.body.pipeThrough(new DecompressionStream("gzip"));
+            return new Response(stream).json();
+        }).then(function (rows) {
+            cache = {};  // keep a single page resident
+            cache[page.file] = rows;
+            return rows;
+        });
+    }
+
+    function matchingPages() {
+        var severity = el("severity").value, prefix = el("path").value;
+        return summary.pages.filter(function (page) {
+            if (severity && !page.severities[severity]) { return false; }
+            if (prefix && summary.shard_by === "directory" &&
+                page.directory.indexOf(prefix) !== 0 && prefix.indexOf(page.directory) !== 0) { return false; }
+            return true;
+        });
+    }
+
+    function render() {
+        el("position").textContent = pages.length ? "Page " + (cursor + 1) + " of " + pages.length : "No matches";
+        var body = el("rows");
+        body.textContent = "";
+        if (!pages.length) { return; }
+        var severity = el("severity").value, prefix = el("path").value, text = el("text").value.toLowerCase();
+        loadPage(pages[cursor]).then(function (rows) {
+            rows.forEach(function (row) {
+                if (severity && row[3] !== severity) { return; }
+                if (prefix && String(row[0]).indexOf(prefix) !== 0) { return; }
+                if (text && String(row[4]).toLowerCase().indexOf(text) === -1) { return; }
+                var tr = document.createElement("tr");
+                tr.className = row[3];
+                row.forEach(function (value) {
+                    var td = document.createElement("td");
+                    td.textContent = value;
+                    tr.appendChild(td);
+                });
+                body.appendChild(tr);
+            });
+        });
+    }
+
+    function refilter() { pages = matchingPages(); cursor = 0; render(); }
+
+    fetch("data/summary.json").then(function (r) { return r.json(); }).then(function (data) {
+        summary = data;
+        el("project").textContent = data.metadata.project || "";
+        el("timestamp").textContent = data.metadata.timestamp || "";
+        var metrics = [["Total Violations", data.total_violations]];
+        var chart = data.charts.severity_distribution;
+        chart.labels.forEach(function (label, i) { metrics.push([label, chart.data[i]]); });
+        metrics.forEach(function (metric) {
+            var div = document.createElement("div");
+            div.className = "metric";
+            var h = document.createElement("h3");
+            h.textContent = metric[0];
+            var v = document.createElement("div");
+            v.style.fontSize = "24px";
+            v.textContent = metric[1];
+            div.appendChild(h);
+            div.appendChild(v);
+            el("metrics").appendChild(div);
+        });
+        ["severity", "path", "text"].forEach(function (id) { el(id).addEventListener("change", refilter); });
+        el("prev").addEventListener("click", function () { if (cursor > 0) { cursor--; render(); } });
+        el("next").addEventListener("click", function () { if (cursor < pages.length - 1) { cursor++; render(); } });
+        refilter();
+    });
+})();
+</script>
+</body>
+</html>
+"""
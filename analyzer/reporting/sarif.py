@@ -7,6 +7,10 @@ Generates SARIF (Static Analysis Results Interchange Format) reports
 compatible with GitHub Code Scanning, Azure DevOps, and other platforms.
 
 SARIF 2.1.0 Specification: https://docs.oasis-open.org/sarif/sarif/v2.1.0/
+
+For very large result sets use SARIFStreamWriter, which writes the run
+header and rules once and then appends each result to the output file as
+it arrives, so memory stays flat regardless of finding count.
 """
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
@@ -14,7 +18,7 @@ from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, IO, Iterable, List
 import json
 
 import uuid
@@ -22,6 +26,9 @@ import uuid
 from analyzer.ast_engine.core_analyzer import AnalysisResult, Violation
 from analyzer.thresholds import ConnascenceType
 
+SARIF_SCHEMA = "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+
 class SARIFReporter:
     """SARIF 2.1.0 report generator."""
 
@@ -31,11 +38,16 @@ class SARIFReporter:
         self.tool_uri = "https://github.com/connascence/connascence-analyzer"
         self.organization = "Connascence Analytics"
 
+        # Rules are static; build them and their lookup tables once
+        self._rules = self._create_rules()
+        self._rule_index_by_id = {rule["id"]: i for i, rule in enumerate(self._rules)}
+        self._uri_cache: Dict[str, str] = {}
+
     def generate(self, result: AnalysisResult) -> str:
         """Generate SARIF report from analysis result."""
         sarif_report = {
-            "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
-            "version": "2.1.0",
+            "$schema": SARIF_SCHEMA,
+            "version": SARIF_VERSION,
             "runs": [self._create_run(result)],
         }
 
@@ -92,7 +104,7 @@ class SARIFReporter:
                         "and dynamic forms (Execution, Timing, Value, Identity) of connascence."
                     )
                 },
-                "rules": self._create_rules(),
+                "rules": self._rules,
                 "notifications": [
                     {
                         "id": "CFG001",
@@ -238,19 +250,17 @@ class SARIFReporter:
 
         # Convert severity to SARIF level
         sarif_level = self._severity_to_sarif_level(violation.severity.value)
+        artifact_location = self._artifact_location(violation.file_path)
 
         result = {
             "ruleId": rule_id,
-            "ruleIndex": self._get_rule_index(violation.type),
+            "ruleIndex": self._rule_index_by_id.get(rule_id, -1),
             "level": sarif_level,
             "message": {"text": violation.description, "arguments": [violation.description]},
             "locations": [
                 {
                     "physicalLocation": {
-                        "artifactLocation": {
-                            "uri": self._normalize_path(violation.file_path),
-                            "uriBaseId": "%SRCROOT%",
-                        },
+                        "artifactLocation": artifact_location,
                         "region": {
                             "startLine": violation.line_number,
                             "startColumn": violation.column + 1,  # SARIF is 1-based
@@ -279,7 +289,7 @@ class SARIFReporter:
 
         # Add related locations for cross-module violations
         if violation.locality == "cross_module" and violation.context:
-            related_locations = self._extract_related_locations(violation)
+            related_locations = self._extract_related_locations(violation, artifact_location)
             if related_locations:
                 result["relatedLocations"] = related_locations
 
@@ -291,28 +301,25 @@ class SARIFReporter:
         return mapping.get(severity, "warning")
 
     def _get_rule_index(self, connascence_type: ConnascenceType) -> int:
-        """Get the index of a rule in the rules array."""
-        # This would map to actual rule positions
-        type_order = [
-            ConnascenceType.NAME,
-            ConnascenceType.TYPE,
-            ConnascenceType.MEANING,
-            ConnascenceType.POSITION,
-            ConnascenceType.ALGORITHM,
-            ConnascenceType.EXECUTION,
-            ConnascenceType.TIMING,
-            ConnascenceType.VALUE,
-            ConnascenceType.IDENTITY,
-        ]
-        return type_order.index(connascence_type)
+        """Get the index of a rule in the rules array (-1 when no rule exists)."""
+        return self._rule_index_by_id.get(f"CON_{connascence_type.value}", -1)
 
     def _normalize_path(self, file_path: str) -> str:
         """Normalize file path for SARIF."""
-        # Convert Windows paths to URI format
-        path = Path(file_path)
-        return path.as_posix()
-
-    def _extract_related_locations(self, violation: Violation) -> List[Dict[str, Any]]:
+        uri = self._uri_cache.get(file_path)
+        if uri is None:
+            # Convert Windows paths to URI format
+            uri = Path(file_path).as_posix()
+            self._uri_cache[file_path] = uri
+        return uri
+
+    def _artifact_location(self, file_path: str) -> Dict[str, Any]:
+        """Build the artifactLocation object for a file."""
+        return {"uri": self._normalize_path(file_path), "uriBaseId": "%SRCROOT%"}
+
+    def _extract_related_locations(
+        self, violation: Violation, artifact_location: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
         """Extract related locations from violation context."""
         related_locations = []
 
@@ -322,10 +329,7 @@ class SARIFReporter:
                 {
                     "id": 1,
                     "physicalLocation": {
-                        "artifactLocation": {
-                            "uri": self._normalize_path(violation.file_path),
-                            "uriBaseId": "%SRCROOT%",
-                        },
+                        "artifactLocation": artifact_location or self._artifact_location(violation.file_path),
                         "region": {"startLine": violation.line_number, "startColumn": violation.column + 1},
                     },
                     "message": {"text": f"Related to {violation.context['similar_function']}"},
@@ -334,6 +338,24 @@ class SARIFReporter:
 
         return related_locations
 
+    def stream_results(
+        self,
+        file_results: Iterable[Dict[str, Any]],
+        output_file: str,
+        project_root: str = ".",
+        policy_preset: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Stream per-file results (e.g. from iter_results) straight into a SARIF file.
+
+        Returns the run summary written to the run properties.
+        """
+        with open(output_file, "w", encoding="utf-8") as f:
+            with SARIFStreamWriter(self, f, project_root=project_root, policy_preset=policy_preset) as writer:
+                for file_result in file_results:
+                    writer.write_file_result(file_result)
+            return writer.summary()
+
     def export_results(self, result, output_file=None):
         """Export results to SARIF format.
 
@@ -366,8 +388,8 @@ class SARIFReporter:
         violations = result_dict.get("violations", [])
 
         sarif_report = {
-            "$schema": "https://schemastore.azurewebsites.net/schemas/json/sarif-2.1.0.json",
-            "version": "2.1.0",
+            "$schema": SARIF_SCHEMA,
+            "version": SARIF_VERSION,
             "runs": [
                 {
                     "tool": self._create_tool(),
@@ -410,10 +432,7 @@ class SARIFReporter:
             "locations": [
                 {
                     "physicalLocation": {
-                        "artifactLocation": {
-                            "uri": self._normalize_path(violation_dict.get("file_path", "unknown.py")),
-                            "uriBaseId": "%SRCROOT%",
-                        },
+                        "artifactLocation": self._artifact_location(violation_dict.get("file_path") or "unknown.py"),
                         "region": {"startLine": violation_dict.get("line_number", 1), "startColumn": 1},
                     }
                 }
@@ -429,4 +448,135 @@ class SARIFReporter:
             },
         }
 
+        rule_index = self._rule_index_by_id.get(rule_id)
+        if rule_index is not None:
+            result["ruleIndex"] = rule_index
+
         return result
+
+class SARIFStreamWriter:
+    """
+    Incremental SARIF writer.
+
+    Writes the document header, tool descriptor and rules on open, appends
+    each result as it arrives, and closes the run with summary properties.
+    Only running counters are held in memory.
+
+    Example:
+        with open("report.sarif", "w") as f, SARIFStreamWriter(SARIFReporter(), f) as writer:
+            for file_result in analyzer.iter_results(path):
+                writer.write_file_result(file_result)
+    """
+
+    def __init__(
+        self,
+        reporter: SARIFReporter,
+        stream: IO[str],
+        project_root: str = ".",
+        policy_preset: str = "default",
+    ):
+        self.reporter = reporter
+        self.stream = stream
+        self.project_root = project_root
+        self.policy_preset = policy_preset
+        self.start_time = f"{datetime.now().isoformat()}Z"
+
+        self.results_written = 0
+        self.files_written = 0
+        self.severity_counts: Dict[str, int] = {}
+        self._opened = False
+        self._closed = False
+
+    def __enter__(self) -> "SARIFStreamWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(execution_successful=exc_type is None)
+
+    def open(self) -> None:
+        """Write everything that precedes the results array."""
+        if self._opened:
+            return
+        self._opened = True
+
+        automation = {
+            "id": f"connascence/{uuid.uuid4()}",
+            "correlationGuid": str(uuid.uuid4()),
+            "description": {"text": "Connascence analysis for Python codebases"},
+        }
+        invocations = [
+            {
+                "executionSuccessful": True,
+                "startTimeUtc": self.start_time,
+                "workingDirectory": {"uri": f"file://{self.project_root}"},
+            }
+        ]
+
+        self.stream.write(f'{{"$schema": {json.dumps(SARIF_SCHEMA)}, "version": {json.dumps(SARIF_VERSION)}, "runs": [{{')
+        self.stream.write(f'"tool": {json.dumps(self.reporter._create_tool(), ensure_ascii=False)}, ')
+        self.stream.write(f'"automationDetails": {json.dumps(automation)}, ')
+        self.stream.write(f'"invocations": {json.dumps(invocations)}, ')
+        self.stream.write('"results": [\n')
+
+    def write_violation(self, violation: Any) -> None:
+        """Append one result; accepts Violation objects or violation dicts."""
+        if isinstance(violation, dict):
+            result = self.reporter._create_result_from_dict(violation)
+            severity = violation.get("severity", "medium")
+        else:
+            result = self.reporter._create_result(violation)
+            severity = violation.severity.value
+
+        if self.results_written:
+            self.stream.write(",\n")
+        self.stream.write(json.dumps(result, ensure_ascii=False, default=str))
+
+        self.results_written += 1
+        self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
+
+    def write_violations(self, violations: Iterable[Any]) -> None:
+        """Append several results."""
+        for violation in violations:
+            self.write_violation(violation)
+
+    def write_file_result(self, file_result: Dict[str, Any]) -> None:
+        """Append every violation from one per-file streaming result."""
+        self.write_violations(file_result.get("violations", []))
+        self.files_written += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Running totals for the run properties."""
+        return {
+            "total_violations": self.results_written,
+            "files_analyzed": self.files_written,
+            "severity_counts": dict(self.severity_counts),
+        }
+
+    def close(self, execution_successful: bool = True) -> None:
+        """Close the results array and write the run trailer."""
+        if self._closed:
+            return
+        self.open()
+        self._closed = True
+
+        conversion = {
+            "tool": {"driver": {"name": "connascence-cli", "version": self.reporter.tool_version}},
+            "invocation": {
+                "executionSuccessful": execution_successful,
+                "startTimeUtc": self.start_time,
+                "endTimeUtc": f"{datetime.now().isoformat()}Z",
+            },
+        }
+        properties = {
+            "analysisType": "connascence",
+            "totalFilesAnalyzed": self.files_written,
+            "policyPreset": self.policy_preset,
+            "summaryMetrics": self.summary(),
+        }
+
+        self.stream.write("\n], ")
+        self.stream.write(f'"conversion": {json.dumps(conversion)}, ')
+        self.stream.write(f'"properties": {json.dumps(properties, default=str)}')
+        self.stream.write("}]}\n")
+        self.stream.flush()
@@ -1,20 +1,29 @@
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
-
-from analyzer.constants.thresholds import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH, MINIMUM_TEST_COVERAGE_PERCENTAGE
 """
+Dashboard Reporter
+==================
 
 Generates real-time reporting data for streaming analysis dashboards.
 Provides structured data for visualization of violations, performance metrics,
 and system health during continuous analysis operations.
 
+System health is sampled at most once per health check interval, so frequent
+dashboard refreshes do not re-run the psutil sample on every report.
+
 NASA Rule 7 Compliant: Bounded data structures with automatic cleanup.
 """
 
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from threading import RLock
+from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
 import json
 import time
 import logging
-from dataclasses import asdict
+
+from analyzer.constants.thresholds import DAYS_RETENTION_PERIOD, MAXIMUM_NESTED_DEPTH, MINIMUM_TEST_COVERAGE_PERCENTAGE
+from analyzer.optimization.streaming_performance_monitor import get_global_streaming_monitor
+
+from .result_aggregator import AggregatedResult, get_global_stream_aggregator
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +129,9 @@ class DashboardReporter:
         # Performance tracking
         self.report_generation_times: deque = deque(maxlen=100)
         self.dashboard_requests_count = 0
+
+        # Latest system health sample, reused until the next health check
+        self._health_cache: Optional[Dict[str, Any]] = None
         
         logger.info(f"DashboardReporter initialized with {metrics_retention_minutes}min retention")
     
@@ -142,12 +154,12 @@ class DashboardReporter:
             
             # Generate dashboard sections
             dashboard_data = {
-                "metadata": self._generate_metadata(),
+                "metadata": self._generate_metadata(aggregated_result),
                 "summary": self._generate_summary(aggregated_result, performance_report),
                 "violations": self._generate_violations_data(aggregated_result),
                 "performance": self._generate_performance_data(performance_report),
                 "trends": self._generate_trends_data(),
-                "system_health": self._generate_system_health(),
+                "system_health": self._get_system_health(),
                 "files": self._generate_files_data(aggregated_result),
                 "alerts": self._generate_alerts(aggregated_result, performance_report)
             }
@@ -163,6 +175,13 @@ class DashboardReporter:
             logger.debug(f"Generated dashboard report in {generation_time:.2f}ms")
             
             return dashboard_data
+
+    def _get_system_health(self) -> Dict[str, Any]:
+        """System health section, sampled at most once per health check interval."""
+        now = time.time()
+        if self._health_cache is None or now - self._health_cache["sampled_at"] >= self.health_check_interval:
+            self._health_cache = {**self._generate_system_health(), "sampled_at": now}
+        return self._health_cache
     
     def add_metrics_sample(self, 
                             violations: int,
@@ -257,11 +276,12 @@ class DashboardReporter:
                 "dashboard_requests": self.dashboard_requests_count
             }
     
-    def _generate_metadata(self) -> Dict[str, Any]:
+    def _generate_metadata(self, aggregated_result: AggregatedResult) -> Dict[str, Any]:
         """Generate dashboard metadata."""
         return {
             "generated_at": time.time(),
             "version": "1.0.0",
+            "aggregate_version": aggregated_result.version,
             "retention_minutes": self.metrics_retention_minutes,
             "sampling_interval_seconds": self.trend_sampling_interval,
             "data_points_available": len(self.metrics_history)
@@ -301,6 +321,7 @@ class DashboardReporter:
         
         return {
             "breakdown": violation_breakdown,
+            "severity_breakdown": aggregated_result.severity_breakdown,
             "top_types": [{"type": vtype, "count": count} for vtype, count in top_violations],
             "severity_distribution": severity_distribution,
             "trends_available": list(self.violation_trends.keys()),
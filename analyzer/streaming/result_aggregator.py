@@ -1,9 +1,3 @@
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
-from pathlib import Path
-
-logger = logging.getLogger(__name__)
-
 """
 Stream Result Aggregator System
 ===============================
@@ -12,13 +6,36 @@ Real-time aggregation and merging of streaming analysis results. Handles
 incremental updates, maintains result consistency, and provides efficient
 access to aggregated analysis data during streaming operations.
 
+Aggregates are maintained incrementally rather than recomputed on read:
+
+- Per-type and per-severity totals are running counters; replacing a file's
+  result subtracts its previous contribution and adds the new one.
+- Top violation files come from a fixed-size min-heap, only rebuilt when a
+  member's count drops.
+- Per-file history and per-type trends live in ring buffers, and analysis
+  velocity in per-minute buckets, so memory stays bounded for long-running
+  watch sessions.
+- Reads return read-only snapshots (cached until the next update) whose
+  per-file maps are views over the aggregator state instead of deep copies.
+
 NASA Rule 7 Compliant: Bounded memory usage with LRU eviction.
 """
 
-import json
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from threading import RLock
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+import heapq
 import logging
 import time
 
+logger = logging.getLogger(__name__)
+
+def _empty_view() -> Mapping:
+    return MappingProxyType({})
+
 @dataclass
 class StreamAnalysisResult:
     """Individual streaming analysis result."""
@@ -30,7 +47,7 @@ class StreamAnalysisResult:
     analysis_type: str  # 'incremental', 'full', 'cached'
     dependencies: Set[str] = field(default_factory=set)
     change_type: str = 'modified'  # 'created', 'modified', 'deleted', 'moved'
-    
+
     def __post_init__(self):
         """Validate result data."""
         assert self.file_path, "file_path cannot be empty"
@@ -38,9 +55,9 @@ class StreamAnalysisResult:
         assert isinstance(self.violations, dict), "violations must be dict"
         assert isinstance(self.metrics, dict), "metrics must be dict"
 
-@dataclass
+@dataclass(frozen=True)
 class AggregatedResult:
-    """Aggregated analysis results across multiple files."""
+    """Snapshot of aggregated results across multiple files."""
     total_violations: int = 0
     violation_breakdown: Dict[str, int] = field(default_factory=dict)
     files_analyzed: int = 0
@@ -49,195 +66,350 @@ class AggregatedResult:
     cache_hit_rate: float = 0.0
     incremental_updates: int = 0
     full_analyses: int = 0
-    
-    # Streaming-specific metrics
-    real_time_violations: Dict[str, List[Dict]] = field(default_factory=dict)
-    violation_trends: Dict[str, List[Tuple[float, int]]] = field(default_factory=dict)
-    file_analysis_history: Dict[str, List[Dict]] = field(default_factory=dict)
+    severity_breakdown: Dict[str, int] = field(default_factory=dict)
+    version: int = 0
+
+    # Streaming-specific views (read-only, values are tuples)
+    real_time_violations: Mapping = field(default_factory=_empty_view)
+    violation_trends: Mapping = field(default_factory=_empty_view)
+    file_analysis_history: Mapping = field(default_factory=_empty_view)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization (materializes the views)."""
+        return {
+            "total_violations": self.total_violations,
+            "violation_breakdown": dict(self.violation_breakdown),
+            "files_analyzed": self.files_analyzed,
+            "total_processing_time_ms": self.total_processing_time_ms,
+            "last_update_time": self.last_update_time,
+            "cache_hit_rate": self.cache_hit_rate,
+            "incremental_updates": self.incremental_updates,
+            "full_analyses": self.full_analyses,
+            "severity_breakdown": dict(self.severity_breakdown),
+            "version": self.version,
+            "real_time_violations": {path: list(v) for path, v in self.real_time_violations.items()},
+            "violation_trends": {vtype: [list(point) for point in v] for vtype, v in self.violation_trends.items()},
+            "file_analysis_history": {path: list(v) for path, v in self.file_analysis_history.items()}
+        }
+
+@dataclass
+class _FileContribution:
+    """What one file's current result adds to the running totals."""
+    violation_count: int
+    by_type: Dict[str, int]
+    by_severity: Dict[str, int]
+    processing_time_ms: float
+    incremental: bool
+
+class _ReadOnlyView(Mapping):
+    """
+    Read-only mapping over aggregator state.
+
+    Values are converted with ``transform`` under the aggregator lock on
+    access, so readers never copy entries they do not look at and never
+    observe a ring buffer mid-update.
+    """
+
+    def __init__(self, source: Dict[str, Any], lock: RLock, transform: Callable[[Any], Any] = tuple):
+        self._source = source
+        self._lock = lock
+        self._transform = transform
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._source:  # never let a defaultdict grow on lookup
+                raise KeyError(key)
+            return self._transform(self._source[key])
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = list(self._source)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._source
+
+class _TopFiles:
+    """
+    Fixed-size top-K tracker over per-file counts.
+
+    Keeps at most K members with a lazy min-heap (stale entries are skipped).
+    Increases and new files are O(log K); a member whose count drops marks
+    the tracker dirty and the next read rebuilds from the source counts.
+    """
+
+    def __init__(self, capacity: int, source: Dict[str, int]):
+        self.capacity = capacity
+        self._source = source
+        self._members: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+        self._dirty = False
+
+    def update(self, file_path: str, count: int) -> None:
+        current = self._members.get(file_path)
+        if current is not None:
+            if count < current:
+                self._dirty = True
+            if count <= 0:
+                del self._members[file_path]
+                return
+            self._members[file_path] = count
+            heapq.heappush(self._heap, (count, file_path))
+        elif count > 0:
+            if len(self._members) < self.capacity:
+                self._add(file_path, count)
+            elif count > self._min_count():
+                _, evicted = heapq.heappop(self._heap)
+                del self._members[evicted]
+                self._add(file_path, count)
+        self._compact()
+
+    def remove(self, file_path: str) -> None:
+        if self._members.pop(file_path, None) is not None:
+            self._dirty = True
+
+    def top(self) -> List[Tuple[str, int]]:
+        if self._dirty:
+            largest = heapq.nlargest(self.capacity, self._source.items(), key=lambda item: item[1])
+            self._members = {path: count for path, count in largest if count > 0}
+            self._heap = [(count, path) for path, count in self._members.items()]
+            heapq.heapify(self._heap)
+            self._dirty = False
+        return sorted(self._members.items(), key=lambda item: item[1], reverse=True)
+
+    def _add(self, file_path: str, count: int) -> None:
+        self._members[file_path] = count
+        heapq.heappush(self._heap, (count, file_path))
+
+    def _min_count(self) -> int:
+        while self._heap and self._members.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else 0
+
+    def _compact(self) -> None:
+        # Stale heap entries are bounded to a multiple of K (NASA Rule 7)
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, path) for path, count in self._members.items()]
+            heapq.heapify(self._heap)
 
 class StreamResultAggregator:
     """
     Real-time result aggregation for streaming analysis.
-    
+
     Features:
-    - Incremental result merging and aggregation
-    - Violation trend tracking over time
+    - Incremental result merging with O(1) counter updates
+    - Violation trend tracking over time in ring buffers
     - Efficient memory management with bounded storage
     - Thread-safe operations for concurrent updates
     - Dependency-aware invalidation and updates
-    - Real-time dashboard data generation
+    - Real-time dashboard data generation from snapshot views
     """
-    
+
+    HISTORY_PER_FILE = 100
+    TOP_FILES = 10
+    VELOCITY_WINDOW_MINUTES = 5
+
     def __init__(self,
                 max_file_history: int = 1000,
                 max_trend_points: int = 500,
                 aggregation_window_seconds: float = 300.0):
         """
         Initialize stream result aggregator.
-        
+
         Args:
-            max_file_history: Maximum file results to retain (NASA Rule 7)
+            max_file_history: Maximum files with retained analysis history (NASA Rule 7)
             max_trend_points: Maximum trend data points per violation type
             aggregation_window_seconds: Time window for trend aggregation
         """
         assert 100 <= max_file_history <= 10000, "File history must be 100-10000"
         assert 100 <= max_trend_points <= 5000, "Trend points must be 100-5000"
         assert 60.0 <= aggregation_window_seconds <= 3600.0, "Window must be 1-60 minutes"
-        
+
         self.max_file_history = max_file_history
         self.max_trend_points = max_trend_points
         self.aggregation_window_seconds = aggregation_window_seconds
-        
-        # Thread-safe aggregated state
+
         self._lock = RLock()
-        self.aggregated_result = AggregatedResult()
-        
-        # File-specific result storage (bounded)
+
+        # Latest result per file and its contribution to the totals
         self.file_results: Dict[str, StreamAnalysisResult] = {}
-        self.result_history: deque = deque(maxlen=max_file_history)
-        
+        self._contributions: Dict[str, _FileContribution] = {}
+
+        # Running totals (O(1) add/subtract per violation type)
+        self._type_totals: Dict[str, int] = {}
+        self._severity_totals: Dict[str, int] = {}
+        self._total_violations = 0
+        self._total_processing_time_ms = 0.0
+        self._incremental_files = 0
+        self._last_update_time = 0.0
+
+        # Top violation files
+        self._file_counts: Dict[str, int] = {}
+        self._top_files = _TopFiles(self.TOP_FILES, self._file_counts)
+
+        # Per-file ring buffers, LRU-bounded by file count
+        self._file_history: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        self._real_time_violations: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+
+        # Per-minute velocity buckets: [minute, files, violations, processing_ms]
+        self._velocity_buckets: Deque[List[float]] = deque(maxlen=self.VELOCITY_WINDOW_MINUTES)
+
         # Dependency tracking for intelligent invalidation
         self.file_dependencies: Dict[str, Set[str]] = defaultdict(set)
         self.reverse_dependencies: Dict[str, Set[str]] = defaultdict(set)
-        
+
         # Real-time violation tracking
         self.violation_timeline: defaultdict = defaultdict(lambda: deque(maxlen=max_trend_points))
-        self.active_violations: Dict[str, Dict[str, Any]] = {}
-        
+
+        # Snapshot cache, invalidated by version bumps
+        self._version = 0
+        self._snapshot: Optional[AggregatedResult] = None
+
         # Performance metrics
         self.aggregation_stats = {
             "updates_processed": 0,
             "invalidations_triggered": 0,
             "cache_operations": 0,
             "merge_operations": 0,
-            "last_aggregation_time_ms": 0.0
+            "last_aggregation_time_ms": 0.0,
+            "snapshots_built": 0
         }
-        
+
         logger.info(f"StreamResultAggregator initialized with {max_file_history} file history")
-    
+
     def add_result(self, result: StreamAnalysisResult) -> None:
         """
         Add new streaming analysis result and update aggregated state.
-        
+
         Args:
             result: New analysis result to add
         """
         with self._lock:
             start_time = time.perf_counter()
-            
+
             # Store individual result
             old_result = self.file_results.get(result.file_path)
             self.file_results[result.file_path] = result
-            self.result_history.append(result)
-            
+
             # Update dependency tracking
             self._update_dependencies(result)
-            
+
             # Handle dependency invalidation if needed
             if old_result and old_result.dependencies != result.dependencies:
                 self._invalidate_dependent_results(result.file_path)
-            
+
             # Update aggregated metrics
-            self._update_aggregated_metrics(result, old_result)
-            
-            # Update violation timeline and trends
-            self._update_violation_trends(result)
-            
+            contribution = self._update_aggregated_metrics(result)
+
+            # Update violation timeline, history and velocity
+            self._update_violation_trends(result, contribution)
+
             # Update performance stats
             processing_time = (time.perf_counter() - start_time) * 1000
             self.aggregation_stats["updates_processed"] += 1
             self.aggregation_stats["last_aggregation_time_ms"] = processing_time
             self.aggregation_stats["merge_operations"] += 1
-            
+
             logger.debug(f"Added result for {result.file_path} in {processing_time:.2f}ms")
-    
+
     def remove_result(self, file_path: str) -> bool:
         """
         Remove result for a file (e.g., when file is deleted).
-        
+
         Args:
             file_path: Path of file to remove
-            
+
         Returns:
             True if result was removed
         """
         with self._lock:
             if file_path not in self.file_results:
                 return False
-            
-            old_result = self.file_results.pop(file_path)
-            
-            # Update aggregated metrics by subtracting old result
-            self._subtract_result_from_aggregated(old_result)
-            
-            # Clean up dependencies
+
+            del self.file_results[file_path]
+            self._subtract_contribution(file_path)
+
+            # Clean up dependencies and per-file state
             self._cleanup_dependencies(file_path)
-            
-            # Remove from active violations
-            if file_path in self.active_violations:
-                del self.active_violations[file_path]
-            
+            self._file_history.pop(file_path, None)
+            self._real_time_violations.pop(file_path, None)
+            self._version += 1
+
             logger.info(f"Removed result for deleted file: {file_path}")
             return True
-    
+
     def get_aggregated_result(self) -> AggregatedResult:
-        """Get current aggregated analysis result."""
+        """
+        Get current aggregated analysis result.
+
+        The snapshot is built once per version. Each caller gets its own
+        plain-dict breakdowns (small: one entry per violation type or
+        severity); the per-file maps are read-only views, not copies, so use
+        to_dict() before serializing.
+        """
         with self._lock:
-            # Update timestamp
-            self.aggregated_result.last_update_time = time.time()
-            
-            # Calculate cache hit rate
-            total_analyses = self.aggregated_result.incremental_updates + self.aggregated_result.full_analyses
-            if total_analyses > 0:
-                # Incremental updates indicate cache usage
-                self.aggregated_result.cache_hit_rate = (self.aggregated_result.incremental_updates / total_analyses) * 100.0
-            
-            # Deep copy for thread safety
-            return AggregatedResult(
-                total_violations=self.aggregated_result.total_violations,
-                violation_breakdown=self.aggregated_result.violation_breakdown.copy(),
-                files_analyzed=self.aggregated_result.files_analyzed,
-                total_processing_time_ms=self.aggregated_result.total_processing_time_ms,
-                last_update_time=self.aggregated_result.last_update_time,
-                cache_hit_rate=self.aggregated_result.cache_hit_rate,
-                incremental_updates=self.aggregated_result.incremental_updates,
-                full_analyses=self.aggregated_result.full_analyses,
-                real_time_violations=self._copy_nested_dict(self.aggregated_result.real_time_violations),
-                violation_trends=self._copy_nested_dict(self.aggregated_result.violation_trends),
-                file_analysis_history=self._copy_nested_dict(self.aggregated_result.file_analysis_history)
+            if self._snapshot is None or self._snapshot.version != self._version:
+                self._snapshot = self._build_snapshot()
+            return replace(
+                self._snapshot,
+                violation_breakdown=dict(self._snapshot.violation_breakdown),
+                severity_breakdown=dict(self._snapshot.severity_breakdown)
             )
-    
+
+    def _build_snapshot(self) -> AggregatedResult:
+        """Snapshot of the running totals; caller holds the lock."""
+        files_analyzed = len(self._contributions)
+        snapshot = AggregatedResult(
+            total_violations=self._total_violations,
+            violation_breakdown=dict(self._type_totals),
+            files_analyzed=files_analyzed,
+            total_processing_time_ms=self._total_processing_time_ms,
+            last_update_time=self._last_update_time,
+            # Incremental updates indicate cache usage
+            cache_hit_rate=(self._incremental_files / files_analyzed) * 100.0 if files_analyzed else 0.0,
+            incremental_updates=self._incremental_files,
+            full_analyses=files_analyzed - self._incremental_files,
+            severity_breakdown=dict(self._severity_totals),
+            version=self._version,
+            real_time_violations=_ReadOnlyView(self._real_time_violations, self._lock, transform=lambda v: v),
+            violation_trends=_ReadOnlyView(self.violation_timeline, self._lock),
+            file_analysis_history=_ReadOnlyView(self._file_history, self._lock)
+        )
+        self.aggregation_stats["snapshots_built"] += 1
+        return snapshot
+
     def get_real_time_dashboard_data(self) -> Dict[str, Any]:
         """Generate real-time dashboard data."""
         with self._lock:
             current_time = time.time()
-            
+            snapshot = self.get_aggregated_result()
+
             # Get recent violation trends (last 10 minutes)
             recent_trends = {}
             for violation_type, timeline in self.violation_timeline.items():
-                recent_points = [(timestamp, count) for timestamp, count in timeline 
-                                if current_time - timestamp <= 600.0]
+                recent_points = self._points_since(timeline, current_time - 600.0)
                 if recent_points:
                     recent_trends[violation_type] = recent_points
-            
+
             # Calculate velocity metrics
             velocity_data = self._calculate_analysis_velocity()
-            
-            # Get top violation files
-            top_violation_files = self._get_top_violation_files(limit=10)
-            
+
             dashboard_data = {
                 "summary": {
-                    "total_violations": self.aggregated_result.total_violations,
-                    "files_analyzed": self.aggregated_result.files_analyzed,
-                    "cache_hit_rate": self.aggregated_result.cache_hit_rate,
-                    "last_update": self.aggregated_result.last_update_time,
+                    "total_violations": snapshot.total_violations,
+                    "files_analyzed": snapshot.files_analyzed,
+                    "cache_hit_rate": snapshot.cache_hit_rate,
+                    "last_update": snapshot.last_update_time,
                     "processing_velocity": velocity_data["files_per_minute"]
                 },
-                "violation_breakdown": self.aggregated_result.violation_breakdown,
+                "violation_breakdown": snapshot.violation_breakdown,
+                "severity_breakdown": snapshot.severity_breakdown,
                 "trends": recent_trends,
                 "velocity": velocity_data,
-                "top_files": top_violation_files,
+                "top_files": self._get_top_violation_files(limit=self.TOP_FILES),
                 "performance": {
                     "updates_processed": self.aggregation_stats["updates_processed"],
                     "average_aggregation_time_ms": self.aggregation_stats["last_aggregation_time_ms"],
@@ -245,63 +417,57 @@ class StreamResultAggregator:
                     "active_file_count": len(self.file_results)
                 }
             }
-            
+
             return dashboard_data
-    
+
     def get_file_analysis_history(self, file_path: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get analysis history for a specific file."""
         with self._lock:
-            if file_path not in self.aggregated_result.file_analysis_history:
+            history = self._file_history.get(file_path)
+            if not history:
                 return []
-            
-            history = self.aggregated_result.file_analysis_history[file_path]
-            return history[-limit:] if len(history) > limit else history
-    
+
+            return list(history)[-limit:]
+
     def get_violation_trends(self,
-                            violation_type: str, 
+                            violation_type: str,
                             time_window_seconds: float = 3600.0) -> List[Tuple[float, int]]:
         """Get violation trend data for a specific type."""
         with self._lock:
             if violation_type not in self.violation_timeline:
                 return []
-            
-            current_time = time.time()
+
             timeline = self.violation_timeline[violation_type]
-            
-            # Filter to time window
-            recent_points = [(timestamp, count) for timestamp, count in timeline
-                            if current_time - timestamp <= time_window_seconds]
-            
-            return recent_points
-    
+            return self._points_since(timeline, time.time() - time_window_seconds)
+
     def invalidate_file_results(self, file_paths: List[str]) -> int:
         """
         Invalidate results for specific files (e.g., due to dependency changes).
-        
+
         Args:
             file_paths: List of file paths to invalidate
-            
+
         Returns:
             Number of files invalidated
         """
         with self._lock:
             invalidated = 0
-            
+
             for file_path in file_paths:
                 if file_path in self.file_results:
-                    # Remove from aggregated metrics
-                    old_result = self.file_results[file_path]
-                    self._subtract_result_from_aggregated(old_result)
-                    
                     # Remove the result but keep file in tracking for re-analysis
                     del self.file_results[file_path]
+                    self._subtract_contribution(file_path)
+                    self._real_time_violations.pop(file_path, None)
                     invalidated += 1
-            
+
+            if invalidated:
+                self._version += 1
             self.aggregation_stats["invalidations_triggered"] += invalidated
             logger.info(f"Invalidated results for {invalidated} files")
-            
+
             return invalidated
-    
+
     def get_aggregation_stats(self) -> Dict[str, Any]:
         """Get aggregation performance statistics."""
         with self._lock:
@@ -312,137 +478,158 @@ class StreamResultAggregator:
                 "violation_types_tracked": len(self.violation_timeline),
                 "memory_usage_estimate_mb": self._estimate_memory_usage()
             }
-    
+
     def _update_dependencies(self, result: StreamAnalysisResult) -> None:
         """Update dependency tracking for a result."""
         file_path = result.file_path
-        
+
         # Clear old dependencies
         old_deps = self.file_dependencies.get(file_path, set())
         for dep in old_deps:
             self.reverse_dependencies[dep].discard(file_path)
-        
+
         # Set new dependencies
         self.file_dependencies[file_path] = result.dependencies.copy()
         for dep in result.dependencies:
             self.reverse_dependencies[dep].add(file_path)
-    
+
     def _invalidate_dependent_results(self, changed_file: str) -> None:
         """Invalidate results that depend on a changed file."""
         dependent_files = self.reverse_dependencies.get(changed_file, set())
         if dependent_files:
             self.invalidate_file_results(list(dependent_files))
-    
-    def _update_aggregated_metrics(self,
-                                new_result: StreamAnalysisResult, 
-                                old_result: Optional[StreamAnalysisResult]) -> None:
-        """Update aggregated metrics with new result."""
-        # Subtract old result if exists
-        if old_result:
-            self._subtract_result_from_aggregated(old_result)
-        else:
-            # New file being analyzed
-            self.aggregated_result.files_analyzed += 1
-        
-        # Add new result metrics
-        violation_count = sum(len(v) if isinstance(v, list) else 1 
-                            for v in new_result.violations.values() if v)
-        self.aggregated_result.total_violations += violation_count
-        
-        # Update violation breakdown
-        for violation_type, violations in new_result.violations.items():
-            if violations:  # Only count non-empty violations
-                count = len(violations) if isinstance(violations, list) else 1
-                self.aggregated_result.violation_breakdown[violation_type] = \
-                    self.aggregated_result.violation_breakdown.get(violation_type, 0) + count
-        
-        # Update processing time
-        self.aggregated_result.total_processing_time_ms += new_result.processing_time_ms
-        
-        # Update analysis type counters
-        if new_result.analysis_type == 'incremental':
-            self.aggregated_result.incremental_updates += 1
-        else:
-            self.aggregated_result.full_analyses += 1
-        
-        # Store real-time violations
-        if new_result.violations:
-            self.aggregated_result.real_time_violations[new_result.file_path] = [
+
+    def _update_aggregated_metrics(self, new_result: StreamAnalysisResult) -> _FileContribution:
+        """Replace a file's contribution to the running totals."""
+        file_path = new_result.file_path
+        self._subtract_contribution(file_path, keep_rank=True)
+
+        contribution = self._measure(new_result)
+        self._contributions[file_path] = contribution
+
+        self._total_violations += contribution.violation_count
+        for violation_type, count in contribution.by_type.items():
+            self._type_totals[violation_type] = self._type_totals.get(violation_type, 0) + count
+        for severity, count in contribution.by_severity.items():
+            self._severity_totals[severity] = self._severity_totals.get(severity, 0) + count
+        self._total_processing_time_ms += contribution.processing_time_ms
+        self._incremental_files += contribution.incremental
+
+        self._file_counts[file_path] = contribution.violation_count
+        self._top_files.update(file_path, contribution.violation_count)
+
+        # Store real-time violations (replaced, never mutated, so views can share them)
+        if contribution.by_type:
+            self._real_time_violations[file_path] = tuple(
                 {
                     "timestamp": new_result.timestamp,
                     "violations": new_result.violations,
                     "type": violation_type
-                } for violation_type in new_result.violations.keys() if new_result.violations[violation_type]
-            ]
-        
-        # Update file analysis history
-        if new_result.file_path not in self.aggregated_result.file_analysis_history:
-            self.aggregated_result.file_analysis_history[new_result.file_path] = []
-        
-        file_history = self.aggregated_result.file_analysis_history[new_result.file_path]
-        file_history.append({
-            "timestamp": new_result.timestamp,
-            "violation_count": violation_count,
-            "processing_time_ms": new_result.processing_time_ms,
-            "analysis_type": new_result.analysis_type,
-            "change_type": new_result.change_type
-        })
-        
-        # Keep bounded history (NASA Rule 7)
-        if len(file_history) > 100:
-            self.aggregated_result.file_analysis_history[new_result.file_path] = file_history[-80:]
-    
-    def _subtract_result_from_aggregated(self, old_result: StreamAnalysisResult) -> None:
-        """Subtract old result from aggregated metrics."""
-        # Subtract violation counts
-        violation_count = sum(len(v) if isinstance(v, list) else 1 
-                            for v in old_result.violations.values() if v)
-        self.aggregated_result.total_violations = max(0, self.aggregated_result.total_violations - violation_count)
-        
-        # Update violation breakdown
-        for violation_type, violations in old_result.violations.items():
-            if violations:
-                count = len(violations) if isinstance(violations, list) else 1
-                current_count = self.aggregated_result.violation_breakdown.get(violation_type, 0)
-                new_count = max(0, current_count - count)
-                if new_count == 0:
-                    self.aggregated_result.violation_breakdown.pop(violation_type, None)
-                else:
-                    self.aggregated_result.violation_breakdown[violation_type] = new_count
-        
-        # Subtract processing time
-        self.aggregated_result.total_processing_time_ms = max(0, 
-            self.aggregated_result.total_processing_time_ms - old_result.processing_time_ms)
-        
-        # Update analysis type counters
-        if old_result.analysis_type == 'incremental':
-            self.aggregated_result.incremental_updates = max(0, self.aggregated_result.incremental_updates - 1)
+                } for violation_type in contribution.by_type
+            )
         else:
-            self.aggregated_result.full_analyses = max(0, self.aggregated_result.full_analyses - 1)
-    
-    def _update_violation_trends(self, result: StreamAnalysisResult) -> None:
-        """Update violation trend timeline."""
-        timestamp = result.timestamp
-        
-        for violation_type, violations in result.violations.items():
-            if violations:
-                count = len(violations) if isinstance(violations, list) else 1
-                self.violation_timeline[violation_type].append((timestamp, count))
-        
-        # Also track in aggregated trends
+            self._real_time_violations.pop(file_path, None)
+
+        self._last_update_time = time.time()
+        self._version += 1
+        return contribution
+
+    def _subtract_contribution(self, file_path: str, keep_rank: bool = False) -> None:
+        """
+        Subtract a file's previous contribution from the running totals.
+
+        keep_rank leaves the top-files entry in place for a caller that is
+        about to replace it, so re-analysis of a top file avoids a rebuild.
+        """
+        contribution = self._contributions.pop(file_path, None)
+        if contribution is None:
+            return
+
+        self._total_violations -= contribution.violation_count
+        for violation_type, count in contribution.by_type.items():
+            self._decrement(self._type_totals, violation_type, count)
+        for severity, count in contribution.by_severity.items():
+            self._decrement(self._severity_totals, severity, count)
+        self._total_processing_time_ms = max(0.0, self._total_processing_time_ms - contribution.processing_time_ms)
+        self._incremental_files -= contribution.incremental
+
+        if not keep_rank:
+            self._file_counts.pop(file_path, None)
+            self._top_files.remove(file_path)
+
+    @staticmethod
+    def _decrement(totals: Dict[str, int], key: str, count: int) -> None:
+        remaining = totals.get(key, 0) - count
+        if remaining > 0:
+            totals[key] = remaining
+        else:
+            totals.pop(key, None)
+
+    @staticmethod
+    def _measure(result: StreamAnalysisResult) -> _FileContribution:
+        """Count a result's violations by type and severity."""
+        by_type: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
         for violation_type, violations in result.violations.items():
-            if violations:
-                count = len(violations) if isinstance(violations, list) else 1
-                if violation_type not in self.aggregated_result.violation_trends:
-                    self.aggregated_result.violation_trends[violation_type] = []
-                
-                trend_list = self.aggregated_result.violation_trends[violation_type]
-                trend_list.append((timestamp, count))
-                
-                # Keep bounded (NASA Rule 7)
-                if len(trend_list) > self.max_trend_points:
-                    self.aggregated_result.violation_trends[violation_type] = trend_list[-(self.max_trend_points//2):]
-    
+            if not violations:  # Only count non-empty violations
+                continue
+            if isinstance(violations, list):
+                by_type[violation_type] = len(violations)
+                for violation in violations:
+                    severity = violation.get("severity") if isinstance(violation, dict) else None
+                    if severity:
+                        by_severity[severity] = by_severity.get(severity, 0) + 1
+            else:
+                by_type[violation_type] = 1
+
+        return _FileContribution(
+            violation_count=sum(by_type.values()),
+            by_type=by_type,
+            by_severity=by_severity,
+            processing_time_ms=result.processing_time_ms,
+            incremental=result.analysis_type == 'incremental'
+        )
+
+    def _update_violation_trends(self, result: StreamAnalysisResult, contribution: _FileContribution) -> None:
+        """Update violation timeline, per-file history and velocity buckets."""
+        timestamp = result.timestamp
+        for violation_type, count in contribution.by_type.items():
+            self.violation_timeline[violation_type].append((timestamp, count))
+
+        # Per-file ring buffer; least recently updated files are evicted (NASA Rule 7)
+        history = self._file_history.pop(result.file_path, None)
+        if history is None:
+            history = deque(maxlen=self.HISTORY_PER_FILE)
+        self._file_history[result.file_path] = history
+        history.append({
+            "timestamp": timestamp,
+            "violation_count": contribution.violation_count,
+            "processing_time_ms": result.processing_time_ms,
+            "analysis_type": result.analysis_type,
+            "change_type": result.change_type
+        })
+        while len(self._file_history) > self.max_file_history:
+            self._file_history.popitem(last=False)
+
+        minute = int(timestamp // 60)
+        if not self._velocity_buckets or self._velocity_buckets[-1][0] != minute:
+            self._velocity_buckets.append([minute, 0, 0, 0.0])
+        bucket = self._velocity_buckets[-1]
+        bucket[1] += 1
+        bucket[2] += contribution.violation_count
+        bucket[3] += result.processing_time_ms
+
+    @staticmethod
+    def _points_since(timeline: Deque[Tuple[float, int]], cutoff: float) -> List[Tuple[float, int]]:
+        """Trend points newer than cutoff, scanning back from the newest."""
+        points = []
+        for point in reversed(timeline):
+            if point[0] < cutoff:
+                break
+            points.append(point)
+        points.reverse()
+        return points
+
     def _cleanup_dependencies(self, file_path: str) -> None:
         """Clean up dependency tracking for removed file."""
         # Remove from dependencies
@@ -450,62 +637,51 @@ class StreamResultAggregator:
             deps = self.file_dependencies.pop(file_path)
             for dep in deps:
                 self.reverse_dependencies[dep].discard(file_path)
-        
+
         # Remove from reverse dependencies
         if file_path in self.reverse_dependencies:
             dependent_files = self.reverse_dependencies.pop(file_path)
             for dep_file in dependent_files:
                 self.file_dependencies[dep_file].discard(file_path)
-    
+
     def _calculate_analysis_velocity(self) -> Dict[str, float]:
-        """Calculate analysis velocity metrics."""
-        current_time = time.time()
-        
-        # Count recent analyses (last 5 minutes)
-        recent_results = [r for r in self.result_history 
-                        if current_time - r.timestamp <= 300.0]
-        
-        velocity = {
-            "files_per_minute": len(recent_results) / 5.0 if recent_results else 0.0,
-            "violations_per_minute": sum(sum(len(v) if isinstance(v, list) else 1 
-                                            for v in r.violations.values() if v) 
-                                        for r in recent_results) / 5.0,
-            "avg_processing_time_ms": sum(r.processing_time_ms for r in recent_results) / len(recent_results) 
-                                    if recent_results else 0.0
+        """Calculate analysis velocity metrics from the per-minute buckets."""
+        oldest_minute = int(time.time() // 60) - self.VELOCITY_WINDOW_MINUTES + 1
+        files = violations = 0
+        processing_ms = 0.0
+        for minute, bucket_files, bucket_violations, bucket_ms in self._velocity_buckets:
+            if minute >= oldest_minute:
+                files += bucket_files
+                violations += bucket_violations
+                processing_ms += bucket_ms
+
+        window = float(self.VELOCITY_WINDOW_MINUTES)
+        return {
+            "files_per_minute": files / window,
+            "violations_per_minute": violations / window,
+            "avg_processing_time_ms": processing_ms / files if files else 0.0
         }
-        
-        return velocity
-    
+
     def _get_top_violation_files(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get files with most violations."""
-        file_violation_counts = []
-        
-        for file_path, result in self.file_results.items():
-            violation_count = sum(len(v) if isinstance(v, list) else 1 
-                                for v in result.violations.values() if v)
-            if violation_count > 0:
-                file_violation_counts.append({
-                    "file_path": file_path,
-                    "violation_count": violation_count,
-                    "last_analyzed": result.timestamp,
-                    "analysis_type": result.analysis_type
-                })
-        
-        # Sort by violation count and return top files
-        file_violation_counts.sort(key=lambda x: x["violation_count"], reverse=True)
-        return file_violation_counts[:limit]
-    
-    def _copy_nested_dict(self, nested_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Create deep copy of nested dictionary."""
-        return {k: v.copy() if hasattr(v, 'copy') else v for k, v in nested_dict.items()}
-    
+        top_files = []
+        for file_path, violation_count in self._top_files.top()[:limit]:
+            result = self.file_results[file_path]
+            top_files.append({
+                "file_path": file_path,
+                "violation_count": violation_count,
+                "last_analyzed": result.timestamp,
+                "analysis_type": result.analysis_type
+            })
+        return top_files
+
     def _estimate_memory_usage(self) -> float:
         """Estimate memory usage in MB."""
         # Rough estimate based on stored data
         file_results_size = len(self.file_results) * 2  # ~2KB per result
-        history_size = len(self.result_history) * 1    # ~1KB per history item
+        history_size = sum(len(history) for history in self._file_history.values()) * 0.2  # ~200B per entry
         trends_size = sum(len(timeline) for timeline in self.violation_timeline.values()) * 0.1  # ~100B per trend point
-        
+
         return (file_results_size + history_size + trends_size) / 1024  # Convert to MB
 
 # Global stream result aggregator instance
@@ -533,4 +709,4 @@ def get_streaming_dashboard_data() -> Dict[str, Any]:
 def get_streaming_aggregated_result() -> AggregatedResult:
     """Get aggregated result from global aggregator."""
     aggregator = get_global_stream_aggregator()
-    return aggregator.get_aggregated_result()
\ No newline at end of file
+    return aggregator.get_aggregated_result()
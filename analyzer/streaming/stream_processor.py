@@ -19,29 +19,38 @@ Features:
 - Backpressure handling for large-scale projects
 """
 
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from pathlib import Path
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Union
 import hashlib
+import heapq
+import itertools
 import json
 import logging
 import time
 
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 import asyncio
+import pickle
 import threading
 import weakref
 
 try:
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
 except ImportError:
     # Fallback for when watchdog is not available
+    WATCHDOG_AVAILABLE = False
+    Observer = None
+
     class FileSystemEventHandler:
         """Fallback file system event handler."""
 
     class FileSystemEvent:
         """Fallback file system event."""
-    def __init__(self, src_path=''):
+        def __init__(self, src_path=''):
             self.src_path = src_path
             self.is_directory = False
 
@@ -91,6 +100,107 @@ class AnalysisResult:
     dependencies_analyzed: Set[str] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+# Scheduling priorities (AnalysisRequest.priority scale, higher first)
+PRIORITY_BULK = 1      # large batches such as checkouts or codegen bursts
+PRIORITY_WATCH = 5     # ordinary watcher changes
+PRIORITY_RECENT = 7    # files touched again within the recent window
+PRIORITY_OPEN = 9      # files the client reports as open
+
+@dataclass
+class _PendingChange:
+    """Latest queued change for one file; newer changes replace it."""
+    change: FileChange
+    request_id: str
+    analysis_type: str
+    priority: int
+    generation: int
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+class _StageStats:
+    """Latency samples for one processing stage (bounded, NASA Rule 7)."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.samples: deque = deque(maxlen=max_samples)
+        self.count = 0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.samples.append(elapsed_ms)
+        self.count += 1
+
+    def snapshot(self, depth: int) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "depth": depth,
+            "count": self.count,
+            "avg_ms": sum(ordered) / len(ordered) if ordered else 0.0,
+            "p95_ms": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] if ordered else 0.0,
+            "max_ms": ordered[-1] if ordered else 0.0
+        }
+
+# Worker-resident analyzer state. Each process (or thread) in the analysis
+# executor builds its analyzer once and reuses it for every file.
+_worker_state = threading.local()
+
+def _create_default_analyzer():
+    """Default analyzer factory; module level so process workers can pickle it."""
+    try:
+        from ..unified_analyzer import UnifiedConnascenceAnalyzer
+        return UnifiedConnascenceAnalyzer()
+    except ImportError:
+        return None
+
+def _init_analysis_worker(analyzer_factory: Callable[[], Any]) -> None:
+    """Executor initializer: remember the factory, build lazily on first use."""
+    _worker_state.factory = analyzer_factory
+    _worker_state.analyzer = None
+
+def _analyze_file_in_worker(file_path: str) -> List[Dict[str, Any]]:
+    """Executor entry point: analyze one file with the worker's analyzer."""
+    analyzer = getattr(_worker_state, "analyzer", None)
+    if analyzer is None:
+        factory = getattr(_worker_state, "factory", None) or _create_default_analyzer
+        analyzer = factory()
+        _worker_state.analyzer = analyzer
+    return _analyze_with(analyzer, file_path)
+
+def _analyze_with(analyzer: Any, file_path: str) -> List[Dict[str, Any]]:
+    """Run full analysis on file using existing analyzer."""
+    # Check if analyzer has the analyze_file method
+    if hasattr(analyzer, 'analyze_file'):
+        result = analyzer.analyze_file(file_path)
+        if hasattr(result, 'violations'):
+            return [_violation_to_dict(v) for v in result.violations]
+        elif isinstance(result, dict) and 'violations' in result:
+            return result['violations']
+    
+    # Fallback: try to run basic AST analysis
+    if hasattr(analyzer, 'ast_analyzer') and analyzer.ast_analyzer:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            source_code = f.read()
+            source_lines = source_code.splitlines()
+        
+        import ast
+        tree = ast.parse(source_code)
+        
+        # Use existing AST analyzer
+        violations = analyzer.ast_analyzer.analyze_file(file_path, tree, source_lines)
+        return [_violation_to_dict(v) for v in violations]
+    
+    return []
+
+def _violation_to_dict(violation: Any) -> Dict[str, Any]:
+    """Convert violation object to dictionary format."""
+    if isinstance(violation, dict):
+        return violation
+    
+    # Handle different violation object types
+    if hasattr(violation, '__dict__'):
+        return violation.__dict__
+    elif hasattr(violation, '_asdict'):
+        return violation._asdict()
+    else:
+        return {"description": str(violation), "type": "unknown"}
+
 class FileWatcher(FileSystemEventHandler):
     """
     File system watcher for detecting Python file changes.
@@ -101,7 +211,8 @@ class FileWatcher(FileSystemEventHandler):
     def __init__(self, 
                 callback: Callable[[List[FileChange]], None],
                 debounce_seconds: float = 0.5,
-                file_patterns: Optional[List[str]] = None):
+                file_patterns: Optional[List[str]] = None,
+                backpressure_retry_seconds: float = 1.0):
         """
         Initialize file watcher.
         
@@ -109,17 +220,23 @@ class FileWatcher(FileSystemEventHandler):
             callback: Callback function for file changes
             debounce_seconds: Debounce delay to batch rapid changes
             file_patterns: File patterns to watch (default: Python files)
+            backpressure_retry_seconds: Hold interval while the consumer is saturated
         """
         super().__init__()
         self.callback = callback
         self.debounce_seconds = debounce_seconds
         self.file_patterns = file_patterns or ["*.py"]
+        self.backpressure_retry_seconds = backpressure_retry_seconds
         
         # Change tracking and debouncing
         self._pending_changes: Dict[str, FileChange] = {}
         self._debounce_timers: Dict[str, threading.Timer] = {}
         self._lock = threading.RLock()
         
+        # Backpressure: while set, changes stay merged in _pending_changes
+        self._backpressure = False
+        self._hold_timer: Optional[threading.Timer] = None
+        
         # File content hashing for change detection
         self._file_hashes: Dict[str, str] = {}
     
@@ -210,9 +327,42 @@ class FileWatcher(FileSystemEventHandler):
             self._debounce_timers[file_path_str] = timer
             timer.start()
     
+    def set_backpressure(self, active: bool) -> None:
+        """
+        Hold (or release) flushed changes while the consumer is saturated.
+
+        Held changes keep coalescing per file in _pending_changes, so a
+        burst of events costs one entry per file rather than one per event.
+        """
+        with self._lock:
+            if self._backpressure == active:
+                return
+            self._backpressure = active
+            if not active and self._pending_changes:
+                # Flush off the caller's thread; the callback may re-enter us
+                self._start_hold_timer(0.0)
+
+    def _start_hold_timer(self, delay: float) -> None:
+        """Schedule a retry of held changes."""
+        if self._hold_timer is not None:
+            self._hold_timer.cancel()
+        self._hold_timer = threading.Timer(delay, self._release_held_changes)
+        self._hold_timer.daemon = True
+        self._hold_timer.start()
+
+    def _release_held_changes(self) -> None:
+        """Retry flushing changes held back by backpressure."""
+        with self._lock:
+            self._hold_timer = None
+        self._flush_changes()
+
     def _flush_changes(self) -> None:
         """Flush pending changes to callback."""
         with self._lock:
+            if self._pending_changes and self._backpressure:
+                if self._hold_timer is None:
+                    self._start_hold_timer(self.backpressure_retry_seconds)
+                return
             if self._pending_changes:
                 changes = list(self._pending_changes.values())
                 self._pending_changes.clear()
@@ -238,34 +388,71 @@ class StreamProcessor:
                 max_workers: int = 4,
                 cache_size: int = 10000,
                 buffer_size: int = 1000,
-                flush_interval: float = 5.0):
+                flush_interval: float = 5.0,
+                bulk_threshold: int = 50,
+                recent_window_seconds: float = 30.0,
+                executor_type: str = "process",
+                cpu_workers: Optional[int] = None):
         """
         Initialize stream processor.
         
         Args:
             analyzer_factory: Factory function to create analyzer instances
-            max_queue_size: Maximum analysis request queue size (NASA Rule 7)
+            max_queue_size: Maximum pending files (NASA Rule 7)
             max_workers: Maximum concurrent worker threads
             cache_size: Maximum cache entries to maintain
+            bulk_threshold: Watcher batch size treated as a bulk change
+            recent_window_seconds: Re-edits within this window are prioritised
+            executor_type: Where parsing and detectors run: 'process', 'thread'
+                or 'inline' (on the event loop)
+            cpu_workers: Analysis executor size (default: max_workers)
         """
         assert 10 <= max_queue_size <= 50000, "max_queue_size must be 10-50000"
         assert 1 <= max_workers <= 16, "max_workers must be 1-16"
         assert 100 <= cache_size <= 100000, "cache_size must be 100-100000"
+        assert executor_type in ("process", "thread", "inline"), \
+            f"Invalid executor_type: {executor_type}"
         
-        self.analyzer_factory = analyzer_factory or self._default_analyzer_factory
+        self.analyzer_factory = analyzer_factory or _create_default_analyzer
+        self.executor_type = executor_type
+        self.cpu_workers = cpu_workers or max_workers
         self.max_queue_size = max_queue_size
         self.max_workers = max_workers
         self.buffer_size = buffer_size
         self.flush_interval = flush_interval
+        self.bulk_threshold = bulk_threshold
+        self.recent_window_seconds = recent_window_seconds
 
         # Component integrations
         self._cache = None
         self._aggregator = None
         
-        # Request processing
-        self._request_queue: deque = deque(maxlen=max_queue_size)
-        self._processing_queue = asyncio.Queue(maxsize=max_queue_size)
+        # Request processing: one pending entry per file, ordered by a heap of
+        # (-priority, generation, file). Replaced entries leave stale heap
+        # items behind that are skipped when popped.
+        self._pending: Dict[str, _PendingChange] = {}
+        self._pending_heap: List[Tuple[int, int, str]] = []
+        self._pending_event = asyncio.Event()
+        self._generation = itertools.count(1)
+        self._in_flight: Dict[str, Tuple[FileChange, asyncio.Task]] = {}
         self._results_queue = asyncio.Queue(maxsize=max_queue_size * 2)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # CPU work (parse + detect) runs here, off the event loop
+        self._executor: Optional[Executor] = None
+        self._executor_depth = 0
+        self._stage_stats: Dict[str, _StageStats] = {
+            "queued": _StageStats(),
+            "analysis": _StageStats(),
+            "emit": _StageStats()
+        }
+        
+        # Priority hints and watcher backpressure
+        self._open_files: Set[str] = set()
+        self._recent_touches: "OrderedDict[str, float]" = OrderedDict()
+        self._high_watermark = max(1, int(max_queue_size * 0.8))
+        self._low_watermark = int(max_queue_size * 0.5)
+        self._backpressure_active = False
         
         # Worker management
         self._workers: List[asyncio.Task] = []
@@ -293,7 +480,11 @@ class StreamProcessor:
             "cache_misses": 0,
             "processing_time_ms": 0,
             "queue_overflows": 0,
-            "dependency_invalidations": 0
+            "dependency_invalidations": 0,
+            "coalesced_changes": 0,
+            "superseded_cancellations": 0,
+            "stale_results_dropped": 0,
+            "backpressure_events": 0
         }
         
         # Result callbacks
@@ -302,11 +493,31 @@ class StreamProcessor:
 
     def _default_analyzer_factory(self):
         """Default analyzer factory if none provided."""
-        try:
-            from ..unified_analyzer import UnifiedConnascenceAnalyzer
-            return UnifiedConnascenceAnalyzer()
-        except ImportError:
+        return _create_default_analyzer()
+
+    def _create_executor(self) -> Optional[Executor]:
+        """Create the analysis executor; process workers need a picklable factory."""
+        if self.executor_type == "inline":
+            _init_analysis_worker(self.analyzer_factory)
             return None
+        
+        if self.executor_type == "process":
+            try:
+                pickle.dumps(self.analyzer_factory)
+                return ProcessPoolExecutor(
+                    max_workers=self.cpu_workers,
+                    initializer=_init_analysis_worker,
+                    initargs=(self.analyzer_factory,)
+                )
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                logger.warning(f"Analyzer factory not picklable ({e}) - using thread executor")
+        
+        return ThreadPoolExecutor(
+            max_workers=self.cpu_workers,
+            thread_name_prefix="StreamAnalysis",
+            initializer=_init_analysis_worker,
+            initargs=(self.analyzer_factory,)
+        )
 
     def set_cache(self, cache):
         """Set incremental cache for the processor."""
@@ -475,6 +686,8 @@ class StreamProcessor:
             return
             
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._executor = self._create_executor()
         
         # Start worker tasks
         for i in range(self.max_workers):
@@ -507,6 +720,10 @@ class StreamProcessor:
             await asyncio.gather(*self._workers, return_exceptions=True)
             
         self._workers.clear()
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("Stream processor stopped")
     
     def start_watching(self, directories: List[Union[str, Path]]) -> None:
@@ -554,20 +771,25 @@ class StreamProcessor:
             logger.info("File watching stopped")
     
     def _handle_file_changes(self, changes: List[FileChange]) -> None:
-        """Handle file changes from file watcher."""
+        """Handle file changes from file watcher (called on watcher threads)."""
         if not changes:
             return
-            
-        # Create analysis request from file changes
-        request = AnalysisRequest(
-            request_id=f"watch_{int(time.time() * 1000)}",
-            file_changes=changes,
-            priority=5,  # Medium priority for file changes
-            analysis_type="incremental"
-        )
         
-        # Add to processing queue
-        asyncio.create_task(self._enqueue_request(request))
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            logger.warning(f"Stream processor not running - dropping {len(changes)} file changes")
+            return
+        
+        # Large batches (checkouts, codegen) go behind interactive edits
+        bulk = len(changes) >= self.bulk_threshold
+        loop.call_soon_threadsafe(
+            self._schedule_changes,
+            changes,
+            f"watch_{int(time.time() * 1000)}",
+            "incremental",
+            PRIORITY_BULK if bulk else PRIORITY_WATCH,
+            bulk
+        )
     
     async def submit_request(self, request: AnalysisRequest) -> str:
         """
@@ -583,13 +805,162 @@ class StreamProcessor:
         return request.request_id
     
     async def _enqueue_request(self, request: AnalysisRequest) -> None:
-        """Enqueue analysis request with backpressure handling."""
-        try:
-            await self._processing_queue.put(request)
-            logger.debug(f"Enqueued analysis request: {request.request_id}")
-        except asyncio.QueueFull:
-            self._stats["queue_overflows"] += 1
-            logger.warning(f"Request queue full - dropping request: {request.request_id}")
+        """Enqueue analysis request, coalescing with pending work per file."""
+        self._schedule_changes(
+            request.file_changes, request.request_id, request.analysis_type, request.priority
+        )
+        logger.debug(f"Enqueued analysis request: {request.request_id}")
+    
+    def mark_file_open(self, file_path: Union[str, Path]) -> None:
+        """Prioritise a file the client has open, including queued changes."""
+        key = str(file_path)
+        self._open_files.add(key)
+        pending = self._pending.get(key)
+        if pending is not None and pending.priority < PRIORITY_OPEN:
+            pending.priority = PRIORITY_OPEN
+            self._push_pending(key, pending)
+    
+    def mark_file_closed(self, file_path: Union[str, Path]) -> None:
+        """Drop the open-file priority hint for a file."""
+        self._open_files.discard(str(file_path))
+    
+    def _schedule_changes(self,
+                        changes: List[FileChange],
+                        request_id: str,
+                        analysis_type: str,
+                        priority: int,
+                        bulk: bool = False) -> None:
+        """
+        Coalesce changes into the pending set (event loop thread only).
+        
+        Only the latest change per file is kept; an in-flight analysis of an
+        older version of the file is cancelled.
+        """
+        for change in changes:
+            key = str(change.file_path)
+            change_priority = self._change_priority(key, priority, bulk)
+            pending = self._pending.get(key)
+            
+            enqueued_at = time.perf_counter()
+            if pending is not None:
+                self._stats["coalesced_changes"] += 1
+                change = self._merge_changes(pending.change, change)
+                change_priority = max(change_priority, pending.priority)
+                enqueued_at = pending.enqueued_at
+            elif self._is_duplicate_of_in_flight(key, change):
+                self._stats["coalesced_changes"] += 1
+                continue
+            elif len(self._pending) >= self.max_queue_size and not self._evict_pending(change_priority):
+                self._stats["queue_overflows"] += 1
+                logger.warning(f"Pending queue full - dropping change: {key}")
+                continue
+            
+            self._cancel_in_flight(key)
+            pending = _PendingChange(
+                change=change,
+                request_id=request_id,
+                analysis_type=analysis_type,
+                priority=change_priority,
+                generation=0,
+                enqueued_at=enqueued_at
+            )
+            self._pending[key] = pending
+            self._push_pending(key, pending)
+        
+        self._update_backpressure()
+    
+    def _change_priority(self, key: str, priority: int, bulk: bool) -> int:
+        """Raise priority for open or recently re-edited files."""
+        now = time.time()
+        last_touch = self._recent_touches.pop(key, None)
+        self._recent_touches[key] = now
+        if len(self._recent_touches) > self.cache_size:
+            self._recent_touches.popitem(last=False)
+        
+        if key in self._open_files:
+            return max(priority, PRIORITY_OPEN)
+        if not bulk and last_touch is not None and now - last_touch <= self.recent_window_seconds:
+            return max(priority, PRIORITY_RECENT)
+        return priority
+    
+    def _merge_changes(self, older: FileChange, newer: FileChange) -> FileChange:
+        """Combine two queued changes for the same file; the newer content wins."""
+        change_type = newer.change_type
+        if older.change_type == 'created' and change_type == 'modified':
+            change_type = 'created'  # still needs a full analysis
+        return FileChange(
+            file_path=newer.file_path,
+            change_type=change_type,
+            timestamp=newer.timestamp,
+            content_hash=newer.content_hash,
+            previous_hash=older.previous_hash,
+            size_bytes=newer.size_bytes
+        )
+    
+    def _push_pending(self, key: str, pending: _PendingChange) -> None:
+        """Push a (re)prioritised pending entry onto the heap."""
+        pending.generation = next(self._generation)
+        heapq.heappush(self._pending_heap, (-pending.priority, pending.generation, key))
+        
+        # Compact when stale entries dominate (NASA Rule 7: bounded memory)
+        if len(self._pending_heap) > 2 * len(self._pending) + 64:
+            self._pending_heap = [(-p.priority, p.generation, k) for k, p in self._pending.items()]
+            heapq.heapify(self._pending_heap)
+        self._pending_event.set()
+    
+    def _next_pending(self) -> Optional[_PendingChange]:
+        """Pop the highest-priority live pending change, skipping stale entries."""
+        while self._pending_heap:
+            _, generation, key = heapq.heappop(self._pending_heap)
+            pending = self._pending.get(key)
+            if pending is not None and pending.generation == generation:
+                del self._pending[key]
+                self._update_backpressure()
+                return pending
+        self._pending_event.clear()
+        return None
+    
+    def _evict_pending(self, priority: int) -> bool:
+        """Make room for a change by evicting a strictly lower-priority one."""
+        victim = min(self._pending.items(), key=lambda item: (item[1].priority, -item[1].generation))
+        if victim[1].priority >= priority:
+            return False
+        del self._pending[victim[0]]
+        self._stats["queue_overflows"] += 1
+        logger.warning(f"Pending queue full - evicted lower-priority change: {victim[0]}")
+        return True
+    
+    def _is_duplicate_of_in_flight(self, key: str, change: FileChange) -> bool:
+        """True when the file is already being analyzed at the same content."""
+        in_flight = self._in_flight.get(key)
+        if in_flight is None or change.content_hash is None:
+            return False
+        running_change = in_flight[0]
+        return (running_change.content_hash == change.content_hash and
+                running_change.change_type == change.change_type)
+    
+    def _cancel_in_flight(self, key: str) -> None:
+        """Cancel analysis of an older version of a file."""
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and not in_flight[1].done():
+            in_flight[1].cancel()
+            self._stats["superseded_cancellations"] += 1
+    
+    def _update_backpressure(self) -> None:
+        """Pause watcher flushing above the high watermark, resume below the low one."""
+        depth = len(self._pending)
+        if not self._backpressure_active and depth >= self._high_watermark:
+            self._backpressure_active = True
+            self._stats["backpressure_events"] += 1
+            logger.info(f"Backpressure on: {depth} files pending")
+        elif self._backpressure_active and depth <= self._low_watermark:
+            self._backpressure_active = False
+            logger.info(f"Backpressure off: {depth} files pending")
+        else:
+            return
+        
+        if self.file_watcher is not None:
+            self.file_watcher.set_backpressure(self._backpressure_active)
     
     async def _worker_loop(self) -> None:
         """Main worker loop for processing analysis requests."""
@@ -597,14 +968,15 @@ class StreamProcessor:
         
         while self._running:
             try:
-                # Wait for request with timeout
-                request = await asyncio.wait_for(
-                    self._processing_queue.get(), 
-                    timeout=1.0
-                )
+                pending = self._next_pending()
+                if pending is None:
+                    # Wait for work with timeout
+                    await asyncio.wait_for(self._pending_event.wait(), timeout=1.0)
+                    continue
                 
+                self._stage_stats["queued"].record((time.perf_counter() - pending.enqueued_at) * 1000)
                 async with self._worker_semaphore:
-                    await self._process_request(request)
+                    await self._run_pending(pending)
                     
             except asyncio.TimeoutError:
                 continue  # Normal timeout, check if still running
@@ -614,6 +986,31 @@ class StreamProcessor:
         
         logger.debug(f"Worker stopped: {asyncio.current_task().get_name()}")
     
+    async def _run_pending(self, pending: _PendingChange) -> None:
+        """Analyze one pending change as a cancellable task."""
+        key = str(pending.change.file_path)
+        request = AnalysisRequest(
+            request_id=pending.request_id,
+            file_changes=[pending.change],
+            priority=pending.priority,
+            analysis_type=pending.analysis_type
+        )
+        
+        task = asyncio.ensure_future(self._process_request(request))
+        self._in_flight[key] = (pending.change, task)
+        try:
+            # wait() rather than await so a superseding cancel of the task
+            # does not cancel this worker
+            await asyncio.wait({task})
+        finally:
+            if self._in_flight.get(key, (None, None))[1] is task:
+                del self._in_flight[key]
+            if not task.done():
+                task.cancel()
+        
+        if not task.cancelled():
+            task.exception()  # _process_request logs its own failures
+    
     async def _process_request(self, request: AnalysisRequest) -> None:
         """
         Process individual analysis request.
@@ -645,8 +1042,10 @@ class StreamProcessor:
             # Cache results
             self._cache_results(request, results)
             
-            # Emit results
-            await self._emit_results(results)
+            # Emit results, skipping files that already have a newer change queued
+            fresh_results = [r for r in results if r.file_path not in self._pending]
+            self._stats["stale_results_dropped"] += len(results) - len(fresh_results)
+            await self._emit_results(fresh_results)
             
             # Update statistics
             processing_time_ms = int((time.time() - start_time) * 1000)
@@ -687,16 +1086,13 @@ class StreamProcessor:
                                     request: AnalysisRequest) -> Optional[AnalysisResult]:
         """Analyze individual file change."""
         try:
-            # Create analyzer instance
-            analyzer = self.analyzer_factory()
-            
             # Determine analysis type based on change
             if file_change.change_type == 'created':
                 # Full analysis for new files
-                violations = await self._run_full_analysis(analyzer, file_change.file_path)
+                violations = await self._run_full_analysis(file_change.file_path)
             else:
                 # Incremental analysis for modifications
-                violations = await self._run_incremental_analysis(analyzer, file_change)
+                violations = await self._run_incremental_analysis(file_change)
             
             return AnalysisResult(
                 request_id=request.request_id,
@@ -712,38 +1108,33 @@ class StreamProcessor:
             logger.error(f"Analysis failed for {file_change.file_path}: {e}")
             return None
     
-    async def _run_full_analysis(self, analyzer: Any, file_path: Path) -> List[Dict[str, Any]]:
-        """Run full analysis on file using existing analyzer."""
+    async def _run_full_analysis(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Run full analysis on the analysis executor, keeping the loop free."""
+        start_time = time.perf_counter()
+        executor = self._executor
+        self._executor_depth += 1
         try:
-            # Check if analyzer has the analyze_file method
-            if hasattr(analyzer, 'analyze_file'):
-                result = analyzer.analyze_file(str(file_path))
-                if hasattr(result, 'violations'):
-                    return [self._violation_to_dict(v) for v in result.violations]
-                elif isinstance(result, dict) and 'violations' in result:
-                    return result['violations']
-            
-            # Fallback: try to run basic AST analysis
-            if hasattr(analyzer, 'ast_analyzer') and analyzer.ast_analyzer:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    source_code = f.read()
-                    source_lines = source_code.splitlines()
-                
-                import ast
-                tree = ast.parse(source_code)
-                
-                # Use existing AST analyzer
-                violations = analyzer.ast_analyzer.analyze_file(str(file_path), tree, source_lines)
-                return [self._violation_to_dict(v) for v in violations]
+            if executor is None:
+                return _analyze_file_in_worker(str(file_path))
             
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, _analyze_file_in_worker, str(file_path))
+            
+        except BrokenExecutor as e:
+            if self._executor is executor and self._running:
+                logger.error(f"Analysis executor failed ({e}) - switching to thread executor")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor_type = "thread"
+                self._executor = self._create_executor()
         except Exception as e:
             logger.error(f"Full analysis failed for {file_path}: {e}")
+        finally:
+            self._executor_depth -= 1
+            self._stage_stats["analysis"].record((time.perf_counter() - start_time) * 1000)
         
         return []
     
-    async def _run_incremental_analysis(self, 
-                                        analyzer: Any, 
-                                        file_change: FileChange) -> List[Dict[str, Any]]:
+    async def _run_incremental_analysis(self, file_change: FileChange) -> List[Dict[str, Any]]:
         """Run incremental analysis on file change using delta optimization."""
         try:
             # Import incremental cache for delta tracking
@@ -762,18 +1153,11 @@ class StreamProcessor:
                 logger.debug(f"Using cached incremental result for {file_path}")
                 return cached_result.data if isinstance(cached_result.data, list) else []
             
-            # Track the file change for delta processing
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    new_content = f.read()
-            except Exception as e:
-                logger.warning(f"Could not read {file_path}: {e}")
-                new_content = ""
-            
-            delta = incremental_cache.track_file_change(file_path, None, new_content)
+            # Track the file change for delta processing (blocking read + diff)
+            await asyncio.to_thread(self._track_file_change, incremental_cache, file_path)
             
             # For now, run full analysis (incremental AST diff would be implemented here)
-            violations = await self._run_full_analysis(analyzer, file_path)
+            violations = await self._run_full_analysis(file_path)
             
             # Cache the results
             if violations and current_hash:
@@ -788,20 +1172,22 @@ class StreamProcessor:
         except Exception as e:
             logger.error(f"Incremental analysis failed for {file_change.file_path}: {e}")
             # Fallback to full analysis
-            return await self._run_full_analysis(analyzer, file_change.file_path)
+            return await self._run_full_analysis(file_change.file_path)
+    
+    def _track_file_change(self, incremental_cache: Any, file_path: Path) -> None:
+        """Read the new content and record the delta (runs on a thread)."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                new_content = f.read()
+        except Exception as e:
+            logger.warning(f"Could not read {file_path}: {e}")
+            new_content = ""
+        
+        incremental_cache.track_file_change(file_path, None, new_content)
     
     def _violation_to_dict(self, violation: Any) -> Dict[str, Any]:
         """Convert violation object to dictionary format."""
-        if isinstance(violation, dict):
-            return violation
-        
-        # Handle different violation object types
-        if hasattr(violation, '__dict__'):
-            return violation.__dict__
-        elif hasattr(violation, '_asdict'):
-            return violation._asdict()
-        else:
-            return {"description": str(violation), "type": "unknown"}
+        return _violation_to_dict(violation)
     
     def _handle_file_deletion(self, 
                             file_change: FileChange, 
@@ -847,6 +1233,7 @@ class StreamProcessor:
     
     async def _emit_results(self, results: List[AnalysisResult]) -> None:
         """Emit analysis results to callbacks and queues."""
+        start_time = time.perf_counter()
         for result in results:
             # Add to results queue
             try:
@@ -868,6 +1255,8 @@ class StreamProcessor:
                     callback(results)
                 except Exception as e:
                     logger.error(f"Batch callback failed: {e}")
+        
+        self._stage_stats["emit"].record((time.perf_counter() - start_time) * 1000)
     
     def add_result_callback(self, callback: Callable[[AnalysisResult], None]) -> None:
         """Add callback for individual analysis results."""
@@ -911,10 +1300,22 @@ class StreamProcessor:
             "average_processing_time_ms": avg_processing_time,
             "cache_hit_rate": cache_hit_rate,
             "cache_size": len(self._result_cache),
-            "queue_size": self._processing_queue.qsize(),
+            "queue_size": len(self._pending),
+            "in_flight": len(self._in_flight),
             "results_pending": self._results_queue.qsize(),
             "queue_overflows": self._stats["queue_overflows"],
-            "dependency_invalidations": self._stats["dependency_invalidations"]
+            "dependency_invalidations": self._stats["dependency_invalidations"],
+            "coalesced_changes": self._stats["coalesced_changes"],
+            "superseded_cancellations": self._stats["superseded_cancellations"],
+            "stale_results_dropped": self._stats["stale_results_dropped"],
+            "backpressure_active": self._backpressure_active,
+            "backpressure_events": self._stats["backpressure_events"],
+            "executor_type": self.executor_type,
+            "stages": {
+                "queued": self._stage_stats["queued"].snapshot(len(self._pending)),
+                "analysis": self._stage_stats["analysis"].snapshot(self._executor_depth),
+                "emit": self._stage_stats["emit"].snapshot(self._results_queue.qsize())
+            }
         }
     
     async def __aenter__(self):
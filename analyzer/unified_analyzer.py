@@ -17,7 +17,7 @@ PHASE 3.2 MIGRATION:
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 # Import constants after other imports
 try:
@@ -120,6 +120,18 @@ class UnifiedConnascenceAnalyzer:
         """Codebase analysis - alias for analyze_project."""
         return self.analyze_project(codebase_path)
 
+    def iter_results(self,
+                     project_path: Union[str, Path],
+                     ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """Streaming project analysis - yields per-file results as they complete."""
+        if self._analyzer:
+            yield from self._analyzer.iter_results(project_path, ordered=ordered)
+            return
+        # Fallback: the core engine analyzes sequentially, so its results are
+        # already in discovery order whatever ordered asks for
+        from .core.engine import AnalysisEngine
+        yield from AnalysisEngine().iter_file_results(str(project_path))
+
     # === STREAMING ANALYSIS METHODS ===
 
     def start_streaming_analysis(self, directories: List[Union[str, Path]]) -> None:
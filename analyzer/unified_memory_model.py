@@ -1,8 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional, Union, Tuple, Callable, Set
 
-logger = logging.getLogger(__name__)
-
 """
 Unified Memory Model for Cross-Phase Memory Correlation
 ===================================================
@@ -24,13 +22,17 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union, Tuple, Callable
 import json
 import logging
+import statistics
 import time
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 import asyncio
 import threading
 import weakref
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class MemoryCorrelation:
     """Represents correlation between memory entries across phases."""
@@ -135,229 +137,6 @@ class MemorySafetyValidator:
                 "nasa_pot10_compliant": len(self.safety_violations) == 0
             }
 
-class PhaseCorrelationStorage:
-    """Persistent storage for cross-phase memory correlations."""
-    
-    def __init__(self, storage_path: Optional[str] = None):
-        """Initialize phase correlation storage."""
-        self.storage_path = storage_path or "analyzer/phase_correlation_storage.db"
-        self._ensure_storage_path()
-        self._init_database()
-        self._lock = threading.RLock()
-        
-        # In-memory correlation cache for performance
-        self.correlation_cache: Dict[str, List[MemoryCorrelation]] = defaultdict(list)
-        self.cache_lock = threading.RLock()
-    
-    def _ensure_storage_path(self) -> None:
-        """Ensure storage directory exists."""
-        Path(self.storage_path).parent.mkdir(parents=True, exist_ok=True)
-    
-    def _init_database(self) -> None:
-        """Initialize SQLite database for persistent storage."""
-        with sqlite3.connect(self.storage_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS phase_correlations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    source_phase TEXT NOT NULL,
-                    target_phase TEXT NOT NULL,
-                    correlation_type TEXT NOT NULL,
-                    correlation_strength REAL NOT NULL,
-                    metadata TEXT NOT NULL,
-                    timestamp REAL NOT NULL
-                )
-            """)
-            
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS performance_correlations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    phase TEXT NOT NULL,
-                    metric_name TEXT NOT NULL,
-                    baseline_value REAL NOT NULL,
-                    current_value REAL NOT NULL,
-                    improvement_percentage REAL NOT NULL,
-                    correlation_factors TEXT NOT NULL,
-                    measurement_timestamp REAL NOT NULL,
-                    validation_status TEXT NOT NULL
-                )
-            """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_phase_correlations_source 
-                ON phase_correlations(source_phase)
-            """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_phase_correlations_target 
-                ON phase_correlations(target_phase)
-            """)
-    
-    @contextmanager
-    def get_connection(self):
-        """Thread-safe database connection context manager."""
-        conn = sqlite3.connect(self.storage_path, timeout=30.0)
-        try:
-            yield conn
-        finally:
-            conn.close()
-    
-    def store_correlation(self, correlation: MemoryCorrelation) -> None:
-        """Store memory correlation persistently."""
-        with self._lock:
-            try:
-                with self.get_connection() as conn:
-                    conn.execute("""
-                        INSERT INTO phase_correlations 
-                        (source_phase, target_phase, correlation_type, 
-                        correlation_strength, metadata, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        correlation.source_phase,
-                        correlation.target_phase,
-                        correlation.correlation_type,
-                        correlation.correlation_strength,
-                        json.dumps(correlation.metadata),
-                        correlation.timestamp
-                    ))
-                    conn.commit()
-                
-                # Update cache
-                cache_key = f"{correlation.source_phase}-{correlation.target_phase}"
-                with self.cache_lock:
-                    self.correlation_cache[cache_key].append(correlation)
-                    
-                logger.debug(f"Stored correlation: {correlation.source_phase} -> {correlation.target_phase}")
-                
-            except Exception as e:
-                logger.error(f"Failed to store correlation: {e}")
-    
-    def store_performance_correlation(self, perf_corr: PerformanceCorrelation) -> None:
-        """Store performance correlation data."""
-        with self._lock:
-            try:
-                with self.get_connection() as conn:
-                    conn.execute("""
-                        INSERT INTO performance_correlations 
-                        (phase, metric_name, baseline_value, current_value,
-                        improvement_percentage, correlation_factors, 
-                        measurement_timestamp, validation_status)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        perf_corr.phase,
-                        perf_corr.metric_name,
-                        perf_corr.baseline_value,
-                        perf_corr.current_value,
-                        perf_corr.improvement_percentage,
-                        json.dumps(perf_corr.correlation_factors),
-                        perf_corr.measurement_timestamp,
-                        perf_corr.validation_status
-                    ))
-                    conn.commit()
-                
-                logger.debug(f"Stored performance correlation for {perf_corr.phase}: {perf_corr.metric_name}")
-                
-            except Exception as e:
-                logger.error(f"Failed to store performance correlation: {e}")
-    
-    def get_correlations_by_phase(self, phase: str) -> List[MemoryCorrelation]:
-        """Get all correlations involving a specific phase."""
-        correlations = []
-        
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT source_phase, target_phase, correlation_type,
-                            correlation_strength, metadata, timestamp
-                    FROM phase_correlations 
-                    WHERE source_phase = ? OR target_phase = ?
-                    ORDER BY timestamp DESC
-                """, (phase, phase))
-                
-                for row in cursor.fetchall():
-                    correlation = MemoryCorrelation(
-                        source_phase=row[0],
-                        target_phase=row[1],
-                        correlation_type=row[2],
-                        correlation_strength=row[3],
-                        metadata=json.loads(row[4]),
-                        timestamp=row[5]
-                    )
-                    correlations.append(correlation)
-        
-        except Exception as e:
-            logger.error(f"Failed to get correlations for phase {phase}: {e}")
-        
-        return correlations
-    
-    def get_performance_trends(self, phase: Optional[str] = None) -> List[PerformanceCorrelation]:
-        """Get performance trends across phases."""
-        trends = []
-        
-        try:
-            with self.get_connection() as conn:
-                if phase:
-                    cursor = conn.execute("""
-                        SELECT phase, metric_name, baseline_value, current_value,
-                                improvement_percentage, correlation_factors,
-                                measurement_timestamp, validation_status
-                        FROM performance_correlations 
-                        WHERE phase = ?
-                        ORDER BY measurement_timestamp DESC
-                    """, (phase,))
-                else:
-                    cursor = conn.execute("""
-                        SELECT phase, metric_name, baseline_value, current_value,
-                                improvement_percentage, correlation_factors,
-                                measurement_timestamp, validation_status
-                        FROM performance_correlations 
-                        ORDER BY measurement_timestamp DESC
-                    """)
-                
-                for row in cursor.fetchall():
-                    trend = PerformanceCorrelation(
-                        phase=row[0],
-                        metric_name=row[1],
-                        baseline_value=row[2],
-                        current_value=row[3],
-                        improvement_percentage=row[4],
-                        correlation_factors=json.loads(row[5]),
-                        measurement_timestamp=row[6],
-                        validation_status=row[7]
-                    )
-                    trends.append(trend)
-        
-        except Exception as e:
-            logger.error(f"Failed to get performance trends: {e}")
-        
-        return trends
-    
-    def cleanup_old_correlations(self, max_age_days: int = 30) -> int:
-        """Clean up old correlations to maintain bounded storage."""
-        cleanup_count = 0
-        cutoff_time = time.time() - (max_age_days * 24 * 3600)
-        
-        with self._lock:
-            try:
-                with self.get_connection() as conn:
-                    cursor = conn.execute("DELETE FROM phase_correlations WHERE timestamp < ?", (cutoff_time,))
-                    cleanup_count += cursor.rowcount
-                    
-                    cursor = conn.execute("DELETE FROM performance_correlations WHERE measurement_timestamp < ?", (cutoff_time,))
-                    cleanup_count += cursor.rowcount
-                    
-                    conn.commit()
-                
-                # Clear correlation cache
-                with self.cache_lock:
-                    self.correlation_cache.clear()
-                
-                logger.info(f"Cleaned up {cleanup_count} old correlations")
-                
-            except Exception as e:
-                logger.error(f"Failed to cleanup old correlations: {e}")
-        
-        return cleanup_count
-
 class UnifiedMemoryModel:
     """Unified memory model for cross-phase memory correlation and learning."""
     
@@ -366,7 +145,9 @@ class UnifiedMemoryModel:
                 max_memory_mb: int = 500,
                 max_entries: int = 10000):
         """Initialize unified memory model."""
-        # Core storage and safety
+        # Core storage and safety. The storage module imports this module's
+        # dataclasses, so it is imported here rather than at the top.
+        from .phase_correlation_storage import PhaseCorrelationStorage
         self.storage = PhaseCorrelationStorage(storage_path)
         self.safety_validator = MemorySafetyValidator(max_memory_mb, max_entries)
         
@@ -839,6 +620,9 @@ class UnifiedMemoryModel:
         # Final memory statistics
         final_stats = self.get_unified_performance_report()
         logger.info(f"Final memory statistics: {final_stats['memory_usage']}")
+
+        # Commit queued writes and close the storage connections
+        self.storage.shutdown()
         
         logger.info("Unified Memory Model shutdown completed")
 
@@ -6,6 +6,7 @@ Conducts research and gathers information:
 - Gather requirements and specifications
 - Research best practices and patterns
 - Provide recommendations based on findings
+- Pull relevant code from the semantic index (optional code_search)
 
 Part of core agent roster (Week 5 Day 6).
 
@@ -71,8 +72,13 @@ class ResearcherAgent(AgentBase):
     - Provide recommendations
     """
 
-    def __init__(self):
-        """Initialize Researcher Agent."""
+    def __init__(self, code_search: Optional[Any] = None):
+        """
+        Initialize Researcher Agent.
+
+        Args:
+            code_search: Optional SemanticSearchService for code context
+        """
         metadata = create_agent_metadata(
             agent_id="researcher",
             name="Research and Analysis Specialist",
@@ -115,6 +121,7 @@ class ResearcherAgent(AgentBase):
         )
 
         super().__init__(metadata=metadata)
+        self.code_search = code_search
 
     # ========================================================================
     # AgentContract Implementation
@@ -232,6 +239,7 @@ class ResearcherAgent(AgentBase):
 
         # Gather findings from various sources
         findings = self._gather_findings(topic, depth)
+        findings.extend(await self._search_code(task, topic))
 
         # Generate recommendations
         recommendations = self._generate_recommendations(findings)
@@ -361,6 +369,31 @@ class ResearcherAgent(AgentBase):
 
         return findings
 
+    async def _search_code(self, task: Task, topic: str) -> List[ResearchFinding]:
+        """Relevant indexed code chunks as findings (needs code_search + project_id)."""
+        project_id = task.payload.get("project_id")
+        if self.code_search is None or not project_id:
+            return []
+
+        response = await self.code_search.search(
+            project_id,
+            task.payload.get("query", topic),
+            k=task.payload.get("max_code_results", 5),
+            filters=task.payload.get("code_filters"),
+            project_path=task.payload.get("project_path")
+        )
+        self.log_info(f"Code search returned {len(response.results)} chunks in {response.duration_ms:.1f}ms")
+
+        return [
+            ResearchFinding(
+                source=f"{result.file_path}:{result.start_line}-{result.end_line}",
+                summary=result.content or f"{result.symbol or result.file_path} ({result.language or 'code'})",
+                relevance_score=result.score,
+                key_points=[]  # code is context, not a recommendation
+            )
+            for result in response.results
+        ]
+
     def _generate_recommendations(
         self,
         findings: List[ResearchFinding]
@@ -447,11 +480,14 @@ class ResearcherAgent(AgentBase):
 # Factory Function
 # ============================================================================
 
-def create_researcher_agent() -> ResearcherAgent:
+def create_researcher_agent(code_search: Optional[Any] = None) -> ResearcherAgent:
     """
     Create Researcher Agent instance.
 
+    Args:
+        code_search: Optional SemanticSearchService for code context
+
     Returns:
         ResearcherAgent
     """
-    return ResearcherAgent()
+    return ResearcherAgent(code_search=code_search)
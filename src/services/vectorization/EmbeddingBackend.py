@@ -0,0 +1,267 @@
+"""
+EmbeddingBackend - Pluggable embedding backends for ParallelEmbedder
+
+ParallelEmbedder talks to OpenAI by default; a backend replaces that call
+so vectorization can run without network access:
+- EmbeddingBackend: interface (model name, request limits, async embed)
+- HashedNgramEmbeddingBackend: CPU-only, deterministic code-token
+  embeddings (identifier subwords + bigrams, signed feature hashing into
+  a fixed dimension, sublinear TF with optional frozen IDF), computed for
+  a whole batch at once with NumPy bincount
+- benchmark_embedding_backend: chunks/sec for sizing indexing jobs
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# ============================================================================
+# Backend Interface
+# ============================================================================
+
+class EmbeddingBackend(ABC):
+    """
+    Embedding provider used by ParallelEmbedder.
+
+    Subclasses set the request limits ParallelEmbedder packs batches for
+    and implement embed(); errors raised from embed() go through the same
+    split/retry handling as API errors.
+    """
+
+    model: str = "embedding-backend"
+    dimension: Optional[int] = None
+    max_inputs_per_request: int = 2048
+    max_tokens_per_request: int = 300_000
+    max_tokens_per_input: int = 8191
+    cost_per_1m_tokens: float = 0.0
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, returning one vector per input in order."""
+        pass
+
+
+# ============================================================================
+# Hashed N-gram Backend
+# ============================================================================
+
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_SUBWORD = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+# Multiplier for combining unigram hashes into bigram hashes (golden ratio)
+_BIGRAM_MIX = np.uint64(0x9E3779B1)
+_HASH_MASK = np.uint64(0xFFFFFFFF)
+
+
+class HashedNgramEmbeddingBackend(EmbeddingBackend):
+    """
+    Deterministic feature-hashing embeddings for source code.
+
+    Features per text:
+    - identifier subwords (getUserName -> get, user, name)
+    - whole multi-part identifiers (getusername)
+    - adjacent subword bigrams, weighted by bigram_weight
+
+    Each feature hashes (crc32) to a bucket and a sign; counts become
+    sign * log(1 + tf), optionally scaled by IDF learned with fit(), and
+    rows are L2-normalized so cosine similarity is a dot product.
+    Vectors depend only on the text, so they are safe to cache by content
+    hash and identical across machines.
+    """
+
+    max_inputs_per_request = 256
+    max_tokens_per_request = 1_000_000
+    max_tokens_per_input = 1_000_000
+
+    def __init__(
+        self,
+        dimension: int = 384,
+        bigram_weight: float = 0.5,
+        idf: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            dimension: Output vector dimension
+            bigram_weight: Weight of subword bigram features
+            idf: Optional per-bucket IDF weights (see fit())
+        """
+        self.dimension = dimension
+        self.bigram_weight = bigram_weight
+        self.idf: Optional[np.ndarray] = None
+        self._identifier_hashes: Dict[str, Tuple[Tuple[int, ...], Optional[int]]] = {}
+        self.model = f"hashed-ngram-{dimension}"
+        if idf is not None:
+            self._set_idf(np.asarray(idf, dtype=np.float32))
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        # CPU-bound: keep the event loop free for other batches and progress
+        matrix = await asyncio.to_thread(self.embed_batch, texts)
+        return matrix.tolist()
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts synchronously.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            float32 array of shape (len(texts), dimension), rows L2-normalized
+        """
+        matrix = self._term_frequencies(texts)
+        if self.idf is not None:
+            matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def fit(self, texts: Sequence[str]) -> "HashedNgramEmbeddingBackend":
+        """
+        Learn per-bucket IDF from a corpus and freeze it.
+
+        The model name gains a fingerprint of the weights, so embeddings
+        cached under the unweighted model are not reused.
+
+        Args:
+            texts: Corpus texts (e.g. every chunk of the project)
+
+        Returns:
+            self
+        """
+        document_frequency = np.zeros(self.dimension, dtype=np.float64)
+        for start in range(0, len(texts), self.max_inputs_per_request):
+            batch = texts[start:start + self.max_inputs_per_request]
+            document_frequency += (self._term_frequencies(batch) != 0).sum(axis=0)
+        idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+        self._set_idf(idf.astype(np.float32))
+        return self
+
+    def _set_idf(self, idf: np.ndarray) -> None:
+        if idf.shape != (self.dimension,):
+            raise ValueError(f"IDF must have shape ({self.dimension},), got {idf.shape}")
+        self.idf = idf
+        fingerprint = hashlib.sha256(idf.tobytes()).hexdigest()[:8]
+        self.model = f"hashed-ngram-{self.dimension}-idf-{fingerprint}"
+
+    def _term_frequencies(self, texts: Sequence[str]) -> np.ndarray:
+        """Signed, sublinear hashed feature counts for a batch (one bincount)."""
+        rows: List[np.ndarray] = []
+        hashes: List[np.ndarray] = []
+        weights: List[np.ndarray] = []
+
+        for row, text in enumerate(texts):
+            subwords, identifiers = self._token_hashes(text)
+            unigrams = np.array(subwords + identifiers, dtype=np.uint64)
+            sequence = unigrams[:len(subwords)]
+            bigrams = ((sequence[:-1] * _BIGRAM_MIX) ^ sequence[1:]) & _HASH_MASK
+            features = np.concatenate([unigrams, bigrams])
+            rows.append(np.full(len(features), row, dtype=np.int64))
+            hashes.append(features)
+            weights.append(np.concatenate([
+                np.ones(len(unigrams), dtype=np.float64),
+                np.full(len(bigrams), self.bigram_weight, dtype=np.float64)
+            ]))
+
+        count = len(texts)
+        if not count or not sum(len(h) for h in hashes):
+            return np.zeros((count, self.dimension), dtype=np.float32)
+
+        all_hashes = np.concatenate(hashes)
+        buckets = (all_hashes % np.uint64(self.dimension)).astype(np.int64)
+        signs = np.where((all_hashes >> np.uint64(31)) & np.uint64(1), -1.0, 1.0)
+        flat = np.bincount(
+            np.concatenate(rows) * self.dimension + buckets,
+            weights=signs * np.concatenate(weights),
+            minlength=count * self.dimension
+        ).reshape(count, self.dimension)
+        return (np.sign(flat) * np.log1p(np.abs(flat))).astype(np.float32)
+
+    def _token_hashes(self, text: str) -> Tuple[List[int], List[int]]:
+        """crc32 of subwords (in order) and of whole multi-part identifiers."""
+        subwords: List[int] = []
+        identifiers: List[int] = []
+        memo = self._identifier_hashes
+        for identifier in _IDENTIFIER.findall(text):
+            cached = memo.get(identifier)
+            if cached is None:
+                parts = [part.lower() for part in _SUBWORD.findall(identifier)] or [identifier.lower()]
+                whole = zlib.crc32(identifier.lower().encode()) if len(parts) > 1 else None
+                cached = (tuple(zlib.crc32(part.encode()) for part in parts), whole)
+                if len(memo) < 1_000_000:
+                    memo[identifier] = cached
+            subwords.extend(cached[0])
+            if cached[1] is not None:
+                identifiers.append(cached[1])
+        return subwords, identifiers
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def benchmark_embedding_backend(
+    backend: EmbeddingBackend,
+    texts: Sequence[str],
+    batch_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Measure backend throughput.
+
+    Args:
+        backend: Backend to measure
+        texts: Sample chunks (representative sizes matter)
+        batch_size: Inputs per embed() call (default backend limit)
+
+    Returns:
+        Dict with chunks/sec, chars/sec and timing details
+    """
+    batch_size = batch_size or backend.max_inputs_per_request
+
+    async def run() -> None:
+        for start in range(0, len(texts), batch_size):
+            await backend.embed(list(texts[start:start + batch_size]))
+
+    start_time = time.perf_counter()
+    asyncio.run(run())
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        'model': backend.model,
+        'chunks': len(texts),
+        'batch_size': batch_size,
+        'seconds': round(elapsed, 4),
+        'chunks_per_second': round(len(texts) / elapsed, 1) if elapsed > 0 else 0.0,
+        'chars_per_second': round(sum(len(t) for t in texts) / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+
+def create_local_embedding_backend(
+    dimension: int = 384,
+    corpus: Optional[Sequence[str]] = None
+) -> HashedNgramEmbeddingBackend:
+    """
+    Factory function to create HashedNgramEmbeddingBackend.
+
+    Args:
+        dimension: Output vector dimension
+        corpus: Optional texts to learn IDF weights from
+
+    Returns:
+        HashedNgramEmbeddingBackend instance
+    """
+    backend = HashedNgramEmbeddingBackend(dimension=dimension)
+    if corpus:
+        backend.fit(corpus)
+    return backend
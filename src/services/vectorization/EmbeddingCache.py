@@ -0,0 +1,162 @@
+"""
+EmbeddingCache - Local content-hash embedding cache
+
+Embeddings depend only on (model, text), so chunks are cached by the
+SHA-256 of their normalized content:
+- SQLite (WAL) with float32 blobs; shared across projects and branches
+- Batch lookups and inserts
+- Per-file chunk manifests so the indexer can drop vectors for chunks
+  that disappeared from a modified or deleted file
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import json
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# SQLite limits host parameters per statement; stay well below it
+_LOOKUP_BATCH = 500
+
+
+# ============================================================================
+# EmbeddingCache Class
+# ============================================================================
+
+class EmbeddingCache:
+    """SQLite-backed embedding cache keyed by (model, content_hash)."""
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the cache.
+
+        Args:
+            db_path: SQLite database path
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                token_count INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, content_hash)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS chunk_manifest (
+                scope TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                vector_ids TEXT NOT NULL,
+                PRIMARY KEY (scope, file_path)
+            ) WITHOUT ROWID;
+        """)
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model: str, content_hashes: Iterable[str]) -> Dict[str, Tuple[List[float], int]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            model: Embedding model name
+            content_hashes: Chunk content hashes
+
+        Returns:
+            Dict mapping content_hash -> (embedding, token_count) for hits
+        """
+        wanted = list(dict.fromkeys(content_hashes))
+        found: Dict[str, Tuple[List[float], int]] = {}
+        with self._lock:
+            for i in range(0, len(wanted), _LOOKUP_BATCH):
+                batch = wanted[i:i + _LOOKUP_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT content_hash, token_count, vector FROM embeddings "
+                    f"WHERE model = ? AND content_hash IN ({placeholders})",
+                    [model, *batch]
+                )
+                for digest, token_count, blob in rows:
+                    vector = array('f')
+                    vector.frombytes(blob)
+                    found[digest] = (vector.tolist(), token_count)
+        self.hits += len(found)
+        self.misses += len(wanted) - len(found)
+        return found
+
+    def put_many(self, model: str, entries: Iterable[Tuple[str, List[float], int]]) -> int:
+        """
+        Store embeddings.
+
+        Args:
+            model: Embedding model name
+            entries: (content_hash, embedding, token_count) tuples
+
+        Returns:
+            Number of rows written
+        """
+        rows = [(model, digest, token_count, array('f', embedding).tobytes())
+                for digest, embedding, token_count in entries if embedding]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, content_hash, token_count, vector) VALUES (?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def get_chunk_ids(self, scope: str, file_paths: Iterable[str]) -> Dict[str, List[str]]:
+        """Vector ids last indexed for each file (scope is usually the project id)."""
+        manifest: Dict[str, List[str]] = {}
+        with self._lock:
+            for file_path in file_paths:
+                row = self._conn.execute(
+                    "SELECT vector_ids FROM chunk_manifest WHERE scope = ? AND file_path = ?",
+                    (scope, file_path)
+                ).fetchone()
+                if row:
+                    manifest[file_path] = json.loads(row[0])
+        return manifest
+
+    def set_chunk_ids(self, scope: str, manifest: Dict[str, Optional[List[str]]]) -> None:
+        """Replace per-file vector ids; None removes the file's entry."""
+        with self._lock, self._conn:
+            for file_path, vector_ids in manifest.items():
+                if vector_ids is None:
+                    self._conn.execute(
+                        "DELETE FROM chunk_manifest WHERE scope = ? AND file_path = ?", (scope, file_path)
+                    )
+                else:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO chunk_manifest (scope, file_path, vector_ids) VALUES (?, ?, ?)",
+                        (scope, file_path, json.dumps(vector_ids))
+                    )
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return {'entries': entries, 'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_embedding_cache(db_path: str = ".claude/.artifacts/vectorization/embedding_cache.db") -> EmbeddingCache:
+    """
+    Factory function to create EmbeddingCache.
+
+    Args:
+        db_path: SQLite database path
+
+    Returns:
+        EmbeddingCache instance
+    """
+    return EmbeddingCache(db_path)
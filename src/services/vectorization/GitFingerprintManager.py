@@ -4,6 +4,11 @@ GitFingerprintManager - Git commit hash fingerprinting for cache invalidation
 Uses git commit hash as cache key to detect when project code has changed.
 Enables incremental vectorization (only re-index changed files).
 
+- Git: HEAD/refs read straight from .git, commit details memoized per
+  commit (one `git log` call as fallback) - constant time when unchanged
+- Non-git: persisted Merkle tree of per-directory hashes; only files whose
+  size/mtime changed are re-read and only their ancestor directories rehashed
+
 Performance Impact:
 - Cache hit: <1s (instant retrieval)
 - Cache miss: Triggers full/incremental vectorization
@@ -13,13 +18,31 @@ Week 4 Day 2
 Version: 8.0.0
 """
 
+import hashlib
+import json
+import re
 import subprocess
 import os
-from typing import Optional
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import redis.asyncio as aioredis
 from pathlib import Path
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+
+_SHA_PATTERN = re.compile(r'^[0-9a-f]{40}([0-9a-f]{24})?$')
+
+MERKLE_STATE_VERSION = 1
+MERKLE_IGNORED_DIRS = {'.git', '.hg', '.svn', '__pycache__', 'node_modules', '.venv', 'venv',
+                       '.mypy_cache', '.pytest_cache', '.tox'}
+
 
 # ============================================================================
 # Types
@@ -47,15 +70,24 @@ class GitFingerprintManager:
     When hash changes, cache is invalidated and vectorization reruns.
     """
 
-    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        state_dir: str = ".claude/.artifacts/vectorization/merkle"
+    ):
         """
         Initialize fingerprint manager.
 
         Args:
             redis_client: Optional Redis client for caching
+            state_dir: Where directory Merkle trees are persisted
         """
         self.redis = redis_client
         self.ttl_seconds = 2592000  # 30 days
+        self.state_dir = os.path.abspath(state_dir)
+        self._commit_details: Dict[str, Tuple[Optional[str], Optional[int]]] = {}
+        self._merkle_states: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.last_directory_stats: Dict[str, int] = {}
 
     async def get_current_fingerprint(
         self,
@@ -85,9 +117,12 @@ class GitFingerprintManager:
             return await self._get_directory_fingerprint(project_path)
 
     def _is_git_repository(self, project_path: str) -> bool:
-        """Check if directory is a git repository."""
-        git_dir = os.path.join(project_path, '.git')
-        return os.path.isdir(git_dir)
+        """Check if directory is a git repository (.git dir, or .git file for worktrees)."""
+        return self._resolve_git_dir(project_path) is not None
+
+    # ------------------------------------------------------------------------
+    # Git fingerprint
+    # ------------------------------------------------------------------------
 
     async def _get_git_fingerprint(
         self,
@@ -96,20 +131,30 @@ class GitFingerprintManager:
         """
         Get git commit hash as fingerprint.
 
-        Runs: git rev-parse HEAD
+        Reads HEAD and refs from .git directly (two small file reads); commit
+        message/timestamp come from the loose commit object and are memoized
+        per commit. Falls back to a single `git log` call when the ref or
+        object can't be read (packed objects, reftable, ...).
         """
         try:
-            commit_hash = self._get_commit_hash(project_path)
-            branch_name = self._get_branch_name(project_path)
-            commit_message = self._get_commit_message(project_path)
-            commit_timestamp = self._get_commit_timestamp(project_path)
+            git_dir = self._resolve_git_dir(project_path)
+            commit_hash, branch_name = self._read_head(git_dir) if git_dir else (None, None)
+            if commit_hash is None:
+                return self._git_log_fingerprint(project_path)
+
+            details = self._commit_details.get(commit_hash)
+            if details is None:
+                details = self._read_commit_object(git_dir, commit_hash)
+                if details is None:
+                    return self._git_log_fingerprint(project_path)
+                self._commit_details[commit_hash] = details
 
             return FingerprintResult(
                 fingerprint=commit_hash,
                 is_git_repo=True,
                 branch_name=branch_name,
-                commit_message=commit_message,
-                commit_timestamp=commit_timestamp
+                commit_message=details[0],
+                commit_timestamp=details[1]
             )
 
         except subprocess.TimeoutExpired:
@@ -117,10 +162,70 @@ class GitFingerprintManager:
         except Exception as e:
             raise RuntimeError(f"Failed to get git fingerprint: {e}")
 
-    def _get_commit_hash(self, project_path: str) -> str:
-        """Get current commit hash."""
+    def _resolve_git_dir(self, project_path: str) -> Optional[Path]:
+        dot_git = Path(project_path) / '.git'
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules: ".git" holds "gitdir: <path>"
+            content = dot_git.read_text(encoding='utf-8', errors='ignore').strip()
+            if content.startswith('gitdir:'):
+                git_dir = (Path(project_path) / content[len('gitdir:'):].strip()).resolve()
+                return git_dir if git_dir.is_dir() else None
+        return None
+
+    def _common_dir(self, git_dir: Path) -> Path:
+        """Shared repository dir (differs from git_dir for linked worktrees)."""
+        commondir = git_dir / 'commondir'
+        if commondir.is_file():
+            return (git_dir / commondir.read_text(encoding='utf-8').strip()).resolve()
+        return git_dir
+
+    def _read_head(self, git_dir: Path) -> Tuple[Optional[str], Optional[str]]:
+        """(commit hash, branch) from HEAD; branch is "HEAD" when detached, like rev-parse."""
+        head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        if not head.startswith('ref:'):
+            return (head if _SHA_PATTERN.match(head) else None), 'HEAD'
+
+        ref = head[len('ref:'):].strip()
+        branch = ref[len('refs/heads/'):] if ref.startswith('refs/heads/') else ref
+        common_dir = self._common_dir(git_dir)
+        for base in (git_dir, common_dir):
+            ref_path = base / ref
+            if ref_path.is_file():
+                value = ref_path.read_text(encoding='utf-8').strip()
+                return (value if _SHA_PATTERN.match(value) else None), branch
+
+        packed_refs = common_dir / 'packed-refs'
+        if packed_refs.is_file():
+            with open(packed_refs, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[1] == ref and _SHA_PATTERN.match(parts[0]):
+                        return parts[0], branch
+        return None, branch
+
+    def _read_commit_object(self, git_dir: Path, commit_hash: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """(message, committer timestamp) from a loose commit object, None if packed."""
+        object_path = self._common_dir(git_dir) / 'objects' / commit_hash[:2] / commit_hash[2:]
+        if not object_path.is_file():
+            return None
+        raw = zlib.decompress(object_path.read_bytes())
+        header, _, body = raw.partition(b'\0')
+        if not header.startswith(b'commit '):
+            return None
+
+        headers, _, message = body.partition(b'\n\n')
+        timestamp = None
+        for line in headers.split(b'\n'):
+            if line.startswith(b'committer '):
+                timestamp = int(line.rsplit(b' ', 2)[1])
+        return message.decode('utf-8', errors='replace').strip(), timestamp
+
+    def _git_log_fingerprint(self, project_path: str) -> FingerprintResult:
+        """All metadata from one `git log` call (fallback path)."""
         result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
+            ['git', 'log', '-1', '--format=%H%x00%ct%x00%D%x00%B'],
             cwd=project_path,
             capture_output=True,
             text=True,
@@ -130,72 +235,155 @@ class GitFingerprintManager:
         if result.returncode != 0:
             raise RuntimeError(f"Git command failed: {result.stderr}")
 
-        return result.stdout.strip()
-
-    def _get_branch_name(self, project_path: str) -> Optional[str]:
-        """Get current branch name."""
-        result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.stdout.strip() if result.returncode == 0 else None
-
-    def _get_commit_message(self, project_path: str) -> Optional[str]:
-        """Get last commit message."""
-        result = subprocess.run(
-            ['git', 'log', '-1', '--pretty=%B'],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
+        commit_hash, timestamp, decorations, message = result.stdout.split('\0', 3)
+        branch = re.search(r'HEAD -> ([^,]+)', decorations)
+        return FingerprintResult(
+            fingerprint=commit_hash.strip(),
+            is_git_repo=True,
+            branch_name=branch.group(1).strip() if branch else 'HEAD',
+            commit_message=message.strip(),
+            commit_timestamp=int(timestamp) if timestamp.strip() else None
         )
-        return result.stdout.strip() if result.returncode == 0 else None
 
-    def _get_commit_timestamp(self, project_path: str) -> Optional[int]:
-        """Get last commit timestamp."""
-        result = subprocess.run(
-            ['git', 'log', '-1', '--pretty=%ct'],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return int(result.stdout.strip()) if result.returncode == 0 else None
+    # ------------------------------------------------------------------------
+    # Directory (Merkle) fingerprint
+    # ------------------------------------------------------------------------
 
     async def _get_directory_fingerprint(
         self,
         project_path: str
     ) -> FingerprintResult:
         """
-        Get directory hash as fingerprint (for non-git projects).
+        Get directory Merkle hash as fingerprint (for non-git projects).
 
-        Uses directory mtime + file count as simple fingerprint.
+        Per-directory hashes are persisted between runs. A run stats every
+        entry but only re-reads files whose size/mtime changed, and only
+        rehashes directories on the path to a change; an unchanged tree
+        costs one stat per entry and no file reads.
         """
-        import hashlib
-
         try:
-            # Get all file paths
-            files = list(Path(project_path).rglob('*'))
-            file_count = len([f for f in files if f.is_file()])
+            root = os.path.abspath(project_path)
+            previous = self._load_merkle_state(root)
+            nodes: Dict[str, Dict[str, Any]] = {}
+            stats = {'files_hashed': 0, 'dirs_rehashed': 0}
 
-            # Get directory mtime
-            dir_mtime = os.path.getmtime(project_path)
+            root_hash = self._hash_directory(root, '', previous, nodes, stats)
 
-            # Create simple fingerprint
-            fingerprint_str = f"{project_path}:{file_count}:{dir_mtime}"
-            fingerprint = hashlib.sha256(fingerprint_str.encode()).hexdigest()[:16]
+            if stats['files_hashed'] or stats['dirs_rehashed'] or set(nodes) != set(previous):
+                self._save_merkle_state(root, nodes)
+            self.last_directory_stats = {**stats, 'directories': len(nodes)}
 
             return FingerprintResult(
-                fingerprint=fingerprint,
+                fingerprint=root_hash[:16],
                 is_git_repo=False
             )
 
         except Exception as e:
             raise RuntimeError(f"Failed to get directory fingerprint: {e}")
 
+    def _hash_directory(
+        self,
+        root: str,
+        rel_dir: str,
+        previous: Dict[str, Dict[str, Any]],
+        nodes: Dict[str, Dict[str, Any]],
+        stats: Dict[str, int]
+    ) -> str:
+        """Merkle hash of one directory; reuses the stored hash when nothing below changed."""
+        old = previous.get(rel_dir)
+        old_files = old['files'] if old else {}
+        files: Dict[str, List[Any]] = {}
+        subdirs: List[str] = []
+        now_ns = time.time_ns()
+
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            entries = []
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in MERKLE_IGNORED_DIRS and os.path.abspath(entry.path) != self.state_dir:
+                    subdirs.append(entry.name)
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            cached = old_files.get(entry.name)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                digest = cached[2]
+            else:
+                digest = self._hash_file(entry.path)
+                stats['files_hashed'] += 1
+            # Files modified within the last 2s may change again in the same
+            # mtime tick; store no mtime so they are re-read next time
+            mtime = stat.st_mtime_ns if now_ns - stat.st_mtime_ns > 2_000_000_000 else -1
+            files[entry.name] = [stat.st_size, mtime, digest]
+
+        children = {
+            name: self._hash_directory(root, f"{rel_dir}/{name}" if rel_dir else name, previous, nodes, stats)
+            for name in subdirs
+        }
+
+        unchanged = (
+            old is not None
+            and old['dirs'] == children
+            and {name: value[2] for name, value in old_files.items()} == {name: value[2] for name, value in files.items()}
+        )
+        if unchanged:
+            digest = old['hash']
+        else:
+            hasher = hashlib.sha256()
+            for name, value in files.items():
+                hasher.update(f"f {name} {value[2]}\n".encode('utf-8', errors='surrogateescape'))
+            for name, child_hash in children.items():
+                hasher.update(f"d {name} {child_hash}\n".encode('utf-8', errors='surrogateescape'))
+            digest = hasher.hexdigest()
+            stats['dirs_rehashed'] += 1
+
+        nodes[rel_dir] = {'hash': digest, 'files': files, 'dirs': children}
+        return digest
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        hasher = hashlib.sha256()
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(block)
+        except OSError:
+            return 'unreadable'
+        return hasher.hexdigest()
+
+    def _merkle_state_path(self, root: str) -> str:
+        key = hashlib.sha256(root.encode('utf-8', errors='surrogateescape')).hexdigest()[:16]
+        return os.path.join(self.state_dir, f"{key}.json")
+
+    def _load_merkle_state(self, root: str) -> Dict[str, Dict[str, Any]]:
+        if root in self._merkle_states:
+            return self._merkle_states[root]
+        try:
+            with open(self._merkle_state_path(root), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == MERKLE_STATE_VERSION and state.get('root') == root:
+                self._merkle_states[root] = state['nodes']
+                return state['nodes']
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def _save_merkle_state(self, root: str, nodes: Dict[str, Dict[str, Any]]) -> None:
+        self._merkle_states[root] = nodes
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            path = self._merkle_state_path(root)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'version': MERKLE_STATE_VERSION, 'root': root, 'nodes': nodes}, f, separators=(',', ':'))
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            print(f"⚠️  Failed to persist directory fingerprint state: {e}")
+
     async def get_cached_fingerprint(
         self,
         project_id: str
@@ -277,19 +465,23 @@ class GitFingerprintManager:
 
 
 def create_git_fingerprint_manager(
-    redis_url: Optional[str] = None
+    redis_url: Optional[str] = None,
+    state_dir: str = ".claude/.artifacts/vectorization/merkle"
 ) -> GitFingerprintManager:
     """
     Factory function to create GitFingerprintManager.
 
     Args:
         redis_url: Optional Redis connection URL
+        state_dir: Directory Merkle state location
 
     Returns:
         GitFingerprintManager instance
     """
     redis_client = None
-    if redis_url:
+    if redis_url and REDIS_AVAILABLE:
         redis_client = aioredis.from_url(redis_url)
+    elif redis_url:
+        print("⚠️  redis package not installed, fingerprint caching disabled")
 
-    return GitFingerprintManager(redis_client=redis_client)
+    return GitFingerprintManager(redis_client=redis_client, state_dir=state_dir)
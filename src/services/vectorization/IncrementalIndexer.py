@@ -5,7 +5,9 @@ Achieves 10x speedup through:
 - Git commit fingerprint caching (Redis 30-day TTL)
 - Git diff detection (only changed files)
 - Parallel batch embedding (64 files, 10 concurrent)
-- Pinecone upsert optimization
+- Pinecone upsert optimization (or LocalVectorStore for offline deployments)
+- Bulk file reads on a bounded thread pool, streamed into embedding windows
+  (binary/oversize files skipped by sniffing the first bytes)
 
 Performance:
 - Full indexing: 10K files in <60s (vs 15min baseline)
@@ -17,14 +19,17 @@ Version: 8.0.0
 """
 
 import asyncio
+import os
 import subprocess
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, AsyncIterator, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import time
 
 from .GitFingerprintManager import GitFingerprintManager, FingerprintResult
 from .ParallelEmbedder import ParallelEmbedder, BatchEmbeddingResult, ProgressUpdate
+from .LocalVectorStore import LocalVectorStore
 
 # Pinecone imports (mock for now, real implementation in deployment)
 try:
@@ -62,6 +67,36 @@ class ChangedFiles:
     total: int
 
 
+@dataclass
+class ReadStats:
+    """Bulk file read throughput."""
+    files_read: int = 0
+    bytes_read: int = 0
+    skipped_binary: int = 0
+    skipped_oversize: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1_000_000 / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+
+# Bytes sniffed for NUL to detect binary files (same heuristic as git)
+READ_SNIFF_BYTES = 8192
+DEFAULT_MAX_FILE_BYTES = 1_000_000
+
+
+# Language tag stored with each vector (filterable in search)
+EXTENSION_LANGUAGES = {
+    '.py': 'python', '.ts': 'typescript', '.tsx': 'typescript',
+    '.js': 'javascript', '.jsx': 'javascript', '.md': 'markdown',
+    '.txt': 'text', '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml',
+    '.go': 'go', '.rs': 'rust', '.java': 'java',
+    '.cpp': 'cpp', '.c': 'c', '.h': 'c'
+}
+
+
 # ============================================================================
 # IncrementalIndexer Class
 # ============================================================================
@@ -75,7 +110,7 @@ class IncrementalIndexer:
     2. If hit: Return cached vectors (<1s)
     3. If miss: Detect changed files (git diff)
     4. Embed changed files (parallel batching)
-    5. Upsert to Pinecone
+    5. Upsert to Pinecone (or the local vector store)
     6. Update cache (30-day TTL)
     """
 
@@ -84,7 +119,11 @@ class IncrementalIndexer:
         fingerprint_manager: GitFingerprintManager,
         embedder: ParallelEmbedder,
         pinecone_client: Optional[Any] = None,
-        index_name: str = "spek-platform"
+        index_name: str = "spek-platform",
+        vector_store: Optional[LocalVectorStore] = None,
+        read_workers: int = 16,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        embed_window_files: int = 256
     ):
         """
         Initialize incremental indexer.
@@ -94,11 +133,21 @@ class IncrementalIndexer:
             embedder: Parallel embedder
             pinecone_client: Optional Pinecone client
             index_name: Pinecone index name
+            vector_store: Optional local vector store (used when Pinecone is unavailable)
+            read_workers: Threads used for bulk file reads
+            max_file_bytes: Files larger than this are skipped
+            embed_window_files: Files handed to the embedder per window while reads continue
         """
         self.fingerprint_manager = fingerprint_manager
         self.embedder = embedder
         self.pinecone = pinecone_client
         self.index_name = index_name
+        self.vector_store = vector_store
+        self.read_workers = max(1, read_workers)
+        self.max_file_bytes = max_file_bytes
+        self.embed_window_files = max(1, embed_window_files)
+        self.last_read_stats = ReadStats()
+        self.last_upserted_ids: Set[str] = set()
 
         # File extensions to index
         self.indexed_extensions = {
@@ -186,13 +235,13 @@ class IncrementalIndexer:
 
         print(f"📊 Changed files: {changed_files.total} (added: {len(changed_files.added)}, modified: {len(changed_files.modified)}, deleted: {len(changed_files.deleted)})")
 
-        # Read, embed, and upsert files
-        file_contents = await self._read_files(project_path, changed_files)
-        embedding_result = await self.embedder.embed_files(file_contents)
+        # Read and embed (overlapped), then upsert
+        embedding_result = await self._embed_streamed(project_path, changed_files)
 
         print(f"✅ Embedded {embedding_result.total_files} files in {embedding_result.total_time:.2f}s ({embedding_result.files_per_second:.1f} files/sec)")
 
         vectors_upserted = await self._upsert_vectors(project_id, embedding_result)
+        await self._remove_stale_chunks(project_id, embedding_result, self.last_upserted_ids)
 
         # Handle deletions and update cache
         if changed_files.deleted:
@@ -204,8 +253,7 @@ class IncrementalIndexer:
         )
 
         # Calculate cost
-        cost_per_1m_tokens = 0.02
-        cost_estimate = (embedding_result.total_tokens / 1_000_000) * cost_per_1m_tokens
+        cost_estimate = (embedding_result.total_tokens / 1_000_000) * self.embedder.cost_per_1m_tokens
 
         return VectorizationResult(
             project_id=project_id,
@@ -338,21 +386,135 @@ class IncrementalIndexer:
         Returns:
             Dict mapping relative_path -> content
         """
-        file_contents = {}
+        return {rel_path: content async for rel_path, content in self._iter_files(project_path, changed_files)}
+
+    async def _iter_files(
+        self,
+        project_path: str,
+        changed_files: ChangedFiles
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Yield (relative_path, content) in completion order.
 
-        files_to_read = changed_files.added + changed_files.modified
+        Reads run on a bounded thread pool with at most 2x read_workers files
+        in flight, so memory stays flat however many files changed. Binary
+        and oversize files are skipped; throughput lands in last_read_stats.
+        """
+        loop = asyncio.get_running_loop()
+        files_to_read = iter(changed_files.added + changed_files.modified)
+        stats = ReadStats()
+        self.last_read_stats = stats
+        start_time = time.time()
+        executor = ThreadPoolExecutor(max_workers=self.read_workers, thread_name_prefix="indexer-read")
+        pending = set()
 
-        for rel_path in files_to_read:
-            abs_path = Path(project_path) / rel_path
+        def submit_next() -> bool:
+            rel_path = next(files_to_read, None)
+            if rel_path is None:
+                return False
+            pending.add(loop.run_in_executor(executor, self._read_file, project_path, rel_path))
+            return True
 
-            try:
-                with open(abs_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    file_contents[rel_path] = content
-            except Exception as e:
-                print(f"⚠️  Failed to read {rel_path}: {e}")
+        try:
+            while len(pending) < self.read_workers * 2 and submit_next():
+                pass
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    submit_next()
+                    rel_path, content, outcome, size = future.result()
+                    if outcome == 'ok':
+                        stats.files_read += 1
+                        stats.bytes_read += size
+                        stats.duration_seconds = time.time() - start_time
+                        yield rel_path, content
+                    elif outcome == 'binary':
+                        stats.skipped_binary += 1
+                    elif outcome == 'oversize':
+                        stats.skipped_oversize += 1
+                    else:
+                        stats.failed += 1
+                        print(f"⚠️  Failed to read {rel_path}: {outcome}")
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            stats.duration_seconds = time.time() - start_time
+
+    def _read_file(self, project_path: str, rel_path: str) -> Tuple[str, Optional[str], str, int]:
+        """(rel_path, content, outcome, bytes); runs on a reader thread."""
+        try:
+            with open(os.path.join(project_path, rel_path), 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > self.max_file_bytes:
+                    return rel_path, None, 'oversize', size
+                head = f.read(READ_SNIFF_BYTES)
+                if b'\0' in head:
+                    return rel_path, None, 'binary', size
+                data = head + f.read()
+        except Exception as e:
+            return rel_path, None, str(e), 0
+        return rel_path, data.decode('utf-8', errors='ignore'), 'ok', len(data)
 
-        return file_contents
+    async def _embed_streamed(
+        self,
+        project_path: str,
+        changed_files: ChangedFiles
+    ) -> BatchEmbeddingResult:
+        """
+        Embed files in windows as they are read.
+
+        Each full window is handed to the embedder as a task while reads
+        continue; at most two windows are outstanding so a slow embedder
+        throttles reading instead of buffering the whole project.
+        """
+        start_time = time.time()
+        window: Dict[str, str] = {}
+        in_flight: List[asyncio.Task] = []
+        results: List[BatchEmbeddingResult] = []
+
+        async for rel_path, content in self._iter_files(project_path, changed_files):
+            window[rel_path] = content
+            if len(window) >= self.embed_window_files:
+                in_flight.append(asyncio.create_task(self.embedder.embed_files(window)))
+                window = {}
+                if len(in_flight) >= 2:
+                    results.append(await in_flight.pop(0))
+
+        if window or not (in_flight or results):
+            in_flight.append(asyncio.create_task(self.embedder.embed_files(window)))
+        results.extend(await asyncio.gather(*in_flight))
+
+        stats = self.last_read_stats
+        print(f"📖 Read {stats.files_read} files ({stats.bytes_read / 1_000_000:.1f} MB) in {stats.duration_seconds:.2f}s ({stats.mb_per_second:.1f} MB/s), skipped {stats.skipped_binary} binary, {stats.skipped_oversize} oversize")
+
+        return self._merge_embedding_results(results, time.time() - start_time)
+
+    @staticmethod
+    def _merge_embedding_results(
+        results: List[BatchEmbeddingResult],
+        total_time: float
+    ) -> BatchEmbeddingResult:
+        """Combine per-window embedding results into one."""
+        total_files = sum(result.total_files for result in results)
+        return BatchEmbeddingResult(
+            results=[item for result in results for item in result.results],
+            total_files=total_files,
+            total_tokens=sum(result.total_tokens for result in results),
+            total_time=total_time,
+            files_per_second=total_files / total_time if total_time > 0 else 0,
+            chunks_total=sum(result.chunks_total for result in results),
+            chunks_embedded=sum(result.chunks_embedded for result in results),
+            cache_hits=sum(result.cache_hits for result in results)
+        )
+
+    def _get_index(self) -> Optional[Any]:
+        """Pinecone index when configured, otherwise the local vector store."""
+        if self.pinecone and PINECONE_AVAILABLE:
+            return self.pinecone.Index(self.index_name)
+        return self.vector_store
 
     async def _upsert_vectors(
         self,
@@ -360,7 +522,9 @@ class IncrementalIndexer:
         embedding_result: BatchEmbeddingResult
     ) -> int:
         """
-        Upsert vectors to Pinecone.
+        Upsert vectors to Pinecone or the local vector store.
+
+        Ids of the vectors that reached the index land in last_upserted_ids.
 
         Args:
             project_id: Project identifier
@@ -369,30 +533,47 @@ class IncrementalIndexer:
         Returns:
             Number of vectors upserted
         """
-        if not self.pinecone or not PINECONE_AVAILABLE:
-            print("⚠️  Pinecone not available, skipping upsert")
+        self.last_upserted_ids = set()
+        index = self._get_index()
+        if index is None:
+            print("⚠️  No vector index available (Pinecone or local), skipping upsert")
             return 0
 
         try:
-            index = self.pinecone.Index(self.index_name)
-
             # Prepare vectors for upsert
             vectors = []
             for result in embedding_result.results:
                 if not result.embedding:  # Skip failed embeddings
                     continue
 
-                vector_id = f"{project_id}::{result.file_path}"
+                metadata = {
+                    'project_id': project_id,
+                    'file_path': result.file_path,
+                    'language': EXTENSION_LANGUAGES.get(Path(result.file_path).suffix.lower(), 'text'),
+                    'token_count': result.token_count
+                }
+                if result.chunk_id:
+                    metadata.update({
+                        'chunk_id': result.chunk_id,
+                        'content_hash': result.content_hash,
+                        'start_line': result.start_line,
+                        'end_line': result.end_line,
+                        'symbol': result.symbol or ''
+                    })
                 vectors.append({
-                    'id': vector_id,
+                    'id': self._vector_id(project_id, result.file_path, result.chunk_id),
                     'values': result.embedding,
-                    'metadata': {
-                        'project_id': project_id,
-                        'file_path': result.file_path,
-                        'token_count': result.token_count
-                    }
+                    'metadata': metadata
                 })
 
+            if index is self.vector_store:
+                # Local store takes the whole batch at once
+                index.upsert(vectors=vectors)
+                index.flush()
+                self.last_upserted_ids = {vector['id'] for vector in vectors}
+                print(f"✅ Upserted {len(vectors)} vectors to local vector store")
+                return len(vectors)
+
             # Upsert in batches of 100 (Pinecone limit)
             batch_size = 100
             upserted = 0
@@ -400,13 +581,100 @@ class IncrementalIndexer:
             for i in range(0, len(vectors), batch_size):
                 batch = vectors[i:i + batch_size]
                 index.upsert(vectors=batch)
+                self.last_upserted_ids.update(vector['id'] for vector in batch)
                 upserted += len(batch)
 
             print(f"✅ Upserted {upserted} vectors to Pinecone")
             return upserted
 
         except Exception as e:
-            print(f"❌ Pinecone upsert failed: {e}")
+            print(f"❌ Vector upsert failed: {e}")
+            return len(self.last_upserted_ids)
+
+    @staticmethod
+    def _vector_id(project_id: str, file_path: str, chunk_id: Optional[str] = None) -> str:
+        """Whole-file id, or one id per chunk when the embedder chunks files."""
+        vector_id = f"{project_id}::{file_path}"
+        return f"{vector_id}#{chunk_id}" if chunk_id else vector_id
+
+    def _chunk_manifest(self) -> Optional[Any]:
+        """Embedding cache holding per-file chunk ids (only when chunking)."""
+        if getattr(self.embedder, 'chunker', None) is None:
+            return None
+        return getattr(self.embedder, 'embedding_cache', None)
+
+    async def _remove_stale_chunks(
+        self,
+        project_id: str,
+        embedding_result: BatchEmbeddingResult,
+        upserted_ids: Optional[Set[str]] = None
+    ) -> int:
+        """
+        Delete vectors of chunks that no longer exist in re-embedded files.
+
+        Chunk ids are content hashes, so an edited function gets a new id and
+        the old vector must be removed explicitly. A file's old ids are only
+        retired once every one of its new chunks is in the index; until then
+        the old vectors keep serving it. The manifest records only ids that
+        are actually indexed, so failed chunks never enter it.
+
+        Args:
+            project_id: Project identifier
+            embedding_result: Embedding results that were just upserted
+            upserted_ids: Vector ids that reached the index (default: last_upserted_ids)
+
+        Returns:
+            Number of vectors deleted
+        """
+        manifest = self._chunk_manifest()
+        index = self._get_index()
+        if manifest is None or index is None:
+            return 0
+        if upserted_ids is None:
+            upserted_ids = self.last_upserted_ids
+
+        current: Dict[str, List[str]] = {}
+        for result in embedding_result.results:
+            if result.chunk_id:
+                current.setdefault(result.file_path, []).append(
+                    self._vector_id(project_id, result.file_path, result.chunk_id)
+                )
+
+        try:
+            previous = manifest.get_chunk_ids(project_id, current.keys())
+            indexed: Dict[str, List[str]] = {}
+            stale: Dict[str, List[str]] = {}
+            for path, vector_ids in current.items():
+                # Files indexed before chunking was enabled have a whole-file vector
+                old_ids = previous.get(path, [self._vector_id(project_id, path)])
+                new_ids = [vector_id for vector_id in vector_ids if vector_id in upserted_ids]
+                if len(new_ids) < len(vector_ids):
+                    # Replacements incomplete: keep the old vectors alongside the new ones
+                    indexed[path] = list(dict.fromkeys(old_ids + new_ids))
+                    continue
+                indexed[path] = new_ids
+                replaced = set(new_ids)
+                stale[path] = [vector_id for vector_id in old_ids if vector_id not in replaced]
+
+            stale_ids = [vector_id for vector_ids in stale.values() for vector_id in vector_ids]
+            if stale_ids:
+                try:
+                    index.delete(ids=stale_ids)
+                    if index is self.vector_store:
+                        index.flush()
+                except Exception as e:
+                    # Keep the stale ids in the manifest so a later run retires them
+                    print(f"❌ Stale chunk delete failed: {e}")
+                    for path, vector_ids in stale.items():
+                        indexed[path] = indexed[path] + vector_ids
+                    stale_ids = []
+                else:
+                    print(f"🗑️  Deleted {len(stale_ids)} stale chunk vectors")
+            manifest.set_chunk_ids(project_id, indexed)
+            return len(stale_ids)
+
+        except Exception as e:
+            print(f"❌ Stale chunk cleanup failed: {e}")
             return 0
 
     async def _delete_vectors(
@@ -415,7 +683,7 @@ class IncrementalIndexer:
         deleted_files: List[str]
     ) -> int:
         """
-        Delete vectors from Pinecone for deleted files.
+        Delete vectors for deleted files.
 
         Args:
             project_id: Project identifier
@@ -424,38 +692,49 @@ class IncrementalIndexer:
         Returns:
             Number of vectors deleted
         """
-        if not self.pinecone or not PINECONE_AVAILABLE:
+        index = self._get_index()
+        if index is None:
             return 0
 
         try:
-            index = self.pinecone.Index(self.index_name)
-
-            # Delete by ID
-            vector_ids = [f"{project_id}::{path}" for path in deleted_files]
+            # Delete by ID (every chunk of the file, or the whole-file vector)
+            manifest = self._chunk_manifest()
+            chunk_ids = manifest.get_chunk_ids(project_id, deleted_files) if manifest else {}
+            vector_ids = []
+            for path in deleted_files:
+                vector_ids.extend(chunk_ids.get(path) or [self._vector_id(project_id, path)])
             index.delete(ids=vector_ids)
+            if manifest:
+                manifest.set_chunk_ids(project_id, {path: None for path in deleted_files})
+            if index is self.vector_store:
+                index.flush()
 
-            print(f"🗑️  Deleted {len(vector_ids)} vectors from Pinecone")
+            print(f"🗑️  Deleted {len(vector_ids)} vectors")
             return len(vector_ids)
 
         except Exception as e:
-            print(f"❌ Pinecone delete failed: {e}")
+            print(f"❌ Vector delete failed: {e}")
             return 0
 
 
 def create_incremental_indexer(
-    redis_url: str,
-    openai_api_key: str,
+    redis_url: Optional[str],
+    openai_api_key: Optional[str],
     pinecone_api_key: Optional[str] = None,
-    pinecone_environment: Optional[str] = None
+    pinecone_environment: Optional[str] = None,
+    local_index_path: Optional[str] = None,
+    embedding_backend: Optional[Any] = None
 ) -> IncrementalIndexer:
     """
     Factory function to create IncrementalIndexer.
 
     Args:
-        redis_url: Redis connection URL
-        openai_api_key: OpenAI API key
+        redis_url: Redis connection URL (None disables fingerprint caching)
+        openai_api_key: OpenAI API key (None embeds locally with the hashed n-gram backend)
         pinecone_api_key: Optional Pinecone API key
         pinecone_environment: Optional Pinecone environment
+        local_index_path: Optional directory for an offline LocalVectorStore
+        embedding_backend: Optional embedding backend (overrides OpenAI)
 
     Returns:
         IncrementalIndexer instance
@@ -464,14 +743,23 @@ def create_incremental_indexer(
     from .ParallelEmbedder import create_parallel_embedder
 
     fingerprint_manager = create_git_fingerprint_manager(redis_url)
-    embedder = create_parallel_embedder(openai_api_key)
+    if embedding_backend is None and not openai_api_key:
+        from .EmbeddingBackend import create_local_embedding_backend
+        embedding_backend = create_local_embedding_backend()
+    embedder = create_parallel_embedder(openai_api_key, backend=embedding_backend)
 
     pinecone_client = None
     if pinecone_api_key and PINECONE_AVAILABLE:
         pinecone_client = Pinecone(api_key=pinecone_api_key)
 
+    vector_store = None
+    if local_index_path:
+        from .LocalVectorStore import create_local_vector_store
+        vector_store = create_local_vector_store(local_index_path)
+
     return IncrementalIndexer(
         fingerprint_manager=fingerprint_manager,
         embedder=embedder,
-        pinecone_client=pinecone_client
+        pinecone_client=pinecone_client,
+        vector_store=vector_store
     )
@@ -2,9 +2,17 @@
 ParallelEmbedder - Parallel batch embedding with OpenAI
 
 Optimizes embedding generation through:
-- Batch size 64 (OpenAI-optimized)
-- 10 parallel tasks
+- Batches packed by token count up to the per-request limits
+  (at most 64 inputs, 300K tokens; oversized inputs truncated to 8191)
+- Adaptive concurrency: starts at 10 parallel tasks, halves on rate
+  limits (honouring Retry-After) and ramps back up on success
+- Failed batches retried by splitting in half until the bad input is
+  isolated, instead of dropping the whole batch
 - Progress streaming with ETA
+- Pluggable backend (e.g. the local hashed n-gram backend) for offline,
+  deterministic runs
+- Optional structure-aware chunking with a content-hash embedding cache
+  (only chunks never seen before reach the API)
 
 Performance Target: 10K files in <60s (10x speedup from baseline)
 
@@ -13,12 +21,33 @@ Version: 8.0.0
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional, Callable
+import random
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
 import time
 from pathlib import Path
-from openai import AsyncOpenAI
-import tiktoken
+from .CodeChunker import CodeChunker, CodeChunk
+from .EmbeddingCache import EmbeddingCache
+from .EmbeddingBackend import EmbeddingBackend
+
+try:
+    from openai import AsyncOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    AsyncOpenAI = None
+    OPENAI_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+# OpenAI embeddings request limits
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_REQUEST = 300_000
+MAX_TOKENS_PER_INPUT = 8191
 
 
 # ============================================================================
@@ -27,11 +56,17 @@ import tiktoken
 
 @dataclass
 class EmbeddingResult:
-    """Single file embedding result."""
+    """Single file (or chunk) embedding result."""
     file_path: str
     embedding: List[float]
     token_count: int
     embedding_time: float  # seconds
+    chunk_id: Optional[str] = None
+    content_hash: Optional[str] = None
+    start_line: Optional[int] = None
+    end_line: Optional[int] = None
+    symbol: Optional[str] = None
+    cached: bool = False
 
 
 @dataclass
@@ -42,6 +77,9 @@ class BatchEmbeddingResult:
     total_tokens: int
     total_time: float  # seconds
     files_per_second: float
+    chunks_total: int = 0
+    chunks_embedded: int = 0  # chunks sent to the API (cache misses)
+    cache_hits: int = 0
 
 
 @dataclass
@@ -54,6 +92,99 @@ class ProgressUpdate:
     current_file: Optional[str] = None
 
 
+# ============================================================================
+# Adaptive Concurrency
+# ============================================================================
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limiter for in-flight embedding requests.
+
+    Additive increase (+1 per `limit` successes), multiplicative decrease
+    (halve) on rate limits, plus a shared cooldown so every task pauses
+    when the provider says so, not just the one that hit the limit.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: Optional[int] = None):
+        self.minimum = max(1, minimum)
+        self.maximum = max(maximum or initial * 4, self.minimum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.rate_limited = 0
+        self._cooldown_until = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            # Learned limit survives across event loops; waiters do not
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        condition = self._get_condition()
+        while True:
+            delay = self._cooldown_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with condition:
+                await condition.wait_for(lambda: self.in_flight < int(self.limit))
+                if self._cooldown_until <= time.monotonic():
+                    self.in_flight += 1
+                    return
+
+    async def release(self, rate_limited: bool = False, retry_after: Optional[float] = None) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if rate_limited:
+                self.rate_limited += 1
+                self.limit = max(self.minimum, self.limit / 2)
+                backoff = retry_after if retry_after is not None else random.uniform(0.5, 1.5)
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + backoff)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            condition.notify_all()
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    return getattr(error, 'status_code', None) == 429 or type(error).__name__ == 'RateLimitError'
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Timeouts, connection errors, 5xx and 429 are worth retrying; other 4xx are not."""
+    if _is_input_error(error):
+        return False
+    status = getattr(error, 'status_code', None)
+    return status is None or status >= 500 or status in (408, 409, 429)
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Bad or unauthorised credentials: every request will fail the same way."""
+    return (getattr(error, 'status_code', None) in (401, 403)
+            or type(error).__name__ in ('AuthenticationError', 'PermissionDeniedError'))
+
+
+def _is_input_error(error: Exception) -> bool:
+    """Rejected because of what was sent (bad input, payload or token count too large)."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        # Local backends reject bad input with ValueError/TypeError
+        return isinstance(error, (ValueError, TypeError))
+    return status in (400, 413, 422)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
 # ============================================================================
 # ParallelEmbedder Class
 # ============================================================================
@@ -63,38 +194,74 @@ class ParallelEmbedder:
     Parallel batch embedder for high-performance vectorization.
 
     Optimizations:
-    - Batch size 64 (OpenAI rate limit optimized)
-    - 10 parallel tasks (network I/O concurrent)
+    - Token-packed batches (at most 64 inputs each)
+    - Adaptive parallelism starting at 10 tasks (network I/O concurrent)
+    - Split-and-retry for failed batches
     - Token estimation for accurate cost tracking
     - Progress streaming for UI updates
     """
 
     def __init__(
         self,
-        api_key: str,
+        api_key: Optional[str],
         batch_size: int = 64,
         parallel_tasks: int = 10,
-        model: str = "text-embedding-3-small"
+        model: str = "text-embedding-3-small",
+        chunker: Optional[CodeChunker] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        max_batch_tokens: Optional[int] = None,
+        max_parallel_tasks: Optional[int] = None,
+        max_retries: int = 5,
+        backend: Optional[EmbeddingBackend] = None
     ):
         """
         Initialize parallel embedder.
 
         Args:
-            api_key: OpenAI API key
-            batch_size: Files per batch (default 64, OpenAI optimized)
-            parallel_tasks: Concurrent batches (default 10)
-            model: OpenAI embedding model
+            api_key: OpenAI API key (unused with a backend)
+            batch_size: Max inputs per batch (default 64)
+            parallel_tasks: Initial concurrent batches (default 10)
+            model: OpenAI embedding model (a backend names its own)
+            chunker: Optional chunker (embed chunks instead of whole files)
+            embedding_cache: Optional content-hash embedding cache
+            max_batch_tokens: Token budget per request (default: provider limit)
+            max_parallel_tasks: Concurrency ceiling (default 4x parallel_tasks)
+            max_retries: Retries per request before giving up on an input
+            backend: Optional embedding backend replacing the OpenAI client
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.backend = backend
+        if backend is not None:
+            self.client = None
+            self.model = backend.model
+            self.max_inputs_per_request = backend.max_inputs_per_request
+            self.max_tokens_per_input = backend.max_tokens_per_input
+            self.cost_per_1m_tokens = backend.cost_per_1m_tokens
+            provider_batch_tokens = backend.max_tokens_per_request
+        else:
+            if not OPENAI_AVAILABLE:
+                raise ImportError("openai package is required unless an embedding backend is given")
+            self.client = AsyncOpenAI(api_key=api_key)
+            self.model = model
+            self.max_inputs_per_request = MAX_INPUTS_PER_REQUEST
+            self.max_tokens_per_input = MAX_TOKENS_PER_INPUT
+            self.cost_per_1m_tokens = 0.02  # text-embedding-3-small
+            provider_batch_tokens = MAX_TOKENS_PER_REQUEST
+
         self.batch_size = batch_size
         self.parallel_tasks = parallel_tasks
-        self.model = model
+        self.chunker = chunker
+        self.embedding_cache = embedding_cache
+        self.max_batch_tokens = max_batch_tokens or provider_batch_tokens
+        self.max_retries = max_retries
+        self.limiter = AdaptiveConcurrencyLimiter(parallel_tasks, maximum=max_parallel_tasks)
 
         # Token counting
-        try:
-            self.encoding = tiktoken.get_encoding("cl100k_base")
-        except:
-            self.encoding = None
+        self.encoding = None
+        if TIKTOKEN_AVAILABLE:
+            try:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                self.encoding = None
 
         # Progress callback
         self.progress_callback: Optional[Callable[[ProgressUpdate], None]] = None
@@ -113,6 +280,9 @@ class ParallelEmbedder:
             BatchEmbeddingResult with all embeddings
         """
         start_time = time.time()
+        if self.chunker is not None:
+            return await self._embed_chunked(file_contents, start_time)
+
         files = list(file_contents.items())
         total_files = len(files)
         batches = self._create_batches(files)
@@ -137,9 +307,90 @@ class ParallelEmbedder:
             files_per_second=files_per_second
         )
 
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed raw texts (e.g. search queries) without chunking or caching.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            One embedding per text, in order (empty on failure)
+        """
+        batches = self._create_batches([(str(i), text) for i, text in enumerate(texts)])
+        results = await asyncio.gather(*(self._process_batch(batch) for batch in batches))
+        return [result.embedding for batch_results in results for result in batch_results]
+
+    async def _embed_chunked(
+        self,
+        file_contents: Dict[str, str],
+        start_time: float
+    ) -> BatchEmbeddingResult:
+        """
+        Chunk files, reuse cached embeddings by content hash and embed the rest.
+
+        Identical chunks (within or across files) are embedded once.
+        """
+        chunks: List[CodeChunk] = [
+            chunk
+            for file_path, content in file_contents.items()
+            for chunk in self.chunker.chunk_file(file_path, content)
+        ]
+
+        cached = {}
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get_many(self.model, (chunk.content_hash for chunk in chunks))
+
+        pending: Dict[str, str] = {}
+        for chunk in chunks:
+            if chunk.content_hash not in cached:
+                pending.setdefault(chunk.content_hash, chunk.content)
+
+        # Batches are keyed by content hash rather than file path
+        embedded = await self._process_batches_parallel(
+            self._create_batches(list(pending.items())),
+            len(pending),
+            start_time
+        )
+        fresh = {result.file_path: result for result in embedded}
+        if self.embedding_cache is not None:
+            self.embedding_cache.put_many(
+                self.model,
+                [(digest, result.embedding, result.token_count) for digest, result in fresh.items()]
+            )
+
+        results = []
+        for chunk in chunks:
+            hit = cached.get(chunk.content_hash)
+            result = fresh.get(chunk.content_hash)
+            results.append(EmbeddingResult(
+                file_path=chunk.file_path,
+                embedding=hit[0] if hit else (result.embedding if result else []),
+                token_count=chunk.token_count,
+                embedding_time=0.0 if hit or not result else result.embedding_time,
+                chunk_id=chunk.chunk_id,
+                content_hash=chunk.content_hash,
+                start_line=chunk.start_line,
+                end_line=chunk.end_line,
+                symbol=chunk.symbol,
+                cached=hit is not None
+            ))
+
+        total_time = time.time() - start_time
+        return BatchEmbeddingResult(
+            results=results,
+            total_files=len(file_contents),
+            total_tokens=sum(result.token_count for result in fresh.values()),  # tokens actually billed
+            total_time=total_time,
+            files_per_second=len(file_contents) / total_time if total_time > 0 else 0,
+            chunks_total=len(chunks),
+            chunks_embedded=len(pending),
+            cache_hits=sum(1 for result in results if result.cached)
+        )
+
     async def _process_batches_parallel(
         self,
-        batches: List[List[tuple[str, str]]],
+        batches: List[List[Tuple[str, str, int]]],
         total_files: int,
         start_time: float
     ) -> List[EmbeddingResult]:
@@ -156,26 +407,27 @@ class ParallelEmbedder:
         """
         all_results: List[EmbeddingResult] = []
         processed = 0
-        semaphore = asyncio.Semaphore(self.parallel_tasks)
-
-        async def process_batch_with_limit(batch):
-            async with semaphore:
-                return await self._process_batch(batch)
 
-        tasks = [process_batch_with_limit(batch) for batch in batches]
+        # Concurrency is bounded by self.limiter inside _process_batch
+        tasks = [asyncio.ensure_future(self._process_batch(batch)) for batch in batches]
 
-        for task in asyncio.as_completed(tasks):
-            batch_results = await task
-            all_results.extend(batch_results)
-            processed += len(batch_results)
-
-            # Report progress
-            self._report_progress(
-                processed,
-                total_files,
-                start_time,
-                batch_results
-            )
+        try:
+            for task in asyncio.as_completed(tasks):
+                batch_results = await task
+                all_results.extend(batch_results)
+                processed += len(batch_results)
+
+                # Report progress
+                self._report_progress(
+                    processed,
+                    total_files,
+                    start_time,
+                    batch_results
+                )
+        finally:
+            # Auth failures raise; don't leave the other batches hammering the API
+            for task in tasks:
+                task.cancel()
 
         return all_results
 
@@ -206,75 +458,141 @@ class ParallelEmbedder:
     def _create_batches(
         self,
         files: List[tuple[str, str]]
-    ) -> List[List[tuple[str, str]]]:
+    ) -> List[List[Tuple[str, str, int]]]:
         """
-        Split files into batches of configured size.
+        Pack files into batches by token count.
+
+        A batch closes when adding the next input would exceed the request
+        token budget or the input count limit. Inputs over the per-input
+        limit are truncated so they cannot fail the request.
 
         Args:
             files: List of (file_path, content) tuples
 
         Returns:
-            List of batches
+            List of batches of (file_path, content, token_count)
         """
-        batches = []
-        for i in range(0, len(files), self.batch_size):
-            batch = files[i:i + self.batch_size]
+        max_inputs = min(self.batch_size, self.max_inputs_per_request)
+        batches: List[List[Tuple[str, str, int]]] = []
+        batch: List[Tuple[str, str, int]] = []
+        batch_tokens = 0
+
+        for file_path, content in files:
+            content, tokens = self._truncate(content)
+            if batch and (len(batch) >= max_inputs or batch_tokens + tokens > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append((file_path, content, tokens))
+            batch_tokens += tokens
+
+        if batch:
             batches.append(batch)
         return batches
 
+    def _truncate(self, text: str) -> Tuple[str, int]:
+        """Cut text to the per-input token limit; returns (text, token_count)."""
+        limit = self.max_tokens_per_input
+        tokens = self._count_tokens(text)
+        if tokens <= limit:
+            return text, tokens
+        if self.encoding:
+            try:
+                return self.encoding.decode(self.encoding.encode(text)[:limit]), limit
+            except Exception:
+                pass
+        return text[:limit * 4], limit
+
     async def _process_batch(
         self,
-        batch: List[tuple[str, str]]
+        batch: List[Tuple[str, str, int]],
+        attempt: int = 0
     ) -> List[EmbeddingResult]:
         """
-        Process single batch with OpenAI API.
+        Embed one batch under the concurrency limiter.
+
+        Failures are handled by kind:
+        - input rejected (400/413/422): split the batch in half so one bad
+          input cannot sink its neighbours
+        - transient (429, 5xx, timeouts, connection errors): retry the whole
+          batch with backoff (429 via the shared cooldown)
+        - auth (401/403): raise immediately; no request can succeed
+        Inputs that still fail (rejected on their own, retries exhausted, or
+        any other 4xx) come back with empty embeddings.
 
         Args:
-            batch: List of (file_path, content) tuples
+            batch: List of (file_path, content, token_count) tuples
+            attempt: Retry attempt for this exact batch
 
         Returns:
-            List of EmbeddingResult
+            List of EmbeddingResult in batch order
         """
-        batch_start = time.time()
+        await self.limiter.acquire()
+        try:
+            results = await self._embed_request(batch)
+        except Exception as e:
+            rate_limited = _is_rate_limit(e)
+            await self.limiter.release(rate_limited=rate_limited, retry_after=_retry_after(e))
+            error = e
+        else:
+            await self.limiter.release()
+            return results
 
-        # Prepare texts for embedding
-        texts = [content for _, content in batch]
-        file_paths = [path for path, _ in batch]
+        if _is_auth_error(error):
+            raise error
 
-        try:
-            # Call OpenAI embedding API (batch)
-            response = await self.client.embeddings.create(
-                model=self.model,
-                input=texts
+        if _is_input_error(error) and len(batch) > 1:
+            middle = len(batch) // 2
+            halves = await asyncio.gather(
+                self._process_batch(batch[:middle]),
+                self._process_batch(batch[middle:])
             )
+            return halves[0] + halves[1]
 
-            # Extract embeddings
-            results = []
-            for i, embedding_data in enumerate(response.data):
-                # Count tokens
-                token_count = self._count_tokens(texts[i])
+        if attempt < self.max_retries and _is_retryable(error):
+            if not rate_limited:  # 429 already waits out the limiter cooldown
+                await asyncio.sleep(min(30.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.0))
+            return await self._process_batch(batch, attempt + 1)
 
-                results.append(EmbeddingResult(
-                    file_path=file_paths[i],
-                    embedding=embedding_data.embedding,
-                    token_count=token_count,
-                    embedding_time=time.time() - batch_start
-                ))
+        label = batch[0][0] if len(batch) == 1 else f"{len(batch)} inputs ({batch[0][0]}, ...)"
+        print(f"❌ Embedding failed for {label}: {error}")
+        return [
+            EmbeddingResult(file_path=file_path, embedding=[], token_count=0, embedding_time=0)
+            for file_path, _, _ in batch
+        ]
 
-            return results
+    async def _embed_request(
+        self,
+        batch: List[Tuple[str, str, int]]
+    ) -> List[EmbeddingResult]:
+        """
+        Single embeddings request to the backend or OpenAI (raises on failure).
 
-        except Exception as e:
-            print(f"❌ Batch embedding failed: {e}")
-            # Return empty embeddings on failure
-            return [
-                EmbeddingResult(
-                    file_path=path,
-                    embedding=[],
-                    token_count=0,
-                    embedding_time=0
-                )
-                for path in file_paths
-            ]
+        Args:
+            batch: List of (file_path, content, token_count) tuples
+
+        Returns:
+            List of EmbeddingResult
+        """
+        batch_start = time.time()
+        texts = [content for _, content, _ in batch]
+        if self.backend is not None:
+            vectors = await self.backend.embed(texts)
+        else:
+            response = await self.client.embeddings.create(model=self.model, input=texts)
+            data = sorted(response.data, key=lambda item: getattr(item, 'index', 0))
+            vectors = [item.embedding for item in data]
+        if len(vectors) != len(batch):
+            raise ValueError(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+
+        return [
+            EmbeddingResult(
+                file_path=file_path,
+                embedding=embedding,
+                token_count=token_count,
+                embedding_time=time.time() - batch_start
+            )
+            for (file_path, _, token_count), embedding in zip(batch, vectors)
+        ]
 
     def _count_tokens(self, text: str) -> int:
         """
@@ -326,10 +644,7 @@ class ParallelEmbedder:
             for content in file_contents.values()
         )
 
-        # OpenAI pricing (text-embedding-3-small)
-        cost_per_1m_tokens = 0.02  # $0.02 per 1M tokens
-
-        estimated_cost = (total_tokens / 1_000_000) * cost_per_1m_tokens
+        estimated_cost = (total_tokens / 1_000_000) * self.cost_per_1m_tokens
 
         return {
             'total_files': len(file_contents),
@@ -337,28 +652,40 @@ class ParallelEmbedder:
             'estimated_cost_usd': round(estimated_cost, 4),
             'model': self.model,
             'batch_size': self.batch_size,
-            'parallel_tasks': self.parallel_tasks
+            'parallel_tasks': self.parallel_tasks,
+            'concurrency_limit': int(self.limiter.limit)
         }
 
 
 def create_parallel_embedder(
-    api_key: str,
+    api_key: Optional[str],
     batch_size: int = 64,
-    parallel_tasks: int = 10
+    parallel_tasks: int = 10,
+    chunk_tokens: Optional[int] = 512,
+    cache_path: Optional[str] = ".claude/.artifacts/vectorization/embedding_cache.db",
+    backend: Optional[EmbeddingBackend] = None
 ) -> ParallelEmbedder:
     """
     Factory function to create ParallelEmbedder.
 
     Args:
-        api_key: OpenAI API key
+        api_key: OpenAI API key (unused with a backend)
         batch_size: Files per batch (default 64)
         parallel_tasks: Concurrent batches (default 10)
+        chunk_tokens: Token budget per chunk (None embeds whole files)
+        cache_path: Embedding cache database (None disables the cache)
+        backend: Optional embedding backend (e.g. HashedNgramEmbeddingBackend)
 
     Returns:
         ParallelEmbedder instance
     """
-    return ParallelEmbedder(
+    embedder = ParallelEmbedder(
         api_key=api_key,
         batch_size=batch_size,
-        parallel_tasks=parallel_tasks
+        parallel_tasks=parallel_tasks,
+        embedding_cache=EmbeddingCache(cache_path) if cache_path else None,
+        backend=backend
     )
+    if chunk_tokens:
+        embedder.chunker = CodeChunker(max_tokens=chunk_tokens, count_tokens=embedder._count_tokens)
+    return embedder
@@ -0,0 +1,246 @@
+"""
+SemanticSearch - Code search over the local vector index for agent context
+
+Read side of the vectorization pipeline:
+- search(project_id, text, k, filters) -> ranked chunks with line ranges
+- file / language / path-prefix filters become LocalVectorStore metadata
+  filters, evaluated as cached boolean row masks before scoring
+- Query-result LRU keyed by (index version, query hash); any write to
+  the index bumps the version, so stale results are never served
+- Query-embedding LRU so repeated questions skip the embedder entirely
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .LocalVectorStore import LocalVectorStore
+from .ParallelEmbedder import ParallelEmbedder
+
+
+# ============================================================================
+# Types
+# ============================================================================
+
+@dataclass
+class SearchResult:
+    """One ranked chunk."""
+    file_path: str
+    score: float
+    start_line: Optional[int] = None
+    end_line: Optional[int] = None
+    symbol: Optional[str] = None
+    chunk_id: Optional[str] = None
+    language: Optional[str] = None
+    content: Optional[str] = None
+
+
+@dataclass
+class SearchResponse:
+    """Search results plus cache/latency details."""
+    query: str
+    results: List[SearchResult]
+    index_version: int
+    cached: bool
+    duration_ms: float
+    filters: Dict[str, Any] = field(default_factory=dict)
+
+
+# ============================================================================
+# SemanticSearchService Class
+# ============================================================================
+
+class SemanticSearchService:
+    """
+    Query service over a LocalVectorStore filled by IncrementalIndexer.
+
+    Filters (all optional, AND-ed; lists are OR-ed):
+    - file: exact relative path(s)
+    - language: language tag(s), e.g. "python"
+    - path_prefix: relative path prefix(es), e.g. "src/services/"
+    """
+
+    def __init__(
+        self,
+        vector_store: LocalVectorStore,
+        embedder: ParallelEmbedder,
+        cache_size: int = 512
+    ):
+        """
+        Initialize search service.
+
+        Args:
+            vector_store: Local index written by IncrementalIndexer
+            embedder: Embedder using the same model/backend as the index
+            cache_size: Max cached query results (and query embeddings)
+        """
+        self.vector_store = vector_store
+        self.embedder = embedder
+        self.cache_size = cache_size
+        self._results: "OrderedDict[Tuple[int, str], List[SearchResult]]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def search(
+        self,
+        project_id: str,
+        text: str,
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        project_path: Optional[str] = None
+    ) -> SearchResponse:
+        """
+        Find the chunks most relevant to a natural-language or code query.
+
+        Args:
+            project_id: Project identifier used at indexing time
+            text: Query text
+            k: Number of chunks to return
+            filters: Optional {'file', 'language', 'path_prefix'} filters
+            project_path: When given, attach each chunk's source lines
+
+        Returns:
+            SearchResponse with ranked SearchResults
+        """
+        start_time = time.perf_counter()
+        filters = filters or {}
+        version = self.vector_store.version
+        key = (version, self._query_hash(project_id, text, k, filters))
+
+        results = self._results.get(key)
+        cached = results is not None
+        if cached:
+            self._results.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            vector = await self._embed_query(text)
+            matches = self.vector_store.query(
+                vector, top_k=k, filter=self._store_filter(project_id, filters)
+            )['matches'] if vector else []
+            results = [self._to_result(match) for match in matches]
+            self._remember(self._results, key, results)
+
+        if project_path:
+            results = [self._with_content(result, project_path) for result in results]
+
+        return SearchResponse(
+            query=text,
+            results=results,
+            index_version=version,
+            cached=cached,
+            duration_ms=(time.perf_counter() - start_time) * 1000,
+            filters=filters
+        )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'cached_results': len(self._results),
+            'cached_embeddings': len(self._embeddings),
+            'index_version': self.vector_store.version
+        }
+
+    def clear_cache(self) -> None:
+        self._results.clear()
+        self._embeddings.clear()
+
+    # ------------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------------
+
+    async def _embed_query(self, text: str) -> List[float]:
+        vector = self._embeddings.get(text)
+        if vector is None:
+            vector = (await self.embedder.embed_texts([text]))[0]
+            if vector:
+                self._remember(self._embeddings, text, vector)
+        else:
+            self._embeddings.move_to_end(text)
+        return vector
+
+    def _remember(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _query_hash(project_id: str, text: str, k: int, filters: Dict[str, Any]) -> str:
+        payload = json.dumps([project_id, text, k, filters], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _store_filter(project_id: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+        def as_list(value: Any) -> List[Any]:
+            return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+        store_filter: Dict[str, Any] = {'project_id': {'$eq': project_id}}
+        file_conditions: Dict[str, Any] = {}
+        if filters.get('file'):
+            file_conditions['$in'] = as_list(filters['file'])
+        if filters.get('path_prefix'):
+            file_conditions['$prefix'] = as_list(filters['path_prefix'])
+        if file_conditions:
+            store_filter['file_path'] = file_conditions
+        if filters.get('language'):
+            store_filter['language'] = {'$in': as_list(filters['language'])}
+
+        unknown = set(filters) - {'file', 'language', 'path_prefix'}
+        if unknown:
+            raise ValueError(f"Unsupported search filters: {sorted(unknown)}")
+        return store_filter
+
+    @staticmethod
+    def _to_result(match: Dict[str, Any]) -> SearchResult:
+        metadata = match.get('metadata') or {}
+        return SearchResult(
+            file_path=metadata.get('file_path', match['id']),
+            score=match['score'],
+            start_line=metadata.get('start_line'),
+            end_line=metadata.get('end_line'),
+            symbol=metadata.get('symbol') or None,
+            chunk_id=metadata.get('chunk_id'),
+            language=metadata.get('language')
+        )
+
+    @staticmethod
+    def _with_content(result: SearchResult, project_path: str) -> SearchResult:
+        try:
+            with open(Path(project_path) / result.file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return result
+        start = (result.start_line or 1) - 1
+        end = result.end_line or len(lines)
+        return SearchResult(**{**result.__dict__, 'content': '\n'.join(lines[start:end])})
+
+
+def create_semantic_search_service(
+    vector_store: LocalVectorStore,
+    embedder: ParallelEmbedder,
+    cache_size: int = 512
+) -> SemanticSearchService:
+    """
+    Factory function to create SemanticSearchService.
+
+    Args:
+        vector_store: Local index written by IncrementalIndexer
+        embedder: Embedder matching the index model
+        cache_size: Max cached query results
+
+    Returns:
+        SemanticSearchService instance
+    """
+    return SemanticSearchService(vector_store, embedder, cache_size)
@@ -11,7 +11,8 @@ from .IncrementalIndexer import (
     IncrementalIndexer,
     create_incremental_indexer,
     VectorizationResult,
-    ChangedFiles
+    ChangedFiles,
+    ReadStats
 )
 
 from .ParallelEmbedder import (
@@ -22,6 +23,37 @@ from .ParallelEmbedder import (
     ProgressUpdate
 )
 
+from .LocalVectorStore import (
+    LocalVectorStore,
+    LocalVectorStoreConfig,
+    create_local_vector_store
+)
+
+from .CodeChunker import (
+    CodeChunker,
+    CodeChunk,
+    create_code_chunker
+)
+
+from .EmbeddingCache import (
+    EmbeddingCache,
+    create_embedding_cache
+)
+
+from .EmbeddingBackend import (
+    EmbeddingBackend,
+    HashedNgramEmbeddingBackend,
+    benchmark_embedding_backend,
+    create_local_embedding_backend
+)
+
+from .SemanticSearch import (
+    SemanticSearchService,
+    SearchResult,
+    SearchResponse,
+    create_semantic_search_service
+)
+
 from .GitFingerprintManager import (
     GitFingerprintManager,
     create_git_fingerprint_manager,
@@ -33,11 +65,28 @@ __all__ = [
     'create_incremental_indexer',
     'VectorizationResult',
     'ChangedFiles',
+    'ReadStats',
     'ParallelEmbedder',
     'create_parallel_embedder',
     'EmbeddingResult',
     'BatchEmbeddingResult',
     'ProgressUpdate',
+    'LocalVectorStore',
+    'LocalVectorStoreConfig',
+    'create_local_vector_store',
+    'CodeChunker',
+    'CodeChunk',
+    'create_code_chunker',
+    'EmbeddingCache',
+    'create_embedding_cache',
+    'EmbeddingBackend',
+    'HashedNgramEmbeddingBackend',
+    'benchmark_embedding_backend',
+    'create_local_embedding_backend',
+    'SemanticSearchService',
+    'SearchResult',
+    'SearchResponse',
+    'create_semantic_search_service',
     'GitFingerprintManager',
     'create_git_fingerprint_manager',
     'FingerprintResult',
@@ -138,6 +138,33 @@ async def test_vectorization_10k_files_performance():
     assert files_per_second > 150, f"Throughput {files_per_second} too low"
 
 
+def test_local_embedding_backend_throughput():
+    """
+    Measure offline embedding throughput (chunks/sec) for sizing index jobs.
+
+    Target: >2000 chunks/s for ~500-token code chunks on one CPU
+    """
+    from src.services.vectorization.EmbeddingBackend import (
+        HashedNgramEmbeddingBackend,
+        benchmark_embedding_backend
+    )
+
+    chunk = "\n".join(
+        f"def handler_{i}(request, userId):\n    result = fetchUserProfile(userId, cache=True)\n    return result"
+        for i in range(20)
+    )
+    chunks = [f"# chunk {n}\n{chunk}" for n in range(5000)]
+
+    stats = benchmark_embedding_backend(HashedNgramEmbeddingBackend(dimension=384), chunks)
+
+    print(f"\n=== Local Embedding Throughput ===")
+    print(f"Chunks: {stats['chunks']} (batch size {stats['batch_size']})")
+    print(f"Duration: {stats['seconds']:.2f}s")
+    print(f"Throughput: {stats['chunks_per_second']:.0f} chunks/s")
+
+    assert stats['chunks_per_second'] > 2000, f"Throughput {stats['chunks_per_second']} too low"
+
+
 # ============================================================================
 # Test: Sandbox Performance (Day 3)
 # ============================================================================
@@ -0,0 +1,195 @@
+"""
+Test suite for CodeChunker and EmbeddingCache - Chunked, cached embedding
+
+Tests:
+- Python chunks follow function/class boundaries within the token budget
+- Oversized classes split per method, JavaScript split at top-level braces
+- Content hashes ignore whitespace-only edits
+- ParallelEmbedder only embeds chunks missing from the cache
+- IncrementalIndexer removes vectors of chunks that disappeared
+- Old chunk vectors stay until their replacements are indexed
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.services.vectorization.CodeChunker import CodeChunker, content_hash
+from src.services.vectorization.EmbeddingCache import EmbeddingCache
+from src.services.vectorization.IncrementalIndexer import IncrementalIndexer
+from src.services.vectorization.LocalVectorStore import LocalVectorStore
+from src.services.vectorization.ParallelEmbedder import ParallelEmbedder
+
+
+PYTHON_SOURCE = '''import os
+
+CONSTANT = 1
+
+
+def alpha(x):
+    return x + 1
+
+
+class Service:
+    """Service docstring."""
+
+    def start(self):
+        return "start" * 40
+
+    def stop(self):
+        return "stop" * 40
+
+
+def omega():
+    return os.getcwd()
+'''
+
+JS_SOURCE = '''const api = require("./api");
+
+function load(id) {
+  const s = "{ not a brace";
+  return api.get(id);
+}
+
+export class Store {
+  save(item) { return api.post(item); }
+}
+'''
+
+
+# ============================================================================
+# Fake API client
+# ============================================================================
+
+class _FakeEmbeddings:
+    def __init__(self):
+        self.inputs = []
+
+    async def create(self, model, input):
+        self.inputs.extend(input)
+        return SimpleNamespace(data=[
+            SimpleNamespace(embedding=[float(len(text)), 1.0, float(text.count('\n'))]) for text in input
+        ])
+
+
+def _embedder(tmp_path, max_tokens=512):
+    embedder = ParallelEmbedder(
+        api_key="test",
+        batch_size=4,
+        parallel_tasks=2,
+        chunker=CodeChunker(max_tokens=max_tokens, min_tokens=0),
+        embedding_cache=EmbeddingCache(str(tmp_path / "cache.db"))
+    )
+    embedder.client = SimpleNamespace(embeddings=_FakeEmbeddings())
+    return embedder
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_python_and_js_boundaries():
+    """Definitions become chunks; tiny module code merges; oversized classes split per method."""
+    chunks = CodeChunker(max_tokens=512, min_tokens=0).chunk_file("svc.py", PYTHON_SOURCE)
+    assert [(c.kind, c.symbol) for c in chunks] == [
+        ('module', None), ('function', 'alpha'), ('class', 'Service'), ('function', 'omega')
+    ]
+    assert chunks[1].content.startswith("def alpha") and chunks[1].start_line == 6
+
+    merged = CodeChunker(max_tokens=512, min_tokens=8).chunk_file("svc.py", PYTHON_SOURCE)
+    assert (merged[0].kind, merged[0].symbol, merged[0].start_line) == ('function', 'alpha', 1)
+
+    small = CodeChunker(max_tokens=25, min_tokens=8).chunk_file("svc.py", PYTHON_SOURCE)
+    assert ('method', 'Service.start') in [(c.kind, c.symbol) for c in small]
+    assert all(c.token_count <= 25 for c in small)
+
+    js = CodeChunker(min_tokens=4).chunk_file("store.js", JS_SOURCE)
+    assert [c.symbol for c in js] == ['api', 'load', 'Store']
+
+    assert content_hash("def f():\n    return 1\n") == content_hash("    def f():   \n        return 1")
+
+
+def test_embed_only_new_chunks(tmp_path):
+    """Second run re-embeds only the edited function."""
+    embedder = _embedder(tmp_path)
+    first = asyncio.run(embedder.embed_files({"svc.py": PYTHON_SOURCE, "copy.py": PYTHON_SOURCE}))
+    assert first.chunks_total == 8
+    assert first.chunks_embedded == 4  # identical files share chunks
+    assert all(result.embedding for result in first.results)
+
+    api = embedder.client.embeddings
+    api.inputs.clear()
+    edited = PYTHON_SOURCE.replace("return x + 1", "return x + 2")
+    second = asyncio.run(embedder.embed_files({"svc.py": edited}))
+    assert second.cache_hits == 3
+    assert second.chunks_embedded == 1
+    assert api.inputs == ["def alpha(x):\n    return x + 2"]
+    assert second.total_tokens == second.results[1].token_count
+
+
+def test_indexer_removes_stale_chunks(tmp_path):
+    """Edited chunks replace their old vectors; deleted files drop every chunk."""
+    embedder = _embedder(tmp_path)
+    store = LocalVectorStore(str(tmp_path / "index"))
+    indexer = IncrementalIndexer(fingerprint_manager=None, embedder=embedder, vector_store=store)
+
+    async def index(files):
+        result = await embedder.embed_files(files)
+        await indexer._upsert_vectors("proj", result)
+        await indexer._remove_stale_chunks("proj", result)
+        return result
+
+    first = asyncio.run(index({"svc.py": PYTHON_SOURCE}))
+    assert len(store) == 4
+    second = asyncio.run(index({"svc.py": PYTHON_SOURCE.replace("return x + 1", "return x + 2")}))
+    assert len(store) == 4
+    ids = {f"proj::svc.py#{r.chunk_id}" for r in second.results}
+    assert f"proj::svc.py#{first.results[1].chunk_id}" not in ids
+    match = store.query(second.results[1].embedding, top_k=1)['matches'][0]
+    assert match['metadata']['symbol'] == 'alpha'
+
+    assert asyncio.run(indexer._delete_vectors("proj", ["svc.py"])) == 4
+    assert len(store) == 0
+
+
+def test_stale_chunks_kept_until_replacements_indexed(tmp_path):
+    """A failed chunk keeps the file's old vectors and never enters the manifest."""
+    embedder = _embedder(tmp_path)
+    store = LocalVectorStore(str(tmp_path / "index"))
+    indexer = IncrementalIndexer(fingerprint_manager=None, embedder=embedder, vector_store=store)
+
+    async def index(files, fail_symbol=None, fail_upsert=False):
+        result = await embedder.embed_files(files)
+        for r in result.results:
+            if fail_symbol and r.symbol == fail_symbol:
+                r.embedding = []
+        if fail_upsert:
+            def broken_upsert(vectors):
+                raise OSError("disk full")
+            store.upsert = broken_upsert
+        await indexer._upsert_vectors("proj", result)
+        if fail_upsert:
+            del store.upsert
+        await indexer._remove_stale_chunks("proj", result)
+        return result
+
+    first = asyncio.run(index({"svc.py": PYTHON_SOURCE}))
+    old_ids = {f"proj::svc.py#{r.chunk_id}" for r in first.results}
+
+    edited = PYTHON_SOURCE.replace("return x + 1", "return x + 2")
+    second = asyncio.run(index({"svc.py": edited}, fail_upsert=True))
+    assert set(store._id_to_row) == old_ids
+    assert set(embedder.embedding_cache.get_chunk_ids("proj", ["svc.py"])["svc.py"]) == old_ids
+
+    third = asyncio.run(index({"svc.py": edited}, fail_symbol="alpha"))
+    failed_id = next(f"proj::svc.py#{r.chunk_id}" for r in third.results if r.symbol == "alpha")
+    manifest = set(embedder.embedding_cache.get_chunk_ids("proj", ["svc.py"])["svc.py"])
+    assert failed_id not in manifest
+    assert manifest == set(store._id_to_row) and old_ids <= manifest
+
+    asyncio.run(index({"svc.py": edited}))
+    new_ids = {f"proj::svc.py#{r.chunk_id}" for r in second.results}
+    assert set(store._id_to_row) == new_ids
+    assert set(embedder.embedding_cache.get_chunk_ids("proj", ["svc.py"])["svc.py"]) == new_ids
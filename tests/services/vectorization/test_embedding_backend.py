@@ -0,0 +1,91 @@
+"""
+Test suite for EmbeddingBackend - Offline hashed n-gram embeddings
+
+Tests:
+- Deterministic, normalized vectors independent of batch composition
+- Similar code ranks closer than unrelated code; IDF changes the model name
+- IncrementalIndexer runs end to end offline (local backend + local store)
+- Backends must implement embed()
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.services.vectorization.EmbeddingBackend import EmbeddingBackend, HashedNgramEmbeddingBackend
+from src.services.vectorization.EmbeddingCache import EmbeddingCache
+from src.services.vectorization.GitFingerprintManager import GitFingerprintManager
+from src.services.vectorization.IncrementalIndexer import IncrementalIndexer
+from src.services.vectorization.LocalVectorStore import LocalVectorStore
+from src.services.vectorization.ParallelEmbedder import ParallelEmbedder
+from src.services.vectorization.CodeChunker import CodeChunker
+
+
+USER_CODE = "def get_user_name(user_id):\n    return database.fetch_user(user_id).name\n"
+USER_CODE_EDITED = "def getUserName(userId):\n    return database.fetchUser(userId).name  # camelCase\n"
+OTHER_CODE = "class HttpRetryPolicy:\n    backoff_seconds = 2\n    max_attempts = 5\n"
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_vectors_deterministic_and_similar():
+    """Same text -> same vector in any batch; related code scores higher."""
+    backend = HashedNgramEmbeddingBackend(dimension=256)
+
+    batch = backend.embed_batch([USER_CODE, USER_CODE_EDITED, OTHER_CODE])
+    alone = backend.embed_batch([USER_CODE])
+
+    assert batch.shape == (3, 256) and batch.dtype == np.float32
+    assert np.array_equal(batch[0], alone[0])
+    assert np.allclose(np.linalg.norm(batch, axis=1), 1.0)
+    assert batch[0] @ batch[1] > 0.5 > batch[0] @ batch[2]
+    assert not backend.embed_batch([""]).any()
+
+    model = backend.model
+    backend.fit([USER_CODE, USER_CODE_EDITED, OTHER_CODE])
+    assert backend.model.startswith(model + "-idf-")
+    assert asyncio.run(backend.embed([OTHER_CODE]))[0] == backend.embed_batch([OTHER_CODE])[0].tolist()
+
+
+def test_offline_pipeline(tmp_path):
+    """Fingerprint, chunk, embed, upsert and query with no network services."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "users.py").write_text(USER_CODE)
+    (project / "retry.py").write_text(OTHER_CODE)
+
+    backend = HashedNgramEmbeddingBackend(dimension=128)
+    embedder = ParallelEmbedder(
+        api_key=None,
+        backend=backend,
+        chunker=CodeChunker(max_tokens=256),
+        embedding_cache=EmbeddingCache(str(tmp_path / "cache.db"))
+    )
+    store = LocalVectorStore(str(tmp_path / "index"))
+    fingerprints = GitFingerprintManager(state_dir=str(tmp_path / "merkle"))
+    indexer = IncrementalIndexer(fingerprints, embedder, vector_store=store)
+
+    result = asyncio.run(indexer.vectorize_project("demo", str(project)))
+
+    assert result.vectors_upserted == 2
+    assert result.cost_estimate_usd == 0.0
+    query = backend.embed_batch([USER_CODE_EDITED])[0]
+    assert store.query(query, top_k=1)['matches'][0]['metadata']['file_path'] == "users.py"
+    assert embedder.embedding_cache.get_statistics()['entries'] == 2
+
+
+def test_backend_interface_is_abstract():
+    """A backend without embed() cannot be instantiated."""
+    class Incomplete(EmbeddingBackend):
+        model = "incomplete"
+
+    with pytest.raises(TypeError):
+        EmbeddingBackend()
+    with pytest.raises(TypeError):
+        Incomplete()
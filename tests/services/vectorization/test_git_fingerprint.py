@@ -0,0 +1,107 @@
+"""
+Test suite for GitFingerprintManager - Git and directory fingerprints
+
+Tests:
+- HEAD/ref/commit metadata read from .git matches the git CLI
+  (loose refs, packed refs and objects, detached HEAD)
+- Directory Merkle state persists; unchanged trees read no files
+- Edits and deletes rehash only the changed path
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+
+from src.services.vectorization.GitFingerprintManager import GitFingerprintManager
+
+
+def _git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def _cli_metadata(cwd):
+    return (
+        _git(cwd, 'rev-parse', 'HEAD'),
+        _git(cwd, 'rev-parse', '--abbrev-ref', 'HEAD'),
+        _git(cwd, 'log', '-1', '--pretty=%B'),
+        int(_git(cwd, 'log', '-1', '--pretty=%ct'))
+    )
+
+
+def _fingerprint(manager, path):
+    result = asyncio.run(manager.get_current_fingerprint(str(path)))
+    return result, (result.fingerprint, result.branch_name, result.commit_message, result.commit_timestamp)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="git not installed")
+def test_git_metadata_matches_cli(tmp_path):
+    """Direct .git reads agree with git for loose, packed and detached states."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, 'init', '-q')
+    _git(repo, 'checkout', '-q', '-b', 'feature/search')
+    (repo / "a.py").write_text("print('a')\n")
+    _git(repo, 'add', 'a.py')
+    _git(repo, '-c', 'user.name=dev', '-c', 'user.email=dev@example.com', 'commit', '-q', '-m', 'Add a\n\nDetails')
+
+    manager = GitFingerprintManager(state_dir=str(tmp_path / "state"))
+    result, metadata = _fingerprint(manager, repo)
+    assert result.is_git_repo
+    assert metadata == _cli_metadata(repo)
+
+    _git(repo, 'gc', '-q')  # packs refs and objects
+    assert _fingerprint(GitFingerprintManager(state_dir=str(tmp_path / "state")), repo)[1] == _cli_metadata(repo)
+
+    _git(repo, 'checkout', '-q', '--detach')
+    assert _fingerprint(manager, repo)[1] == _cli_metadata(repo)
+
+
+def test_directory_merkle_incremental(tmp_path):
+    """Persisted tree: no reads when unchanged, only changed paths rehashed."""
+    project = tmp_path / "project"
+    for package in ("core", "api", "docs/guides"):
+        (project / package).mkdir(parents=True)
+        for i in range(5):
+            (project / package / f"m{i}.py").write_text(f"value = {i}\n")
+    (project / "__pycache__").mkdir()
+    (project / "__pycache__" / "m0.pyc").write_bytes(b"\0")
+    past = time.time() - 60
+    for root, _, files in os.walk(project):
+        for name in files:
+            os.utime(os.path.join(root, name), (past, past))
+
+    state_dir = str(tmp_path / "state")
+    first, _ = _fingerprint(GitFingerprintManager(state_dir=state_dir), project)
+    assert not first.is_git_repo
+
+    manager = GitFingerprintManager(state_dir=state_dir)  # fresh process: state from disk
+    again, _ = _fingerprint(manager, project)
+    assert again.fingerprint == first.fingerprint
+    assert manager.last_directory_stats['files_hashed'] == 0
+    assert manager.last_directory_stats['dirs_rehashed'] == 0
+
+    (project / "__pycache__" / "m0.pyc").write_bytes(b"ignored")
+    assert _fingerprint(manager, project)[0].fingerprint == first.fingerprint
+
+    (project / "docs" / "guides" / "m3.py").write_text("value = 'edited'\n")
+    os.utime(project / "docs" / "guides" / "m3.py", (past, past + 1))
+    edited, _ = _fingerprint(manager, project)
+    assert edited.fingerprint != first.fingerprint
+    assert manager.last_directory_stats['files_hashed'] == 1
+    assert manager.last_directory_stats['dirs_rehashed'] == 3  # guides, docs, root
+
+    (project / "api" / "m1.py").unlink()
+    removed, _ = _fingerprint(manager, project)
+    assert removed.fingerprint not in (first.fingerprint, edited.fingerprint)
+    assert manager.last_directory_stats['dirs_rehashed'] == 2
@@ -0,0 +1,155 @@
+"""
+Test suite for LocalVectorStore - Offline vector index
+
+Tests:
+- Exact top-k matches brute-force cosine search
+- Upsert overwrite, tombstoned deletes and compaction
+- Persistence across reopen
+- Malformed batches rejected with ValueError
+- IVF coarse quantizer search
+- IncrementalIndexer upsert/delete through the local store
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.services.vectorization.LocalVectorStore import (
+    LocalVectorStore,
+    LocalVectorStoreConfig
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def embeddings():
+    """Random embeddings with their normalized copies."""
+    rng = np.random.default_rng(7)
+    matrix = rng.standard_normal((2000, 64)).astype(np.float32)
+    return matrix, matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def store(tmp_path, embeddings):
+    """Store populated with 2000 vectors, searched in small blocks."""
+    matrix, _ = embeddings
+    store = LocalVectorStore(str(tmp_path / "index"), config=LocalVectorStoreConfig(block_rows=256))
+    store.upsert([
+        {'id': f"doc-{i}", 'values': matrix[i], 'metadata': {'n': i}}
+        for i in range(len(matrix))
+    ])
+    return store
+
+
+def _brute_force(normalized, query, alive, top_k=10):
+    scores = normalized @ (query / np.linalg.norm(query))
+    scores[~alive] = -np.inf
+    return [f"doc-{i}" for i in np.argsort(-scores)[:top_k]]
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_exact_search_matches_brute_force(store, embeddings):
+    """Blocked matmul top-k equals exhaustive cosine ranking."""
+    _, normalized = embeddings
+    queries = np.random.default_rng(1).standard_normal((4, 64)).astype(np.float32)
+    alive = np.ones(len(normalized), dtype=bool)
+
+    results = store.query_batch(queries, top_k=10)
+
+    for query, result in zip(queries, results):
+        assert [match['id'] for match in result['matches']] == _brute_force(normalized, query, alive)
+    assert results[0]['matches'][0]['metadata'] == {'n': int(results[0]['matches'][0]['id'].split('-')[1])}
+
+
+def test_delete_compaction_and_reopen(store, embeddings, tmp_path):
+    """Deleted ids disappear, compaction reclaims rows, state survives reopen."""
+    matrix, normalized = embeddings
+    alive = np.ones(len(matrix), dtype=bool)
+
+    store.delete([f"doc-{i}" for i in range(0, 200)])
+    alive[:200] = False
+    assert store.describe_index_stats()['tombstones'] == 200
+
+    store.delete([f"doc-{i}" for i in range(200, 1000)])
+    alive[:1000] = False
+    stats = store.describe_index_stats()
+    assert stats['tombstones'] == 0  # compacted
+    assert stats['total_vector_count'] == 1000
+
+    store.upsert([{'id': "doc-1500", 'values': matrix[3], 'metadata': {'moved': True}}])
+    store.flush()
+
+    reopened = LocalVectorStore(str(tmp_path / "index"))
+    assert len(reopened) == 1000
+    top = reopened.query(matrix[3], top_k=1)['matches'][0]
+    assert top['id'] == "doc-1500" and top['metadata'] == {'moved': True}
+
+    query = matrix[1700]
+    normalized = normalized.copy()
+    normalized[1500] = normalized[3]
+    assert [m['id'] for m in reopened.query(query)['matches']] == _brute_force(normalized, query, alive)
+
+
+def test_rejects_malformed_batches(tmp_path):
+    """Scalar values and wrong dimensions raise ValueError and leave the store empty."""
+    store = LocalVectorStore(str(tmp_path / "index"))
+
+    with pytest.raises(ValueError):
+        store.upsert([{'id': "a", 'values': 0.5}, {'id': "b", 'values': 0.25}])
+    assert len(store) == 0 and store.dimension is None
+
+    store.upsert([{'id': "a", 'values': [1.0, 0.0, 0.0]}])
+    with pytest.raises(ValueError):
+        store.upsert([{'id': "b", 'values': [1.0, 0.0]}])
+    assert len(store) == 1
+
+
+def test_ivf_search(tmp_path):
+    """IVF probes nearby lists and still finds clustered neighbours."""
+    rng = np.random.default_rng(3)
+    centers = rng.standard_normal((20, 32)).astype(np.float32)
+    matrix = centers[rng.integers(0, 20, 3000)] + 0.05 * rng.standard_normal((3000, 32)).astype(np.float32)
+
+    store = LocalVectorStore(str(tmp_path / "ivf"), config=LocalVectorStoreConfig(
+        ivf_lists=16, ivf_probe=4, ivf_train_min_rows=1000
+    ))
+    store.upsert([{'id': f"v{i}", 'values': matrix[i]} for i in range(len(matrix))])
+
+    approximate = store.query(matrix[42], top_k=5)
+    exact = store.query(matrix[42], top_k=5, exact=True)
+    assert store.ivf_trained
+    assert approximate['matches'][0]['id'] == "v42"
+    assert {m['id'] for m in approximate['matches']} == {m['id'] for m in exact['matches']}
+
+
+def test_indexer_uses_local_store(tmp_path):
+    """IncrementalIndexer upserts and deletes through the local store."""
+    from src.services.vectorization.IncrementalIndexer import IncrementalIndexer
+    from src.services.vectorization.ParallelEmbedder import BatchEmbeddingResult, EmbeddingResult
+
+    store = LocalVectorStore(str(tmp_path / "index"))
+    indexer = IncrementalIndexer(fingerprint_manager=None, embedder=None, vector_store=store)
+    batch = BatchEmbeddingResult(
+        results=[
+            EmbeddingResult("a.py", [1.0, 0.0, 0.0], 10, 0.0),
+            EmbeddingResult("b.py", [0.0, 1.0, 0.0], 12, 0.0),
+            EmbeddingResult("broken.py", [], 0, 0.0),
+        ],
+        total_files=3, total_tokens=22, total_time=0.0, files_per_second=0.0
+    )
+
+    assert asyncio.run(indexer._upsert_vectors("proj", batch)) == 2
+    assert store.query([0.9, 0.1, 0.0], top_k=1)['matches'][0]['metadata']['file_path'] == "a.py"
+
+    assert asyncio.run(indexer._delete_vectors("proj", ["a.py"])) == 1
+    assert [m['id'] for m in store.query([1.0, 0.0, 0.0])['matches']] == ["proj::b.py"]
@@ -0,0 +1,155 @@
+"""
+Test suite for ParallelEmbedder - Batch planning and adaptive concurrency
+
+Tests:
+- Batches packed by token budget and input count, oversized inputs truncated
+- Failed batches split until the bad input is isolated
+- Rate limits shrink the concurrency limit and are retried without loss
+- Outages retry whole batches (no splitting); auth errors fail fast
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.vectorization.ParallelEmbedder import (
+    MAX_TOKENS_PER_INPUT,
+    ParallelEmbedder
+)
+
+
+# ============================================================================
+# Fake API client
+# ============================================================================
+
+class _APIError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={'retry-after': '0.01'})
+
+
+class _FakeEmbeddings:
+    """Rejects inputs containing POISON and answers 429 above `capacity` in flight.
+
+    `failures` is a list of status codes returned (in order) before requests succeed.
+    """
+
+    def __init__(self, capacity=100, failures=()):
+        self.capacity = capacity
+        self.failures = list(failures)
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = []
+
+    async def create(self, model, input):
+        self.requests.append(list(input))
+        if self.failures:
+            raise _APIError(self.failures.pop(0))
+        if any("POISON" in text for text in input):
+            raise _APIError(400)
+        if self.in_flight >= self.capacity:
+            raise _APIError(429)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)
+        ])
+
+
+def _embedder(capacity=100, failures=(), **kwargs):
+    embedder = ParallelEmbedder(api_key="test", **kwargs)
+    embedder.client = SimpleNamespace(embeddings=_FakeEmbeddings(capacity, failures))
+    return embedder
+
+
+async def _no_sleep(delay, result=None):
+    return result
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_batches_packed_by_tokens():
+    """Token budget and input count both close a batch."""
+    embedder = _embedder(batch_size=4, max_batch_tokens=1000)
+    files = [(f"f{i}.py", "x" * 1600) for i in range(5)]  # 400 tokens each
+    files.append(("huge.py", "y" * (MAX_TOKENS_PER_INPUT * 8)))
+    files.extend((f"s{i}.py", "z" * 40) for i in range(6))
+
+    batches = embedder._create_batches(files)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1, 1, 4, 2]
+    assert all(sum(tokens for _, _, tokens in batch) <= 1000 or len(batch) == 1 for batch in batches)
+    assert batches[3][0][0] == "huge.py" and batches[3][0][2] == MAX_TOKENS_PER_INPUT
+
+
+def test_failed_batch_split_isolates_bad_input():
+    """Only the rejected input loses its embedding."""
+    embedder = _embedder(batch_size=16)
+    files = {f"f{i}.py": f"content {i}" for i in range(16)}
+    files["f5.py"] = "POISON"
+
+    result = asyncio.run(embedder.embed_files(files))
+
+    empty = [r.file_path for r in result.results if not r.embedding]
+    assert empty == ["f5.py"]
+    assert len(result.results) == 16
+    assert all(r.embedding == [float(len(files[r.file_path]))] for r in result.results if r.embedding)
+
+
+def test_rate_limits_back_off_without_losing_batches():
+    """429s halve the limit; every batch eventually succeeds."""
+    embedder = _embedder(capacity=3, batch_size=2, parallel_tasks=8)
+    files = {f"f{i}.py": f"content {i}" for i in range(80)}
+
+    result = asyncio.run(embedder.embed_files(files))
+
+    assert all(r.embedding for r in result.results)
+    assert len(result.results) == 80
+    assert embedder.limiter.rate_limited > 0
+    assert embedder.limiter.limit < 8
+    assert embedder.client.embeddings.peak <= 3
+
+
+def test_outage_retries_whole_batch_without_splitting(monkeypatch):
+    """5xx and connection errors back off and resend the same batch."""
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+    embedder = _embedder(failures=[503, 502], batch_size=16)
+    files = {f"f{i}.py": f"content {i}" for i in range(16)}
+
+    result = asyncio.run(embedder.embed_files(files))
+
+    assert all(r.embedding for r in result.results)
+    assert [len(request) for request in embedder.client.embeddings.requests] == [16, 16, 16]
+
+
+def test_outage_exhausting_retries_fails_batch_once(monkeypatch):
+    """A persistent outage costs max_retries + 1 requests, not a split cascade."""
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+    embedder = _embedder(failures=[500] * 10, batch_size=8, max_retries=2)
+    files = {f"f{i}.py": f"content {i}" for i in range(8)}
+
+    result = asyncio.run(embedder.embed_files(files))
+
+    assert len(result.results) == 8 and not any(r.embedding for r in result.results)
+    assert len(embedder.client.embeddings.requests) == 3
+
+
+def test_auth_error_fails_fast():
+    """401 raises immediately instead of splitting or retrying."""
+    embedder = _embedder(failures=[401] * 10, batch_size=4)
+    files = {f"f{i}.py": f"content {i}" for i in range(4)}
+
+    with pytest.raises(_APIError):
+        asyncio.run(embedder.embed_files(files))
+    assert len(embedder.client.embeddings.requests) == 1
@@ -0,0 +1,130 @@
+"""
+Test suite for SemanticSearch - Code search over the local index
+
+Tests:
+- Metadata filters ($eq, $in, $prefix) match a brute-force scan
+- search() ranks chunks with line ranges and honours project/file/language/prefix filters
+- Result LRU hits until the index version changes
+- ResearcherAgent turns search results into findings
+
+Week 4 Day 2
+Version: 8.0.0
+"""
+
+import asyncio
+
+import numpy as np
+
+from src.services.vectorization.CodeChunker import CodeChunker
+from src.services.vectorization.EmbeddingBackend import HashedNgramEmbeddingBackend
+from src.services.vectorization.IncrementalIndexer import IncrementalIndexer
+from src.services.vectorization.LocalVectorStore import LocalVectorStore, LocalVectorStoreConfig
+from src.services.vectorization.ParallelEmbedder import ParallelEmbedder
+from src.services.vectorization.SemanticSearch import SemanticSearchService
+
+
+FILES = {
+    "src/auth/login.py": "def verify_password(user, password):\n    return hash_password(password) == user.password_hash\n",
+    "src/auth/tokens.ts": "export function issueToken(userId) {\n  return jwt.sign({ userId }, SECRET);\n}\n",
+    "src/billing/invoice.py": "def compute_invoice_total(items):\n    return sum(item.price * item.quantity for item in items)\n",
+    "docs/auth.md": "# Authentication\nUsers verify their password before a token is issued.\n",
+}
+
+
+def _index(tmp_path):
+    embedder = ParallelEmbedder(
+        api_key=None,
+        backend=HashedNgramEmbeddingBackend(dimension=128),
+        chunker=CodeChunker(max_tokens=256)
+    )
+    store = LocalVectorStore(str(tmp_path / "index"))
+    indexer = IncrementalIndexer(fingerprint_manager=None, embedder=embedder, vector_store=store)
+
+    async def build():
+        for project_id in ("app", "other"):
+            await indexer._upsert_vectors(project_id, await embedder.embed_files(FILES))
+
+    asyncio.run(build())
+    return store, SemanticSearchService(store, embedder, cache_size=8)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_store_filters_match_brute_force(tmp_path):
+    """Bitmap filters select exactly the rows a metadata scan would."""
+    rng = np.random.default_rng(5)
+    vectors = rng.standard_normal((3000, 16)).astype(np.float32)
+    store = LocalVectorStore(str(tmp_path / "filtered"), config=LocalVectorStoreConfig(block_rows=500))
+    metadata = [{'file_path': f"pkg{i % 7}/mod{i % 40}.py", 'language': ['python', 'go'][i % 2]} for i in range(3000)]
+    store.upsert([{'id': str(i), 'values': vectors[i], 'metadata': metadata[i]} for i in range(3000)])
+    store.delete([str(i) for i in range(0, 3000, 10)])
+
+    query = rng.standard_normal(16).astype(np.float32)
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    for flt, keep in [
+        ({'language': 'go'}, lambda m: m['language'] == 'go'),
+        ({'file_path': {'$prefix': ['pkg1/', 'pkg3/']}, 'language': {'$in': ['python']}},
+         lambda m: m['file_path'][:5] in ('pkg1/', 'pkg3/') and m['language'] == 'python'),
+        ({'file_path': {'$in': ['pkg2/mod9.py']}}, lambda m: m['file_path'] == 'pkg2/mod9.py'),
+    ]:
+        allowed = [i for i in range(3000) if i % 10 and keep(metadata[i])]
+        expected = sorted(allowed, key=lambda i: -(normalized[i] @ query))[:5]
+        assert [int(m['id']) for m in store.query(query, top_k=5, filter=flt)['matches']] == expected
+
+
+def test_search_filters_and_line_ranges(tmp_path):
+    """Relevant chunk first, scoped to the project and filters."""
+    store, service = _index(tmp_path)
+
+    response = asyncio.run(service.search("app", "verify user password", k=3))
+    top = response.results[0]
+    assert (top.file_path, top.start_line, top.end_line, top.symbol) == ("src/auth/login.py", 1, 2, "verify_password")
+    assert len(response.results) == 3
+
+    python_only = asyncio.run(service.search("app", "verify user password", k=10, filters={'language': 'python'}))
+    assert {r.file_path for r in python_only.results} == {"src/auth/login.py", "src/billing/invoice.py"}
+
+    scoped = asyncio.run(service.search("app", "token", k=10, filters={'path_prefix': "src/auth/", 'language': ['typescript']}))
+    assert [r.file_path for r in scoped.results] == ["src/auth/tokens.ts"]
+
+    project = tmp_path / "project"
+    (project / "src" / "auth").mkdir(parents=True)
+    (project / "src" / "auth" / "login.py").write_text(FILES["src/auth/login.py"])
+    with_content = asyncio.run(service.search("app", "password", k=1, filters={'file': "src/auth/login.py"},
+                                              project_path=str(project)))
+    assert with_content.results[0].content.startswith("def verify_password")
+
+
+def test_result_cache_invalidated_by_index_writes(tmp_path):
+    """Same query hits the LRU until the store version changes."""
+    store, service = _index(tmp_path)
+
+    first = asyncio.run(service.search("app", "invoice total", k=2))
+    second = asyncio.run(service.search("app", "invoice total", k=2))
+    assert not first.cached and second.cached
+    assert second.results == first.results
+
+    store.delete([f"app::src/billing/invoice.py#{first.results[0].chunk_id}"])
+    third = asyncio.run(service.search("app", "invoice total", k=2))
+    assert not third.cached and third.index_version > first.index_version
+    assert all(r.file_path != "src/billing/invoice.py" for r in third.results)
+    assert service.get_statistics()['hits'] == 1
+
+
+def test_researcher_agent_uses_code_search(tmp_path):
+    """Research findings include indexed code chunks with locations."""
+    from src.agents.AgentBase import Task
+    from src.agents.core.ResearcherAgent import ResearcherAgent
+
+    _, service = _index(tmp_path)
+    agent = ResearcherAgent(code_search=service)
+    task = Task(id="t1", type="research-topic", description="auth",
+                payload={"topic": "password verification", "project_id": "app", "max_code_results": 2},
+                priority=5)
+
+    findings = asyncio.run(agent._search_code(task, "password verification"))
+
+    assert findings[0].source == "src/auth/login.py:1-2"
+    assert len(findings) == 2
@@ -0,0 +1,83 @@
+"""
+Unit Tests - OfflineAdvisoryStore
+
+Tests for advisory_store.py covering:
+- OSV range semantics (introduced/fixed/last_affected, explicit versions)
+- PEP 440 ordering for PyPI pre/post/dev releases
+- Incremental refresh with updated and withdrawn advisories
+"""
+
+import json
+
+import pytest
+
+from analyzer.enterprise.supply_chain.advisory_store import OfflineAdvisoryStore, version_key
+
+
+def _advisory(advisory_id, ecosystem, name, events, modified="2024-01-01T00:00:00Z", **extra):
+    advisory = {
+        "id": advisory_id,
+        "modified": modified,
+        "affected": [{
+            "package": {"ecosystem": ecosystem, "name": name},
+            "ranges": [{"type": "ECOSYSTEM", "events": events}],
+        }],
+    }
+    advisory.update(extra)
+    return advisory
+
+
+@pytest.fixture
+def store(tmp_path):
+    dump = tmp_path / "dump"
+    dump.mkdir()
+    (dump / "npm.json").write_text(json.dumps([
+        _advisory("NPM-1", "npm", "left-pad", [{"introduced": "0"}, {"fixed": "1.3.0"}]),
+        _advisory("NPM-2", "npm", "left-pad", [{"introduced": "1.2.0"}, {"last_affected": "1.4.0"}]),
+    ]))
+    (dump / "pypi.json").write_text(json.dumps(
+        _advisory("PY-1", "PyPI", "Django_Utils", [{"introduced": "2.0"}, {"fixed": "2.10.1"}])
+    ))
+    store = OfflineAdvisoryStore(tmp_path / "osv.db")
+    store.import_dump(dump)
+    yield store
+    store.close()
+
+
+def test_range_semantics(store):
+    """Fixed bounds are exclusive, last_affected bounds inclusive."""
+    assert store.affected_advisory_ids("npm", "left-pad", "1.0.0") == ["NPM-1"]
+    assert store.affected_advisory_ids("npm", "left-pad", "1.2.5") == ["NPM-1", "NPM-2"]
+    assert store.affected_advisory_ids("npm", "left-pad", "1.3.0") == ["NPM-2"]
+    assert store.affected_advisory_ids("npm", "left-pad", "1.4.0") == ["NPM-2"]
+    assert store.affected_advisory_ids("npm", "left-pad", "1.4.1") == []
+    assert store.affected_advisory_ids("npm", "unknown-pkg", "1.0.0") == []
+
+
+def test_pep440_ordering(store):
+    """PyPI names are normalized and pre/dev releases sort before the final release."""
+    assert version_key("PyPI", "2.10.1rc1") < version_key("PyPI", "2.10.1") < version_key("PyPI", "2.10.1.post1")
+    assert store.affected_advisory_ids("PyPI", "django-utils", "2.10.1rc1") == ["PY-1"]
+    assert store.affected_advisory_ids("PyPI", "django-utils", "2.10.1") == []
+    assert store.query("PyPI", "django.utils", "2.9")[0]["id"] == "PY-1"
+
+
+def test_refresh_applies_updates_and_withdrawals(store, tmp_path):
+    """Refresh skips unchanged files and applies newer revisions only."""
+    unchanged = store.refresh(tmp_path / "dump")
+    assert unchanged["files_skipped"] == 2
+    assert unchanged["advisories_imported"] == 0
+
+    delta = tmp_path / "delta"
+    delta.mkdir()
+    (delta / "delta.json").write_text(json.dumps([
+        _advisory("NPM-1", "npm", "left-pad", [{"introduced": "0"}, {"fixed": "1.1.0"}],
+                  modified="2025-01-01T00:00:00Z"),
+        _advisory("NPM-2", "npm", "left-pad", [], modified="2025-01-01T00:00:00Z",
+                  withdrawn="2025-01-01T00:00:00Z"),
+    ]))
+    stats = store.refresh(tmp_path / "dump", delta)
+
+    assert stats["advisories_withdrawn"] == 1
+    assert store.affected_advisory_ids("npm", "left-pad", "1.0.0") == ["NPM-1"]
+    assert store.affected_advisory_ids("npm", "left-pad", "1.2.5") == []
@@ -0,0 +1,130 @@
+"""
+Unit Tests - AnalysisEngine quality scores
+
+Tests for core/engine.py and core/cli.py covering:
+- Streamed (NDJSON) summaries are scored from the running severity counts
+- The quality gate fails a streamed run with violations and passes a clean one
+- Violation lists and streamed counts score identically
+- The default engine streams real detector findings as NDJSON lines
+"""
+
+import json
+
+import pytest
+
+from analyzer.core import cli
+from analyzer.core.engine import AnalysisEngine
+
+
+class _SeverityDetector:
+    """Reports one violation per '# <severity>' marker in a file."""
+
+    def analyze(self, file_path):
+        with open(file_path) as f:
+            return [
+                {"type": "marker", "severity": line.split("# ", 1)[1].strip(), "file_path": file_path}
+                for line in f if line.startswith("# ")
+            ]
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    def load(engine):
+        engine.detectors = [_SeverityDetector()]
+    monkeypatch.setattr(AnalysisEngine, "_load_detectors", load)
+
+
+def _project(tmp_path, markers):
+    for i, severity in enumerate(markers):
+        (tmp_path / f"module_{i}.py").write_text(f"# {severity}\nx = 1\n" if severity else "x = 1\n")
+    return str(tmp_path)
+
+
+def _run_ndjson(tmp_path, project):
+    output = tmp_path / "out.ndjson"
+    code = cli.main([project, "--format", "ndjson", "--fail-on-critical", "--output", str(output)])
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    return code, lines[-1]
+
+
+def _ndjson_lines(tmp_path, project):
+    output = tmp_path / "out.ndjson"
+    code = cli.main([project, "--format", "ndjson", "--output", str(output)])
+    return code, [json.loads(line) for line in output.read_text().splitlines()]
+
+
+@pytest.mark.usefixtures("detector")
+class TestStreamedQualityGate:
+    """Test quality scores computed from streamed counts."""
+
+    def test_violations_fail_the_gate(self, tmp_path):
+        """A streamed run with a critical violation fails --fail-on-critical."""
+        (tmp_path / "src").mkdir()
+        code, summary = _run_ndjson(tmp_path, _project(tmp_path / "src", ["critical", "", ""]))
+
+        assert summary["type"] == "summary"
+        assert summary["summary"]["critical_violations"] == 1
+        assert summary["quality_scores"]["nasa_compliance"] <= 0.70
+        assert code == 1
+
+    def test_clean_run_passes_the_gate(self, tmp_path):
+        """No violations scores full compliance and passes."""
+        (tmp_path / "src").mkdir()
+        code, summary = _run_ndjson(tmp_path, _project(tmp_path / "src", ["", ""]))
+
+        assert summary["quality_scores"]["nasa_compliance"] == 1.0
+        assert code == 0
+
+    def test_streamed_and_batch_scores_agree(self):
+        """summarize_counts scores the same as the violation-list path."""
+        engine = AnalysisEngine()
+        violations = [{"severity": s} for s in ("high", "medium", "low", "medium")]
+
+        batch = engine._calculate_quality_scores(violations, files_analyzed=5)
+        streamed = engine.summarize_counts("src", 5, {"high": 1, "medium": 2, "low": 1})["quality_scores"]
+
+        assert streamed == batch
+        assert batch["nasa_compliance"] == pytest.approx(1.0 - 5.5 / 5 / 10)
+
+
+class TestDetectorBackedStream:
+    """Test NDJSON output from the default, detector-backed engine."""
+
+    def test_ndjson_lines_carry_findings(self, tmp_path):
+        """main() writes one line per file with its findings, then a summary."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("def f(x):\n    return x * 86400\n")
+        (tmp_path / "src" / "b.py").write_text("y = 1\n")
+
+        code, lines = _ndjson_lines(tmp_path, str(tmp_path / "src"))
+
+        files, summary = lines[:-1], lines[-1]
+        assert code == 0
+        assert [line["type"] for line in files] == ["file", "file"]
+        assert [line["file_path"].rsplit("/", 1)[-1] for line in files] == ["a.py", "b.py"]
+        found = files[0]["violations"]
+        assert found and all(v["file_path"].endswith("a.py") for v in found)
+        assert any("86400" in json.dumps(v) for v in found)
+        assert all(line["violation_count"] == len(line["violations"]) for line in files)
+        assert summary["type"] == "summary"
+        assert summary["summary"]["total_violations"] == sum(len(line["violations"]) for line in files)
+
+    def test_run_analysis_counts_files_in_one_walk(self, tmp_path, monkeypatch):
+        """run_analysis discovers files once and records how many it analyzed."""
+        (tmp_path / "a.py").write_text("x = 3600\n")
+        (tmp_path / "broken.py").write_text("def (:\n")
+        engine = AnalysisEngine()
+        walks = []
+        discover = engine._discover_files
+
+        def counting_discover(path):
+            walks.append(path)
+            return discover(path)
+
+        monkeypatch.setattr(engine, "_discover_files", counting_discover)
+        results = engine.run_analysis(str(tmp_path))
+
+        assert len(walks) == 1
+        assert results["files_analyzed"] == 2
+        assert results["violations"]
+        assert results["summary"]["total_violations"] == len(results["violations"])
@@ -0,0 +1,145 @@
+"""
+Unit Tests - SegmentedAuditLog
+
+Tests for audit_log.py covering:
+- Hash chaining and sealed Merkle blocks
+- Per-record inclusion proofs against signed roots
+- Size-based segment rotation
+- Resume after reopen and torn-tail recovery
+- Tamper detection, including unreadable lines and forged seal signatures
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from analyzer.enterprise.compliance.audit_log import SegmentedAuditLog, verify_proof
+
+
+def _hmac_signer(key):
+    return lambda root: hmac.new(key, root.encode(), hashlib.sha256).hexdigest()
+
+
+class TestSegmentedAuditLog:
+    """Test the segmented append-only audit log."""
+
+    def test_proofs_against_signed_roots(self, tmp_path):
+        """Sealed records carry a Merkle proof to a signed block root."""
+        log = SegmentedAuditLog(tmp_path, records_per_root=4, signer=lambda root: f"sig:{root}")
+        for i in range(10):
+            log.append({"event_type": "detection", "index": i})
+
+        proof = log.get_proof(6)
+        assert proof["event"] == {"event_type": "detection", "index": 5}
+        assert proof["seal"]["signature"] == f"sig:{proof['seal']['merkle_root']}"
+        assert verify_proof(proof)
+        assert log.get_proof(10) is None  # pending block is not sealed yet
+
+        report = log.verify()
+        assert report["valid"]
+        assert report["records_verified"] == 10
+        assert report["seals_verified"] == 2
+        assert report["unsealed_records"] == 2
+        log.close()
+
+    def test_rotation_and_resume(self, tmp_path):
+        """Segments rotate by size and the chain continues after reopening."""
+        log = SegmentedAuditLog(tmp_path, max_segment_bytes=4096, records_per_root=8)
+        for i in range(200):
+            log.append({"payload": "x" * 40, "index": i})
+        log.close()
+        assert len(log.segments()) > 1
+
+        reopened = SegmentedAuditLog(tmp_path, max_segment_bytes=4096, records_per_root=8)
+        assert reopened.last_sequence == 200
+        assert reopened.append({"index": 200}) == 201
+        assert verify_proof(reopened.get_proof(150))
+        assert reopened.verify()["valid"]
+        reopened.close()
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        """A partially written final line is dropped on resume."""
+        log = SegmentedAuditLog(tmp_path)
+        log.append({"index": 0}, durable=True)
+        log.close()
+        with open(log.segments()[-1], "ab") as f:
+            f.write(b'{"event":{"ind')
+
+        reopened = SegmentedAuditLog(tmp_path)
+        assert reopened.last_sequence == 1
+        assert reopened.verify()["valid"]
+        reopened.close()
+
+    def test_tampering_is_detected(self, tmp_path):
+        """Editing a stored record breaks verification."""
+        log = SegmentedAuditLog(tmp_path, records_per_root=2)
+        for i in range(4):
+            log.append({"user": "alice", "index": i})
+        proof = log.get_proof(1)
+        log.close()
+
+        segment = log.segments()[0]
+        segment.write_text(segment.read_text().replace('"user":"alice"', '"user":"mallory"', 1))
+
+        reopened = SegmentedAuditLog(tmp_path, records_per_root=2)
+        assert not reopened.verify()["valid"]
+        assert not verify_proof(reopened.get_proof(1))
+        assert verify_proof(proof)
+        reopened.close()
+
+    def test_closed_log_rejects_appends(self, tmp_path):
+        """Appending after close raises."""
+        log = SegmentedAuditLog(tmp_path)
+        log.close()
+        with pytest.raises(RuntimeError):
+            log.append({"index": 0})
+
+    def test_corrupt_middle_line_is_reported_not_truncated(self, tmp_path):
+        """Only a torn final line is dropped; earlier corruption stays and fails verify()."""
+        log = SegmentedAuditLog(tmp_path, records_per_root=5)
+        for i in range(25):
+            log.append({"index": i})
+        log.close()
+        segment = log.segments()[0]
+        lines = segment.read_bytes().split(b"\n")
+        lines[3] = b'{"event":{"index":3' + b"#" * 10
+        segment.write_bytes(b"\n".join(lines))
+        size = segment.stat().st_size
+
+        reopened = SegmentedAuditLog(tmp_path, records_per_root=5)
+        assert segment.stat().st_size == size
+        assert reopened.last_sequence == 25
+
+        report = reopened.verify()
+        assert not report["valid"]
+        assert report["records_verified"] == 24
+        assert report["seals_verified"] == 5
+        assert "Unreadable line 4 in segment-000000000001.log" in report["issues"]
+        assert reopened.get_proof(2) is None  # its block has an unreadable record
+        assert verify_proof(reopened.get_proof(7))
+        reopened.close()
+
+    def test_seal_signatures_are_verified(self, tmp_path):
+        """Re-signed roots with the wrong key fail verify() and verify_proof()."""
+        signer = _hmac_signer(b"audit-key")
+        log = SegmentedAuditLog(tmp_path, records_per_root=2, signer=signer)
+        for i in range(4):
+            log.append({"index": i})
+        assert log.verify()["signatures_verified"] == 2
+
+        proof = log.get_proof(3)
+        check = lambda root, signature: hmac.compare_digest(signer(root), signature or "")
+        assert verify_proof(proof, check)
+        log.close()
+
+        segment = log.segments()[0]
+        forged = _hmac_signer(b"attacker")(proof["seal"]["merkle_root"])
+        segment.write_text(segment.read_text().replace(proof["seal"]["signature"], forged))
+
+        reopened = SegmentedAuditLog(tmp_path, records_per_root=2, signature_verifier=check)
+        report = reopened.verify()
+        assert report["issues"] == ["Seal 3-4 signature is invalid"]
+        assert not verify_proof(reopened.get_proof(3), check)
+        assert verify_proof(reopened.get_proof(1), check)
+        reopened.close()
@@ -0,0 +1,146 @@
+"""
+Unit Tests - CryptographicSigner batch signing
+
+Tests for crypto_signer.py covering:
+- One signature over a Merkle root for many artifacts
+- Inclusion proofs embedded in the signature bundle
+- Batch verification and tamper detection
+- Forged bundles (attacker key + embedded certificate) and unproven artifacts rejected
+- Embedded certificates trusted only when they chain to the configured CA
+"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from analyzer.enterprise.supply_chain.crypto_signer import CryptographicSigner
+
+pytestmark = pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl not available")
+
+
+def _self_signed(directory, name):
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+         "-keyout", str(directory / f"{name}-key.pem"), "-out", str(directory / f"{name}-cert.pem"),
+         "-days", "1", "-subj", f"/CN={name}"],
+        capture_output=True, check=True
+    )
+    return str(directory / f"{name}-key.pem"), str(directory / f"{name}-cert.pem")
+
+
+def _ca_issued(directory, name, ca_key, ca_cert):
+    key, csr, cert = (str(directory / f"{name}-{suffix}") for suffix in ("key.pem", "req.csr", "cert.pem"))
+    subprocess.run(["openssl", "req", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", csr,
+                    "-subj", f"/CN={name}"], capture_output=True, check=True)
+    subprocess.run(["openssl", "x509", "-req", "-in", csr, "-CA", ca_cert, "-CAkey", ca_key,
+                    "-CAcreateserial", "-out", cert, "-days", "1"], capture_output=True, check=True)
+    return key, cert
+
+
+def _signer(output_dir, key, cert=None, **config):
+    return CryptographicSigner({
+        "output_dir": str(output_dir),
+        "signing_key_path": key,
+        "signing_cert_path": cert,
+        "batch_signing": True,
+        **config,
+    })
+
+
+@pytest.fixture
+def signer(tmp_path):
+    key, cert = _self_signed(tmp_path, "spek-test")
+    return _signer(tmp_path / "out", key, cert)
+
+
+@pytest.fixture
+def artifacts(tmp_path):
+    paths = []
+    for i in range(25):
+        path = tmp_path / f"artifact-{i}.tar.gz"
+        path.write_bytes(f"release artifact {i}".encode())
+        paths.append({"path": str(path)})
+    return paths
+
+
+def test_batch_signs_once_with_proofs(signer, artifacts):
+    """Every artifact shares one verified signature and has its own proof."""
+    results = signer.sign_artifacts(artifacts)
+
+    assert results["signatures_created"] == 25
+    assert results["verification_successful"] == 25
+    assert len({result["signature_path"] for result in results["artifacts"]}) == 1
+    assert all(result["inclusion_proof"] for result in results["artifacts"])
+
+
+def test_bundle_verifies_and_detects_tampering(signer, artifacts, tmp_path):
+    """The batch verifier checks one signature plus per-artifact proofs."""
+    signer.sign_artifacts(artifacts)
+    bundle_path = signer.create_signature_bundle(artifacts)
+
+    bundle = json.loads(open(bundle_path).read())
+    assert len(bundle["batch_signatures"]) == 1
+    assert all(artifact["signed"] for artifact in bundle["artifacts"])
+
+    report = signer.verify_signature_bundle(bundle_path)
+    assert report["valid"]
+    assert report["artifacts_verified"] == 25
+
+    (tmp_path / "artifact-3.tar.gz").write_bytes(b"tampered")
+    report = signer.verify_signature_bundle(bundle_path)
+    assert not report["valid"]
+    assert report["artifacts_failed"] == [str(tmp_path / "artifact-3.tar.gz")]
+
+
+def test_forged_bundle_with_embedded_certificate_rejected(signer, artifacts, tmp_path):
+    """A bundle re-signed with another key is rejected even though it embeds that key's certificate."""
+    evil = tmp_path / "evil"
+    evil.mkdir()
+    (evil / "artifact-0.tar.gz").write_bytes(b"backdoored release")
+    forged = [{"path": str(evil / "artifact-0.tar.gz")}]
+    attacker = _signer(evil / "out", *_self_signed(evil, "attacker"))
+    attacker.sign_artifacts(forged)
+    forged_bundle = attacker.create_signature_bundle(forged)
+    assert attacker.verify_signature_bundle(forged_bundle)["valid"]
+
+    report = signer.verify_signature_bundle(forged_bundle)
+    assert not report["valid"]
+    assert report["batch_signatures_failed"] == 1
+    assert report["artifacts_failed"] == [str(evil / "artifact-0.tar.gz")]
+
+
+def test_embedded_certificate_must_chain_to_ca(artifacts, tmp_path):
+    """Without a configured certificate, only CA-issued embedded certificates are trusted."""
+    ca_key, ca_cert = _self_signed(tmp_path, "spek-ca")
+    issued = _signer(tmp_path / "issued", *_ca_issued(tmp_path, "release", ca_key, ca_cert))
+    issued.sign_artifacts(artifacts)
+    issued_bundle = issued.create_signature_bundle(artifacts)
+
+    attacker = _signer(tmp_path / "attacker", *_self_signed(tmp_path, "attacker"))
+    attacker.sign_artifacts(artifacts)
+    attacker_bundle = attacker.create_signature_bundle(artifacts)
+
+    verifier = CryptographicSigner({"output_dir": str(tmp_path / "verify"), "ca_cert_path": ca_cert})
+    assert verifier.verify_signature_bundle(issued_bundle)["valid"]
+    assert not verifier.verify_signature_bundle(attacker_bundle)["valid"]
+
+    untrusting = CryptographicSigner({"output_dir": str(tmp_path / "verify-none")})
+    assert not untrusting.verify_signature_bundle(issued_bundle)["valid"]
+
+
+def test_artifacts_without_proof_invalidate_bundle(signer, artifacts, tmp_path):
+    """Artifacts lacking an inclusion proof are reported, not silently skipped."""
+    signer.sign_artifacts(artifacts)
+    bundle_path = signer.create_signature_bundle(artifacts)
+    bundle = json.loads(open(bundle_path).read())
+    del bundle["artifacts"][7]["inclusion_proof"]
+    bundle["artifacts"].append({"path": str(tmp_path / "unsigned.bin"), "name": "unsigned.bin", "signed": False})
+    with open(bundle_path, "w") as f:
+        json.dump(bundle, f)
+
+    report = signer.verify_signature_bundle(bundle_path)
+    assert not report["valid"]
+    assert report["artifacts_verified"] == 24
+    assert report["artifacts_unproven"] == [str(tmp_path / "artifact-7.tar.gz"), str(tmp_path / "unsigned.bin")]
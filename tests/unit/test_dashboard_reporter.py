@@ -0,0 +1,76 @@
+"""
+Unit Tests - DashboardReporter
+
+Tests for dashboard_reporter.py covering:
+- Reports built from the aggregator snapshot are JSON-encodable
+- System health is sampled once per health check interval
+"""
+
+import json
+import time
+
+import pytest
+
+from analyzer.streaming import dashboard_reporter
+from analyzer.streaming.dashboard_reporter import DashboardReporter
+from analyzer.streaming.result_aggregator import StreamAnalysisResult, StreamResultAggregator
+
+
+def _result(file_path, magic=0, position=0):
+    return StreamAnalysisResult(
+        file_path=file_path,
+        timestamp=time.time(),
+        violations={
+            "magic_literal": [{"severity": "low"} for _ in range(magic)],
+            "position": [{"severity": "high"} for _ in range(position)],
+        },
+        metrics={},
+        processing_time_ms=1.5,
+        analysis_type="full",
+    )
+
+
+@pytest.fixture
+def aggregator(monkeypatch):
+    aggregator = StreamResultAggregator()
+    monkeypatch.setattr(dashboard_reporter, "get_global_stream_aggregator", lambda: aggregator)
+    return aggregator
+
+
+class TestDashboardReporter:
+    """Test real-time reports over the incremental aggregator."""
+
+    def test_report_reflects_aggregator(self, aggregator):
+        """Counters, breakdowns and version come from the current snapshot."""
+        reporter = DashboardReporter()
+        for name, magic, position in (("a.py", 2, 1), ("b.py", 1, 0), ("c.py", 0, 3)):
+            aggregator.add_result(_result(name, magic, position))
+        aggregator.remove_result("c.py")
+
+        report = json.loads(json.dumps(reporter.generate_real_time_report()))
+
+        assert report["summary"]["total_violations"] == 4
+        assert report["summary"]["files_analyzed"] == 2
+        assert report["violations"]["breakdown"] == {"magic_literal": 3, "position": 1}
+        assert report["violations"]["severity_breakdown"] == {"low": 3, "high": 1}
+        assert report["metadata"]["aggregate_version"] == aggregator.get_aggregated_result().version
+        json.dumps(aggregator.get_aggregated_result().to_dict())
+
+    def test_system_health_sampled_per_interval(self, aggregator, monkeypatch):
+        """Repeated reports within one health interval reuse the psutil sample."""
+        reporter = DashboardReporter(health_check_interval_seconds=5.0)
+        samples = []
+        sample = reporter._generate_system_health
+
+        def counting_sample():
+            samples.append(1)
+            return sample()
+
+        monkeypatch.setattr(reporter, "_generate_system_health", counting_sample)
+        for _ in range(3):
+            reporter.generate_real_time_report()
+        assert len(samples) == 1
+
+        reporter._health_cache["sampled_at"] -= 5.0
+        reporter.generate_real_time_report()
+        assert len(samples) == 2
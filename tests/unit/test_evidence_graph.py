@@ -0,0 +1,108 @@
+"""
+Unit Tests - EvidenceGraph
+
+Tests for evidence_graph.py covering:
+- One collection pass shared by SOC2, ISO27001 and NIST SSDF
+- Control evaluation from fact selectors and content-hash citations
+- Workflow and authentication terms match whole tokens only
+- Dependency ordering, memoization and collector failures
+- NIST SSDF validation fed from the graph
+"""
+
+import pytest
+
+from analyzer.enterprise.compliance.evidence_graph import (
+    ControlRequirement, EvidenceGraph, FactCollector, content_hash
+)
+from analyzer.enterprise.compliance.nist_ssdf import NISTSSFDFramework
+
+
+@pytest.fixture
+def project(tmp_path):
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "ci.yml").write_text("steps:\n  - run: pytest\n  - uses: github/codeql-action/analyze\n")
+    (tmp_path / ".github" / "pull_request_template.md").write_text("## Checklist")
+    (tmp_path / "SECURITY.md").write_text("Report vulnerabilities privately.")
+    (tmp_path / "requirements.txt").write_text("requests==2.31.0\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_app.py").write_text("def test_ok(): pass\n")
+    return tmp_path
+
+
+def test_frameworks_share_one_collection_pass(project):
+    """Every collector runs once for all three frameworks."""
+    graph = EvidenceGraph(str(project))
+    results = graph.assess(["SOC2", "ISO27001", "NIST-SSDF"])
+
+    assert graph.stats["collectors_run"] == len(graph.collectors)
+    graph.evaluate_framework("SOC2")
+    assert graph.stats["collectors_run"] == len(graph.collectors)
+
+    nist = results["frameworks"]["NIST-SSDF"]["controls"]
+    assert nist["PW.8"]["status"] == "satisfied"
+    assert nist["PS.2"]["status"] == "missing"
+    soc2_scan = results["frameworks"]["SOC2"]["controls"]["CC7.1"]["evidence"]["security_scanning"]
+    nist_scan = nist["RV.1"]["evidence"]["vulnerability_scanning"]
+    assert soc2_scan["content_hash"] == nist_scan["content_hash"]
+    assert soc2_scan["content_hash"] in results["evidence"]
+
+    iso_evidence = graph.control_evidence("ISO27001")
+    assert iso_evidence["A.5.1"]["policy_docs"] == ["SECURITY.md"]
+
+
+def test_custom_collectors_and_controls(tmp_path):
+    """Dependencies run first, values are memoized and failures are recorded."""
+    calls = []
+    graph = EvidenceGraph(str(tmp_path), collectors=[
+        FactCollector("base", lambda g: calls.append("base") or {"items": [1, 2]}),
+        FactCollector("derived", lambda g: calls.append("derived") or len(g.fact("base")["items"]), ("base",)),
+        FactCollector("broken", lambda g: g.fact("base")),  # undeclared dependency
+    ])
+
+    control = ControlRequirement("DEMO", "D.1", "Demo", {"items": "base.items", "count": "derived"})
+    results = graph.evaluate_controls([control])
+    assert results["DEMO"]["controls"]["D.1"]["status"] == "satisfied"
+    assert graph.fact("derived") == 2
+    assert calls == ["base", "derived"]
+    assert graph.collect(["base"])["base"].content_hash == content_hash({"items": [1, 2]})
+
+    fresh = EvidenceGraph(str(tmp_path), collectors=graph.collectors.values())
+    assert fresh.collect(["broken"])["broken"].error
+    with pytest.raises(KeyError):
+        graph.fact("unknown")
+
+
+def test_indicator_terms_match_whole_tokens(tmp_path):
+    """'design', 'latest' and 'tokenizer' are not signing, testing or token evidence."""
+    workflows = tmp_path / ".github" / "workflows"
+    workflows.mkdir(parents=True)
+    (workflows / "docs.yml").write_text("name: design docs\nruns-on: ubuntu-latest\nenv:\n  MODE: prerelease_notes\n")
+    (workflows / "publish.yml").write_text("steps:\n  - run: cosign sign-blob dist.tar\n  - run: npm test\n")
+    (tmp_path / "auth_settings.py").write_text("TOKENIZER = 'bpe'\nHASHLIB_ALGO = None\n")
+    (tmp_path / "auth.env").write_text("API_TOKEN=secret\n")
+
+    graph = EvidenceGraph(str(tmp_path))
+    indicators = graph.fact("ci_workflows")["indicators"]
+    assert indicators["signing"] == [".github/workflows/publish.yml"]
+    assert indicators["testing"] == [".github/workflows/publish.yml"]
+    assert indicators["deployment"] == []
+    assert graph.fact("authentication_config")["methods"] == ["oauth2_jwt"]
+
+    (tmp_path / "auth.env").unlink()
+    graph.invalidate()
+    assert graph.fact("authentication_config")["methods"] == []
+
+
+def test_nist_validator_is_fed_from_the_graph(project):
+    """The NIST SSDF check scores practices from shared facts, collected once."""
+    graph = EvidenceGraph(str(project))
+    graph.evaluate_framework("NIST-SSDF")
+    collected = graph.stats["collectors_run"]
+
+    check = NISTSSFDFramework().run_compliance_check(str(project), evidence_graph=graph)
+
+    summary = check["practice_assessment"]["summary"]
+    assert check["validation_results"]["score"] == round(summary["compliance_percentage"] / 100, 3)
+    assert check["practice_assessment"]["controls"]["PW.8"]["status"] == "satisfied"
+    assert graph.stats["collectors_run"] == collected
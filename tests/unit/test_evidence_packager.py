@@ -0,0 +1,60 @@
+"""
+Unit Tests - EvidencePackager
+
+Tests for evidence_packager.py covering:
+- Single-read multi-algorithm hashing
+- Streaming zip/tar packages without a staging directory
+- Manifest integrity hashes verified on extraction
+"""
+
+import hashlib
+
+import pytest
+
+from analyzer.enterprise.supply_chain.evidence_packager import EvidencePackager, multi_digest
+
+
+def test_multi_digest_matches_hashlib(tmp_path):
+    """One read produces the same digests as hashing each algorithm separately."""
+    data = bytes(range(256)) * 50000
+    artifact = tmp_path / "artifact.bin"
+    artifact.write_bytes(data)
+
+    digests = multi_digest(artifact, ("sha256", "sha512", "md5"))
+    assert digests["sha256"] == hashlib.sha256(data).hexdigest()
+    assert digests["sha512"] == hashlib.sha512(data).hexdigest()
+    assert digests["md5"] == hashlib.md5(data).hexdigest()
+
+
+@pytest.mark.parametrize("package_format", ["zip", "tar", "tar.gz"])
+def test_package_streams_and_verifies(tmp_path, package_format):
+    """Packages carry per-file integrity hashes that verify after extraction."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "Dockerfile").write_text("FROM python:3.12")
+    artifact = project / "dist.whl"
+    artifact.write_bytes(b"wheel" * 1000)
+    (project / "dist.whl.sig").write_text("signature")
+
+    packager = EvidencePackager({
+        "output_dir": str(tmp_path / "out"),
+        "package_format": package_format,
+        "include_build_logs": True,
+    })
+    info = packager.create_evidence_package(str(project), [{"path": str(artifact)}])
+
+    integrity = info["manifest"]["integrity"]["files"]
+    assert integrity["build/Dockerfile"] == hashlib.sha256(b"FROM python:3.12").hexdigest()
+    assert "signatures/dist.whl.sig" in info["files_included"]
+    assert info["manifest"]["artifacts"][0]["checksums"]["sha256"] == hashlib.sha256(b"wheel" * 1000).hexdigest()
+
+    extracted = packager.extract_evidence_package(info["package_path"], str(tmp_path / "extracted"))
+    assert extracted["verification"]["valid"]
+    assert not extracted["verification"]["checks_failed"]
+
+
+def test_unsupported_format_rejected(tmp_path):
+    """Unknown package formats raise before anything is written."""
+    packager = EvidencePackager({"output_dir": str(tmp_path), "package_format": "rar"})
+    with pytest.raises(ValueError):
+        packager.create_evidence_package(str(tmp_path), [])
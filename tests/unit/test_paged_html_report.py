@@ -0,0 +1,99 @@
+"""
+Unit Tests - PagedHTMLReporter
+
+Tests for paged_html.py covering:
+- Page sharding by count and by directory
+- Bounded open pages when directories interleave
+- Summary index contents
+- Compressed and uncompressed data pages
+"""
+
+import gzip
+import json
+
+import pytest
+
+from analyzer.reporting.paged_html import PagedHTMLReporter
+
+
+def _violations(count):
+    severities = ["critical", "high", "medium", "low"]
+    for i in range(count):
+        yield {
+            "file_path": f"pkg{i % 3}/module_{i % 10}.py",
+            "line_number": i,
+            "type": "CoM",
+            "severity": severities[i % 4],
+            "description": f"Magic literal {i}",
+        }
+
+
+class TestPagedHTMLReporter:
+    """Test paged report generation."""
+
+    def test_pages_by_count(self, tmp_path):
+        """Violations are split into fixed-size compressed pages."""
+        index = PagedHTMLReporter(page_size=10).write(_violations(25), tmp_path, {"project": "demo"})
+
+        summary = json.loads((tmp_path / "data" / "summary.json").read_text())
+        assert index.name == "index.html"
+        assert summary["total_violations"] == 25
+        assert [page["count"] for page in summary["pages"]] == [10, 10, 5]
+        assert summary["metadata"]["project"] == "demo"
+
+        rows = json.loads(gzip.decompress((tmp_path / "data" / summary["pages"][0]["file"]).read_bytes()))
+        assert len(rows) == 10
+        assert rows[0][0] == "pkg0/module_0.py"
+
+    def test_pages_by_directory(self, tmp_path):
+        """Directory sharding never mixes directories within a page."""
+        PagedHTMLReporter(page_size=100, shard_by="directory").write(_violations(30), tmp_path)
+
+        summary = json.loads((tmp_path / "data" / "summary.json").read_text())
+        assert sorted(page["directory"] for page in summary["pages"]) == ["pkg0", "pkg1", "pkg2"]
+
+    def test_open_pages_are_bounded(self, tmp_path, monkeypatch):
+        """Interleaved directories spill the least recently used partial page."""
+        from analyzer.reporting import paged_html
+
+        resident = []
+        flush = paged_html._PageWriter.flush
+
+        def tracking_flush(writer, violations, directory):
+            resident.append(len(violations))
+            flush(writer, violations, directory)
+
+        monkeypatch.setattr(paged_html._PageWriter, "flush", tracking_flush)
+        PagedHTMLReporter(page_size=100, shard_by="directory", max_open_pages=2).write(_violations(30), tmp_path)
+
+        summary = json.loads((tmp_path / "data" / "summary.json").read_text())
+        assert summary["total_violations"] == 30
+        assert max(resident) == 1  # round-robin directories never grow past one row
+        assert {page["directory"] for page in summary["pages"]} == {"pkg0", "pkg1", "pkg2"}
+        assert all(len({row[0].split("/")[0] for row in json.loads(
+            gzip.decompress((tmp_path / "data" / page["file"]).read_bytes()))}) == 1 for page in summary["pages"])
+
+    def test_uncompressed_pages(self, tmp_path):
+        """compress=False writes plain JSON pages."""
+        PagedHTMLReporter(page_size=50, compress=False).write(_violations(5), tmp_path)
+
+        summary = json.loads((tmp_path / "data" / "summary.json").read_text())
+        rows = json.loads((tmp_path / "data" / summary["pages"][0]["file"]).read_text())
+        assert summary["compressed"] is False
+        assert len(rows) == 5
+
+    def test_page_severity_index(self, tmp_path):
+        """Each page records its severity counts for client-side filtering."""
+        PagedHTMLReporter(page_size=4).write(_violations(4), tmp_path)
+
+        summary = json.loads((tmp_path / "data" / "summary.json").read_text())
+        assert summary["pages"][0]["severities"] == {"critical": 1, "high": 1, "medium": 1, "low": 1}
+
+    def test_invalid_configuration(self):
+        """Invalid page sizes and shard modes are rejected."""
+        with pytest.raises(ValueError):
+            PagedHTMLReporter(page_size=0)
+        with pytest.raises(ValueError):
+            PagedHTMLReporter(shard_by="file")
+        with pytest.raises(ValueError):
+            PagedHTMLReporter(max_open_pages=0)
@@ -0,0 +1,299 @@
+"""
+Unit Tests - PhaseCorrelationStorage write-behind ingestion
+
+Tests for phase_correlation_storage.py covering:
+- Batched write-behind commits and read-your-writes
+- Compressed payloads stored as BLOBs
+- Flush on shutdown
+- Writer survives failing batches and hooks; bounded read flushes
+- Timestamp validation at submit time
+- Rollup tables and epoch-invalidated query cache
+- Performance trends served from the daily trend rollups
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from analyzer.phase_correlation_storage import PhaseCorrelationStorage, UNIFIED_MODEL_AVAILABLE, WriteBehindWriter
+
+pytestmark = pytest.mark.skipif(not UNIFIED_MODEL_AVAILABLE, reason="unified memory model not importable")
+
+def _correlation(i, metadata=None):
+    from analyzer.unified_memory_model import MemoryCorrelation
+
+    return MemoryCorrelation(
+        source_phase="phase1",
+        target_phase=f"phase{2 + i % 3}",
+        correlation_type="learning",
+        correlation_strength=0.5,
+        metadata=metadata or {"index": i},
+    )
+
+def _performance(phase, improvement, timestamp, status="validated", factors=("cache",)):
+    from analyzer.unified_memory_model import PerformanceCorrelation
+
+    return PerformanceCorrelation(
+        phase=phase,
+        metric_name="latency",
+        baseline_value=100.0,
+        current_value=100.0 + improvement,
+        improvement_percentage=improvement,
+        correlation_factors=list(factors),
+        measurement_timestamp=timestamp,
+        validation_status=status,
+    )
+
+@pytest.fixture
+def storage(tmp_path):
+    store = PhaseCorrelationStorage(str(tmp_path / "phase.db"), backup_enabled=False, write_batch_size=100)
+    yield store
+    store.shutdown()
+
+class TestWriteBehindStorage:
+    """Test write-behind ingestion."""
+
+    def test_batches_and_reads_own_writes(self, storage):
+        """Queued rows are committed in batches and visible to reads."""
+        for i in range(1000):
+            assert storage.store_correlation(_correlation(i))
+
+        correlations = storage.get_correlations_by_phase("phase1", use_cache=False)
+        stats = storage.get_storage_statistics()["write_behind"]
+
+        assert len(correlations) == 1000
+        assert stats["records_written"] == 1000
+        assert stats["pending"] == 0
+        assert stats["batches_written"] < 1000
+
+    def test_large_metadata_stored_as_blob(self, storage):
+        """Metadata over the threshold is gzip-compressed into a BLOB."""
+        metadata = {"notes": "x" * 5000}
+        storage.store_correlation(_correlation(0, metadata))
+        storage.flush()
+
+        with storage.connection_pool.get_connection() as conn:
+            stored = conn.execute("SELECT metadata FROM phase_correlations").fetchone()[0]
+
+        assert isinstance(stored, bytes)
+        assert len(stored) < 5000
+        assert storage.get_correlations_by_phase("phase1", use_cache=False)[0].metadata == metadata
+
+    def test_shutdown_flushes_queue(self, tmp_path):
+        """Rows still queued at shutdown are committed."""
+        path = tmp_path / "phase.db"
+        store = PhaseCorrelationStorage(str(path), backup_enabled=False)
+        for i in range(500):
+            store.store_correlation(_correlation(i))
+        store.shutdown()
+
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM phase_correlations").fetchone()[0] == 500
+
+class TestWriterFailures:
+    """Test that failures never stall the write-behind writer."""
+
+    def test_hook_errors_keep_writer_alive(self, tmp_path):
+        """A non-sqlite error from on_batch drops only the offending row."""
+        path = str(tmp_path / "writer.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE t (value)")
+
+        def on_batch(conn, rows_by_statement):
+            for statement, rows in rows_by_statement.items():
+                for (value,) in rows:
+                    value // 2  # TypeError for strings
+
+        writer = WriteBehindWriter(path, batch_size=10, on_batch=on_batch)
+        try:
+            for value in (1, "bad", 3):
+                writer.submit("INSERT INTO t VALUES (?)", (value,))
+            assert writer.flush(timeout=5)
+
+            writer.submit("INSERT INTO t VALUES (?)", (4,))
+            assert writer.flush(timeout=5)
+            assert writer._thread.is_alive()
+            assert writer.stats["records_written"] == 3
+            assert writer.stats["records_failed"] == 1
+            assert [row[1] for row in writer.failed_rows] == [("bad",)]
+        finally:
+            writer.close(timeout=5)
+
+        with sqlite3.connect(path) as conn:
+            assert sorted(row[0] for row in conn.execute("SELECT value FROM t")) == [1, 3, 4]
+
+    def test_reads_do_not_block_on_stalled_writer(self, tmp_path):
+        """Reads give up waiting after read_flush_timeout and see committed rows."""
+        store = PhaseCorrelationStorage(str(tmp_path / "phase.db"), backup_enabled=False, read_flush_timeout=0.05)
+        release = threading.Event()
+        apply_rollups = store.writer.on_batch
+
+        def stalled(conn, rows_by_statement):
+            release.wait(5)
+            apply_rollups(conn, rows_by_statement)
+
+        store.writer.on_batch = stalled
+        try:
+            store.store_correlation(_correlation(0))
+
+            started = time.time()
+            assert store.get_correlations_by_phase("phase1") == []
+            assert time.time() - started < 2
+
+            release.set()
+            assert len(store.get_correlations_by_phase("phase1")) == 1
+        finally:
+            release.set()
+            store.shutdown()
+
+    @pytest.mark.parametrize("timestamp", ["yesterday", None, float("nan")])
+    def test_invalid_timestamps_rejected_on_submit(self, storage, timestamp):
+        """Unbucketable timestamps fail the store call instead of the writer."""
+        assert not storage.store_performance_correlation(_performance("phase2", 5.0, timestamp))
+
+        assert storage.store_performance_correlation(_performance("phase2", 5.0, "1700000000"))
+        assert storage.flush(timeout=5)
+        assert storage.writer.stats["records_failed"] == 0
+        assert storage.get_performance_rollups(phase="phase2", bucket="day")[0]["sample_count"] == 1
+
+class TestRollups:
+    """Test rollup maintenance and cache invalidation."""
+
+    def test_rollups_match_raw_rows(self, storage):
+        """Hour buckets aggregate every inserted measurement."""
+        base = 1_700_000_000 - 1_700_000_000 % 3600
+        for i in range(240):
+            storage.store_performance_correlation(_performance("phase2", float(i % 7), base + i * 60))
+
+        rollups = storage.get_performance_rollups(phase="phase2", bucket="hour")
+
+        assert [r["bucket_start"] for r in rollups] == [base + h * 3600 for h in range(4)]
+        assert sum(r["sample_count"] for r in rollups) == 240
+        assert rollups[0]["min_improvement"] == 0.0
+        assert rollups[0]["max_improvement"] == 6.0
+        assert rollups[0]["validated_count"] == 60
+
+    def test_cache_invalidated_by_writes(self, storage):
+        """A cached read is replaced once a write touches its table."""
+        storage.store_correlation(_correlation(0))
+        assert len(storage.get_correlations_by_phase("phase1")) == 1
+        assert len(storage.get_correlations_by_phase("phase1")) == 1
+        hits = storage.storage_stats["cache_hits"]
+
+        storage.store_correlation(_correlation(1))
+
+        assert len(storage.get_correlations_by_phase("phase1")) == 2
+        assert storage.storage_stats["cache_hits"] == hits
+
+    def test_backfills_existing_rows(self, tmp_path):
+        """Rows written before the rollup tables existed are rolled up on open."""
+        path = str(tmp_path / "phase.db")
+        store = PhaseCorrelationStorage(path, backup_enabled=False, write_behind=False)
+        store.store_performance_correlation(_performance("phase3", 5.0, 1_700_000_000))
+        with store.connection_pool.get_connection() as conn:
+            conn.execute("DELETE FROM performance_rollups")
+            conn.commit()
+        store.shutdown()
+
+        reopened = PhaseCorrelationStorage(path, backup_enabled=False)
+        try:
+            rollups = reopened.get_performance_rollups(phase="phase3", bucket="day")
+            assert len(rollups) == 1
+            assert rollups[0]["average_improvement"] == 5.0
+        finally:
+            reopened.shutdown()
+
+class TestPerformanceTrends:
+    """Test trend queries served from the trend rollups."""
+
+    def test_trends_summarise_rollups_not_raw_rows(self, storage):
+        """Trends are grouped means over the window and survive raw row cleanup."""
+        now = time.time()
+        for i in range(30):
+            storage.store_performance_correlation(_performance("phase2", 10.0 + i % 3, now - 120 - i * 3600))
+        storage.store_performance_correlation(_performance("phase2", 40.0, now - 60, status="pending"))
+        storage.store_performance_correlation(_performance("phase2", 7.0, now - 7200, factors=["pool"]))
+        storage.flush(timeout=5)
+        with storage.connection_pool.get_connection() as conn:
+            conn.execute("DELETE FROM performance_correlations")
+            conn.commit()
+
+        trends = storage.get_performance_trends("phase2")
+
+        assert [(t.validation_status, t.correlation_factors) for t in trends] == [
+            ("pending", ["cache"]), ("validated", ["cache"]), ("validated", ["pool"])
+        ]
+        assert trends[1].improvement_percentage == pytest.approx(11.0)
+        assert trends[1].measurement_timestamp == pytest.approx(now - 120)
+        assert [t.improvement_percentage for t in storage.get_performance_trends(
+            "phase2", validation_status="pending")] == [40.0]
+        assert storage.get_performance_trends("phase2", since=now + 2 * 86400) == []
+
+    def test_trend_cache_invalidated_by_writes(self, storage):
+        """A new measurement moves the cached trend average."""
+        now = time.time()
+        storage.store_performance_correlation(_performance("phase3", 10.0, now))
+        assert storage.get_performance_trends("phase3")[0].improvement_percentage == 10.0
+
+        storage.store_performance_correlation(_performance("phase3", 20.0, now))
+
+        assert storage.get_performance_trends("phase3")[0].improvement_percentage == 15.0
+
+    def test_backfills_trend_rollups(self, tmp_path):
+        """Measurements written before the trend rollups existed are rolled up on open."""
+        path = str(tmp_path / "phase.db")
+        store = PhaseCorrelationStorage(path, backup_enabled=False, write_behind=False)
+        store.store_performance_correlation(_performance("phase4", 6.0, time.time()))
+        with store.connection_pool.get_connection() as conn:
+            conn.execute("DELETE FROM performance_trend_rollups")
+            conn.commit()
+        store.shutdown()
+
+        reopened = PhaseCorrelationStorage(path, backup_enabled=False)
+        try:
+            assert [t.improvement_percentage for t in reopened.get_performance_trends("phase4")] == [6.0]
+        finally:
+            reopened.shutdown()
+
+    def test_memory_model_insights_use_rollups(self, tmp_path):
+        """The unified memory model reads its trends through the rollup-backed storage."""
+        from analyzer.unified_memory_model import UnifiedMemoryModel
+
+        model = UnifiedMemoryModel(str(tmp_path / "memory.db"))
+        try:
+            for improvement in (30.0, 50.0):
+                model.storage.store_performance_correlation(_performance("phase5", improvement, time.time()))
+
+            insights = model.get_cross_phase_learning_insights("phase5")
+
+            assert [t["improvement_percentage"] for t in insights["performance_correlations"]] == [40.0]
+            assert any("avg 40.0%" in s for s in insights["suggested_optimizations"])
+            assert model.storage.cleanup_old_correlations(max_age_days=30) == 0
+        finally:
+            model.shutdown()
+
+    def test_learning_integration_uses_rollups(self, tmp_path, monkeypatch):
+        """Phase learning classifies patterns against rolled-up trends."""
+        import asyncio
+
+        from analyzer import cross_phase_learning_integration as learning
+        from analyzer.unified_memory_model import UnifiedMemoryModel
+
+        model = UnifiedMemoryModel(str(tmp_path / "memory.db"))
+        monkeypatch.setattr(learning, "get_global_storage", lambda: model.storage)
+        try:
+            model.storage.store_correlation(_correlation(0, {"correlation_factors": ["cache"]}))
+            for improvement in (30.0, 50.0):
+                model.storage.store_performance_correlation(_performance("phase2", improvement, time.time()))
+
+            integration = learning.CrossPhaseLearningIntegration(model)
+            results = asyncio.run(integration.analyze_and_learn_from_phase("phase2"))
+
+            assert "error" not in results
+            assert results["patterns_discovered"] == 1
+            pattern = next(iter(integration.learned_patterns.values()))
+            assert [p["improvement_percentage"] for p in pattern.pattern_data["performance_improvements"]] == [40.0]
+        finally:
+            model.shutdown()
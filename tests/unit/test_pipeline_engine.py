@@ -0,0 +1,126 @@
+"""
+Unit Tests - PipelinedAnalysisEngine
+
+Tests for pipeline_engine.py covering:
+- Per-file results for readable, unreadable and unparsable files
+- Input-order streaming
+- Detector failures isolated to the failing file (ordered and unordered)
+- Bounded stage queues and stage counters
+"""
+
+import ast
+
+import pytest
+
+from analyzer.performance import pipeline_engine
+from analyzer.performance.pipeline_engine import DETECT_STAGES, PipelineConfig, PipelinedAnalysisEngine
+
+
+def _count_functions(file_path, source, tree):
+    return [
+        {"type": "function", "file_path": file_path, "line_number": node.lineno}
+        for node in ast.walk(tree)
+        if isinstance(node, ast.FunctionDef)
+    ]
+
+
+def _fail_on_module_5(file_path, source, tree):
+    if file_path.endswith("module_5.py"):
+        raise RuntimeError("detector crashed")
+    return _count_functions(file_path, source, tree)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setitem(DETECT_STAGES, "functions", _count_functions)
+    config = PipelineConfig(use_processes=False, detect_workers=2, io_workers=2,
+                            io_queue_depth=4, batch_files=2, detector="functions")
+    return PipelinedAnalysisEngine(config)
+
+
+def _write_files(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"module_{i}.py"
+        path.write_text("".join(f"def f{j}():\n    pass\n" for j in range(i % 3 + 1)))
+        paths.append(path)
+    return paths
+
+
+class TestPipelinedAnalysisEngine:
+    """Test staged read/parse/detect execution."""
+
+    def test_results_in_input_order(self, engine, tmp_path):
+        """ordered=True yields one result per file in input order."""
+        paths = _write_files(tmp_path, 12)
+        results = list(engine.iter_results(paths, ordered=True))
+
+        assert [r["file_path"] for r in results] == [str(p) for p in paths]
+        assert [r["violation_count"] for r in results] == [i % 3 + 1 for i in range(12)]
+
+    def test_read_and_parse_errors_are_reported(self, engine, tmp_path):
+        """Missing and unparsable files produce error results, not exceptions."""
+        broken = tmp_path / "broken.py"
+        broken.write_text("def (:\n")
+        results = {r["file_path"]: r for r in engine.iter_results([broken, tmp_path / "missing.py"])}
+
+        assert results[str(broken)]["error"].startswith("SyntaxError")
+        assert "error" in results[str(tmp_path / "missing.py")]
+        assert engine.get_stage_stats()["io"]["errors"] == 1
+        assert engine.get_stage_stats()["parse"]["errors"] == 1
+
+    def test_stage_queues_are_bounded(self, engine, tmp_path):
+        """Stage counters add up and in-flight work never exceeds the queue depths."""
+        paths = _write_files(tmp_path, 30)
+        summary = engine.analyze_files(paths)
+        stats = summary["stage_stats"]
+
+        assert summary["files_analyzed"] == 30
+        assert stats["io"]["items"] == stats["parse"]["items"] == stats["detect"]["items"] == 30
+        assert stats["io"]["max_queue_depth"] <= 4
+        assert stats["detect"]["max_queue_depth"] <= engine.detect_queue_depth
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_detector_failure_isolated_to_file(self, engine, tmp_path, monkeypatch, ordered):
+        """A detector raising on one file yields an error for it; its batch-mates survive."""
+        monkeypatch.setitem(DETECT_STAGES, "functions", _fail_on_module_5)
+        paths = _write_files(tmp_path, 12)
+        results = list(engine.iter_results(paths, ordered=ordered))
+
+        by_path = {r["file_path"]: r for r in results}
+        assert len(results) == 12
+        assert set(by_path) == {str(p) for p in paths}
+        assert "detector crashed" in by_path[str(paths[5])]["error"]
+        assert by_path[str(paths[4])]["violation_count"] == 4 % 3 + 1
+        assert engine.get_stage_stats()["detect"]["errors"] == 1
+        assert engine.get_stage_stats()["detect"]["items"] == 11
+        if ordered:
+            assert [r["file_path"] for r in results] == [str(p) for p in paths]
+
+    def test_failed_batch_reports_every_file(self, engine, tmp_path, monkeypatch):
+        """A batch that dies as a whole still yields one error per file, in order."""
+        real_batch = pipeline_engine._parse_and_detect_batch
+
+        def flaky_batch(batch, detector):
+            if any(path.endswith("module_3.py") for _, path, _ in batch):
+                raise OSError("worker died")
+            return real_batch(batch, detector)
+
+        monkeypatch.setattr(pipeline_engine, "_parse_and_detect_batch", flaky_batch)
+        paths = _write_files(tmp_path, 10)
+        results = list(engine.iter_results(paths, ordered=True))
+
+        assert [r["file_path"] for r in results] == [str(p) for p in paths]
+        failed = [r for r in results if "error" in r]
+        assert str(paths[3]) in {r["file_path"] for r in failed}
+        assert all("worker died" in r["error"] for r in failed)
+
+    def test_in_order_flushes_after_gap(self):
+        """Held results are emitted when the stream ends, even past a missing index."""
+        results = [{"index": 2}, {"index": 0}, {"index": 3}]
+        assert [r["index"] for r in PipelinedAnalysisEngine._in_order(iter(results))] == [0, 2, 3]
+
+    def test_unknown_detector_rejected(self):
+        """Detector names must be registered stages."""
+        with pytest.raises(ValueError):
+            PipelinedAnalysisEngine(PipelineConfig(detector="missing"))
@@ -0,0 +1,127 @@
+"""
+Unit Tests - UnifiedReportingCoordinator
+
+Tests for coordinator.py covering:
+- Single-format reports build only the model data they use
+- Multi-format reports share one legacy conversion across formats
+- Chart series and the text/summary output file split
+- Tabular formats render from the model's shared violation rows
+"""
+
+import json
+
+import pytest
+
+from analyzer.analyzer_types import UnifiedAnalysisResult
+from analyzer.reporting.coordinator import UnifiedReportingCoordinator
+
+
+def _result(count=6):
+    severities = ["critical", "high", "medium", "low"]
+    violations = [
+        {
+            "id": f"v{i}",
+            "file_path": f"pkg/module_{i % 2}.py",
+            "line_number": i + 1,
+            "type": "CoM" if i % 3 else "CoP",
+            "severity": severities[i % 4],
+            "description": f"Violation {i}",
+        }
+        for i in range(count)
+    ]
+    return UnifiedAnalysisResult(
+        connascence_violations=violations,
+        duplication_clusters=[],
+        nasa_violations=[],
+        total_violations=count,
+        critical_count=2,
+        high_count=2,
+        medium_count=1,
+        low_count=1,
+        connascence_index=1.5,
+        nasa_compliance_score=0.9,
+        duplication_score=1.0,
+        overall_quality_score=0.8,
+        project_path="/tmp/demo",
+        policy_preset="standard",
+        analysis_duration_ms=12,
+        files_analyzed=2,
+        timestamp="2026-01-01T00:00:00",
+        priority_fixes=["Fix module_0"],
+        improvement_actions=[],
+    )
+
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    coordinator = UnifiedReportingCoordinator()
+    coordinator.conversions = 0
+    convert = coordinator._convert_to_legacy_format
+
+    def counting_convert(analysis_result):
+        coordinator.conversions += 1
+        return convert(analysis_result)
+
+    monkeypatch.setattr(coordinator, "_convert_to_legacy_format", counting_convert)
+    return coordinator
+
+
+class TestReportModel:
+    """Test lazy, shared report model data."""
+
+    @pytest.mark.parametrize("format_type", ["text", "csv", "xml", "summary"])
+    def test_single_format_skips_legacy_conversion(self, coordinator, format_type):
+        """Formats rendered from the analysis result never convert it."""
+        content = coordinator.generate_report(_result(), format_type)
+
+        assert content
+        assert coordinator.conversions == 0
+
+    def test_multi_format_converts_once(self, coordinator, tmp_path):
+        """Formats rendered from one model share a single legacy conversion."""
+        files = coordinator.generate_multi_format_report(
+            _result(), ["sarif", "text", "summary", "csv", "sarif"], tmp_path, "demo"
+        )
+
+        assert coordinator.conversions == 1
+        assert set(files) == {"sarif", "text", "summary", "csv"}
+        assert files["summary"].endswith("demo_summary.txt")
+        assert json.loads((tmp_path / "demo.sarif").read_text())["runs"]
+
+        model = coordinator.build_report_model(_result())
+        assert model.legacy_result is model.legacy_result
+        assert coordinator.conversions == 2
+
+    def test_chart_series(self, coordinator):
+        """Dashboard charts come from one pass over the violations."""
+        model = coordinator.build_report_model(_result())
+        data = coordinator.get_dashboard_report_data(model.analysis_result, model)
+
+        assert data["charts"]["severity_distribution"]["data"] == [2, 2, 1, 1]
+        assert data["charts"]["file_distribution"] == {"labels": ["module_0.py", "module_1.py"], "data": [3, 3]}
+        assert data["charts"]["type_distribution"] == {"labels": ["CoP", "CoM"], "data": [2, 4]}
+        assert coordinator.conversions == 0
+
+    def test_tabular_formats_share_violation_rows(self, coordinator, monkeypatch):
+        """CSV and XML render from one build of the model's violation rows."""
+        builds = []
+        create_rows = coordinator._create_violation_rows
+
+        def counting_rows(analysis_result):
+            builds.append(1)
+            return create_rows(analysis_result)
+
+        monkeypatch.setattr(coordinator, "_create_violation_rows", counting_rows)
+        result = _result()
+        result.nasa_violations = [{"rule_id": "NASA-2", "severity": "high", "rule_title": "Loop bound"}]
+        model = coordinator.build_report_model(result)
+
+        csv_lines = coordinator._render("csv", model, {}).splitlines()
+        xml = coordinator._render("xml", model, {})
+
+        assert len(builds) == 1
+        assert csv_lines[1].split(",")[:4] == ["pkg/module_0.py", "1", "CoP", "critical"]
+        assert csv_lines[-1].split(",")[2:] == ["NASA-2", "high", "Loop bound", "1", "NASA"]
+        assert xml.count("<violation>") == 6
+        assert "NASA-2" not in xml
+        assert coordinator.conversions == 0
@@ -0,0 +1,116 @@
+"""
+Unit Tests - StreamResultAggregator
+
+Tests for result_aggregator.py covering:
+- Running totals across add, replace and remove
+- Aggregated results and dashboard data serialize with json.dumps
+- Breakdowns handed to callers are independent copies
+- Invalidation evicts real-time violations, directly and through dependencies
+"""
+
+import json
+import time
+
+from analyzer.streaming.result_aggregator import StreamAnalysisResult, StreamResultAggregator
+
+
+def _result(file_path, magic=0, position=0, analysis_type="full"):
+    return StreamAnalysisResult(
+        file_path=file_path,
+        timestamp=time.time(),
+        violations={
+            "magic_literal": [{"severity": "low"} for _ in range(magic)],
+            "position": [{"severity": "high"} for _ in range(position)],
+        },
+        metrics={},
+        processing_time_ms=2.0,
+        analysis_type=analysis_type,
+    )
+
+
+def _aggregator():
+    aggregator = StreamResultAggregator()
+    aggregator.add_result(_result("a.py", magic=3, position=1))
+    aggregator.add_result(_result("b.py", magic=1, analysis_type="incremental"))
+    aggregator.add_result(_result("c.py", position=2))
+    return aggregator
+
+
+class TestStreamResultAggregator:
+    """Test incremental aggregation and its serializable outputs."""
+
+    def test_totals_follow_replacements_and_removals(self):
+        """Replacing or removing a file subtracts its previous contribution."""
+        aggregator = _aggregator()
+        aggregator.add_result(_result("a.py", magic=1))
+        aggregator.remove_result("c.py")
+        result = aggregator.get_aggregated_result()
+
+        assert result.total_violations == 2
+        assert result.files_analyzed == 2
+        assert result.violation_breakdown == {"magic_literal": 2}
+        assert result.severity_breakdown == {"low": 2}
+
+    def test_aggregated_result_is_json_serializable(self):
+        """Breakdowns are plain dicts and to_dict() materializes the per-file views."""
+        result = _aggregator().get_aggregated_result()
+
+        assert type(result.violation_breakdown) is dict
+        assert type(result.severity_breakdown) is dict
+        json.dumps({"breakdown": result.violation_breakdown, "severity": result.severity_breakdown})
+        payload = json.loads(json.dumps(result.to_dict()))
+        assert payload["total_violations"] == 7
+        assert payload["violation_breakdown"] == {"magic_literal": 4, "position": 3}
+        assert set(payload["file_analysis_history"]) == {"a.py", "b.py", "c.py"}
+
+    def test_empty_result_is_json_serializable(self):
+        """Default (empty) snapshot fields serialize too."""
+        result = StreamResultAggregator().get_aggregated_result()
+
+        assert json.loads(json.dumps(result.to_dict()))["violation_breakdown"] == {}
+
+    def test_dashboard_data_is_json_serializable(self):
+        """Dashboard payload goes straight to json.dumps."""
+        data = json.loads(json.dumps(_aggregator().get_real_time_dashboard_data()))
+
+        assert data["violation_breakdown"] == {"magic_literal": 4, "position": 3}
+        assert data["severity_breakdown"] == {"low": 4, "high": 3}
+
+    def test_breakdowns_are_independent_copies(self):
+        """Mutating a returned breakdown does not affect the aggregate or other readers."""
+        aggregator = _aggregator()
+        first = aggregator.get_aggregated_result()
+        first.violation_breakdown["magic_literal"] = 999
+
+        assert aggregator.get_aggregated_result().violation_breakdown["magic_literal"] == 4
+        assert aggregator.aggregation_stats["snapshots_built"] == 1
+
+    def test_invalidation_evicts_real_time_violations(self):
+        """Invalidated files drop out of the real-time map in new and existing snapshots."""
+        aggregator = _aggregator()
+        before = aggregator.get_aggregated_result()
+        assert "a.py" in before.real_time_violations
+
+        assert aggregator.invalidate_file_results(["a.py", "missing.py"]) == 1
+        after = aggregator.get_aggregated_result()
+
+        assert set(after.real_time_violations) == {"b.py", "c.py"}
+        assert "a.py" not in before.real_time_violations  # views read the live map
+        assert set(after.to_dict()["real_time_violations"]) == {"b.py", "c.py"}
+        assert after.total_violations == 3
+
+    def test_dependency_change_evicts_dependents(self):
+        """Changing a file's dependencies invalidates the files that depend on it."""
+        aggregator = StreamResultAggregator()
+        base = _result("base.py", magic=1)
+        base.dependencies = {"util.py"}
+        dependent = _result("app.py", position=1)
+        dependent.dependencies = {"base.py"}
+        aggregator.add_result(base)
+        aggregator.add_result(dependent)
+
+        changed = _result("base.py", magic=1)
+        changed.dependencies = {"other.py"}
+        aggregator.add_result(changed)
+
+        assert set(aggregator.get_aggregated_result().real_time_violations) == {"base.py"}
@@ -0,0 +1,115 @@
+"""
+Unit Tests - SARIFStreamWriter
+
+Tests for sarif.py covering:
+- Streamed documents match the json.dumps SARIF document for the same violations
+- Violation objects and violation dicts
+- Empty runs still produce a complete SARIF document
+"""
+
+import io
+import json
+
+from analyzer.reporting.coordinator import UnifiedReportingCoordinator
+from analyzer.reporting.sarif import SARIFReporter, SARIFStreamWriter
+
+
+def _violation_dicts(count=5):
+    types = ["CoM", "CoP", "CoX"]  # CoX has no rule
+    severities = ["critical", "high", "medium", "low"]
+    return [
+        {
+            "id": f"v{i}",
+            "rule_id": f"CON_{types[i % 3]}",
+            "type": types[i % 3],
+            "severity": severities[i % 4],
+            "description": f"Violation {i} – magic literal",
+            "file_path": f"pkg\\module_{i % 2}.py" if i % 2 else f"pkg/module_{i % 2}.py",
+            "line_number": i + 1,
+            "weight": 2.0,
+        }
+        for i in range(count)
+    ]
+
+
+def _legacy_result(violations):
+    """The AnalysisResult shape the coordinator hands to SARIFReporter.generate."""
+    analysis_result = type("Unified", (), {
+        "connascence_violations": violations, "project_path": "/repo", "timestamp": "2026-01-01T00:00:00",
+        "files_analyzed": 2, "analysis_duration_ms": 5, "policy_preset": "strict", "total_violations": len(violations),
+        "critical_count": 0, "high_count": 0, "medium_count": 0, "low_count": 0,
+    })()
+    return UnifiedReportingCoordinator()._convert_to_legacy_format(analysis_result)
+
+
+def _stream(reporter, violations, **kwargs):
+    buffer = io.StringIO()
+    with SARIFStreamWriter(reporter, buffer, **kwargs) as writer:
+        writer.write_violations(violations)
+    return json.loads(buffer.getvalue()), writer
+
+
+def _stable(run):
+    """Drop per-run identifiers and timestamps."""
+    invocations = [
+        {key: value for key, value in invocation.items() if key != "startTimeUtc"}
+        for invocation in run["invocations"]
+    ]
+    return {"tool": run["tool"], "results": run["results"], "invocations": invocations,
+            "description": run["automationDetails"]["description"]}
+
+
+class TestSARIFStreamWriter:
+    """Test the streamed SARIF document against the in-memory one."""
+
+    def test_violation_objects_match_generate(self):
+        """Streaming Violation objects gives the same run as generate()."""
+        reporter = SARIFReporter()
+        legacy = _legacy_result(_violation_dicts())
+
+        expected = json.loads(reporter.generate(legacy))
+        streamed, _ = _stream(reporter, legacy.violations, project_root="/repo", policy_preset="strict")
+
+        assert streamed["$schema"] == expected["$schema"]
+        assert streamed["version"] == expected["version"]
+        assert _stable(streamed["runs"][0]) == _stable(expected["runs"][0])
+        assert [r["ruleIndex"] for r in streamed["runs"][0]["results"]] == [2, 3, -1, 2, 3]
+
+    def test_violation_dicts_match_export(self):
+        """Streaming violation dicts gives the same run as export_results()."""
+        reporter = SARIFReporter()
+        violations = _violation_dicts()
+
+        expected = json.loads(reporter.export_results({"violations": violations, "path": "/repo", "policy": "strict"}))
+        streamed, writer = _stream(reporter, violations, project_root="/repo", policy_preset="strict")
+
+        run = streamed["runs"][0]
+        assert _stable(run) == _stable(expected["runs"][0])
+        assert run["properties"]["policyPreset"] == expected["runs"][0]["properties"]["policyPreset"]
+        assert run["properties"]["summaryMetrics"] == writer.summary()
+        assert writer.summary()["severity_counts"] == {"critical": 2, "high": 1, "medium": 1, "low": 1}
+        assert run["conversion"]["invocation"]["executionSuccessful"] is True
+
+    def test_empty_run(self):
+        """No violations still yields a valid document with an empty results array."""
+        reporter = SARIFReporter()
+        expected = json.loads(reporter.export_results({"violations": []}))
+        streamed, writer = _stream(reporter, [])
+
+        assert _stable(streamed["runs"][0]) == _stable(expected["runs"][0])
+        assert streamed["runs"][0]["results"] == []
+        assert writer.summary() == {"total_violations": 0, "files_analyzed": 0, "severity_counts": {}}
+
+    def test_stream_results_to_file(self, tmp_path):
+        """stream_results writes per-file results and reports the totals."""
+        violations = _violation_dicts(4)
+        output = tmp_path / "report.sarif"
+
+        summary = SARIFReporter().stream_results(
+            [{"violations": violations[:3]}, {"violations": []}, {"violations": violations[3:]}], str(output)
+        )
+
+        document = json.loads(output.read_text(encoding="utf-8"))
+        assert len(document["runs"][0]["results"]) == 4
+        assert summary["files_analyzed"] == 3
+        assert document["runs"][0]["properties"]["totalFilesAnalyzed"] == 3
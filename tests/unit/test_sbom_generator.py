@@ -0,0 +1,78 @@
+"""
+Unit Tests - SBOMGenerator
+
+Tests for sbom_generator.py covering:
+- Fingerprint cache reuse for unchanged and touched-but-identical manifests
+- Component diff when a lockfile changes, removed once nothing changes
+- CycloneDX and SPDX rendered from the same component list
+"""
+
+import json
+import os
+
+import pytest
+
+from analyzer.enterprise.supply_chain.sbom_generator import SBOMGenerator
+
+
+def _write_npm_project(project, lodash_version):
+    (project / "package.json").write_text(json.dumps({
+        "name": "demo", "version": "3.1.0",
+        "dependencies": {"lodash": "^4.0.0"}, "devDependencies": {"jest": "^29.0.0"},
+    }))
+    (project / "package-lock.json").write_text(json.dumps({
+        "lockfileVersion": 3,
+        "packages": {
+            "node_modules/lodash": {"version": lodash_version},
+            "node_modules/jest": {"version": "29.7.0"},
+        },
+    }))
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    _write_npm_project(project, "4.17.20")
+    (project / "requirements.txt").write_text("requests==2.31.0\n")
+    return project
+
+
+def test_unchanged_manifests_hit_cache(project, tmp_path):
+    """Unchanged and touched-but-identical manifests are not re-parsed."""
+    SBOMGenerator({"output_dir": str(tmp_path / "out")}).generate_all_formats(str(project))
+
+    generator = SBOMGenerator({"output_dir": str(tmp_path / "out")})
+    generator.generate_all_formats(str(project))
+    os.utime(project / "package-lock.json", ns=(0, 0))
+    generator.generate_all_formats(str(project))
+
+    assert generator.cache_stats == {"hits": 4, "misses": 0}
+    assert generator.last_diff is None
+
+
+def test_lockfile_change_emits_diff(project, tmp_path):
+    """A changed lockfile is re-parsed and its version changes are reported."""
+    generator = SBOMGenerator({"output_dir": str(tmp_path / "out")})
+    generator.generate_all_formats(str(project))
+
+    _write_npm_project(project, "4.17.21")
+    results = generator.generate_all_formats(str(project))
+
+    assert generator.last_diff["sources_changed"] == ["npm"]
+    assert generator.last_diff["changed"] == [{
+        "ecosystem": "npm", "name": "lodash", "scope": "dependencies",
+        "previous_version": "4.17.20", "version": "4.17.21",
+    }]
+    assert json.loads((tmp_path / "out" / "sbom-diff.json").read_text()) == generator.last_diff
+
+    cyclone_dx = json.loads(open(results["cyclone_dx"]).read())
+    spdx = json.loads(open(results["spdx"]).read())
+    assert [c["version"] for c in cyclone_dx["components"] if c["name"] == "lodash"] == ["4.17.21"]
+    assert len(spdx["packages"]) == len(cyclone_dx["components"]) + 1  # plus the root package
+    assert cyclone_dx["metadata"]["timestamp"] == spdx["creationInfo"]["created"]
+    assert "BUILD_DEPENDENCY_OF" in {r["relationshipType"] for r in spdx["relationships"]}
+
+    generator.generate_all_formats(str(project))
+    assert generator.last_diff is None
+    assert not (tmp_path / "out" / "sbom-diff.json").exists()
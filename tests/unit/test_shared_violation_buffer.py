@@ -0,0 +1,109 @@
+"""
+Unit Tests - Shared Violation Buffer
+
+Tests for shared_violation_buffer.py covering:
+- Round-trip encoding of violation dicts with their keys, order and types
+- String interning and extra-field preservation
+- Lazy shared memory segment reads and release
+"""
+
+import pytest
+
+from analyzer.performance.shared_violation_buffer import (
+    encode_violations,
+    iter_decoded_violations,
+    read_violation_segment,
+    shared_memory_supported,
+    write_violation_segment,
+)
+
+
+def _violations(count=3):
+    return [
+        {
+            "type": "connascence_of_meaning",
+            "severity": "high",
+            "file_path": "pkg/module.py",
+            "description": f"Magic literal {i}",
+            "line_number": i + 1,
+            "column": 4,
+            "weight": 2.5,
+            "rule_id": "CON_M",
+            "context": {"value": i},
+        }
+        for i in range(count)
+    ]
+
+
+class TestViolationEncoding:
+    """Test the compact binary record format."""
+
+    def test_round_trip_preserves_fields(self):
+        """Decoded violations match the originals, key order included."""
+        original = _violations()
+        decoded = list(iter_decoded_violations(memoryview(encode_violations(original))))
+        assert decoded == original
+        assert [list(v) for v in decoded] == [list(v) for v in original]
+
+    def test_absent_columns_stay_absent(self):
+        """Keys the original dict did not have are not added on decode."""
+        original = [{"line_number": 7}, {"severity": "low", "file_path": None}, {}]
+        decoded = list(iter_decoded_violations(memoryview(encode_violations(original))))
+        assert decoded == original
+
+    def test_column_keys_keep_their_types(self):
+        """Values the fixed columns cannot hold exactly keep their original types."""
+        original = [{
+            "line_number": None, "weight": 1, "column": True, "severity": 3,
+            "description": "big", "context": ("a", 1), "id": 2**40,
+        }, {"line_number": 2**40, "weight": 2.5}]
+        decoded = list(iter_decoded_violations(memoryview(encode_violations(original))))
+        assert decoded == original
+        assert [[type(value) for value in v.values()] for v in decoded] == [
+            [type(value) for value in v.values()] for v in original
+        ]
+
+    def test_repeated_strings_are_interned(self):
+        """Repeated file paths do not grow the payload linearly."""
+        small = encode_violations(_violations(10))
+        large = encode_violations(_violations(100))
+        assert len(large) < len(small) * 10
+
+    def test_rejects_foreign_buffer(self):
+        """Buffers without the segment header are refused."""
+        with pytest.raises(ValueError):
+            list(iter_decoded_violations(memoryview(b"XXXX" + bytes(32))))
+
+
+@pytest.mark.skipif(not shared_memory_supported(), reason="POSIX shared memory required")
+class TestSharedSegments:
+    """Test shared memory segment lifecycle."""
+
+    def test_segment_round_trip(self):
+        """Violations are decoded lazily and the segment is released when exhausted."""
+        from multiprocessing import shared_memory
+
+        original = _violations(50)
+        handle = write_violation_segment(original)
+        assert handle["count"] == 50
+
+        reader = read_violation_segment(handle)
+        assert next(reader) == original[0]
+        shared_memory.SharedMemory(name=handle["name"]).close()  # still mapped mid-iteration
+        assert [next(reader)] + list(reader) == original[1:]
+
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle["name"])
+
+    def test_closing_early_releases_segment(self):
+        """A consumer that stops early still releases the segment."""
+        from multiprocessing import shared_memory
+
+        handle = write_violation_segment(_violations(10))
+        reader = read_violation_segment(handle)
+        next(reader)
+        reader.close()
+
+        assert list(reader) == []
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle["name"])
@@ -0,0 +1,148 @@
+"""
+Unit Tests - StreamProcessor
+
+Tests for stream_processor.py covering:
+- Stage latency percentiles
+- Per-file coalescing of queued changes and priority ordering
+- Watcher backpressure between the high and low watermarks
+- Analysis on the executor with per-stage statistics
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from analyzer.streaming.stream_processor import (
+    PRIORITY_BULK, PRIORITY_OPEN, PRIORITY_WATCH, FileChange, StreamProcessor, _StageStats
+)
+
+
+class _LineAnalyzer:
+    """Reports one violation per line of the analyzed file."""
+
+    def analyze_file(self, file_path):
+        with open(file_path) as f:
+            return {"violations": [{"type": "line", "line": i} for i, _ in enumerate(f, 1)]}
+
+
+def _change(path, change_type="modified", content_hash=None):
+    return FileChange(file_path=Path(path), change_type=change_type, timestamp=time.time(),
+                      content_hash=content_hash)
+
+
+def _drain(processor):
+    order = []
+    pending = processor._next_pending()
+    while pending is not None:
+        order.append(str(pending.change.file_path))
+        pending = processor._next_pending()
+    return order
+
+
+class _Watcher:
+    def __init__(self):
+        self.calls = []
+
+    def set_backpressure(self, active):
+        self.calls.append(active)
+
+
+class TestStageStats:
+    """Test stage latency snapshots."""
+
+    @pytest.mark.parametrize("samples, p95", [
+        ([7.0], 7.0),
+        ([float(i) for i in range(1, 11)], 10.0),
+        ([float(i) for i in range(1, 101)], 96.0),
+    ])
+    def test_p95_matches_performance_monitor(self, samples, p95):
+        """p95 uses index int(n * 0.95), clamped to the last sample."""
+        stats = _StageStats()
+        for sample in reversed(samples):
+            stats.record(sample)
+
+        snapshot = stats.snapshot(depth=3)
+        assert snapshot["p95_ms"] == p95
+        assert snapshot["max_ms"] == max(samples)
+        assert snapshot["count"] == len(samples)
+        assert snapshot["depth"] == 3
+
+    def test_empty_snapshot(self):
+        """No samples reports zeros."""
+        assert _StageStats().snapshot(0) == {"depth": 0, "count": 0, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+
+
+class TestScheduling:
+    """Test coalescing, priorities and backpressure of pending changes."""
+
+    def test_changes_coalesce_per_file(self):
+        """A newer change replaces the queued one; a new file stays a full analysis."""
+        processor = StreamProcessor(executor_type="inline")
+        processor._schedule_changes([_change("a.py", "created", "h1")], "r1", "incremental", PRIORITY_WATCH)
+        processor._schedule_changes([_change("a.py", "modified", "h2")], "r2", "incremental", PRIORITY_WATCH)
+
+        assert len(processor._pending) == 1
+        pending = processor._next_pending()
+        assert (pending.change.change_type, pending.change.content_hash) == ("created", "h2")
+        assert processor.get_stats()["coalesced_changes"] == 1
+
+    def test_open_files_run_before_bulk_changes(self):
+        """Open files jump ahead of watcher changes, which run before bulk batches."""
+        processor = StreamProcessor(executor_type="inline", bulk_threshold=2)
+        processor._schedule_changes([_change("bulk1.py"), _change("bulk2.py")], "b", "incremental",
+                                    PRIORITY_BULK, bulk=True)
+        processor._schedule_changes([_change("edit.py")], "w", "incremental", PRIORITY_WATCH)
+        processor._schedule_changes([_change("open.py")], "w", "incremental", PRIORITY_WATCH)
+        processor.mark_file_open("open.py")
+
+        assert processor._pending["open.py"].priority == PRIORITY_OPEN
+        assert _drain(processor) == ["open.py", "edit.py", "bulk1.py", "bulk2.py"]
+
+    def test_backpressure_follows_watermarks(self):
+        """The watcher is held at the high watermark and released at the low one."""
+        processor = StreamProcessor(executor_type="inline", max_queue_size=10)
+        processor.file_watcher = _Watcher()
+        processor._schedule_changes([_change(f"f{i}.py") for i in range(8)], "r", "incremental", PRIORITY_WATCH)
+        assert processor.get_stats()["backpressure_active"]
+
+        for _ in range(2):
+            processor._next_pending()
+        assert processor.get_stats()["backpressure_active"]
+        processor._next_pending()  # 5 pending: low watermark
+
+        assert processor.file_watcher.calls == [True, False]
+        assert processor.get_stats()["backpressure_events"] == 1
+
+
+class TestExecutorAnalysis:
+    """Test end-to-end analysis through the executor."""
+
+    def test_thread_executor_analyzes_and_reports_stages(self, tmp_path):
+        """Results are emitted once per file and every stage records a sample."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"m{i}.py"
+            path.write_text("x = 1\n" * (i + 1))
+            paths.append(path)
+
+        async def run():
+            processor = StreamProcessor(analyzer_factory=_LineAnalyzer, executor_type="thread", max_workers=2)
+            results = []
+            processor.add_result_callback(results.append)
+            async with processor:
+                processor._schedule_changes([_change(p, "created") for p in paths], "r", "full", PRIORITY_WATCH)
+                for _ in range(200):
+                    if len(results) == len(paths):
+                        break
+                    await asyncio.sleep(0.01)
+            return processor.get_stats(), results
+
+        stats, results = asyncio.run(run())
+
+        assert {r.file_path: len(r.violations) for r in results} == {str(p): i + 1 for i, p in enumerate(paths)}
+        assert stats["executor_type"] == "thread"
+        for stage in ("queued", "analysis", "emit"):
+            assert stats["stages"][stage]["count"] == len(paths)
+        assert stats["stages"]["analysis"]["depth"] == 0